@@ -5,15 +5,36 @@ Security Notes:
 - API keys are hashed using bcrypt with automatic salting
 - Legacy SHA-256 hashes are detected but are no longer accepted for auth
 - Bcrypt verification uses constant-time comparison internally
+
+Performance Notes:
+- Keys are issued as ``bai_<key_id>_<secret>``. The ``key_id`` is not secret
+  and is stored in an indexed column, so verifying a key is one indexed
+  lookup plus one bcrypt check, independent of how many users have keys.
+  A made-up key either names no ``key_id`` (no bcrypt at all) or costs a
+  single bcrypt check, so invalid-key floods no longer scale with user count.
+- Keys issued before key ids existed are still accepted; only those rows are
+  scanned, and the scan goes away as they are rotated. A key that failed the
+  scan is remembered (by HMAC, in a bounded cache) so repeating it costs no
+  bcrypt, and the scan can be switched off entirely, or from a deadline on,
+  once those keys have been rotated (API_KEY_LEGACY_SCAN,
+  API_KEY_LEGACY_SCAN_UNTIL).
+- Verified keys are remembered in a bounded in-memory cache keyed by
+  HMAC-SHA256 under a per-process secret, keeping bcrypt off the hot path.
 """
 
 import hashlib
+import hmac
 import json
 import logging
 import os
 import secrets
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Annotated, Dict, Optional
+from typing import Annotated, Dict, Optional, Tuple
 
 import bcrypt
 from fastapi import Depends, Header, HTTPException, status
@@ -26,18 +47,48 @@ BCRYPT_PREFIX = "$2"
 # SHA-256 hashes are 64 hex characters
 SHA256_HASH_LENGTH = 64
 
+# Issued keys look like "bai_<key_id>_<secret>"; key_id is a 12-char hex id
+KEY_PREFIX = "bai_"
+KEY_ID_LENGTH = 12
+
+SQLITE_HEADER = b"SQLite format 3\x00"
+
 # API Key header configuration
 API_KEY_HEADER = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
+def parse_key_id(api_key: str) -> Optional[str]:
+    """
+    Extract the non-secret lookup id from an API key.
+
+    Args:
+        api_key: The plain-text API key.
+
+    Returns:
+        The key id, or None for keys issued without one (or malformed keys).
+    """
+    if not api_key.startswith(KEY_PREFIX):
+        return None
+    end = len(KEY_PREFIX) + KEY_ID_LENGTH
+    if len(api_key) <= end + 1 or api_key[end] != "_":
+        return None
+    key_id = api_key[len(KEY_PREFIX):end]
+    try:
+        int(key_id, 16)
+    except ValueError:
+        return None
+    return key_id
+
+
 class APIKeyStore:
     """
-    File-based API key storage with secure hashing.
+    SQLite-backed API key storage with secure hashing.
 
     API keys are stored as bcrypt hashes with automatic salting for security.
     The plain-text key is only returned once when created and cannot be
-    retrieved later. This is a stepping stone to Redis/database storage
-    in production.
+    retrieved later. Each user has at most one key, stored as a row of
+    ``(user_id, key_id, key_hash)`` with a unique index on ``key_id``; creating
+    or revoking a key writes only that row.
 
     Security features:
     - Bcrypt hashing with automatic salt generation (cost factor 12)
@@ -48,32 +99,135 @@ class APIKeyStore:
     # Bcrypt cost factor (work factor) - 12 is a good balance of security and performance
     BCRYPT_ROUNDS = 12
 
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        verify_cache_size: Optional[int] = None,
+        verify_cache_ttl: Optional[float] = None,
+        rejected_cache_size: Optional[int] = None,
+        legacy_scan: Optional[bool] = None,
+        legacy_scan_until: Optional[datetime] = None,
+    ):
         """
         Initialize the API key store.
 
         Args:
-            storage_path: Path to the JSON file for storing API keys.
-                         Defaults to API_KEY_STORAGE_PATH env var or ./data/api_keys.json
+            storage_path: Path to the SQLite database for storing API keys.
+                         Defaults to API_KEY_STORAGE_PATH env var or ./data/api_keys.db.
+                         A JSON key file from earlier versions found at this path
+                         (or next to it with a .json suffix) is imported once.
+            verify_cache_size: Maximum verified keys kept in memory.
+                         Defaults to API_KEY_VERIFY_CACHE_SIZE env var or 10000.
+            verify_cache_ttl: Seconds a verified key is trusted without a
+                         database lookup, which bounds how long a key revoked by
+                         another worker keeps working here. Defaults to
+                         API_KEY_VERIFY_CACHE_TTL_SECONDS env var or 300.
+            rejected_cache_size: Maximum keys remembered as failing the scan of
+                         keys without a key id. Defaults to
+                         API_KEY_REJECTED_CACHE_SIZE env var or 10000.
+            legacy_scan: Whether keys without a key id are accepted at all.
+                         Defaults to API_KEY_LEGACY_SCAN env var or true.
+            legacy_scan_until: When (UTC) to stop accepting keys without a
+                         key id. Defaults to API_KEY_LEGACY_SCAN_UNTIL env var
+                         (ISO 8601), or no deadline.
         """
         self.storage_path = Path(
             storage_path
-            or os.environ.get("API_KEY_STORAGE_PATH", "./data/api_keys.json")
+            or os.environ.get("API_KEY_STORAGE_PATH", "./data/api_keys.db")
         )
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        if verify_cache_size is None:
+            verify_cache_size = int(os.environ.get("API_KEY_VERIFY_CACHE_SIZE", "10000"))
+        if verify_cache_ttl is None:
+            verify_cache_ttl = float(
+                os.environ.get("API_KEY_VERIFY_CACHE_TTL_SECONDS", "300")
+            )
+        if rejected_cache_size is None:
+            rejected_cache_size = int(os.environ.get("API_KEY_REJECTED_CACHE_SIZE", "10000"))
+        if legacy_scan is None:
+            legacy_scan = os.environ.get("API_KEY_LEGACY_SCAN", "true").lower() in (
+                "1", "true", "yes"
+            )
+        if legacy_scan_until is None and os.environ.get("API_KEY_LEGACY_SCAN_UNTIL"):
+            legacy_scan_until = datetime.fromisoformat(os.environ["API_KEY_LEGACY_SCAN_UNTIL"])
+        if legacy_scan_until is not None and legacy_scan_until.tzinfo is None:
+            legacy_scan_until = legacy_scan_until.replace(tzinfo=timezone.utc)
+        self.verify_cache_size = verify_cache_size
+        self.verify_cache_ttl = verify_cache_ttl
+        self.rejected_cache_size = rejected_cache_size
+        self.legacy_scan = legacy_scan
+        self.legacy_scan_until = legacy_scan_until
         self._cache: Dict[str, str] = {}  # user_id -> hashed_key
         self._legacy_hash_users: set = set()  # Track users with legacy hashes
-        # scrypt(plain_key, ephemeral_salt) -> user_id for keys already
-        # verified via bcrypt this process. Without it every request costs one
-        # bcrypt check per stored user (O(n) at cost factor 12), which turns
-        # auth into a DoS lever. The per-process random salt makes the
-        # in-memory index useless for offline guessing, and a hit is still
-        # re-verified against the stored bcrypt hash before being trusted.
-        self._index_salt = secrets.token_bytes(32)
-        self._verified_index: Dict[str, str] = {}
+        # Users whose bcrypt key predates key ids and can only be found by scanning
+        self._unindexed_users: set = set()
+        # HMAC(process secret, plain_key) -> (user_id, stored hash, verified at).
+        # The secret never leaves the process, so the cache is useless for
+        # offline guessing; an entry is only honoured while the user's stored
+        # hash is unchanged, so revoked or rotated keys drop out immediately.
+        self._verify_secret = secrets.token_bytes(32)
+        self._verified: "OrderedDict[bytes, Tuple[str, str, float]]" = OrderedDict()
+        # HMAC(process secret, plain_key) -> rejected at, for keys without a
+        # key id that matched no unindexed user. The unindexed set only
+        # shrinks at runtime, so a rejection stays correct; the TTL just
+        # keeps the cache from pinning entries forever.
+        self._rejected: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = self._connect()
         self._load()
         logger.info(f"API key storage initialized at: {self.storage_path}")
 
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, importing a legacy JSON key file if present."""
+        legacy_keys = self._read_legacy_json()
+        conn = sqlite3.connect(str(self.storage_path), check_same_thread=False)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS api_keys (
+                user_id TEXT PRIMARY KEY,
+                key_id TEXT UNIQUE,
+                key_hash TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
+        )
+        if legacy_keys:
+            now = datetime.now(timezone.utc).isoformat()
+            with conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO api_keys (user_id, key_id, key_hash, created_at) "
+                    "VALUES (?, NULL, ?, ?)",
+                    [(user_id, key_hash, now) for user_id, key_hash in legacy_keys.items()],
+                )
+            logger.info(f"Imported {len(legacy_keys)} API keys from legacy JSON storage")
+        return conn
+
+    def _read_legacy_json(self) -> Dict[str, str]:
+        """
+        Read (and set aside) a JSON key file written by earlier versions.
+
+        The JSON file is renamed to ``<name>.bak`` once read so it is only
+        imported once.
+        """
+        candidates = [self.storage_path]
+        if self.storage_path.suffix != ".json":
+            candidates.append(self.storage_path.with_suffix(".json"))
+        for path in candidates:
+            if not path.is_file():
+                continue
+            with open(path, "rb") as f:
+                if f.read(len(SQLITE_HEADER)) == SQLITE_HEADER:
+                    continue
+            try:
+                with open(path, "r") as f:
+                    keys = json.load(f) if path.stat().st_size else {}
+            except (json.JSONDecodeError, IOError) as e:
+                logger.error(f"Error loading legacy API keys from {path}: {e}")
+                continue
+            os.replace(path, path.with_name(path.name + ".bak"))
+            return keys
+        return {}
+
     def _hash_key(self, api_key: str) -> str:
         """
         Hash an API key using bcrypt with automatic salt generation.
@@ -130,38 +284,42 @@ class APIKeyStore:
             return False
 
     def _load(self) -> None:
-        """Load API keys from disk and identify legacy hashes."""
-        if self.storage_path.exists():
-            try:
-                with open(self.storage_path, "r") as f:
-                    self._cache = json.load(f)
-
-                # Identify users with legacy SHA-256 hashes
-                legacy_count = 0
-                for user_id, stored_hash in self._cache.items():
-                    if self._is_legacy_hash(stored_hash):
-                        self._legacy_hash_users.add(user_id)
-                        legacy_count += 1
-
-                logger.info(f"Loaded {len(self._cache)} API keys from storage")
-                if legacy_count > 0:
-                    logger.warning(
-                        f"Found {legacy_count} API key(s) using legacy SHA-256 hashing. "
-                        "These keys are disabled until they are rotated to bcrypt."
-                    )
-            except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"Error loading API keys: {e}")
-                self._cache = {}
-        else:
-            self._cache = {}
-
-    def _save(self) -> None:
-        """Save API keys to disk."""
+        """Load key hashes from the database and identify legacy hashes."""
         try:
-            with open(self.storage_path, "w") as f:
-                json.dump(self._cache, f, indent=2)
-        except IOError as e:
-            logger.error(f"Error saving API keys: {e}")
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT user_id, key_id, key_hash FROM api_keys"
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error loading API keys: {e}")
+            rows = []
+
+        legacy_count = 0
+        for user_id, key_id, stored_hash in rows:
+            self._cache[user_id] = stored_hash
+            if self._is_legacy_hash(stored_hash):
+                self._legacy_hash_users.add(user_id)
+                legacy_count += 1
+            elif key_id is None:
+                self._unindexed_users.add(user_id)
+
+        logger.info(f"Loaded {len(self._cache)} API keys from storage")
+        if self._unindexed_users and not self._legacy_scan_enabled():
+            logger.warning(
+                f"{len(self._unindexed_users)} API key(s) issued before key ids are no "
+                "longer accepted (API_KEY_LEGACY_SCAN); rotate them."
+            )
+        if legacy_count > 0:
+            logger.warning(
+                f"Found {legacy_count} API key(s) using legacy SHA-256 hashing. "
+                "These keys are disabled until they are rotated to bcrypt."
+            )
+
+    def _forget_user(self, user_id: str) -> None:
+        """Drop in-memory state for a user whose key is being replaced or revoked."""
+        self._cache.pop(user_id, None)
+        self._legacy_hash_users.discard(user_id)
+        self._unindexed_users.discard(user_id)
 
     def create_key(self, user_id: str) -> str:
         """
@@ -173,10 +331,22 @@ class APIKeyStore:
         Returns:
             The plain-text key (only returned once - cannot be retrieved later).
         """
-        plain_key = secrets.token_urlsafe(32)
+        key_id = secrets.token_hex(KEY_ID_LENGTH // 2)
+        plain_key = f"{KEY_PREFIX}{key_id}_{secrets.token_urlsafe(32)}"
         hashed_key = self._hash_key(plain_key)
+        try:
+            with self._lock, self._conn:
+                self._conn.execute(
+                    "INSERT INTO api_keys (user_id, key_id, key_hash, created_at) "
+                    "VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(user_id) DO UPDATE SET key_id = excluded.key_id, "
+                    "key_hash = excluded.key_hash, created_at = excluded.created_at",
+                    (user_id, key_id, hashed_key, datetime.now(timezone.utc).isoformat()),
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Error saving API key: {e}")
+        self._forget_user(user_id)
         self._cache[user_id] = hashed_key
-        self._save()
         logger.info(f"Created new API key for user: {user_id}")
         return plain_key
 
@@ -194,6 +364,53 @@ class APIKeyStore:
             return None  # Key exists but cannot be retrieved
         return self.create_key(user_id)
 
+    def _cache_digest(self, api_key: str) -> bytes:
+        return hmac.new(self._verify_secret, api_key.encode("utf-8"), hashlib.sha256).digest()
+
+    def _remember(self, digest: bytes, user_id: str, stored_hash: str) -> None:
+        if self.verify_cache_size <= 0:
+            return
+        with self._lock:
+            self._verified[digest] = (user_id, stored_hash, time.monotonic())
+            self._verified.move_to_end(digest)
+            while len(self._verified) > self.verify_cache_size:
+                self._verified.popitem(last=False)
+
+    def _legacy_scan_enabled(self) -> bool:
+        """Whether keys without a key id are still looked up by scanning."""
+        if not self.legacy_scan:
+            return False
+        return self.legacy_scan_until is None or datetime.now(timezone.utc) < self.legacy_scan_until
+
+    def _recently_rejected(self, digest: bytes) -> bool:
+        with self._lock:
+            rejected_at = self._rejected.get(digest)
+            if rejected_at is None:
+                return False
+            if time.monotonic() - rejected_at < self.verify_cache_ttl:
+                return True
+            del self._rejected[digest]
+            return False
+
+    def _remember_rejected(self, digest: bytes) -> None:
+        if self.rejected_cache_size <= 0:
+            return
+        with self._lock:
+            self._rejected[digest] = time.monotonic()
+            self._rejected.move_to_end(digest)
+            while len(self._rejected) > self.rejected_cache_size:
+                self._rejected.popitem(last=False)
+
+    def _lookup_key_id(self, key_id: str) -> Optional[Tuple[str, str]]:
+        try:
+            with self._lock:
+                return self._conn.execute(
+                    "SELECT user_id, key_hash FROM api_keys WHERE key_id = ?", (key_id,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.error(f"Error looking up API key: {e}")
+            return None
+
     def verify_key(self, api_key: str) -> Optional[str]:
         """
         Verify an API key and return the associated user_id.
@@ -207,35 +424,50 @@ class APIKeyStore:
         Returns:
             The user_id if valid, None otherwise.
         """
-        digest = hashlib.scrypt(
-            api_key.encode("utf-8"),
-            salt=self._index_salt,
-            n=2**11,
-            r=8,
-            p=1,
-        ).hex()
-        cached_user = self._verified_index.get(digest)
-        if cached_user is not None:
-            # Re-check against the stored hash so revoked/rotated keys can
-            # never be replayed from the index.
-            stored_hash = self._cache.get(cached_user)
-            if stored_hash and not self._is_legacy_hash(stored_hash) and self._verify_bcrypt(
+        if not api_key:
+            return None
+
+        digest = self._cache_digest(api_key)
+        entry = self._verified.get(digest)
+        if entry is not None:
+            user_id, verified_hash, verified_at = entry
+            if (
+                time.monotonic() - verified_at < self.verify_cache_ttl
+                and self._cache.get(user_id) == verified_hash
+            ):
+                return user_id
+            with self._lock:
+                self._verified.pop(digest, None)
+
+        key_id = parse_key_id(api_key)
+        if key_id is not None:
+            row = self._lookup_key_id(key_id)
+            if row is None:
+                return None
+            user_id, stored_hash = row
+            if self._is_legacy_hash(stored_hash) or not self._verify_bcrypt(
                 api_key, stored_hash
             ):
-                return cached_user
-            self._verified_index.pop(digest, None)
-
+                return None
+            self._cache[user_id] = stored_hash
+            self._remember(digest, user_id, stored_hash)
+            return user_id
+
+        # Keys issued before key ids existed: only their rows need scanning.
+        if not self._unindexed_users or not self._legacy_scan_enabled():
+            return None
+        if self._recently_rejected(digest):
+            return None
         result = None
-        for user_id, stored_hash in self._cache.items():
-            if self._is_legacy_hash(stored_hash):
-                continue
-
+        for user_id in list(self._unindexed_users):
+            stored_hash = self._cache.get(user_id)
             # Bcrypt hash - bcrypt.checkpw uses constant-time comparison
-            if self._verify_bcrypt(api_key, stored_hash):
+            if stored_hash and self._verify_bcrypt(api_key, stored_hash):
                 if result is None:
                     result = user_id
-        if result is not None:
-            self._verified_index[digest] = result
+                    self._remember(digest, user_id, stored_hash)
+        if result is None:
+            self._remember_rejected(digest)
         return result
 
     def upgrade_legacy_hash(self, user_id: str, api_key: str) -> bool:
@@ -287,9 +519,16 @@ class APIKeyStore:
         Returns:
             True if key was revoked, False if user had no key.
         """
-        if user_id in self._cache:
-            del self._cache[user_id]
-            self._save()
+        try:
+            with self._lock, self._conn:
+                deleted = self._conn.execute(
+                    "DELETE FROM api_keys WHERE user_id = ?", (user_id,)
+                ).rowcount
+        except sqlite3.Error as e:
+            logger.error(f"Error revoking API key: {e}")
+            deleted = 0
+        if deleted or user_id in self._cache:
+            self._forget_user(user_id)
             logger.info(f"Revoked API key for user: {user_id}")
             return True
         return False
@@ -306,6 +545,16 @@ class APIKeyStore:
         """
         return user_id in self._cache
 
+    def cache_stats(self) -> Dict[str, int]:
+        """Sizes of the verified and rejected key caches and of the unindexed key scan."""
+        return {
+            "verified_keys": len(self._verified),
+            "max_verified_keys": self.verify_cache_size,
+            "unindexed_keys": len(self._unindexed_users),
+            "rejected_keys": len(self._rejected),
+            "legacy_scan": self._legacy_scan_enabled(),
+        }
+
 
 # Initialize API key storage singleton
 api_key_store = APIKeyStore()
@@ -49,6 +49,7 @@ from src.organizations import (
     get_organization_service,
     log_authorization_failure,
 )
+from src.organizations.authz_cache import resolve_principal
 from src.types.organization import OrganizationPlanTier, OrganizationRole
 
 logger = logging.getLogger(__name__)
@@ -143,6 +144,7 @@ class OrganizationAuthContext:
 async def require_org_scoped_api_key(
     x_organization_id: Optional[str] = Header(None, alias="X-Organization-ID"),
     user_id: str = Depends(verify_api_key),
+    request: Request = None,
 ) -> OrganizationAuthContext:
     """
     Authenticate API key and optionally resolve organization context.
@@ -154,9 +156,14 @@ async def require_org_scoped_api_key(
        - Loads their role and permissions
        - Loads organization quota information
 
+    Membership and quota come from the request-scoped / short-TTL
+    authorization cache, so integrations repeating the same key do not hit
+    the database on every call.
+
     Args:
         x_organization_id: Optional organization ID from header.
         user_id: The authenticated user ID from API key.
+        request: The current request (lookups are memoized on it).
 
     Returns:
         OrganizationAuthContext with user and optional org details.
@@ -174,13 +181,12 @@ async def require_org_scoped_api_key(
         )
 
     try:
-        org_service = get_organization_service()
-
-        # Get organization and verify it exists
-        org = await org_service.get_organization(x_organization_id)
-
-        # Get user's role in organization
-        role = await org_service.get_member_role(x_organization_id, user_id)
+        # Get organization (verifying it exists) and user's role in it
+        principal = await resolve_principal(
+            get_organization_service(), x_organization_id, user_id, request
+        )
+        org = principal.organization
+        role = principal.context.role
 
         if role is None:
             # User is not a member of this organization
@@ -38,6 +38,7 @@ from src.organizations import (
     get_organization_service,
     log_authorization_failure,
 )
+from src.organizations.authz_cache import resolve_principal
 from src.types.organization import OrganizationRole
 
 logger = logging.getLogger(__name__)
@@ -111,6 +112,7 @@ async def get_organization_id_from_path(
 async def get_current_organization(
     organization_id: str = Depends(get_organization_id_from_path),
     user_id: str = Depends(verify_api_key),
+    request: Request = None,
 ):
     """
     Get the current organization and verify membership.
@@ -118,6 +120,7 @@ async def get_current_organization(
     Args:
         organization_id: The organization ID from path.
         user_id: The authenticated user ID.
+        request: The current request (lookups are memoized on it).
 
     Returns:
         The organization.
@@ -126,15 +129,15 @@ async def get_current_organization(
         HTTPException: If organization not found or user not a member.
     """
     try:
-        org_service = get_organization_service()
-        org = await org_service.get_organization(organization_id)
+        principal = await resolve_principal(
+            get_organization_service(), organization_id, user_id, request
+        )
 
         # Verify membership
-        member = await org_service.get_member(organization_id, user_id)
-        if not member:
+        if not principal.context.is_org_member:
             raise NotOrganizationMemberError(organization_id)
 
-        return org
+        return principal.organization
 
     except OrganizationNotFoundError:
         raise HTTPException(
@@ -154,16 +157,20 @@ async def get_current_organization(
 async def get_organization_context(
     organization_id: str = Depends(get_organization_id_from_path),
     user_id: str = Depends(verify_api_key),
+    request: Request = None,
 ) -> AuthorizationContext:
     """
     Get authorization context for the current request.
 
     This dependency fetches the user's role in the organization and
-    creates an AuthorizationContext for permission checking.
+    creates an AuthorizationContext for permission checking. Lookups are
+    memoized per request and cached briefly per principal
+    (see src/organizations/authz_cache.py).
 
     Args:
         organization_id: The organization ID from path.
         user_id: The authenticated user ID.
+        request: The current request (lookups are memoized on it).
 
     Returns:
         AuthorizationContext with user's permissions.
@@ -172,23 +179,15 @@ async def get_organization_context(
         HTTPException: If organization not found or user not a member.
     """
     try:
-        org_service = get_organization_service()
-
-        # Verify organization exists
-        await org_service.get_organization(organization_id)
-
-        # Get user's role in organization
-        role = await org_service.get_member_role(organization_id, user_id)
+        # Verifies the organization exists and gets the user's role in it
+        principal = await resolve_principal(
+            get_organization_service(), organization_id, user_id, request
+        )
 
-        if role is None:
+        if principal.context.role is None:
             raise NotOrganizationMemberError(organization_id)
 
-        return AuthorizationContext(
-            user_id=user_id,
-            organization_id=organization_id,
-            role=role,
-            is_org_member=True,
-        )
+        return principal.context
 
     except OrganizationNotFoundError:
         raise HTTPException(
@@ -208,6 +207,7 @@ async def get_organization_context(
 async def get_optional_organization_context(
     x_organization_id: Optional[str] = Header(None, alias="X-Organization-ID"),
     user_id: str = Depends(verify_api_key),
+    request: Request = None,
 ) -> AuthorizationContext:
     """
     Get authorization context with optional organization.
@@ -217,6 +217,7 @@ async def get_optional_organization_context(
     Args:
         x_organization_id: Optional organization ID from header.
         user_id: The authenticated user ID.
+        request: The current request (lookups are memoized on it).
 
     Returns:
         AuthorizationContext (with or without organization).
@@ -230,20 +231,11 @@ async def get_optional_organization_context(
         )
 
     try:
-        org_service = get_organization_service()
-
-        # Verify organization exists
-        await org_service.get_organization(x_organization_id)
-
-        # Get user's role in organization
-        role = await org_service.get_member_role(x_organization_id, user_id)
-
-        return AuthorizationContext(
-            user_id=user_id,
-            organization_id=x_organization_id,
-            role=role,
-            is_org_member=role is not None,
+        # Verifies the organization exists and gets the user's role in it
+        principal = await resolve_principal(
+            get_organization_service(), x_organization_id, user_id, request
         )
+        return principal.context
 
     except OrganizationNotFoundError:
         # Organization not found - treat as no organization context
@@ -360,6 +360,7 @@ async def generate_blog(
                 "passed": seo_result.passed,
                 "passes_used": seo_result.passes_used,
                 "suggestions_applied": seo_result.suggestions_applied,
+                "sections_rewritten": seo_result.sections_rewritten,
             }
 
         if fact_check_result:
@@ -8,6 +8,7 @@ Authorization:
 - All endpoints require an authenticated user (Clerk session JWT via `Authorization: Bearer ...`).
 """
 
+import asyncio
 import logging
 import uuid
 from typing import Any, Dict, List, Optional, Set
@@ -40,7 +41,7 @@ ALLOWED_HTML_TAGS: Set[str] = {
 from src.brand.analyzer import VoiceAnalyzer
 from src.brand.scorer import VoiceScorer
 from src.brand.storage import get_brand_voice_storage
-from src.brand.trainer import VoiceTrainer
+from src.brand.trainer import VoiceTrainer, remove_sample_from_fingerprint
 from src.types.brand import (
     ContentType,
     SampleAnalysis,
@@ -232,6 +233,10 @@ class ScoreContentRequest(BaseModel):
     content: str = Field(..., min_length=20, max_length=50000, description="Content to score")
     content_type: str = Field(default="text", max_length=20)
     provider: str = Field(default="openai")
+    include_feedback: bool = Field(
+        default=False,
+        description="Generate LLM feedback if none is cached (cached feedback is always returned)",
+    )
 
     @field_validator("profile_id")
     @classmethod
@@ -424,6 +429,7 @@ async def delete_sample(
     """
     try:
         storage = get_brand_voice_storage()
+        samples = await storage.get_samples(user_id, profile_id)
         deleted = await storage.delete_sample(user_id, profile_id, sample_id)
 
         if not deleted:
@@ -432,12 +438,18 @@ async def delete_sample(
                 detail="Sample not found"
             )
 
-        samples = await storage.get_samples(user_id, profile_id)
+        # Subtract the sample from the trained fingerprint instead of retraining
+        sample = next((s for s in samples if s.id == sample_id), None)
+        fingerprint = await storage.get_fingerprint(user_id, profile_id)
+        if sample and fingerprint:
+            updated = remove_sample_from_fingerprint(fingerprint, sample)
+            if updated:
+                await storage.save_fingerprint(user_id, updated)
 
         return {
             "success": True,
             "message": "Sample deleted",
-            "remaining_samples": len(samples),
+            "remaining_samples": len(samples) - 1,
         }
     except HTTPException:
         raise
@@ -487,22 +499,24 @@ async def train_voice(
                     detail="No matching samples found"
                 )
 
+        # Only samples added since the last training run are analyzed
+        previous = await storage.get_fingerprint(user_id, request.profile_id)
         trainer = VoiceTrainer(request.provider)
-        fingerprint = trainer.train(request.profile_id, samples)
+        fingerprint = await asyncio.to_thread(
+            trainer.train, request.profile_id, samples, previous
+        )
 
         # Store fingerprint
         await storage.save_fingerprint(user_id, fingerprint)
 
-        # Update sample analysis status for all samples in profile
-        all_samples = await storage.get_samples(user_id, request.profile_id)
-        for sample in all_samples:
-            if not sample.is_analyzed:
-                # Mark as analyzed (analysis was done during training)
+        # Persist analyses computed during training
+        for sample in samples:
+            if not sample.is_analyzed and sample.analysis_result is not None:
                 await storage.update_sample_analysis(
                     user_id,
                     sample.id,
-                    sample.analysis_result or SampleAnalysis(),
-                    sample.quality_score
+                    sample.analysis_result,
+                    sample.analysis_result.quality_score,
                 )
 
         return TrainVoiceResponse(
@@ -602,7 +616,13 @@ async def score_content(
             content_type = ContentType.TEXT
 
         scorer = VoiceScorer(request.provider)
-        score = scorer.score(request.content, fingerprint, content_type)
+        score = await asyncio.to_thread(
+            scorer.score,
+            request.content,
+            fingerprint,
+            content_type,
+            request.include_feedback,
+        )
 
         # Determine grade
         grade = (
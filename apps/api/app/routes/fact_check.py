@@ -5,12 +5,12 @@ Fact-checking API endpoints.
 import asyncio
 import logging
 from functools import partial
-from typing import Optional
+from typing import Annotated, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
-from src.fact_checking.fact_checker import check_facts
+from src.fact_checking.fact_checker import check_facts, check_facts_batch
 from src.organizations import AuthorizationContext
 from src.text_generation.core import GenerationOptions
 
@@ -30,6 +30,40 @@ class FactCheckRequest(BaseModel):
     )
 
 
+class BatchFactCheckRequest(BaseModel):
+    contents: list[Annotated[str, Field(min_length=10, max_length=50000)]] = Field(
+        ...,
+        min_length=1,
+        max_length=20,
+        description="Documents to check; claims shared between them are validated once",
+    )
+    sources: Optional[list[dict]] = Field(
+        default=None,
+        description="Optional sources shared by all documents (title, url, snippet dicts)",
+    )
+
+
+def _result_data(result) -> dict:
+    return {
+        "overall_confidence": result.overall_confidence,
+        "verified_count": result.verified_count,
+        "unverified_count": result.unverified_count,
+        "contradicted_count": result.contradicted_count,
+        "summary": result.summary,
+        "claims": [
+            {
+                "text": v.claim.text,
+                "claim_type": v.claim.claim_type.value,
+                "status": v.status.value,
+                "confidence": v.confidence,
+                "explanation": v.explanation,
+                "supporting_sources": v.supporting_sources,
+            }
+            for v in result.claims
+        ],
+    }
+
+
 @router.post(
     "",
     status_code=status.HTTP_200_OK,
@@ -57,22 +91,37 @@ async def fact_check_content(
 
     return {
         "success": True,
-        "data": {
-            "overall_confidence": result.overall_confidence,
-            "verified_count": result.verified_count,
-            "unverified_count": result.unverified_count,
-            "contradicted_count": result.contradicted_count,
-            "summary": result.summary,
-            "claims": [
-                {
-                    "text": v.claim.text,
-                    "claim_type": v.claim.claim_type.value,
-                    "status": v.status.value,
-                    "confidence": v.confidence,
-                    "explanation": v.explanation,
-                    "supporting_sources": v.supporting_sources,
-                }
-                for v in result.claims
-            ],
-        },
+        "data": _result_data(result),
+    }
+
+
+@router.post(
+    "/batch",
+    status_code=status.HTTP_200_OK,
+    summary="Check facts in several documents",
+)
+async def fact_check_batch(
+    request: BatchFactCheckRequest,
+    auth_ctx: AuthorizationContext = Depends(require_content_creation),
+):
+    """
+    Extract and verify factual claims across several documents.
+
+    Claims are extracted in batched calls and deduplicated across the
+    documents, so a claim that several documents share is verified once.
+    If no sources are provided, web research is run once for the batch.
+    """
+    await require_pro_tier(auth_ctx.user_id)
+
+    results = await asyncio.to_thread(
+        partial(
+            check_facts_batch,
+            contents=request.contents,
+            sources=request.sources,
+        )
+    )
+
+    return {
+        "success": True,
+        "data": [_result_data(result) for result in results],
     }
@@ -21,7 +21,12 @@ from fastapi.responses import JSONResponse
 
 from app.auth import verify_api_key
 from src.config import Settings, get_settings
-from src.db import get_database_url, is_database_configured, fetchrow as db_fetchrow
+from src.db import (
+    get_database_url,
+    get_pool_stats,
+    is_database_configured,
+    fetchrow as db_fetchrow,
+)
 from src.storage import redis_client as _redis_client_instance
 
 logger = logging.getLogger(__name__)
@@ -339,6 +344,7 @@ async def _get_full_database_status() -> Dict[str, Any]:
             "connected": bool(response),
             "latency_ms": latency_ms,
             "tables_accessible": True,
+            "pools": get_pool_stats(),
         }
     except Exception:
         logger.warning("Database health check failed", exc_info=True)
@@ -480,7 +486,8 @@ async def database_health(_: str = Depends(verify_api_key)) -> Dict[str, Any]:
     """
     Detailed database health check.
 
-    Returns comprehensive information about Postgres (Neon) connectivity.
+    Returns comprehensive information about Postgres (Neon) connectivity,
+    including per-pool sizing and connection acquire-wait metrics.
     """
     db_status = await _get_full_database_status()
 
@@ -558,7 +565,16 @@ async def cache_stats(_: str = Depends(verify_api_key)) -> Dict[str, Any]:
 
     Returns hit rates and sizes for all caches.
     """
-    from src.utils.cache import get_content_analysis_cache, get_voice_analysis_cache
+    from app.auth import api_key_store
+    from src.organizations.authz_cache import get_authorization_timings
+    from src.storage.query_cache import get_query_cache
+    from src.utils.cache import (
+        get_content_analysis_cache,
+        get_fact_check_cache,
+        get_text_analysis_cache,
+        get_voice_analysis_cache,
+        get_voice_feedback_cache,
+    )
 
     content_cache = get_content_analysis_cache()
     voice_cache = get_voice_analysis_cache()
@@ -568,6 +584,12 @@ async def cache_stats(_: str = Depends(verify_api_key)) -> Dict[str, Any]:
         "caches": {
             "content_analysis": content_cache.stats,
             "voice_analysis": voice_cache.stats,
+            "voice_feedback": get_voice_feedback_cache().stats,
+            "text_analysis": get_text_analysis_cache().stats,
+            "fact_check": get_fact_check_cache().stats,
+            "query": get_query_cache().stats,
+            "authorization": get_authorization_timings(),
+            "api_keys": api_key_store.cache_stats(),
         },
     }
 
@@ -579,7 +601,13 @@ async def cleanup_caches(_: str = Depends(verify_api_key)) -> Dict[str, Any]:
 
     Returns count of removed entries from each cache.
     """
-    from src.utils.cache import get_content_analysis_cache, get_voice_analysis_cache
+    from src.storage.query_cache import get_query_cache
+    from src.utils.cache import (
+        get_content_analysis_cache,
+        get_fact_check_cache,
+        get_voice_analysis_cache,
+        get_voice_feedback_cache,
+    )
 
     content_cache = get_content_analysis_cache()
     voice_cache = get_voice_analysis_cache()
@@ -592,6 +620,9 @@ async def cleanup_caches(_: str = Depends(verify_api_key)) -> Dict[str, Any]:
         "cleaned": {
             "content_analysis": content_cleaned,
             "voice_analysis": voice_cleaned,
+            "voice_feedback": get_voice_feedback_cache().cleanup_expired(),
+            "query": get_query_cache().cleanup_expired(),
+            "fact_check": get_fact_check_cache().cleanup_expired(),
         },
     }
 
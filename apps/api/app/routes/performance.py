@@ -7,12 +7,15 @@ Provides endpoints for:
 - Getting performance summaries and trends
 - SEO ranking data
 - Content recommendations
+- Streaming CSV/NDJSON/Parquet exports
 """
 
 import logging
+from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from ..auth import verify_api_key
@@ -217,6 +220,13 @@ def get_recommendation_engine():
     return RecommendationEngine()
 
 
+def get_dashboard_service():
+    """Get the dashboard service instance."""
+    from src.analytics.dashboard_service import DashboardService
+
+    return DashboardService()
+
+
 # =============================================================================
 # Tracking Endpoints
 # =============================================================================
@@ -794,13 +804,15 @@ async def get_keyword_ranking_history(
 async def get_recommendations(
     organization_id: Optional[str] = Query(default=None),
     limit_per_type: int = Query(default=3, ge=1, le=10),
+    incremental: bool = Query(default=True),
     user_id: str = Depends(verify_api_key),
 ):
     """
     Get AI-powered content recommendations.
 
     Returns topic suggestions, optimal posting times, and format recommendations
-    based on historical performance data.
+    based on historical performance data. With ``incremental`` (the default)
+    only content updated since the previous request is re-read.
     """
     try:
         engine = get_recommendation_engine()
@@ -809,6 +821,7 @@ async def get_recommendations(
             organization_id=organization_id,
             user_id=user_id,
             limit_per_type=limit_per_type,
+            incremental=incremental,
         )
 
         return [
@@ -916,3 +929,77 @@ async def get_timing_recommendations(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(e),
         )
+
+
+# =============================================================================
+# Export Endpoints
+# =============================================================================
+
+_EXPORT_FORMAT_PATTERN = "^(csv|ndjson|parquet|arrow)$"
+
+
+def _export_response(chunks, format: str, name: str) -> StreamingResponse:
+    from src.analytics.export import EXPORT_EXTENSIONS, EXPORT_MEDIA_TYPES
+
+    filename = f"{name}-{datetime.utcnow():%Y%m%d}.{EXPORT_EXTENSIONS[format]}"
+    return StreamingResponse(
+        chunks,
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/export")
+async def export_performance(
+    format: str = Query(default="csv", pattern=_EXPORT_FORMAT_PATTERN),
+    time_range: str = Query(default="30d", pattern="^(1h|24h|7d|30d|90d|365d|all)$"),
+    organization_id: Optional[str] = Query(default=None),
+    page_size: Optional[int] = Query(default=None, ge=1, le=50000),
+    user_id: str = Depends(verify_api_key),
+):
+    """
+    Stream content performance data.
+
+    Rows are paged from the database and written as they arrive, so exports
+    of any size start immediately and use bounded memory. Parquet and Arrow
+    require pyarrow on the server.
+    """
+    from src.types.performance import PerformanceTimeRange
+
+    try:
+        chunks = get_dashboard_service().stream_performance_export(
+            format=format,
+            time_range=PerformanceTimeRange(time_range),
+            organization_id=organization_id,
+            page_size=page_size,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return _export_response(chunks, format, "performance")
+
+
+@router.get("/export/seo")
+async def export_seo_rankings(
+    format: str = Query(default="csv", pattern=_EXPORT_FORMAT_PATTERN),
+    days: int = Query(default=30, ge=1, le=365),
+    organization_id: Optional[str] = Query(default=None),
+    page_size: Optional[int] = Query(default=None, ge=1, le=50000),
+    user_id: str = Depends(verify_api_key),
+):
+    """
+    Stream SEO ranking history, newest first.
+
+    Same streaming behaviour and formats as ``/performance/export``.
+    """
+    try:
+        chunks = get_dashboard_service().stream_seo_export(
+            format=format,
+            organization_id=organization_id,
+            days=days,
+            page_size=page_size,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return _export_response(chunks, format, "seo-rankings")
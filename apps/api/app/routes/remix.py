@@ -9,9 +9,12 @@ Authorization:
 - Pass the organization ID via X-Organization-ID header for org-scoped access
 """
 
+import json
+import logging
 from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from src.config import get_settings
@@ -33,6 +36,8 @@ from ..error_handlers import sanitize_error_message
 from ..middleware import increment_usage_for_operation, require_pro_tier, require_quota
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/remix", tags=["Content Remix"])
 
 _ALLOWED_PROVIDERS = {"openai", "anthropic", "gemini"}
@@ -179,7 +184,7 @@ async def analyze_content(
 
     provider = _normalize_provider(request.provider)
     analyzer = ContentAnalyzer(provider)
-    analysis = analyzer.analyze(request.source_content)
+    analysis = await analyzer.analyze_async(request.source_content)
 
     return {
         "success": True,
@@ -226,27 +231,8 @@ async def preview_remix(
     return await service.preview(preview_request)
 
 
-@router.post("/transform", response_model=RemixResponse)
-async def transform_content(
-    request: RemixRequestAPI,
-    _tier: str = Depends(require_pro_tier),
-    auth_ctx: AuthorizationContext = Depends(require_content_creation),
-):
-    """
-    Transform content into multiple formats.
-
-    This is the main remix endpoint. It:
-    1. Analyzes the source content
-    2. Transforms to each requested format in parallel
-    3. Scores quality of each transformation
-    4. Returns all transformed content with metrics
-
-    **Authorization:** Requires content.create permission in the organization.
-    """
-    # Use organization_id for scoping if available, fallback to user_id
-    scope_id = auth_ctx.organization_id or auth_ctx.user_id
-    user_id = auth_ctx.user_id
-    # Validate formats
+def _build_remix_request(request: RemixRequestAPI) -> RemixRequest:
+    """Validate target formats and build the internal remix request."""
     target_formats = []
     for fmt_str in request.target_formats:
         try:
@@ -269,8 +255,7 @@ async def transform_content(
             detail="Maximum 10 formats per request"
         )
 
-    # Create internal request
-    remix_request = RemixRequest(
+    return RemixRequest(
         source_content=request.source_content,
         target_formats=target_formats,
         preserve_voice=request.preserve_voice,
@@ -279,13 +264,8 @@ async def transform_content(
         conversation_id=request.conversation_id,
     )
 
-    # Get service with specified provider
-    provider = _normalize_provider(request.provider)
-    service = get_remix_service(provider)
 
-    result = await service.remix(remix_request, user_id=user_id)
-
-    # Increment usage after successful transformation
+async def _record_remix_usage(user_id: str, target_formats: List[ContentFormat]) -> None:
     await increment_usage_for_operation(
         user_id=user_id,
         operation_type="remix",
@@ -296,9 +276,89 @@ async def transform_content(
         },
     )
 
+
+@router.post("/transform", response_model=RemixResponse)
+async def transform_content(
+    request: RemixRequestAPI,
+    _tier: str = Depends(require_pro_tier),
+    auth_ctx: AuthorizationContext = Depends(require_content_creation),
+):
+    """
+    Transform content into multiple formats.
+
+    This is the main remix endpoint. It:
+    1. Analyzes the source content
+    2. Transforms to each requested format in parallel
+    3. Scores quality of each transformation
+    4. Returns all transformed content with metrics
+
+    **Authorization:** Requires content.create permission in the organization.
+    """
+    user_id = auth_ctx.user_id
+    remix_request = _build_remix_request(request)
+
+    # Get service with specified provider
+    provider = _normalize_provider(request.provider)
+    service = get_remix_service(provider)
+
+    result = await service.remix(remix_request, user_id=user_id)
+
+    # Increment usage after successful transformation
+    await _record_remix_usage(user_id, remix_request.target_formats)
+
     return result
 
 
+@router.post(
+    "/transform/stream",
+    responses={
+        200: {
+            "description": "SSE stream started",
+            "content": {"text/event-stream": {}},
+        },
+    },
+)
+async def transform_content_stream(
+    request: RemixRequestAPI,
+    _tier: str = Depends(require_pro_tier),
+    auth_ctx: AuthorizationContext = Depends(require_content_creation),
+) -> StreamingResponse:
+    """
+    Transform content into multiple formats, streaming each format as it completes.
+
+    Server-Sent Events: ``analysis`` (source analysis), then one ``format``
+    (a remixed content piece) or ``error`` event per target format in
+    completion order, then ``complete`` with the full /transform response.
+
+    **Authorization:** Requires content.create permission in the organization.
+    """
+    user_id = auth_ctx.user_id
+    remix_request = _build_remix_request(request)
+    provider = _normalize_provider(request.provider)
+    service = get_remix_service(provider)
+
+    async def generate_sse_events():
+        try:
+            async for event in service.remix_stream(remix_request, user_id=user_id):
+                data = event.data.model_dump(mode="json") if isinstance(event.data, BaseModel) else event.data
+                yield f"event: {event.type}\ndata: {json.dumps(data)}\n\n"
+                if event.type == "complete" and event.data.success:
+                    await _record_remix_usage(user_id, remix_request.target_formats)
+        except Exception as exc:
+            logger.error("Streaming remix error: %s", exc, exc_info=True)
+            yield f"event: error\ndata: {json.dumps({'error': 'An unexpected error occurred.'})}\n\n"
+
+    return StreamingResponse(
+        generate_sse_events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post("/transform/{format_id}")
 async def transform_single_format(
     format_id: str,
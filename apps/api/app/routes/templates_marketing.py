@@ -24,6 +24,7 @@ from src.templates.template_engine import (
     get_categories,
     get_template,
     get_templates_by_category,
+    search_templates,
 )
 from src.types.providers import GenerationOptions
 
@@ -87,6 +88,10 @@ class TemplateGenerateRequest(BaseModel):
         default=None,
         description="Generation options with validated ranges",
     )
+    use_cache: bool = Field(
+        default=False,
+        description="Reuse a memoized result for identical inputs",
+    )
 
     @field_validator("fields")
     @classmethod
@@ -142,6 +147,7 @@ class TemplateGenerateResponse(BaseModel):
     raw_text: str = ""
     execution_time_ms: int = 0
     error: Optional[str] = None
+    cached: bool = False
 
 
 # ---------------------------------------------------------------------------
@@ -174,7 +180,9 @@ async def list_marketing_templates(
     Returns template metadata without the raw prompt template.
     """
     try:
-        if category:
+        if search:
+            templates = search_templates(search, category or None)
+        elif category:
             templates = get_templates_by_category(category)
         else:
             templates = get_all_templates()
@@ -184,14 +192,6 @@ async def list_marketing_templates(
             detail={"error": sanitize_error_message(str(exc)), "success": False},
         )
 
-    # Apply search filter if provided
-    if search:
-        term = search.lower()
-        templates = [
-            t for t in templates
-            if term in t["name"].lower() or term in t["description"].lower()
-        ]
-
     return TemplateListResponse(
         success=True,
         data=templates,
@@ -291,6 +291,7 @@ async def generate_template_content(
             fields=request.fields,
             provider_type=request.provider_type,
             options=gen_options,
+            use_cache=request.use_cache,
         )
     except Exception as exc:
         logger.error(
@@ -340,4 +341,5 @@ async def generate_template_content(
         raw_text=result["raw_text"],
         execution_time_ms=result["execution_time_ms"],
         error=None,
+        cached=result.get("cached", False),
     )
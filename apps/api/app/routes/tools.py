@@ -11,11 +11,13 @@ This module provides endpoints for:
 """
 
 import asyncio
+import json
 import logging
+import time
 from typing import List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 
 from ..auth import verify_api_key
@@ -25,6 +27,7 @@ from ..middleware import increment_usage_for_operation, require_pro_tier, requir
 from src.scoring import score_content
 from src.tools import (
     ToolCategory,
+    ToolExecutionError,
     ToolExecutionRequest,
     ToolExecutionResult,
     ToolListResponse,
@@ -97,6 +100,10 @@ class ToolExecuteRequest(BaseModel):
         default=None,
         description="Generation options with validated ranges"
     )
+    use_cache: bool = Field(
+        default=False,
+        description="Reuse a memoized output for identical inputs"
+    )
 
     @field_validator("brand_profile_id")
     @classmethod
@@ -137,10 +144,7 @@ async def list_tools(
     - Paginate results
     """
     registry = get_registry()
-
-    # Auto-discover tools if registry is empty
-    if len(registry._tools) == 0:
-        registry.auto_discover()
+    registry.ensure_loaded()
 
     # Parse category if provided
     category_enum = None
@@ -177,10 +181,7 @@ async def list_categories(
     List all tool categories with their metadata and tool counts.
     """
     registry = get_registry()
-
-    # Auto-discover if needed
-    if len(registry._tools) == 0:
-        registry.auto_discover()
+    registry.ensure_loaded()
 
     return registry.list_categories()
 
@@ -193,10 +194,7 @@ async def get_stats(
     Get statistics about the tool registry.
     """
     registry = get_registry()
-
-    # Auto-discover if needed
-    if len(registry._tools) == 0:
-        registry.auto_discover()
+    registry.ensure_loaded()
 
     return registry.get_stats()
 
@@ -217,10 +215,7 @@ async def get_tool(
     - Examples
     """
     registry = get_registry()
-
-    # Auto-discover if needed
-    if len(registry._tools) == 0:
-        registry.auto_discover()
+    registry.ensure_loaded()
 
     if not registry.has_tool(tool_id):
         raise HTTPException(
@@ -247,10 +242,7 @@ async def execute_tool(
     - error: Error message if failed
     """
     registry = get_registry()
-
-    # Auto-discover if needed
-    if len(registry._tools) == 0:
-        registry.auto_discover()
+    registry.ensure_loaded()
 
     if not registry.has_tool(tool_id):
         raise HTTPException(
@@ -289,6 +281,7 @@ async def execute_tool(
         inputs=inputs,
         provider_type=request.provider_type,
         options=options_dict,
+        use_cache=request.use_cache,
     )
 
     # Execute the tool
@@ -332,10 +325,7 @@ async def get_tools_by_category(
     Get all tools in a specific category.
     """
     registry = get_registry()
-
-    # Auto-discover if needed
-    if len(registry._tools) == 0:
-        registry.auto_discover()
+    registry.ensure_loaded()
 
     try:
         category_enum = ToolCategory(category.lower())
@@ -360,10 +350,7 @@ async def validate_inputs(
     Returns validation errors if any, or empty list if valid.
     """
     registry = get_registry()
-
-    # Auto-discover if needed
-    if len(registry._tools) == 0:
-        registry.auto_discover()
+    registry.ensure_loaded()
 
     if not registry.has_tool(tool_id):
         raise HTTPException(
@@ -407,10 +394,7 @@ async def score_tool_content(
     - Improvement suggestions
     """
     registry = get_registry()
-
-    # Auto-discover if needed
-    if len(registry._tools) == 0:
-        registry.auto_discover()
+    registry.ensure_loaded()
 
     if not registry.has_tool(tool_id):
         raise HTTPException(
@@ -419,8 +403,7 @@ async def score_tool_content(
         )
 
     # Get tool category for content type weighting
-    tool = registry.get_tool(tool_id)
-    definition = tool.get_definition()
+    definition = registry.get_definition(tool_id)
     content_type = definition.metadata.category.value if hasattr(definition.metadata.category, 'value') else str(definition.metadata.category)
 
     # Score the content
@@ -472,6 +455,13 @@ class VariationExecuteRequest(BaseModel):
         default=None,
         description="Keywords for SEO scoring"
     )
+    single_call: bool = Field(
+        default=False,
+        description=(
+            "Request all variations in one provider call (n > 1) where the provider "
+            "supports it; variations then differ by sampling only"
+        ),
+    )
 
     @field_validator("brand_profile_id")
     @classmethod
@@ -492,27 +482,10 @@ class VariationExecuteRequest(BaseModel):
         return v
 
 
-@router.post("/{tool_id}/variations", response_model=VariationGenerationResult)
-async def generate_variations(
-    tool_id: str,
-    request: VariationExecuteRequest,
-    user_id: str = Depends(require_pro_tier),
-):
-    """
-    Generate multiple content variations for A/B testing.
-
-    Each variation uses slightly different parameters:
-    - Variation A: Standard temperature, default style
-    - Variation B: Higher temperature, more creative style
-    - Variation C: Lower temperature, more concise style
-
-    Returns all variations with optional scores for comparison.
-    """
+async def _prepare_variations(tool_id: str, request: VariationExecuteRequest, user_id: str):
+    """Resolve the tool, check remaining quota and apply the brand voice."""
     registry = get_registry()
-
-    # Auto-discover if needed
-    if len(registry._tools) == 0:
-        registry.auto_discover()
+    registry.ensure_loaded()
 
     if not registry.has_tool(tool_id):
         raise HTTPException(
@@ -556,14 +529,61 @@ async def generate_variations(
         except Exception as e:
             logger.debug("Failed to load brand voice fingerprint: %s", e)
 
+    return tool, inputs
+
+
+async def _record_variation_usage(
+    user_id: str,
+    tool_id: str,
+    request: VariationExecuteRequest,
+    generated_count: int,
+) -> None:
+    """Increment quota usage once per generated variation."""
+    for _ in range(generated_count):
+        await increment_usage_for_operation(
+            user_id=user_id,
+            operation_type="tool",
+            tokens_used=0,
+            metadata={
+                "tool_id": tool_id,
+                "provider_type": request.provider_type,
+                "variation": True,
+                "requested_variations": request.variation_count,
+                "generated_variations": generated_count,
+                "brand_profile_id": request.brand_profile_id,
+            },
+        )
+
+
+@router.post("/{tool_id}/variations", response_model=VariationGenerationResult)
+async def generate_variations(
+    tool_id: str,
+    request: VariationExecuteRequest,
+    user_id: str = Depends(require_pro_tier),
+):
+    """
+    Generate multiple content variations for A/B testing.
+
+    Each variation uses slightly different parameters:
+    - Variation A: Standard temperature, default style
+    - Variation B: Higher temperature, more creative style
+    - Variation C: Lower temperature, more concise style
+
+    Variations are generated and scored concurrently. With ``single_call``
+    (OpenAI only) all variations come from one provider call.
+
+    Returns all variations with optional scores for comparison.
+    """
+    tool, inputs = await _prepare_variations(tool_id, request, user_id)
+
     # Execute variations
-    result = await asyncio.to_thread(
-        tool.execute_variations,
+    result = await tool.execute_variations_async(
         inputs=inputs,
         variation_count=request.variation_count,
         provider_type=request.provider_type,
         include_scores=request.include_scores,
         keywords=request.keywords,
+        single_call=request.single_call,
     )
 
     if not result.success:
@@ -579,26 +599,80 @@ async def generate_variations(
             }
         )
 
-    # Increment quota usage once per generated variation.
-    generated_count = len(result.variations or [])
-    for _ in range(generated_count):
-        await increment_usage_for_operation(
-            user_id=user_id,
-            operation_type="tool",
-            tokens_used=0,
-            metadata={
-                "tool_id": tool_id,
-                "provider_type": request.provider_type,
-                "variation": True,
-                "requested_variations": request.variation_count,
-                "generated_variations": generated_count,
-                "brand_profile_id": request.brand_profile_id,
-            },
-        )
+    await _record_variation_usage(user_id, tool_id, request, len(result.variations or []))
 
     return result
 
 
+@router.post(
+    "/{tool_id}/variations/stream",
+    responses={
+        200: {
+            "description": "SSE stream started",
+            "content": {"text/event-stream": {}},
+        },
+    },
+)
+async def stream_variations(
+    tool_id: str,
+    request: VariationExecuteRequest,
+    user_id: str = Depends(require_pro_tier),
+) -> StreamingResponse:
+    """
+    Generate content variations, streaming each one as soon as it is ready.
+
+    Server-Sent Events: one ``variation`` event per generated variation in
+    completion order, then ``complete`` with the variation count, or
+    ``error`` if the inputs are invalid or every variation failed.
+    """
+    tool, inputs = await _prepare_variations(tool_id, request, user_id)
+
+    async def generate_sse_events():
+        start_time = time.time()
+        generated = 0
+        try:
+            async for variation in tool.stream_variations(
+                inputs,
+                variation_count=request.variation_count,
+                provider_type=request.provider_type,
+                include_scores=request.include_scores,
+                keywords=request.keywords,
+                single_call=request.single_call,
+            ):
+                generated += 1
+                yield f"event: variation\ndata: {json.dumps(variation.model_dump(mode='json'))}\n\n"
+        except ToolExecutionError as exc:
+            yield f"event: error\ndata: {json.dumps({'error': exc.message})}\n\n"
+            return
+        except Exception as exc:
+            logger.error("Streaming variations error: %s", exc, exc_info=True)
+            yield f"event: error\ndata: {json.dumps({'error': 'An unexpected error occurred.'})}\n\n"
+            return
+        finally:
+            if generated:
+                await _record_variation_usage(user_id, tool_id, request, generated)
+
+        if not generated:
+            yield f"event: error\ndata: {json.dumps({'error': 'All variation generations failed'})}\n\n"
+            return
+        complete = {
+            "tool_id": tool_id,
+            "variation_count": generated,
+            "execution_time_ms": int((time.time() - start_time) * 1000),
+        }
+        yield f"event: complete\ndata: {json.dumps(complete)}\n\n"
+
+    return StreamingResponse(
+        generate_sse_events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        },
+    )
+
+
 @router.post("/score", response_model=ContentScoreResult)
 async def score_content_generic(
     request: ContentScoreRequestBody,
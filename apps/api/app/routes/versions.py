@@ -27,6 +27,7 @@ from src.types.version import (
     ChangeType,
     CreateVersionRequest,
     CreateVersionResponse,
+    DiffGranularity,
     RestoreVersionResponse,
     VersionCompareResponse,
     VersionDetailResponse,
@@ -370,12 +371,16 @@ async def compare_versions(
     content_id: str,
     v1: int = Query(..., ge=1, description="First version number"),
     v2: int = Query(..., ge=1, description="Second version number"),
+    granularity: DiffGranularity = Query(
+        DiffGranularity.LINE, description="Diff unit for hunks: line, word or paragraph"
+    ),
     auth_ctx: AuthorizationContext = Depends(require_content_access),
 ) -> VersionCompareResponse:
     """
     Compare two versions of content.
 
-    Returns both versions with a unified diff showing the changes.
+    Returns both versions with a unified diff showing the changes, plus
+    structured hunks at the requested granularity.
 
     **Authorization:** Requires content.view permission in the organization.
 
@@ -383,6 +388,7 @@ async def compare_versions(
         content_id: The content UUID.
         v1: First version number.
         v2: Second version number.
+        granularity: Token unit for the structured hunks.
         auth_ctx: The authorization context with user and org info.
 
     Returns:
@@ -404,7 +410,9 @@ async def compare_versions(
 
     try:
         service = get_version_service()
-        comparison = await service.compare_versions(content_id, v1, v2)
+        comparison = await service.compare_versions(
+            content_id, v1, v2, granularity=granularity
+        )
 
         if not comparison:
             raise HTTPException(
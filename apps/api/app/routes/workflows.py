@@ -22,6 +22,7 @@ from pydantic import BaseModel, Field
 
 from src.config import get_settings
 from src.organizations import AuthorizationContext
+from src.storage.result_cache import get_result_cache
 from src.text_generation.core import GenerationOptions
 from src.workflows.preset_workflows import PRESET_WORKFLOWS, build_preset_workflow
 from src.workflows import workflow_store
@@ -100,6 +101,10 @@ class ExecuteWorkflowRequest(BaseModel):
         default=None,
         description="If set, execute a preset workflow instead of a custom one",
     )
+    use_cache: bool = Field(
+        default=False,
+        description="Reuse memoized outputs of deterministic steps with identical inputs",
+    )
 
 
 class CancelWorkflowRequest(BaseModel):
@@ -336,7 +341,9 @@ async def execute_workflow(
         provider=provider_type,
     )
 
-    engine = WorkflowEngine()
+    engine = WorkflowEngine(
+        result_cache=get_result_cache() if request.use_cache else None,
+    )
     _running_engines[execution_id] = engine
 
     options = GenerationOptions(
@@ -373,6 +380,7 @@ async def execute_workflow(
                 results=execution.results,
                 completed_at=execution.completed_at.isoformat() if execution.completed_at else None,
                 error=execution.error,
+                cached_steps=execution.cached_steps,
             )
 
             # Track usage on success.
@@ -470,6 +478,7 @@ async def get_execution_status(
         "completed_at": record.get("completed_at"),
         "error": record.get("error"),
         "results": record.get("results", {}),
+        "cached_steps": record.get("cached_steps", []),
     }
 
 
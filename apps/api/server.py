@@ -236,6 +236,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning("Failed to initialize organization schema: %s", e)
 
+    # Initialize research schema (kept off the request path)
+    try:
+        from src.research.research_store import ensure_research_schema
+        await ensure_research_schema()
+    except Exception as e:
+        logger.warning("Failed to initialize research schema: %s", e)
+
     yield
 
     # Cancel the reconciliation task on shutdown
@@ -249,12 +256,36 @@ async def lifespan(app: FastAPI):
         close_llm_clients()
     except Exception as e:
         logger.warning("Failed to close LLM clients: %s", e)
+    try:
+        from src.analytics.ingestion import shutdown_ingestion_pipeline
+
+        await shutdown_ingestion_pipeline()
+    except Exception as e:
+        logger.warning("Failed to flush analytics events: %s", e)
+    try:
+        from src.organizations.audit_service import shutdown_audit_service
+
+        await shutdown_audit_service()
+    except Exception as e:
+        logger.warning("Failed to flush audit log entries: %s", e)
     try:
         from src.db import close_pool
 
         await close_pool()
     except Exception as e:
         logger.warning("Failed to close Postgres pool: %s", e)
+    try:
+        from src.remix.executor import shutdown_remix_executor
+
+        shutdown_remix_executor()
+    except Exception as e:
+        logger.warning("Failed to shut down remix executor: %s", e)
+    try:
+        from src.utils.http_client import close_http_clients
+
+        await close_http_clients()
+    except Exception as e:
+        logger.warning("Failed to close outbound HTTP clients: %s", e)
     try:
         clear_research_cache()
     except Exception as e:
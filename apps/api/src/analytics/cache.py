@@ -0,0 +1,71 @@
+"""
+Query-cache tags for analytics reads (see src/storage/query_cache.py).
+
+Each domain has three kinds of tag:
+
+- ``<domain>``              reset tag; bumping it drops every entry in the domain
+- ``<domain>:<scope>``      e.g. ``performance:org:<id>`` or ``seo:keyword:<kw>``
+- ``<domain>:all``          carried by unscoped reads (no org / keyword filter)
+
+A read is tagged with the reset tag plus either its scope or ``:all``. A
+write to known scopes bumps those scopes and ``:all`` (unscoped reads include
+every scope), so other organizations' cached dashboards survive it.
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..storage.query_cache import invalidate_tags
+
+PERFORMANCE = "performance"
+SEO = "seo"
+
+
+def _read_tags(domain: str, scope: Optional[str]) -> List[str]:
+    return [domain, f"{domain}:{scope}" if scope else f"{domain}:all"]
+
+
+def _write_tags(domain: str, scopes: Iterable[Optional[str]]) -> List[str]:
+    return [f"{domain}:all"] + [f"{domain}:{scope}" for scope in scopes if scope]
+
+
+def performance_tags(args: Dict[str, Any]) -> List[str]:
+    """Tags for a read over content_performance / events / rollups."""
+    org = args.get("organization_id")
+    return _read_tags(PERFORMANCE, f"org:{org}" if org else None)
+
+
+def seo_keyword_tags(args: Dict[str, Any]) -> List[str]:
+    """Tags for a read of one keyword's ranking history."""
+    keyword = args.get("keyword")
+    return _read_tags(SEO, f"keyword:{keyword}" if keyword else None)
+
+
+def seo_tags(args: Dict[str, Any]) -> List[str]:
+    """Tags for reads across all rankings (rankings carry no organization)."""
+    return _read_tags(SEO, None)
+
+
+async def invalidate_performance(organization_ids: Iterable[Optional[str]]) -> None:
+    """Drop cached performance reads for these organizations and unscoped reads."""
+    await invalidate_tags(_write_tags(PERFORMANCE, (f"org:{o}" for o in organization_ids if o)))
+
+
+async def invalidate_seo_keyword(keyword: str) -> None:
+    """Drop cached ranking reads for ``keyword`` and unscoped SEO reads."""
+    await invalidate_tags(_write_tags(SEO, [f"keyword:{keyword}"]))
+
+
+async def invalidate_seo_keywords(keywords: Iterable[str]) -> None:
+    """``invalidate_seo_keyword`` for many keywords in one tag bump."""
+    await invalidate_tags(_write_tags(SEO, (f"keyword:{k}" for k in keywords)))
+
+
+def uses_shared_store(service: Any) -> bool:
+    """Only cache services reading the shared Neon store.
+
+    Services built with an injected client (tests, ad-hoc scripts) see data
+    no other caller shares, so their reads bypass the cache.
+    """
+    from .neon_query import NeonQueryClient
+
+    return isinstance(service._get_supabase(), NeonQueryClient)
@@ -6,24 +6,46 @@ This module provides:
 - Comparison periods (this week vs last week)
 - Dashboard data formatting
 - Export functionality (CSV, JSON)
+
+On Neon, period totals and charts are aggregated in SQL over the hourly/daily
+rollup tables (db/migrations/012) that the ingestion pipeline maintains, so
+their cost depends on the time range and not on how much content an
+organization has. Injected Supabase-style clients keep the row-scan path.
 """
 
+import asyncio
 import csv
 import io
 import json
 import logging
 import os
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Literal, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional, Sequence, Tuple
 
+from ..db import fetch, fetch_pages, fetchrow
+from ..storage.query_cache import read_through
 from ..types.performance import (
     PerformanceTimeRange,
     TrendDirection,
 )
+from .cache import performance_tags, uses_shared_store
+from .export import (
+    PERFORMANCE_EXPORT_COLUMNS,
+    SEO_EXPORT_COLUMNS,
+    ColumnSpec,
+    encode_export,
+    get_export_page_size,
+)
 
 logger = logging.getLogger(__name__)
 
+HOURLY_ROLLUP_TABLE = "performance_rollups_hourly"
+DAILY_ROLLUP_TABLE = "performance_rollups_daily"
+
+# Ranges up to this long are read from hourly buckets, longer ones from daily.
+HOURLY_ROLLUP_MAX_SPAN = timedelta(days=2)
+
 
 @dataclass
 class DashboardMetric:
@@ -142,6 +164,7 @@ class DashboardService:
     # Dashboard Data Generation
     # =========================================================================
 
+    @read_through("dashboard", tags=performance_tags, enabled=uses_shared_store)
     async def get_dashboard_data(
         self,
         time_range: PerformanceTimeRange = PerformanceTimeRange.MONTH,
@@ -159,28 +182,25 @@ class DashboardService:
         Returns:
             DashboardData object with metrics, charts, and lists.
         """
-        # Get current and previous period data
-        current_data = await self._get_period_data(time_range, organization_id, user_id)
-        previous_data = await self._get_previous_period_data(
-            time_range, organization_id, user_id
+        # The sections are independent (each handles its own errors), so they
+        # are fetched concurrently.
+        (
+            current_data,
+            previous_data,
+            charts,
+            top_content,
+            recent_activity,
+        ) = await asyncio.gather(
+            self._get_period_data(time_range, organization_id, user_id),
+            self._get_previous_period_data(time_range, organization_id, user_id),
+            self._build_charts(time_range, organization_id, user_id),
+            self._get_top_content_list(organization_id, user_id, limit=5),
+            self._get_recent_activity(organization_id, user_id, limit=10),
         )
 
         # Build metrics cards
         metrics = self._build_metrics(current_data, previous_data, time_range)
 
-        # Build charts
-        charts = await self._build_charts(time_range, organization_id, user_id)
-
-        # Get top content
-        top_content = await self._get_top_content_list(
-            organization_id, user_id, limit=5
-        )
-
-        # Get recent activity
-        recent_activity = await self._get_recent_activity(
-            organization_id, user_id, limit=10
-        )
-
         return DashboardData(
             metrics=metrics,
             charts=charts,
@@ -200,7 +220,12 @@ class DashboardService:
             return self._get_empty_period_data()
 
         try:
-            start_date, end_date = self._get_date_range(time_range)
+            start_date, _ = self._get_date_range(time_range)
+
+            if self._uses_rollups(supabase):
+                return await self._aggregate_rollup_period(
+                    start_date, None, organization_id, user_id
+                )
 
             query = (
                 supabase.table("content_performance")
@@ -216,23 +241,7 @@ class DashboardService:
                 query = query.eq("user_id", user_id)
 
             result = await query.execute()
-
-            if not result.data:
-                return self._get_empty_period_data()
-
-            return {
-                "views": sum(r.get("views", 0) for r in result.data),
-                "unique_views": sum(r.get("unique_views", 0) for r in result.data),
-                "shares": sum(r.get("shares", 0) for r in result.data),
-                "conversions": sum(r.get("conversions", 0) for r in result.data),
-                "avg_time_on_page": self._safe_average(
-                    [r.get("time_on_page_seconds", 0) for r in result.data]
-                ),
-                "avg_bounce_rate": self._safe_average(
-                    [r.get("bounce_rate", 0) for r in result.data]
-                ),
-                "content_count": len(result.data),
-            }
+            return self._summarize_period_rows(result.data)
 
         except Exception as e:
             logger.error(f"Failed to get period data: {e}")
@@ -255,6 +264,11 @@ class DashboardService:
             previous_start = current_start - timedelta(days=period_days)
             previous_end = current_start
 
+            if self._uses_rollups(supabase):
+                return await self._aggregate_rollup_period(
+                    previous_start, previous_end, organization_id, user_id
+                )
+
             query = (
                 supabase.table("content_performance")
                 .select(
@@ -270,28 +284,168 @@ class DashboardService:
                 query = query.eq("user_id", user_id)
 
             result = await query.execute()
-
-            if not result.data:
-                return self._get_empty_period_data()
-
-            return {
-                "views": sum(r.get("views", 0) for r in result.data),
-                "unique_views": sum(r.get("unique_views", 0) for r in result.data),
-                "shares": sum(r.get("shares", 0) for r in result.data),
-                "conversions": sum(r.get("conversions", 0) for r in result.data),
-                "avg_time_on_page": self._safe_average(
-                    [r.get("time_on_page_seconds", 0) for r in result.data]
-                ),
-                "avg_bounce_rate": self._safe_average(
-                    [r.get("bounce_rate", 0) for r in result.data]
-                ),
-                "content_count": len(result.data),
-            }
+            return self._summarize_period_rows(result.data)
 
         except Exception as e:
             logger.error(f"Failed to get previous period data: {e}")
             return self._get_empty_period_data()
 
+    def _summarize_period_rows(
+        self, rows: Optional[List[Dict[str, Any]]]
+    ) -> Dict[str, Any]:
+        """Sum per-content rows (row-scan path for non-Neon clients)."""
+        if not rows:
+            return self._get_empty_period_data()
+
+        return {
+            "views": sum(r.get("views", 0) for r in rows),
+            "unique_views": sum(r.get("unique_views", 0) for r in rows),
+            "shares": sum(r.get("shares", 0) for r in rows),
+            "conversions": sum(r.get("conversions", 0) for r in rows),
+            "avg_time_on_page": self._safe_average(
+                [r.get("time_on_page_seconds", 0) for r in rows]
+            ),
+            "avg_bounce_rate": self._safe_average(
+                [r.get("bounce_rate", 0) for r in rows]
+            ),
+            "content_count": len(rows),
+        }
+
+    # =========================================================================
+    # Rollup Queries (Neon)
+    # =========================================================================
+
+    def _uses_rollups(self, supabase: Any) -> bool:
+        """Rollup tables are only maintained by the Neon ingestion pipeline."""
+        from .neon_query import NeonQueryClient
+
+        return isinstance(supabase, NeonQueryClient)
+
+    def _rollup_table(self, start: datetime, end: Optional[datetime]) -> Tuple[str, str]:
+        """Pick the rollup table and bucket unit for a range."""
+        span = (end or datetime.utcnow()) - start
+        if span <= HOURLY_ROLLUP_MAX_SPAN:
+            return HOURLY_ROLLUP_TABLE, "hour"
+        return DAILY_ROLLUP_TABLE, "day"
+
+    def _as_utc(self, value: datetime) -> datetime:
+        """Tag naive (utcnow-based) datetimes as UTC before handing them to asyncpg."""
+        return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+    def _bucket_floor(self, value: datetime, unit: str) -> datetime:
+        """Start (UTC) of the rollup bucket containing ``value``."""
+        value = self._as_utc(value).replace(minute=0, second=0, microsecond=0)
+        if unit == "day":
+            value = value.replace(hour=0)
+        return value
+
+    def _rollup_filters(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+        organization_id: Optional[str],
+        user_id: Optional[str],
+    ) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause over rollup buckets.
+
+        ``start``/``end`` must already be bucket-aligned. ``end`` is exclusive;
+        without it the bucket in progress is included.
+        """
+        conditions: List[str] = []
+        args: List[Any] = []
+        for clause, value in (
+            ("bucket_start >= ${}", start),
+            ("bucket_start < ${}", end),
+            ("organization_id = ${}", organization_id),
+            ("user_id = ${}", user_id),
+        ):
+            if value is not None:
+                args.append(value)
+                conditions.append(clause.format(len(args)))
+        where = " AND ".join(conditions) if conditions else "TRUE"
+        return where, args
+
+    async def _aggregate_rollup_period(
+        self,
+        start: datetime,
+        end: Optional[datetime],
+        organization_id: Optional[str],
+        user_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Sum one period in SQL from the rollup buckets it covers.
+
+        Periods are widened to whole buckets; consecutive periods never share
+        a bucket because both edges are floored the same way.
+        """
+        table, unit = self._rollup_table(start, end)
+        where, args = self._rollup_filters(
+            self._bucket_floor(start, unit),
+            self._bucket_floor(end, unit) if end is not None else None,
+            organization_id,
+            user_id,
+        )
+
+        totals_query = fetchrow(
+            f"""
+            SELECT
+                COALESCE(SUM(views), 0) AS views,
+                COALESCE(SUM(unique_views), 0) AS unique_views,
+                COALESCE(SUM(shares), 0) AS shares,
+                COALESCE(SUM(conversions), 0) AS conversions,
+                COALESCE(SUM(time_on_page_seconds), 0) AS time_on_page_seconds,
+                COALESCE(SUM(time_on_page_samples), 0) AS time_on_page_samples,
+                COALESCE(SUM(bounces), 0) AS bounces
+            FROM {table}
+            WHERE {where}
+            """,
+            *args,
+        )
+        row, content_count = await asyncio.gather(
+            totals_query,
+            self._count_tracked_content(start, end, organization_id, user_id),
+        )
+        if row is None:
+            return self._get_empty_period_data()
+
+        views = int(row["views"])
+        samples = int(row["time_on_page_samples"])
+        return {
+            "views": views,
+            "unique_views": int(row["unique_views"]),
+            "shares": int(row["shares"]),
+            "conversions": int(row["conversions"]),
+            "avg_time_on_page": (
+                float(row["time_on_page_seconds"]) / samples if samples else 0.0
+            ),
+            "avg_bounce_rate": min(int(row["bounces"]) / views, 1.0) if views else 0.0,
+            "content_count": content_count,
+        }
+
+    async def _count_tracked_content(
+        self,
+        start: datetime,
+        end: Optional[datetime],
+        organization_id: Optional[str],
+        user_id: Optional[str],
+    ) -> int:
+        """Count content tracked in a period (index-backed COUNT, no row transfer)."""
+        conditions = ["last_tracked_at >= $1"]
+        args: List[Any] = [self._as_utc(start)]
+        for clause, value in (
+            ("last_tracked_at < ${}", self._as_utc(end) if end is not None else None),
+            ("organization_id = ${}", organization_id),
+            ("user_id = ${}", user_id),
+        ):
+            if value is not None:
+                args.append(value)
+                conditions.append(clause.format(len(args)))
+
+        row = await fetchrow(
+            f"SELECT COUNT(*) AS n FROM content_performance WHERE {' AND '.join(conditions)}",
+            *args,
+        )
+        return int(row["n"]) if row else 0
+
     def _get_empty_period_data(self) -> Dict[str, Any]:
         """Return empty period data structure."""
         return {
@@ -443,26 +597,12 @@ class DashboardService:
         user_id: Optional[str],
     ) -> List[DashboardChart]:
         """Build dashboard charts."""
-        charts = []
-
-        # Views over time chart
-        views_chart = await self._build_views_chart(
-            time_range, organization_id, user_id
+        results = await asyncio.gather(
+            self._build_views_chart(time_range, organization_id, user_id),
+            self._build_content_type_chart(organization_id, user_id),
+            self._build_shares_chart(organization_id, user_id),
         )
-        if views_chart:
-            charts.append(views_chart)
-
-        # Content type breakdown
-        type_chart = await self._build_content_type_chart(organization_id, user_id)
-        if type_chart:
-            charts.append(type_chart)
-
-        # Platform shares breakdown
-        shares_chart = await self._build_shares_chart(organization_id, user_id)
-        if shares_chart:
-            charts.append(shares_chart)
-
-        return charts
+        return [chart for chart in results if chart]
 
     async def _build_views_chart(
         self,
@@ -478,6 +618,12 @@ class DashboardService:
         try:
             start_date, end_date = self._get_date_range(time_range)
 
+            if self._uses_rollups(supabase):
+                daily_data = await self._rollup_views_by_bucket(
+                    start_date, organization_id, user_id
+                )
+                return self._views_chart(daily_data) if daily_data else None
+
             query = (
                 supabase.table("performance_snapshots")
                 .select("snapshot_date, views, unique_views")
@@ -502,36 +648,92 @@ class DashboardService:
                 daily_data[date]["views"] += row.get("views", 0)
                 daily_data[date]["unique_views"] += row.get("unique_views", 0)
 
-            sorted_dates = sorted(daily_data.keys())
-
-            return DashboardChart(
-                chart_type="line",
-                title="Views Over Time",
-                labels=sorted_dates,
-                datasets=[
-                    {
-                        "label": "Total Views",
-                        "data": [daily_data[d]["views"] for d in sorted_dates],
-                        "borderColor": "#3b82f6",
-                        "fill": False,
-                    },
-                    {
-                        "label": "Unique Views",
-                        "data": [daily_data[d]["unique_views"] for d in sorted_dates],
-                        "borderColor": "#10b981",
-                        "fill": False,
-                    },
-                ],
-                options={
-                    "responsive": True,
-                    "maintainAspectRatio": False,
-                },
-            )
+            return self._views_chart(daily_data)
 
         except Exception as e:
             logger.error(f"Failed to build views chart: {e}")
             return None
 
+    def _views_chart(self, daily_data: Dict[str, Dict[str, int]]) -> DashboardChart:
+        """Line chart from views/unique views keyed by bucket label."""
+        sorted_dates = sorted(daily_data.keys())
+
+        return DashboardChart(
+            chart_type="line",
+            title="Views Over Time",
+            labels=sorted_dates,
+            datasets=[
+                {
+                    "label": "Total Views",
+                    "data": [daily_data[d]["views"] for d in sorted_dates],
+                    "borderColor": "#3b82f6",
+                    "fill": False,
+                },
+                {
+                    "label": "Unique Views",
+                    "data": [daily_data[d]["unique_views"] for d in sorted_dates],
+                    "borderColor": "#10b981",
+                    "fill": False,
+                },
+            ],
+            options={
+                "responsive": True,
+                "maintainAspectRatio": False,
+            },
+        )
+
+    async def _rollup_views_by_bucket(
+        self,
+        start: datetime,
+        organization_id: Optional[str],
+        user_id: Optional[str],
+    ) -> Dict[str, Dict[str, int]]:
+        """Views per hour (short ranges) or per day, grouped in SQL."""
+        table, unit = self._rollup_table(start, None)
+        where, args = self._rollup_filters(
+            self._bucket_floor(start, unit), None, organization_id, user_id
+        )
+        rows = await fetch(
+            f"""
+            SELECT bucket_start, SUM(views) AS views, SUM(unique_views) AS unique_views
+            FROM {table}
+            WHERE {where}
+            GROUP BY bucket_start
+            ORDER BY bucket_start
+            """,
+            *args,
+        )
+        label_format = "%Y-%m-%d %H:00" if unit == "hour" else "%Y-%m-%d"
+        return {
+            row["bucket_start"].astimezone(timezone.utc).strftime(label_format): {
+                "views": int(row["views"]),
+                "unique_views": int(row["unique_views"]),
+            }
+            for row in rows
+        }
+
+    async def _rollup_totals_by(
+        self,
+        column: str,
+        metric: str,
+        organization_id: Optional[str],
+        user_id: Optional[str],
+    ) -> Dict[str, int]:
+        """Lifetime ``metric`` totals grouped by a rollup dimension column."""
+        where, args = self._rollup_filters(None, None, organization_id, user_id)
+        rows = await fetch(
+            f"""
+            SELECT {column} AS label, SUM({metric}) AS total
+            FROM {DAILY_ROLLUP_TABLE}
+            WHERE {where}
+            GROUP BY {column}
+            HAVING SUM({metric}) > 0
+            ORDER BY total DESC
+            """,
+            *args,
+        )
+        return {row["label"] or "unknown": int(row["total"]) for row in rows}
+
     async def _build_content_type_chart(
         self,
         organization_id: Optional[str],
@@ -543,25 +745,34 @@ class DashboardService:
             return None
 
         try:
-            query = supabase.table("content_performance").select("content_type, views")
+            if self._uses_rollups(supabase):
+                type_views = await self._rollup_totals_by(
+                    "content_type", "views", organization_id, user_id
+                )
+                if not type_views:
+                    return None
+            else:
+                query = supabase.table("content_performance").select(
+                    "content_type, views"
+                )
 
-            if organization_id:
-                query = query.eq("organization_id", organization_id)
-            if user_id:
-                query = query.eq("user_id", user_id)
+                if organization_id:
+                    query = query.eq("organization_id", organization_id)
+                if user_id:
+                    query = query.eq("user_id", user_id)
 
-            result = await query.execute()
+                result = await query.execute()
 
-            if not result.data:
-                return None
+                if not result.data:
+                    return None
 
-            # Aggregate by content type
-            type_views: Dict[str, int] = {}
-            for row in result.data:
-                content_type = row.get("content_type", "other")
-                type_views[content_type] = type_views.get(content_type, 0) + row.get(
-                    "views", 0
-                )
+                # Aggregate by content type
+                type_views = {}
+                for row in result.data:
+                    content_type = row.get("content_type", "other")
+                    type_views[content_type] = type_views.get(
+                        content_type, 0
+                    ) + row.get("views", 0)
 
             labels = list(type_views.keys())
             values = list(type_views.values())
@@ -595,24 +806,33 @@ class DashboardService:
             return None
 
         try:
-            query = supabase.table("content_performance").select("shares_by_platform")
+            if self._uses_rollups(supabase):
+                platform_shares = await self._rollup_totals_by(
+                    "platform", "shares", organization_id, user_id
+                )
+            else:
+                query = supabase.table("content_performance").select(
+                    "shares_by_platform"
+                )
 
-            if organization_id:
-                query = query.eq("organization_id", organization_id)
-            if user_id:
-                query = query.eq("user_id", user_id)
+                if organization_id:
+                    query = query.eq("organization_id", organization_id)
+                if user_id:
+                    query = query.eq("user_id", user_id)
 
-            result = await query.execute()
+                result = await query.execute()
 
-            if not result.data:
-                return None
+                if not result.data:
+                    return None
 
-            # Aggregate platform shares
-            platform_shares: Dict[str, int] = {}
-            for row in result.data:
-                shares = row.get("shares_by_platform", {})
-                for platform, count in shares.items():
-                    platform_shares[platform] = platform_shares.get(platform, 0) + count
+                # Aggregate platform shares
+                platform_shares = {}
+                for row in result.data:
+                    shares = row.get("shares_by_platform", {})
+                    for platform, count in shares.items():
+                        platform_shares[platform] = (
+                            platform_shares.get(platform, 0) + count
+                        )
 
             if not platform_shares:
                 return None
@@ -765,19 +985,7 @@ class DashboardService:
                 return ""
 
             output = io.StringIO()
-            fieldnames = [
-                "content_id",
-                "title",
-                "content_type",
-                "views",
-                "unique_views",
-                "shares",
-                "conversions",
-                "bounce_rate",
-                "time_on_page_seconds",
-                "published_at",
-                "last_tracked_at",
-            ]
+            fieldnames = [name for name, _ in PERFORMANCE_EXPORT_COLUMNS]
 
             writer = csv.DictWriter(
                 output, fieldnames=fieldnames, extrasaction="ignore"
@@ -820,8 +1028,8 @@ class DashboardService:
             query = (
                 supabase.table("seo_rankings")
                 .select("*")
-                .gte("tracked_at", start_date.isoformat())
-                .order("tracked_at", desc=True)
+                .gte("last_checked_at", start_date.isoformat())
+                .order("last_checked_at", desc=True)
             )
 
             if organization_id:
@@ -837,15 +1045,7 @@ class DashboardService:
                 return ""
 
             output = io.StringIO()
-            fieldnames = [
-                "keyword",
-                "position",
-                "previous_position",
-                "change",
-                "search_volume",
-                "url",
-                "tracked_at",
-            ]
+            fieldnames = [name for name, _ in SEO_EXPORT_COLUMNS]
 
             writer = csv.DictWriter(
                 output, fieldnames=fieldnames, extrasaction="ignore"
@@ -861,6 +1061,133 @@ class DashboardService:
             logger.error(f"Failed to export SEO data: {e}")
             return "" if format == "csv" else "[]"
 
+    # =========================================================================
+    # Streaming Exports
+    # =========================================================================
+
+    def stream_performance_export(
+        self,
+        format: str = "csv",
+        time_range: PerformanceTimeRange = PerformanceTimeRange.MONTH,
+        organization_id: Optional[str] = None,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream performance data page by page.
+
+        Unlike ``export_performance_data`` the rows are never all in memory:
+        they are read through a server-side cursor (Neon) or in ranged pages
+        (injected clients) and encoded as each page arrives.
+
+        Args:
+            format: csv, ndjson, parquet or arrow.
+            time_range: Time range to export.
+            organization_id: Optional organization filter.
+            page_size: Rows per page (default ANALYTICS_EXPORT_PAGE_SIZE).
+
+        Returns:
+            Async iterator of encoded chunks.
+
+        Raises:
+            ValueError: If the format is unknown or needs pyarrow.
+        """
+        start_date, _ = self._get_date_range(time_range)
+        pages = self._export_pages(
+            "content_performance",
+            PERFORMANCE_EXPORT_COLUMNS,
+            "last_tracked_at",
+            start_date,
+            organization_id,
+            page_size or get_export_page_size(),
+        )
+        return encode_export(format, pages, PERFORMANCE_EXPORT_COLUMNS)
+
+    def stream_seo_export(
+        self,
+        format: str = "csv",
+        organization_id: Optional[str] = None,
+        days: int = 30,
+        page_size: Optional[int] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream SEO ranking data page by page, newest first.
+
+        Args:
+            format: csv, ndjson, parquet or arrow.
+            organization_id: Optional organization filter.
+            days: Days of data to export.
+            page_size: Rows per page (default ANALYTICS_EXPORT_PAGE_SIZE).
+
+        Returns:
+            Async iterator of encoded chunks.
+
+        Raises:
+            ValueError: If the format is unknown or needs pyarrow.
+        """
+        pages = self._export_pages(
+            "seo_rankings",
+            SEO_EXPORT_COLUMNS,
+            "last_checked_at",
+            datetime.utcnow() - timedelta(days=days),
+            organization_id,
+            page_size or get_export_page_size(),
+        )
+        return encode_export(format, pages, SEO_EXPORT_COLUMNS)
+
+    async def _export_pages(
+        self,
+        table: str,
+        columns: ColumnSpec,
+        time_column: str,
+        start_date: datetime,
+        organization_id: Optional[str],
+        page_size: int,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """Yield rows of ``table`` tracked since ``start_date``, newest first."""
+        supabase = self._get_supabase()
+        if not supabase:
+            return
+
+        names = [name for name, _ in columns]
+        try:
+            if self._uses_rollups(supabase):
+                args: List[Any] = [self._as_utc(start_date)]
+                where = f"{time_column} >= $1"
+                if organization_id:
+                    args.append(organization_id)
+                    where += " AND organization_id = $2"
+                sql = (
+                    f"SELECT {', '.join(names)} FROM {table} "
+                    f"WHERE {where} ORDER BY {time_column} DESC"
+                )
+                async for page in fetch_pages(sql, *args, page_size=page_size):
+                    yield page
+                return
+
+            offset = 0
+            while True:
+                query = (
+                    supabase.table(table)
+                    .select(", ".join(names))
+                    .gte(time_column, start_date.isoformat())
+                    .order(time_column, desc=True)
+                    .range(offset, offset + page_size - 1)
+                )
+                if organization_id:
+                    query = query.eq("organization_id", organization_id)
+                page = (await query.execute()).data or []
+                if page:
+                    yield page
+                if len(page) < page_size:
+                    return
+                offset += page_size
+
+        except Exception as e:
+            # Headers are already sent; re-raise so the client sees a broken
+            # transfer rather than a silently truncated file.
+            logger.error(f"Failed to stream {table} export: {e}")
+            raise
+
     # =========================================================================
     # Utility Methods
     # =========================================================================
@@ -0,0 +1,228 @@
+"""
+Streaming exports of performance and SEO data.
+
+Rows arrive as an async iterator of pages (lists of mappings) and are
+encoded page by page, so an export of any size holds at most one page of
+rows plus one page of encoded output in memory:
+
+- ``csv``      header first, then one chunk per page
+- ``ndjson``   one JSON object per line
+- ``parquet``  one row group per page (requires pyarrow)
+- ``arrow``    Arrow IPC stream, one record batch per page (requires pyarrow)
+
+Text formats emit their first chunk before the first page is fetched, so a
+client sees response bytes immediately.
+"""
+
+import csv
+import io
+import json
+import os
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Dict, List, Mapping, Sequence, Tuple
+
+# (column, kind) where kind is one of "str", "int", "float", "timestamp".
+ColumnSpec = Sequence[Tuple[str, str]]
+Pages = AsyncIterator[Sequence[Mapping[str, Any]]]
+
+PERFORMANCE_EXPORT_COLUMNS: ColumnSpec = (
+    ("content_id", "str"),
+    ("title", "str"),
+    ("content_type", "str"),
+    ("views", "int"),
+    ("unique_views", "int"),
+    ("shares", "int"),
+    ("conversions", "int"),
+    ("bounce_rate", "float"),
+    ("time_on_page_seconds", "float"),
+    ("published_at", "timestamp"),
+    ("last_tracked_at", "timestamp"),
+)
+
+SEO_EXPORT_COLUMNS: ColumnSpec = (
+    ("keyword", "str"),
+    ("position", "int"),
+    ("previous_position", "int"),
+    ("change", "int"),
+    ("search_volume", "int"),
+    ("url", "str"),
+    ("tracked_at", "timestamp"),
+    ("last_checked_at", "timestamp"),
+)
+
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+    "arrow": "application/vnd.apache.arrow.stream",
+}
+
+EXPORT_EXTENSIONS: Dict[str, str] = {
+    "csv": "csv",
+    "ndjson": "ndjson",
+    "parquet": "parquet",
+    "arrow": "arrows",
+}
+
+_COLUMNAR_FORMATS = ("parquet", "arrow")
+
+
+def get_export_page_size() -> int:
+    """Rows fetched and encoded per page (ANALYTICS_EXPORT_PAGE_SIZE)."""
+    return max(1, int(os.environ.get("ANALYTICS_EXPORT_PAGE_SIZE", "1000")))
+
+
+def check_export_format(format: str) -> None:
+    """Raise ValueError for formats this process cannot produce.
+
+    Call before starting a response: once streaming has begun the status
+    code can no longer report the problem.
+    """
+    if format not in EXPORT_MEDIA_TYPES:
+        raise ValueError(f"Unsupported export format: {format}")
+    if format in _COLUMNAR_FORMATS:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            raise ValueError(f"{format} export requires pyarrow to be installed")
+
+
+def encode_export(format: str, pages: Pages, columns: ColumnSpec) -> AsyncIterator[bytes]:
+    """Encode ``pages`` as ``format``, yielding bytes chunks."""
+    check_export_format(format)
+    if format == "csv":
+        return _encode_csv(pages, columns)
+    if format == "ndjson":
+        return _encode_ndjson(pages, columns)
+    return _encode_columnar(format, pages, columns)
+
+
+# =============================================================================
+# Text formats
+# =============================================================================
+
+
+def _text_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+async def _encode_csv(pages: Pages, columns: ColumnSpec) -> AsyncIterator[bytes]:
+    names = [name for name, _ in columns]
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    writer.writerow(names)
+    yield buffer.getvalue().encode("utf-8")
+
+    async for page in pages:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_text_value(row.get(name)) for name in names] for row in page)
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def _encode_ndjson(pages: Pages, columns: ColumnSpec) -> AsyncIterator[bytes]:
+    names = [name for name, _ in columns]
+    async for page in pages:
+        lines = [
+            json.dumps({name: _text_value(row.get(name)) for name in names}, default=str)
+            for row in page
+        ]
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+# =============================================================================
+# Columnar formats (pyarrow)
+# =============================================================================
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands written bytes back to the caller on drain()."""
+
+    def __init__(self) -> None:
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _arrow_schema(columns: ColumnSpec) -> Any:
+    import pyarrow as pa
+
+    types = {
+        "str": pa.string(),
+        "int": pa.int64(),
+        "float": pa.float64(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+def _arrow_value(value: Any, kind: str) -> Any:
+    if value is None:
+        return None
+    if kind == "timestamp" and isinstance(value, str):
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if kind == "float":
+        return float(value)
+    if kind == "int":
+        return int(value)
+    return value
+
+
+async def _encode_columnar(
+    format: str, pages: Pages, columns: ColumnSpec
+) -> AsyncIterator[bytes]:
+    import pyarrow as pa
+
+    schema = _arrow_schema(columns)
+    sink = _ChunkSink()
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        writer = pq.ParquetWriter(sink, schema)
+    else:
+        writer = pa.ipc.new_stream(sink, schema)
+
+    try:
+        async for page in pages:
+            if not page:
+                continue
+            batch = pa.record_batch(
+                [
+                    pa.array([_arrow_value(row.get(name), kind) for row in page], type=field.type)
+                    for (name, kind), field in zip(columns, schema)
+                ],
+                schema=schema,
+            )
+            writer.write_batch(batch)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+
+    chunk = sink.drain()
+    if chunk:
+        yield chunk
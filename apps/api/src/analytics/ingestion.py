@@ -0,0 +1,561 @@
+"""
+Buffered ingestion pipeline for performance events.
+
+Tracking pixels, webhooks and the ``/performance/track`` endpoints can see
+bursts of thousands of events per second.  Writing each event with its own
+INSERT plus a read-modify-write of ``content_performance`` costs several
+round-trips per hit and loses increments under concurrency.
+
+Instead, ``enqueue()`` appends the event to a bounded in-memory ring buffer
+and returns immediately.  A background task drains the buffer in
+micro-batches (when ``batch_size`` events are waiting or every
+``flush_interval`` seconds) and, in one transaction per batch:
+
+- inserts all raw events into ``performance_events`` with a single
+  multi-row ``INSERT ... SELECT FROM unnest(...)``
+- applies the aggregates as atomic increments on ``content_performance``
+  (``views = views + EXCLUDED.views``), one row per content_id
+- adds the same increments to the hourly and daily rollup buckets
+  (``performance_rollups_hourly`` / ``_daily``, db/migrations/012) that the
+  dashboard aggregates over
+
+Events come from tracking pixels and third-party webhooks, so ``enqueue()``
+first coerces the client-supplied fields the tables constrain (revenue,
+content type, IP address, value); one malformed event must not fail the
+batch it shares with hundreds of good ones.
+
+If the buffer is full the oldest events are overwritten and counted as
+dropped; a failed batch is retried once on the next flush.  If the retry
+fails too while the database still answers an empty probe write, the batch
+is bisected so only the events the database rejects are dropped.
+
+Written batches invalidate the cached analytics reads of the organizations
+they touched (src/analytics/cache.py), coalesced to at most one
+invalidation per ``invalidate_interval`` so a steady event stream does not
+keep every dashboard permanently uncached.
+"""
+
+import asyncio
+import ipaddress
+import json
+import logging
+import math
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+from ..types.performance import MetricType, PerformanceEvent
+from .cache import invalidate_performance
+
+logger = logging.getLogger(__name__)
+
+# Returns the organization ids the batch touched (None if unknown).
+BatchWriter = Callable[[List[PerformanceEvent]], Awaitable[Optional[Iterable[Optional[str]]]]]
+
+_INSERT_EVENTS_SQL = """
+INSERT INTO performance_events (
+    content_id, event_type, value, user_id, session_id, timestamp,
+    metadata, source, platform, ip_address, user_agent, referrer
+)
+SELECT
+    t.content_id, t.event_type, t.value, t.user_id, t.session_id, t.ts,
+    t.metadata::jsonb, t.source, t.platform, t.ip_address::inet, t.user_agent, t.referrer
+FROM unnest(
+    $1::text[], $2::text[], $3::numeric[], $4::text[], $5::text[], $6::timestamptz[],
+    $7::text[], $8::text[], $9::text[], $10::text[], $11::text[], $12::text[]
+) AS t(
+    content_id, event_type, value, user_id, session_id, ts,
+    metadata, source, platform, ip_address, user_agent, referrer
+)
+"""
+
+_UPSERT_AGGREGATES_SQL = """
+INSERT INTO content_performance (
+    content_id, content_type, title, views, unique_views, shares,
+    shares_by_platform, conversions, revenue, backlinks,
+    first_tracked_at, last_tracked_at
+)
+SELECT
+    t.content_id, t.content_type, t.title, t.views, t.unique_views, t.shares,
+    t.shares_by_platform::jsonb, t.conversions, t.revenue, t.backlinks,
+    t.first_at, t.last_at
+FROM unnest(
+    $1::text[], $2::text[], $3::text[], $4::int[], $5::int[], $6::int[],
+    $7::text[], $8::int[], $9::numeric[], $10::int[],
+    $11::timestamptz[], $12::timestamptz[]
+) AS t(
+    content_id, content_type, title, views, unique_views, shares,
+    shares_by_platform, conversions, revenue, backlinks, first_at, last_at
+)
+ON CONFLICT (content_id) DO UPDATE SET
+    views = content_performance.views + EXCLUDED.views,
+    unique_views = content_performance.unique_views + EXCLUDED.unique_views,
+    shares = content_performance.shares + EXCLUDED.shares,
+    shares_by_platform = content_performance.shares_by_platform || COALESCE((
+        SELECT jsonb_object_agg(
+            e.key,
+            COALESCE((content_performance.shares_by_platform ->> e.key)::int, 0)
+                + e.value::int
+        )
+        FROM jsonb_each_text(EXCLUDED.shares_by_platform) AS e
+    ), '{}'::jsonb),
+    conversions = content_performance.conversions + EXCLUDED.conversions,
+    revenue = content_performance.revenue + EXCLUDED.revenue,
+    backlinks = content_performance.backlinks + EXCLUDED.backlinks,
+    last_tracked_at = GREATEST(content_performance.last_tracked_at, EXCLUDED.last_tracked_at),
+    updated_at = NOW()
+RETURNING organization_id
+"""
+
+# Shared by both rollup tables; {table} and {unit} are fixed identifiers, the
+# per-(content, hour, platform) increments come in as arrays. Dimensions are
+# taken from the content_performance row upserted just before.
+_UPSERT_ROLLUPS_SQL = """
+INSERT INTO {table} (
+    bucket_start, organization_id, user_id, content_type, platform,
+    views, unique_views, shares, conversions, revenue, backlinks,
+    time_on_page_seconds, time_on_page_samples, bounces
+)
+SELECT
+    date_trunc('{unit}', t.hour AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+    COALESCE(cp.organization_id, ''), COALESCE(cp.user_id, ''), cp.content_type, t.platform,
+    SUM(t.views), SUM(t.unique_views), SUM(t.shares), SUM(t.conversions), SUM(t.revenue),
+    SUM(t.backlinks), SUM(t.time_on_page), SUM(t.time_on_page_samples), SUM(t.bounces)
+FROM unnest(
+    $1::text[], $2::timestamptz[], $3::text[], $4::int[], $5::int[], $6::int[],
+    $7::int[], $8::numeric[], $9::int[], $10::numeric[], $11::int[], $12::int[]
+) AS t(
+    content_id, hour, platform, views, unique_views, shares,
+    conversions, revenue, backlinks, time_on_page, time_on_page_samples, bounces
+)
+JOIN content_performance cp ON cp.content_id = t.content_id
+GROUP BY 1, 2, 3, 4, 5
+ORDER BY 1, 2, 3, 4, 5
+ON CONFLICT (bucket_start, organization_id, user_id, content_type, platform) DO UPDATE SET
+    views = {table}.views + EXCLUDED.views,
+    unique_views = {table}.unique_views + EXCLUDED.unique_views,
+    shares = {table}.shares + EXCLUDED.shares,
+    conversions = {table}.conversions + EXCLUDED.conversions,
+    revenue = {table}.revenue + EXCLUDED.revenue,
+    backlinks = {table}.backlinks + EXCLUDED.backlinks,
+    time_on_page_seconds = {table}.time_on_page_seconds + EXCLUDED.time_on_page_seconds,
+    time_on_page_samples = {table}.time_on_page_samples + EXCLUDED.time_on_page_samples,
+    bounces = {table}.bounces + EXCLUDED.bounces,
+    updated_at = NOW()
+"""
+
+_UPSERT_HOURLY_ROLLUPS_SQL = _UPSERT_ROLLUPS_SQL.format(
+    table="performance_rollups_hourly", unit="hour"
+)
+_UPSERT_DAILY_ROLLUPS_SQL = _UPSERT_ROLLUPS_SQL.format(
+    table="performance_rollups_daily", unit="day"
+)
+
+_ROLLUP_COUNTERS = (
+    "views", "unique_views", "shares", "conversions", "revenue", "backlinks",
+    "time_on_page", "time_on_page_samples", "bounces",
+)
+
+
+# content_performance.content_type CHECK (supabase/migrations/015).
+_CONTENT_TYPES = frozenset({"blog", "book", "social", "email", "video"})
+# performance_events.value is NUMERIC(12, 4); revenue is NUMERIC(12, 2) >= 0.
+_MAX_EVENT_VALUE = 1e8
+_MAX_REVENUE = 1e10
+
+
+def _finite_float(value: Any, limit: float) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if math.isfinite(number) and abs(number) < limit else None
+
+
+def _inet_or_none(value: Any) -> Optional[str]:
+    """The address if Postgres INET accepts it, else None."""
+    if not value:
+        return None
+    text = str(value).strip()
+    if "%" in text:  # IPv6 zone ids are not valid INET input
+        return None
+    try:
+        return str(ipaddress.ip_address(text))
+    except ValueError:
+        return None
+
+
+def clean_event(event: PerformanceEvent) -> Optional[PerformanceEvent]:
+    """
+    Coerce an event's client-supplied fields to what the tables accept.
+
+    Unknown content types become "blog", unparseable or negative revenue
+    and invalid IP addresses are dropped. Returns None if the event value
+    itself is not a storable number.
+    """
+    value = _finite_float(event.value, _MAX_EVENT_VALUE)
+    if value is None:
+        return None
+    event.value = value
+    event.ip_address = _inet_or_none(event.ip_address)
+
+    metadata = dict(event.metadata or {})
+    if "content_type" in metadata and metadata["content_type"] not in _CONTENT_TYPES:
+        metadata["content_type"] = "blog"
+    if "title" in metadata and not isinstance(metadata["title"], str):
+        metadata["title"] = str(metadata["title"])
+    if "revenue" in metadata:
+        revenue = _finite_float(metadata["revenue"], _MAX_REVENUE)
+        if revenue is None or revenue < 0:
+            del metadata["revenue"]
+        else:
+            metadata["revenue"] = revenue
+    event.metadata = metadata
+    return event
+
+
+def _utc(ts: datetime) -> datetime:
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts
+
+
+def aggregate_events(events: List[PerformanceEvent]) -> Dict[str, Dict[str, Any]]:
+    """Fold a batch of events into per-content counter increments."""
+    totals: Dict[str, Dict[str, Any]] = {}
+    for event in events:
+        ts = _utc(event.timestamp)
+        agg = totals.get(event.content_id)
+        if agg is None:
+            agg = totals[event.content_id] = {
+                "content_type": event.metadata.get("content_type", "blog"),
+                "title": event.metadata.get("title", "Untitled"),
+                "views": 0,
+                "unique_views": 0,
+                "shares": 0,
+                "shares_by_platform": {},
+                "conversions": 0,
+                "revenue": 0.0,
+                "backlinks": 0,
+                "first_at": ts,
+                "last_at": ts,
+            }
+        else:
+            agg["first_at"] = min(agg["first_at"], ts)
+            agg["last_at"] = max(agg["last_at"], ts)
+
+        kind = event.event_type
+        if kind == MetricType.VIEW:
+            agg["views"] += 1
+        elif kind == MetricType.UNIQUE_VIEW:
+            agg["unique_views"] += 1
+        elif kind == MetricType.SHARE:
+            agg["shares"] += 1
+            platform = event.platform or "unknown"
+            agg["shares_by_platform"][platform] = agg["shares_by_platform"].get(platform, 0) + 1
+        elif kind == MetricType.CONVERSION:
+            agg["conversions"] += 1
+            if event.metadata.get("revenue"):
+                agg["revenue"] += float(event.metadata["revenue"])
+        elif kind == MetricType.BACKLINK:
+            agg["backlinks"] += 1
+    return totals
+
+
+def aggregate_rollups(
+    events: List[PerformanceEvent],
+) -> Dict[Tuple[str, datetime, str], Dict[str, float]]:
+    """Fold a batch of events into rollup increments per (content, hour, platform)."""
+    totals: Dict[Tuple[str, datetime, str], Dict[str, float]] = {}
+    for event in events:
+        hour = _utc(event.timestamp).replace(minute=0, second=0, microsecond=0)
+        key = (event.content_id, hour, event.platform or "")
+        agg = totals.get(key)
+        if agg is None:
+            agg = totals[key] = dict.fromkeys(_ROLLUP_COUNTERS, 0)
+
+        kind = event.event_type
+        if kind == MetricType.VIEW:
+            agg["views"] += 1
+        elif kind == MetricType.UNIQUE_VIEW:
+            agg["unique_views"] += 1
+        elif kind == MetricType.SHARE:
+            agg["shares"] += 1
+        elif kind == MetricType.CONVERSION:
+            agg["conversions"] += 1
+            if event.metadata.get("revenue"):
+                agg["revenue"] += float(event.metadata["revenue"])
+        elif kind == MetricType.BACKLINK:
+            agg["backlinks"] += 1
+        elif kind == MetricType.TIME_ON_PAGE:
+            agg["time_on_page"] += float(event.value)
+            agg["time_on_page_samples"] += 1
+        elif kind == MetricType.BOUNCE:
+            agg["bounces"] += 1
+    return totals
+
+
+async def write_event_batch(events: List[PerformanceEvent]) -> Set[Optional[str]]:
+    """Persist a batch of events and their aggregates in one transaction.
+
+    Returns the organization ids of the content rows that were updated.
+    """
+    from ..db import get_pool
+
+    pool = await get_pool()
+    if pool is None:
+        raise RuntimeError("Event ingestion requires a database pool (DATABASE_URL).")
+
+    event_columns: List[List[Any]] = [[] for _ in range(12)]
+    for e in events:
+        row = (
+            e.content_id, e.event_type.value, e.value, e.user_id, e.session_id,
+            _utc(e.timestamp), json.dumps(e.metadata or {}, default=str), e.source,
+            e.platform, e.ip_address, e.user_agent, e.referrer,
+        )
+        for column, value in zip(event_columns, row):
+            column.append(value)
+
+    totals = aggregate_events(events)
+    # Sorted so concurrent flushers lock content_performance rows in the same order.
+    content_ids = sorted(totals)
+    agg_columns: List[List[Any]] = [[] for _ in range(12)]
+    for cid in content_ids:
+        a = totals[cid]
+        row = (
+            cid, a["content_type"], a["title"], a["views"], a["unique_views"], a["shares"],
+            json.dumps(a["shares_by_platform"]), a["conversions"], a["revenue"],
+            a["backlinks"], a["first_at"], a["last_at"],
+        )
+        for column, value in zip(agg_columns, row):
+            column.append(value)
+
+    rollup_columns: List[List[Any]] = [[] for _ in range(3 + len(_ROLLUP_COUNTERS))]
+    for key, counters in sorted(aggregate_rollups(events).items()):
+        row = (*key, *(counters[name] for name in _ROLLUP_COUNTERS))
+        for column, value in zip(rollup_columns, row):
+            column.append(value)
+
+    async with pool.acquire() as conn:
+        async with conn.transaction():
+            await conn.execute(_INSERT_EVENTS_SQL, *event_columns)
+            touched = await conn.fetch(_UPSERT_AGGREGATES_SQL, *agg_columns)
+            await conn.execute(_UPSERT_HOURLY_ROLLUPS_SQL, *rollup_columns)
+            await conn.execute(_UPSERT_DAILY_ROLLUPS_SQL, *rollup_columns)
+    return {row["organization_id"] for row in touched}
+
+
+@dataclass
+class IngestionStats:
+    """Counters for the ingestion pipeline."""
+
+    enqueued: int = 0
+    written: int = 0
+    dropped: int = 0
+    failed: int = 0
+    batches: int = 0
+    last_batch_ms: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def to_dict(self, buffered: int) -> Dict[str, Any]:
+        elapsed = max(time.monotonic() - self.started_at, 1e-9)
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed": self.failed,
+            "batches": self.batches,
+            "buffered": buffered,
+            "last_batch_ms": round(self.last_batch_ms, 2),
+            "events_per_second": round(self.written / elapsed, 1),
+        }
+
+
+class EventIngestionPipeline:
+    """Ring buffer plus background micro-batch flusher for performance events."""
+
+    def __init__(
+        self,
+        capacity: int = 100_000,
+        batch_size: int = 500,
+        flush_interval: float = 0.25,
+        writer: Optional[BatchWriter] = None,
+        invalidate_interval: float = 5.0,
+    ):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.invalidate_interval = invalidate_interval
+        self._writer = writer or write_event_batch
+        self._buffer: Deque[PerformanceEvent] = deque(maxlen=capacity)
+        self._retry: Optional[List[PerformanceEvent]] = None
+        self._stats = IngestionStats()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._touched_orgs: Set[Optional[str]] = set()
+        self._cache_dirty = False
+        self._last_invalidation = 0.0
+
+    def enqueue(self, event: PerformanceEvent) -> None:
+        """Buffer an event for the next batch. Never blocks or awaits."""
+        cleaned = clean_event(event)
+        if cleaned is None:
+            self._stats.failed += 1
+            logger.warning("Dropping event for %s with invalid value %r", event.content_id, event.value)
+            return
+        event = cleaned
+        if len(self._buffer) == self.capacity:
+            self._stats.dropped += 1
+        self._buffer.append(event)
+        self._stats.enqueued += 1
+        self._ensure_running()
+        if len(self._buffer) >= self.batch_size and self._wake is not None:
+            self._wake.set()
+
+    def _ensure_running(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Flushed explicitly (or on the next enqueue from a loop).
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        # Background task, event and lock are bound to the running loop.
+        self._loop = loop
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception as e:  # pragma: no cover - flush already logs
+                logger.error("Event ingestion flush failed: %s", e)
+
+    async def flush(self) -> int:
+        """Write everything currently buffered. Returns events written."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        written = 0
+        async with self._flush_lock:
+            while self._retry or self._buffer:
+                if self._retry is not None:
+                    batch, retried = self._retry, True
+                    self._retry = None
+                else:
+                    count = min(self.batch_size, len(self._buffer))
+                    batch = [self._buffer.popleft() for _ in range(count)]
+                    retried = False
+
+                try:
+                    written += await self._write(batch)
+                except Exception as e:
+                    if retried:
+                        written += await self._write_isolating(batch, e)
+                    else:
+                        self._retry = batch
+                        logger.warning("Event batch write failed, will retry: %s", e)
+                    break
+        await self._invalidate_caches()
+        return written
+
+    async def _write(self, batch: List[PerformanceEvent]) -> int:
+        start = time.perf_counter()
+        touched = await self._writer(batch)
+        self._stats.last_batch_ms = (time.perf_counter() - start) * 1000
+        self._stats.batches += 1
+        self._stats.written += len(batch)
+        self._touched_orgs.update(touched or ())
+        self._cache_dirty = True
+        return len(batch)
+
+    async def _write_isolating(self, batch: List[PerformanceEvent], error: Exception) -> int:
+        """
+        Handle a batch whose retry failed, dropping only the events the
+        database rejects. Returns the number of events written.
+        """
+        if len(batch) > 1:
+            try:
+                await self._writer([])  # Probe: fails too if the database is down.
+            except Exception:
+                pass
+            else:
+                mid = len(batch) // 2
+                written = 0
+                for half in (batch[:mid], batch[mid:]):
+                    try:
+                        written += await self._write(half)
+                    except Exception as e:
+                        written += await self._write_isolating(half, e)
+                return written
+        self._stats.failed += len(batch)
+        logger.error("Dropping %d events after failed retry: %s", len(batch), error)
+        return 0
+
+    async def _invalidate_caches(self, force: bool = False) -> None:
+        """Invalidate cached reads for written data, at most once per interval."""
+        if not self._cache_dirty:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_invalidation < self.invalidate_interval:
+            return  # picked up by a later flush (the flusher also runs when idle)
+        orgs, self._touched_orgs = self._touched_orgs, set()
+        self._cache_dirty = False
+        self._last_invalidation = now
+        try:
+            await invalidate_performance(orgs)
+        except Exception as e:
+            logger.warning("Analytics cache invalidation failed: %s", e)
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write any remaining events."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self.flush()
+        await self._invalidate_caches(force=True)
+
+    def stats(self) -> Dict[str, Any]:
+        return self._stats.to_dict(len(self._buffer))
+
+
+_pipeline: Optional[EventIngestionPipeline] = None
+
+
+def is_buffered_ingestion_enabled() -> bool:
+    return os.environ.get("ANALYTICS_INGEST_BUFFERED", "true").lower() in ("1", "true", "yes")
+
+
+def get_ingestion_pipeline() -> EventIngestionPipeline:
+    """Return the process-wide event ingestion pipeline."""
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = EventIngestionPipeline(
+            capacity=int(os.environ.get("ANALYTICS_INGEST_BUFFER_SIZE", "100000")),
+            batch_size=int(os.environ.get("ANALYTICS_INGEST_BATCH_SIZE", "500")),
+            flush_interval=int(os.environ.get("ANALYTICS_INGEST_FLUSH_INTERVAL_MS", "250")) / 1000,
+            invalidate_interval=int(
+                os.environ.get("ANALYTICS_CACHE_INVALIDATE_INTERVAL_MS", "5000")
+            ) / 1000,
+        )
+    return _pipeline
+
+
+async def shutdown_ingestion_pipeline() -> None:
+    """Flush buffered events on shutdown."""
+    global _pipeline
+    if _pipeline is not None:
+        await _pipeline.stop()
+        _pipeline = None
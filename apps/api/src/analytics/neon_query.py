@@ -3,25 +3,38 @@ query-builder API used by the analytics services.
 
 This lets those services move off supabase-py onto Neon with minimal changes:
 each `self._get_supabase()` returns a NeonQueryClient (when DATABASE_URL is set)
-and the existing `...execute()` chains are simply awaited. A pg_catalog jsonb
-codec is registered per connection so jsonb columns (shares_by_platform,
-metadata, data) round-trip as dict/list automatically; ISO-8601 string bounds
+and the existing `...execute()` chains are simply awaited. Queries run on a
+dedicated ``analytics`` pool whose ``init`` hook registers a pg_catalog jsonb
+codec once per connection, so jsonb columns (shares_by_platform, metadata,
+data) round-trip as dict/list automatically without an extra round-trip per
+query (and without leaking the codec to callers of the default pool, which
+pass jsonb as JSON text). ISO-8601 string bounds
 (e.g. ``start_date.isoformat()``) are coerced to datetime so comparisons against
 timestamptz columns work.
 
 Only the surface the services actually use is implemented: table/select/insert/
 update/delete + eq/gte/lte/lt/is_ + order/limit/range, and an awaitable
-execute() returning an object with a ``.data`` list.
+execute() returning an object with a ``.data`` list. Inserts/upserts of more
+than ``BULK_ROWS_THRESHOLD`` rows are sent as one pipelined ``executemany``
+of a single-row statement instead of one giant multi-row VALUES.
 """
 
 from __future__ import annotations
 
 import json
+import os
 import re
 from datetime import date, datetime
 from decimal import Decimal
 from typing import Any, List, Optional, Tuple
 
+ANALYTICS_POOL = "analytics"
+
+# Above this many rows, insert/upsert uses executemany. Multi-row VALUES
+# statements are unique per row count (never reusable as prepared statements)
+# and hit Postgres' 32767 bind-parameter limit on wide tables.
+BULK_ROWS_THRESHOLD = int(os.environ.get("NEON_BULK_ROWS_THRESHOLD", "50"))
+
 _ISO_DT = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
 _ISO_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
@@ -171,12 +184,38 @@ class _Query:
                 clauses.append(f'"{col}" {op} ${len(params)}')
         return " WHERE " + " AND ".join(clauses)
 
+    def _rows(self) -> List[dict]:
+        return self._payload if isinstance(self._payload, list) else [self._payload]
+
+    def _is_bulk(self) -> bool:
+        return self._op in ("insert", "upsert") and len(self._rows()) > BULK_ROWS_THRESHOLD
+
+    def _insert_sql(self, cols: List[str], value_groups: List[str], returning: bool) -> str:
+        col_sql = ", ".join(f'"{c}"' for c in cols)
+        sql = f'INSERT INTO "{self._table}" ({col_sql}) VALUES ' + ", ".join(value_groups)
+        if self._op == "upsert":
+            updates = ", ".join(
+                f'"{c}" = EXCLUDED."{c}"' for c in cols if c != self._on_conflict
+            )
+            sql += f' ON CONFLICT ("{self._on_conflict}") DO UPDATE SET {updates}'
+        if returning:
+            sql += " RETURNING *"
+        return sql
+
+    def _build_bulk(self) -> Tuple[str, List[Tuple[Any, ...]]]:
+        """Single-row statement plus one argument tuple per row."""
+        rows = self._rows()
+        cols = list(rows[0].keys())
+        placeholders = ", ".join(f"${i}" for i in range(1, len(cols) + 1))
+        sql = self._insert_sql(cols, [f"({placeholders})"], returning=False)
+        args = [tuple(_coerce(row.get(c)) for c in cols) for row in rows]
+        return sql, args
+
     def _build(self) -> Tuple[str, List[Any]]:
         params: List[Any] = []
         if self._op in ("insert", "upsert"):
-            rows = self._payload if isinstance(self._payload, list) else [self._payload]
+            rows = self._rows()
             cols = list(rows[0].keys())
-            col_sql = ", ".join(f'"{c}"' for c in cols)
             value_groups = []
             for row in rows:
                 placeholders = []
@@ -184,16 +223,7 @@ class _Query:
                     params.append(_coerce(row.get(c)))
                     placeholders.append(f"${len(params)}")
                 value_groups.append("(" + ", ".join(placeholders) + ")")
-            sql = f'INSERT INTO "{self._table}" ({col_sql}) VALUES ' + ", ".join(
-                value_groups
-            )
-            if self._op == "upsert":
-                updates = ", ".join(
-                    f'"{c}" = EXCLUDED."{c}"' for c in cols if c != self._on_conflict
-                )
-                sql += f' ON CONFLICT ("{self._on_conflict}") DO UPDATE SET {updates}'
-            sql += " RETURNING *"
-            return sql, params
+            return self._insert_sql(cols, value_groups, returning=True), params
 
         if self._op == "update":
             set_parts = []
@@ -224,6 +254,13 @@ class _Query:
         return sql, params
 
     async def execute(self) -> _Result:
+        if self._is_bulk():
+            # executemany returns no rows; hand back the payload that was
+            # written, as callers of bulk inserts only check for success.
+            sql, args = self._build_bulk()
+            await self._client._executemany(sql, args)
+            return _Result([dict(row) for row in self._rows()])
+
         sql, params = self._build()
         rows = await self._client._fetch(sql, params)
         data = [_normalize_row(dict(r)) for r in rows]
@@ -232,25 +269,39 @@ class _Query:
         return _Result(data)
 
 
+async def _init_connection(conn) -> None:
+    """Pool ``init`` hook: runs once per new analytics connection."""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=json.dumps,
+        decoder=json.loads,
+        schema="pg_catalog",
+    )
+
+
 class NeonQueryClient:
-    """Supabase-client-shaped facade over the shared asyncpg pool."""
+    """Supabase-client-shaped facade over the analytics asyncpg pool."""
 
-    async def _fetch(self, sql: str, params: List[Any]):
+    async def _pool(self):
         from ..db import get_pool
 
-        pool = await get_pool()
+        pool = await get_pool(ANALYTICS_POOL, init=_init_connection)
         if pool is None:
             raise RuntimeError(
                 "NeonQueryClient requires a database pool (DATABASE_URL)."
             )
+        return pool
+
+    async def _fetch(self, sql: str, params: List[Any]):
+        pool = await self._pool()
         async with pool.acquire() as conn:
-            await conn.set_type_codec(
-                "jsonb",
-                encoder=json.dumps,
-                decoder=json.loads,
-                schema="pg_catalog",
-            )
             return await conn.fetch(sql, *params)
 
+    async def _executemany(self, sql: str, args: List[Tuple[Any, ...]]) -> None:
+        pool = await self._pool()
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.executemany(sql, args)
+
     def table(self, name: str) -> _Query:
         return _Query(self, name)
@@ -24,6 +24,13 @@ from ..types.performance import (
     PerformanceTrend,
     TrendDirection,
 )
+from .cache import invalidate_performance
+from .ingestion import (
+    clean_event,
+    get_ingestion_pipeline,
+    is_buffered_ingestion_enabled,
+    write_event_batch,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -127,17 +134,38 @@ class PerformanceService:
         """
         Track a performance event.
 
+        On Neon the event is handed to the buffered ingestion pipeline
+        (src/analytics/ingestion.py) and written in the next micro-batch, so
+        this returns without waiting for the database.
+
         Args:
             event: The performance event to track.
 
         Returns:
-            True if the event was tracked successfully.
+            True if the event was accepted (buffered) or tracked successfully.
         """
         supabase = self._get_supabase()
         if not supabase:
             logger.warning("Cannot track event: Supabase not configured")
             return False
 
+        from .neon_query import NeonQueryClient
+
+        if isinstance(supabase, NeonQueryClient):
+            try:
+                if is_buffered_ingestion_enabled():
+                    get_ingestion_pipeline().enqueue(event)
+                else:
+                    cleaned = clean_event(event)
+                    if cleaned is None:
+                        logger.warning(f"Dropping event with invalid value {event.value!r}")
+                        return False
+                    await invalidate_performance(await write_event_batch([cleaned]))
+                return True
+            except Exception as e:
+                logger.error(f"Failed to track event: {e}")
+                return False
+
         try:
             # Insert the event
             data = {
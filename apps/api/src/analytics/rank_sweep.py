@@ -0,0 +1,189 @@
+"""
+Concurrent keyword rank sweeps.
+
+A sweep checks many keywords for one target URL:
+
+1. The latest stored ranking of every keyword is loaded in one query.
+2. SERP lookups fan out over ``concurrency`` workers, paced by a token
+   bucket at ``requests_per_second`` (the SERP provider's rate limit).
+3. Rankings whose position differs from the stored one, or that have none,
+   are inserted at the end; in the same call the latest stored row of every
+   unchanged keyword gets its ``last_checked_at`` bumped. A keyword's
+   history only grows when it moves, and readers window on
+   ``last_checked_at`` so a stable keyword still shows as tracked.
+
+With a ``sweep_id`` every finished lookup is appended to a JSONL checkpoint
+(``SEO_SWEEP_CHECKPOINT_DIR``). Rerunning an interrupted sweep with the same
+id skips keywords already looked up; the checkpoint is removed once the
+insert succeeds.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+from ..text_generation.rate_limiter import TokenBucket
+from ..types.performance import SEORanking
+
+if TYPE_CHECKING:
+    from .seo_tracker import SEOTracker
+
+logger = logging.getLogger(__name__)
+
+SEARCH_ENGINE = "google"
+
+
+class RankSweep:
+    """One rank-tracking pass over a keyword list for a target URL."""
+
+    def __init__(
+        self,
+        tracker: "SEOTracker",
+        concurrency: Optional[int] = None,
+        requests_per_second: Optional[float] = None,
+        sweep_id: Optional[str] = None,
+        checkpoint_dir: Optional[str] = None,
+    ):
+        """
+        Args:
+            tracker: SEOTracker providing lookups and storage.
+            concurrency: Parallel lookups (default SERP_API_MAX_CONCURRENCY or 8).
+            requests_per_second: Lookup rate limit (default
+                SERP_API_REQUESTS_PER_SECOND or 5).
+            sweep_id: Enables checkpointing under this name.
+            checkpoint_dir: Checkpoint directory (default
+                SEO_SWEEP_CHECKPOINT_DIR or ./data/seo_sweeps).
+        """
+        self.tracker = tracker
+        self.concurrency = max(
+            1, concurrency or int(os.environ.get("SERP_API_MAX_CONCURRENCY", "8"))
+        )
+        rate = requests_per_second or float(
+            os.environ.get("SERP_API_REQUESTS_PER_SECOND", "5")
+        )
+        # Burst of at most one second's worth of requests.
+        self._bucket = TokenBucket(rate=rate, capacity=max(1.0, rate))
+
+        self.checkpoint_path: Optional[str] = None
+        if sweep_id:
+            directory = checkpoint_dir or os.environ.get(
+                "SEO_SWEEP_CHECKPOINT_DIR", "./data/seo_sweeps"
+            )
+            self.checkpoint_path = os.path.join(directory, f"{sweep_id}.jsonl")
+
+        self.stats: Dict[str, int] = {
+            "lookups": 0,
+            "resumed": 0,
+            "failed": 0,
+            "changed": 0,
+            "unchanged": 0,
+        }
+
+    async def run(
+        self,
+        keywords: Iterable[str],
+        target_url: str,
+        location: Optional[str] = None,
+    ) -> List[SEORanking]:
+        """
+        Check every keyword, persist the rankings that changed and mark the
+        unchanged ones as checked.
+
+        Returns:
+            Rankings in keyword order; keywords whose lookup failed are
+            omitted (and retried when the sweep is resumed).
+        """
+        keywords = list(dict.fromkeys(keywords))
+        if not self.tracker.is_configured:
+            logger.warning("SERP API key not configured; skipping rank sweep")
+            return []
+
+        results = self._load_checkpoint()
+        self.stats["resumed"] = sum(1 for k in keywords if k in results)
+        pending = iter([k for k in keywords if k not in results])
+
+        previous = await self.tracker._get_previous_rankings(keywords, target_url)
+
+        async def worker() -> None:
+            # Workers share one iterator, so each keyword is taken exactly once.
+            for keyword in pending:
+                ranking = await self._check(keyword, target_url, location, previous.get(keyword))
+                if ranking is not None:
+                    results[keyword] = ranking
+                    self._append_checkpoint(ranking)
+
+        await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+        rankings = [results[k] for k in keywords if k in results]
+        # Not-found (position 0) results are never stored, as with single checks.
+        changed: List[SEORanking] = []
+        unchanged: List[str] = []
+        for r in rankings:
+            if not r.position:
+                continue
+            if r.previous_position is None or r.change != 0:
+                changed.append(r)
+            else:
+                unchanged.append(r.keyword)
+        self.stats["changed"] = len(changed)
+        self.stats["unchanged"] = len(unchanged)
+
+        if await self.tracker._store_rankings(changed, target_url, unchanged):
+            self._clear_checkpoint()
+
+        return rankings
+
+    async def _check(
+        self,
+        keyword: str,
+        target_url: str,
+        location: Optional[str],
+        previous: Optional[SEORanking],
+    ) -> Optional[SEORanking]:
+        while not await self._bucket.acquire():
+            pass
+
+        self.stats["lookups"] += 1
+        try:
+            position, found_url = await self.tracker._lookup_position(
+                keyword, target_url, location, None, SEARCH_ENGINE
+            )
+        except Exception as e:
+            self.stats["failed"] += 1
+            logger.warning(f"Failed to track keyword '{keyword}': {e}")
+            return None
+
+        return self.tracker._build_ranking(
+            keyword, position, found_url, previous, location, SEARCH_ENGINE
+        )
+
+    # =========================================================================
+    # Checkpoints
+    # =========================================================================
+
+    def _load_checkpoint(self) -> Dict[str, SEORanking]:
+        if not self.checkpoint_path or not os.path.exists(self.checkpoint_path):
+            return {}
+
+        results: Dict[str, SEORanking] = {}
+        with open(self.checkpoint_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    ranking = self.tracker._ranking_from_record(json.loads(line))
+                except (ValueError, KeyError):
+                    continue  # torn final line from an interrupted write
+                results[ranking.keyword] = ranking
+        return results
+
+    def _append_checkpoint(self, ranking: SEORanking) -> None:
+        if not self.checkpoint_path:
+            return
+        os.makedirs(os.path.dirname(self.checkpoint_path) or ".", exist_ok=True)
+        with open(self.checkpoint_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(ranking.to_dict()) + "\n")
+
+    def _clear_checkpoint(self) -> None:
+        if self.checkpoint_path and os.path.exists(self.checkpoint_path):
+            os.remove(self.checkpoint_path)
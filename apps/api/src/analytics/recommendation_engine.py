@@ -6,13 +6,23 @@ This engine provides:
 - Optimal posting time suggestions
 - Format recommendations (blog vs social vs email)
 - Keyword opportunity detection
+
+Scoring works on per-column accumulators (one slot per topic, weekday, hour
+or format) rather than nested dicts, title tokenization is cached per
+content_id, and ``get_all_recommendations`` runs the families concurrently.
+With ``incremental=True`` it keeps a per-organization snapshot of
+content_performance and only re-reads rows updated since the previous run.
 """
 
+import asyncio
+import heapq
 import logging
 import os
-from collections import defaultdict
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from ..types.performance import (
     ContentFormat,
@@ -22,9 +32,98 @@ from ..types.performance import (
     TimingRecommendation,
     TopicRecommendation,
 )
+from ..storage.query_cache import read_through
+from .cache import performance_tags, seo_tags, uses_shared_store
 
 logger = logging.getLogger(__name__)
 
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of",
+    "with", "by", "from", "is", "are", "was", "were", "be", "been", "being",
+    "have", "has", "had", "do", "does", "did", "will", "would", "could",
+    "should", "may", "might", "must", "shall", "can", "how", "what", "when",
+    "where", "why", "which", "who", "whom", "this", "that", "these", "those",
+    "your", "our", "my", "their", "its",
+})
+_STRIP_CHARS = ",.!?;:\"'()-"
+_WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+# Rows the topic family scores (the top content by views).
+TOPIC_SAMPLE_SIZE = 50
+
+# Tokenized titles keyed by content_id; the title is kept to detect renames.
+TITLE_TOPIC_CACHE_SIZE = 50_000
+_title_topics: "OrderedDict[str, Tuple[str, Tuple[str, ...]]]" = OrderedDict()
+
+# Incremental snapshots: how many organizations to keep, how long before a
+# full reload (picks up deleted content), and how far to re-read behind the
+# previous load to absorb clock skew between this process and Postgres.
+_MAX_SNAPSHOTS = 32
+SNAPSHOT_MAX_AGE = timedelta(hours=1)
+_SNAPSHOT_OVERLAP = timedelta(seconds=30)
+_SNAPSHOT_COLUMNS = (
+    "content_id, title, content_type, user_id, views, shares, conversions, "
+    "published_at, metadata, updated_at"
+)
+_shared_snapshots: "OrderedDict[Optional[str], _ContentSnapshot]" = OrderedDict()
+
+
+@dataclass
+class _ContentSnapshot:
+    """content_performance rows for one organization, keyed by content_id."""
+
+    rows: Dict[str, Dict[str, Any]]
+    loaded_at: datetime
+    created_at: datetime
+
+
+def _tokenize_title(title: str) -> List[str]:
+    """Up to five topics: important words first, then stop-word-free bigrams."""
+    if not title:
+        return []
+    words = [word.strip(_STRIP_CHARS) for word in title.lower().split()]
+    topics = [w for w in words if len(w) >= 4 and w not in _STOP_WORDS]
+    if len(topics) < 5:
+        topics.extend(
+            f"{w1} {w2}"
+            for w1, w2 in zip(words, words[1:])
+            if w1 not in _STOP_WORDS and w2 not in _STOP_WORDS
+        )
+    return topics[:5]
+
+
+def _title_topics_for(content_id: Optional[str], title: str) -> Tuple[str, ...]:
+    """Cached ``_tokenize_title`` for a piece of content."""
+    if content_id is None:
+        return tuple(_tokenize_title(title))
+    entry = _title_topics.get(content_id)
+    if entry is not None and entry[0] == title:
+        _title_topics.move_to_end(content_id)
+        return entry[1]
+    topics = tuple(_tokenize_title(title))
+    _title_topics[content_id] = (title, topics)
+    if len(_title_topics) > TITLE_TOPIC_CACHE_SIZE:
+        _title_topics.popitem(last=False)
+    return topics
+
+
+@lru_cache(maxsize=65536)
+def _parse_publish_slot(published_at: str) -> Optional[Tuple[int, int]]:
+    """(weekday, hour) of an ISO timestamp, in the timestamp's own offset."""
+    try:
+        dt = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt.weekday(), dt.hour
+
+
+def _publish_slot(published_at: Any) -> Optional[Tuple[int, int]]:
+    if isinstance(published_at, datetime):
+        return published_at.weekday(), published_at.hour
+    if isinstance(published_at, str) and published_at:
+        return _parse_publish_slot(published_at)
+    return None
+
 
 class RecommendationEngineError(Exception):
     """Exception raised for errors in the recommendation engine."""
@@ -57,6 +156,7 @@ class RecommendationEngine:
         self._supabase = supabase_client
         self._llm_provider = llm_provider
         self._min_data_points = min_data_points
+        self._local_snapshots: "OrderedDict[Optional[str], _ContentSnapshot]" = OrderedDict()
 
     def _get_supabase(self) -> Optional[Any]:
         """Return the Neon (asyncpg) query client, or None if no DB is configured.
@@ -80,6 +180,9 @@ class RecommendationEngine:
     # Topic Recommendations
     # =========================================================================
 
+    @read_through(
+        "recommendations:topic", tags=performance_tags, enabled=uses_shared_store
+    )
     async def get_topic_recommendations(
         self,
         organization_id: Optional[str] = None,
@@ -109,7 +212,7 @@ class RecommendationEngine:
                     "content_id, title, content_type, views, shares, conversions, metadata"
                 )
                 .order("views", desc=True)
-                .limit(50)
+                .limit(TOPIC_SAMPLE_SIZE)
             )
 
             if organization_id:
@@ -118,178 +221,113 @@ class RecommendationEngine:
                 query = query.eq("user_id", user_id)
 
             result = await query.execute()
+            return self._build_topic_recommendations(result.data, limit)
 
-            if not result.data or len(result.data) < self._min_data_points:
-                return self._get_default_topic_recommendations(limit)
+        except Exception as e:
+            logger.error(f"Failed to get topic recommendations: {e}")
+            return self._get_default_topic_recommendations(limit)
 
-            # Analyze topics from high-performing content
-            topic_scores = self._analyze_topics(result.data)
+    def _build_topic_recommendations(
+        self, content_data: Optional[List[Dict[str, Any]]], limit: int
+    ) -> List[TopicRecommendation]:
+        """Score topics over the top content rows and build recommendations."""
+        if not content_data or len(content_data) < self._min_data_points:
+            return self._get_default_topic_recommendations(limit)
 
-            # Get existing topics to avoid duplicates
-            existing_topics = {item.get("title", "").lower() for item in result.data}
+        # Analyze topics from high-performing content
+        topic_scores = self._analyze_topics(content_data)
 
-            # Generate recommendations
-            recommendations = []
-            for topic, score_data in sorted(
-                topic_scores.items(),
-                key=lambda x: x[1]["score"],
-                reverse=True,
-            )[:limit]:
-                if topic.lower() in existing_topics:
-                    continue
+        # Get existing topics to avoid duplicates
+        existing_topics = {(item.get("title") or "").lower() for item in content_data}
 
-                rec = TopicRecommendation(
-                    recommendation_type=RecommendationType.TOPIC,
-                    title=f"Create content about: {topic}",
-                    description=f"Based on your top-performing content, this topic shows high potential. "
-                    f"Related content has averaged {score_data['avg_views']:.0f} views.",
-                    confidence=min(score_data["score"] / 100, 1.0),
-                    priority=len(recommendations) + 1,
-                    topic=topic,
-                    related_keywords=score_data.get("keywords", []),
-                    estimated_traffic=int(score_data["avg_views"] * 0.8),
-                    competition_level=self._estimate_competition(score_data),
-                    based_on=score_data.get("content_ids", []),
-                )
-                recommendations.append(rec)
+        # Generate recommendations
+        recommendations = []
+        for topic, score_data in sorted(
+            topic_scores.items(),
+            key=lambda x: x[1]["score"],
+            reverse=True,
+        )[:limit]:
+            if topic.lower() in existing_topics:
+                continue
 
-            return recommendations
+            rec = TopicRecommendation(
+                recommendation_type=RecommendationType.TOPIC,
+                title=f"Create content about: {topic}",
+                description=f"Based on your top-performing content, this topic shows high potential. "
+                f"Related content has averaged {score_data['avg_views']:.0f} views.",
+                confidence=min(score_data["score"] / 100, 1.0),
+                priority=len(recommendations) + 1,
+                topic=topic,
+                related_keywords=score_data.get("keywords", []),
+                estimated_traffic=int(score_data["avg_views"] * 0.8),
+                competition_level=self._estimate_competition(score_data),
+                based_on=score_data.get("content_ids", []),
+            )
+            recommendations.append(rec)
 
-        except Exception as e:
-            logger.error(f"Failed to get topic recommendations: {e}")
-            return self._get_default_topic_recommendations(limit)
+        return recommendations
 
     def _analyze_topics(
         self, content_data: List[Dict[str, Any]]
     ) -> Dict[str, Dict[str, Any]]:
-        """Analyze topics from content data."""
-        topic_scores = defaultdict(
-            lambda: {
-                "score": 0,
-                "count": 0,
-                "total_views": 0,
-                "total_shares": 0,
-                "avg_views": 0,
-                "keywords": [],
-                "content_ids": [],
-            }
-        )
+        """Analyze topics from content data.
+
+        Each distinct topic gets a slot in parallel accumulator columns, so a
+        row costs one dict lookup per topic instead of a nested-dict update.
+        """
+        slots: Dict[str, int] = {}
+        counts: List[int] = []
+        total_views: List[float] = []
+        total_shares: List[float] = []
+        content_ids: List[List[Any]] = []
 
         for item in content_data:
-            # Extract topics from title and metadata
-            title = item.get("title", "")
+            # Extract topics from title (cached per content) and metadata
+            content_id = item.get("content_id")
             metadata = item.get("metadata", {}) or {}
-            keywords = metadata.get("keywords", [])
-            tags = metadata.get("tags", [])
-
-            # Simple topic extraction from title
-            topics = self._extract_topics_from_title(title)
-            topics.extend(keywords[:3])
-            topics.extend(tags[:3])
+            topics: Iterable[str] = _title_topics_for(content_id, item.get("title", ""))
+            keywords = metadata.get("keywords", [])[:3]
+            tags = metadata.get("tags", [])[:3]
+            if keywords or tags:
+                topics = [*topics, *keywords, *tags]
 
             views = item.get("views", 0)
             shares = item.get("shares", 0)
-            content_id = item.get("content_id")
 
             for topic in topics:
                 if not topic or len(topic) < 3:
                     continue
 
                 topic = topic.strip().lower()
-                data = topic_scores[topic]
-                data["count"] += 1
-                data["total_views"] += views
-                data["total_shares"] += shares
-                data["score"] += views + (shares * 10)  # Weight shares higher
-                data["content_ids"].append(content_id)
+                slot = slots.get(topic)
+                if slot is None:
+                    slot = slots[topic] = len(counts)
+                    counts.append(0)
+                    total_views.append(0)
+                    total_shares.append(0)
+                    content_ids.append([])
+                counts[slot] += 1
+                total_views[slot] += views
+                total_shares[slot] += shares
+                content_ids[slot].append(content_id)
 
-        # Calculate averages
-        for topic, data in topic_scores.items():
-            if data["count"] > 0:
-                data["avg_views"] = data["total_views"] / data["count"]
-
-        return dict(topic_scores)
+        return {
+            topic: {
+                # Weight shares higher
+                "score": total_views[i] + total_shares[i] * 10,
+                "count": counts[i],
+                "total_views": total_views[i],
+                "total_shares": total_shares[i],
+                "avg_views": total_views[i] / counts[i],
+                "keywords": [],
+                "content_ids": content_ids[i],
+            }
+            for topic, i in slots.items()
+        }
 
     def _extract_topics_from_title(self, title: str) -> List[str]:
         """Extract potential topics from a title."""
-        if not title:
-            return []
-
-        # Remove common words and extract key phrases
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "from",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "must",
-            "shall",
-            "can",
-            "how",
-            "what",
-            "when",
-            "where",
-            "why",
-            "which",
-            "who",
-            "whom",
-            "this",
-            "that",
-            "these",
-            "those",
-            "your",
-            "our",
-            "my",
-            "their",
-            "its",
-        }
-
-        words = title.lower().split()
-        topics = []
-
-        # Extract individual important words
-        for word in words:
-            word = word.strip(",.!?;:\"'()-")
-            if len(word) >= 4 and word not in stop_words:
-                topics.append(word)
-
-        # Extract bigrams
-        for i in range(len(words) - 1):
-            w1 = words[i].strip(",.!?;:\"'()-")
-            w2 = words[i + 1].strip(",.!?;:\"'()-")
-            if w1 not in stop_words and w2 not in stop_words:
-                topics.append(f"{w1} {w2}")
-
-        return topics[:5]
+        return _tokenize_title(title)
 
     def _estimate_competition(self, score_data: Dict[str, Any]) -> str:
         """Estimate competition level for a topic."""
@@ -342,6 +380,9 @@ class RecommendationEngine:
     # Timing Recommendations
     # =========================================================================
 
+    @read_through(
+        "recommendations:timing", tags=performance_tags, enabled=uses_shared_store
+    )
     async def get_timing_recommendations(
         self,
         organization_id: Optional[str] = None,
@@ -379,99 +420,114 @@ class RecommendationEngine:
                 query = query.eq("content_type", content_type)
 
             result = await query.execute()
+            return self._build_timing_recommendations(result.data)
 
-            if not result.data or len(result.data) < self._min_data_points:
-                return self._get_default_timing_recommendations()
+        except Exception as e:
+            logger.error(f"Failed to get timing recommendations: {e}")
+            return self._get_default_timing_recommendations()
 
-            # Analyze performance by day and hour
-            timing_data = self._analyze_timing(result.data)
+    def _build_timing_recommendations(
+        self, content_data: Optional[List[Dict[str, Any]]]
+    ) -> List[TimingRecommendation]:
+        """Build day and hour recommendations from published content rows."""
+        if not content_data or len(content_data) < self._min_data_points:
+            return self._get_default_timing_recommendations()
 
-            # Generate recommendations
-            recommendations = []
+        # Analyze performance by day and hour
+        timing_data = self._analyze_timing(content_data)
+        if not timing_data["by_day"]:
+            return self._get_default_timing_recommendations()
 
-            # Best day recommendation
-            best_day = max(
-                timing_data["by_day"].items(), key=lambda x: x[1]["avg_engagement"]
-            )
-            recommendations.append(
-                TimingRecommendation(
-                    recommendation_type=RecommendationType.TIMING,
-                    title=f"Publish on {best_day[0].capitalize()}",
-                    description=f"Content published on {best_day[0]} shows "
-                    f"{best_day[1]['avg_engagement']:.0f}% higher engagement.",
-                    confidence=min(best_day[1]["count"] / 10, 0.9),
-                    priority=1,
-                    day_of_week=best_day[0],
-                    hour_utc=timing_data["best_hour"],
-                    expected_engagement_boost=best_day[1]["avg_engagement"],
-                )
-            )
+        # Generate recommendations
+        recommendations = []
 
-            # Best hour recommendation
-            best_hour = timing_data["best_hour"]
-            hour_data = timing_data["by_hour"].get(best_hour, {})
-            recommendations.append(
-                TimingRecommendation(
-                    recommendation_type=RecommendationType.TIMING,
-                    title=f"Post at {best_hour}:00 UTC",
-                    description=f"Content posted at this time receives "
-                    f"{hour_data.get('avg_views', 0):.0f} average views.",
-                    confidence=min(hour_data.get("count", 0) / 10, 0.85),
-                    priority=2,
-                    day_of_week="",
-                    hour_utc=best_hour,
-                    expected_engagement_boost=hour_data.get("avg_engagement", 0),
-                )
+        # Best day recommendation
+        best_day = max(
+            timing_data["by_day"].items(), key=lambda x: x[1]["avg_engagement"]
+        )
+        recommendations.append(
+            TimingRecommendation(
+                recommendation_type=RecommendationType.TIMING,
+                title=f"Publish on {best_day[0].capitalize()}",
+                description=f"Content published on {best_day[0]} shows "
+                f"{best_day[1]['avg_engagement']:.0f}% higher engagement.",
+                confidence=min(best_day[1]["count"] / 10, 0.9),
+                priority=1,
+                day_of_week=best_day[0],
+                hour_utc=timing_data["best_hour"],
+                expected_engagement_boost=best_day[1]["avg_engagement"],
             )
+        )
 
-            return recommendations
+        # Best hour recommendation
+        best_hour = timing_data["best_hour"]
+        hour_data = timing_data["by_hour"].get(best_hour, {})
+        recommendations.append(
+            TimingRecommendation(
+                recommendation_type=RecommendationType.TIMING,
+                title=f"Post at {best_hour}:00 UTC",
+                description=f"Content posted at this time receives "
+                f"{hour_data.get('avg_views', 0):.0f} average views.",
+                confidence=min(hour_data.get("count", 0) / 10, 0.85),
+                priority=2,
+                day_of_week="",
+                hour_utc=best_hour,
+                expected_engagement_boost=hour_data.get("avg_engagement", 0),
+            )
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to get timing recommendations: {e}")
-            return self._get_default_timing_recommendations()
+        return recommendations
 
     def _analyze_timing(self, content_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze content performance by timing."""
-        by_day = defaultdict(lambda: {"count": 0, "total_views": 0, "total_shares": 0})
-        by_hour = defaultdict(lambda: {"count": 0, "total_views": 0, "total_shares": 0})
+        """Analyze content performance by timing.
 
-        for item in content_data:
-            published_at = item.get("published_at")
-            if not published_at:
-                continue
+        Accumulates into fixed weekday (7) and hour (24) columns; parsed
+        timestamps are cached, so repeat runs only parse new values.
+        """
+        day_count, day_views, day_shares = [0] * 7, [0] * 7, [0] * 7
+        hour_count, hour_views, hour_shares = [0] * 24, [0] * 24, [0] * 24
+        day_order: List[int] = []
+        hour_order: List[int] = []
 
-            try:
-                dt = datetime.fromisoformat(published_at.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
+        for item in content_data:
+            slot = _publish_slot(item.get("published_at"))
+            if slot is None:
                 continue
 
-            day = dt.strftime("%A").lower()
-            hour = dt.hour
+            day, hour = slot
             views = item.get("views", 0)
             shares = item.get("shares", 0)
 
-            by_day[day]["count"] += 1
-            by_day[day]["total_views"] += views
-            by_day[day]["total_shares"] += shares
-
-            by_hour[hour]["count"] += 1
-            by_hour[hour]["total_views"] += views
-            by_hour[hour]["total_shares"] += shares
-
-        # Calculate averages and engagement scores
-        for data in by_day.values():
-            if data["count"] > 0:
-                data["avg_views"] = data["total_views"] / data["count"]
-                data["avg_engagement"] = (
-                    data["avg_views"] + data["total_shares"] * 10
-                ) / data["count"]
-
-        for data in by_hour.values():
-            if data["count"] > 0:
-                data["avg_views"] = data["total_views"] / data["count"]
-                data["avg_engagement"] = (
-                    data["avg_views"] + data["total_shares"] * 10
-                ) / data["count"]
+            if not day_count[day]:
+                day_order.append(day)
+            day_count[day] += 1
+            day_views[day] += views
+            day_shares[day] += shares
+
+            if not hour_count[hour]:
+                hour_order.append(hour)
+            hour_count[hour] += 1
+            hour_views[hour] += views
+            hour_shares[hour] += shares
+
+        # Averages and engagement scores, in first-seen order like the rows
+        def summarize(count: int, views: float, shares: float) -> Dict[str, Any]:
+            avg_views = views / count
+            return {
+                "count": count,
+                "total_views": views,
+                "total_shares": shares,
+                "avg_views": avg_views,
+                "avg_engagement": (avg_views + shares * 10) / count,
+            }
+
+        by_day = {
+            _WEEKDAYS[d]: summarize(day_count[d], day_views[d], day_shares[d])
+            for d in day_order
+        }
+        by_hour = {
+            h: summarize(hour_count[h], hour_views[h], hour_shares[h]) for h in hour_order
+        }
 
         # Find best hour
         best_hour = 9  # Default
@@ -479,8 +535,8 @@ class RecommendationEngine:
             best_hour = max(by_hour.items(), key=lambda x: x[1].get("avg_views", 0))[0]
 
         return {
-            "by_day": dict(by_day),
-            "by_hour": dict(by_hour),
+            "by_day": by_day,
+            "by_hour": by_hour,
             "best_hour": best_hour,
         }
 
@@ -513,6 +569,9 @@ class RecommendationEngine:
     # Format Recommendations
     # =========================================================================
 
+    @read_through(
+        "recommendations:format", tags=performance_tags, enabled=uses_shared_store
+    )
     async def get_format_recommendations(
         self,
         content_id: Optional[str] = None,
@@ -544,72 +603,90 @@ class RecommendationEngine:
                 query = query.eq("organization_id", organization_id)
 
             result = await query.execute()
+            return self._build_format_recommendations(result.data)
 
-            if not result.data or len(result.data) < self._min_data_points:
-                return self._get_default_format_recommendations()
+        except Exception as e:
+            logger.error(f"Failed to get format recommendations: {e}")
+            return self._get_default_format_recommendations()
 
-            # Calculate performance by format
-            format_performance = defaultdict(
-                lambda: {
-                    "count": 0,
-                    "total_views": 0,
-                    "total_shares": 0,
-                    "total_conversions": 0,
-                }
-            )
+    def _build_format_recommendations(
+        self, content_data: Optional[List[Dict[str, Any]]]
+    ) -> List[FormatRecommendation]:
+        """Rank content types by average views and shares."""
+        if not content_data or len(content_data) < self._min_data_points:
+            return self._get_default_format_recommendations()
 
-            for item in result.data:
-                content_type = item.get("content_type", "blog")
-                format_performance[content_type]["count"] += 1
-                format_performance[content_type]["total_views"] += item.get("views", 0)
-                format_performance[content_type]["total_shares"] += item.get(
-                    "shares", 0
-                )
-                format_performance[content_type]["total_conversions"] += item.get(
-                    "conversions", 0
-                )
+        format_performance = self._analyze_formats(content_data)
 
-            # Calculate averages
-            for data in format_performance.values():
-                if data["count"] > 0:
-                    data["avg_views"] = data["total_views"] / data["count"]
-                    data["avg_shares"] = data["total_shares"] / data["count"]
-                    data["score"] = data["avg_views"] + data["avg_shares"] * 5
-
-            # Sort by score and generate recommendations
-            sorted_formats = sorted(
-                format_performance.items(),
-                key=lambda x: x[1].get("score", 0),
-                reverse=True,
-            )
+        # Sort by score and generate recommendations
+        sorted_formats = sorted(
+            format_performance.items(),
+            key=lambda x: x[1].get("score", 0),
+            reverse=True,
+        )
 
-            recommendations = []
-            for i, (format_type, data) in enumerate(sorted_formats[:3]):
-                try:
-                    content_format = ContentFormat(format_type)
-                except ValueError:
-                    content_format = ContentFormat.BLOG
+        recommendations = []
+        for i, (format_type, data) in enumerate(sorted_formats[:3]):
+            try:
+                content_format = ContentFormat(format_type)
+            except ValueError:
+                content_format = ContentFormat.BLOG
 
-                recommendations.append(
-                    FormatRecommendation(
-                        recommendation_type=RecommendationType.FORMAT,
-                        title=f"Create {format_type.capitalize()} content",
-                        description=f"{format_type.capitalize()} content averages "
-                        f"{data['avg_views']:.0f} views and {data['avg_shares']:.0f} shares.",
-                        confidence=min(data["count"] / 20, 0.9),
-                        priority=i + 1,
-                        recommended_format=content_format,
-                        transformation_suggestions=self._get_format_suggestions(
-                            content_format
-                        ),
-                    )
+            recommendations.append(
+                FormatRecommendation(
+                    recommendation_type=RecommendationType.FORMAT,
+                    title=f"Create {format_type.capitalize()} content",
+                    description=f"{format_type.capitalize()} content averages "
+                    f"{data['avg_views']:.0f} views and {data['avg_shares']:.0f} shares.",
+                    confidence=min(data["count"] / 20, 0.9),
+                    priority=i + 1,
+                    recommended_format=content_format,
+                    transformation_suggestions=self._get_format_suggestions(
+                        content_format
+                    ),
                 )
+            )
 
-            return recommendations
+        return recommendations
 
-        except Exception as e:
-            logger.error(f"Failed to get format recommendations: {e}")
-            return self._get_default_format_recommendations()
+    def _analyze_formats(
+        self, content_data: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Per content type totals and averages, one accumulator slot per type."""
+        slots: Dict[str, int] = {}
+        counts: List[int] = []
+        views: List[float] = []
+        shares: List[float] = []
+        conversions: List[float] = []
+
+        for item in content_data:
+            content_type = item.get("content_type", "blog")
+            slot = slots.get(content_type)
+            if slot is None:
+                slot = slots[content_type] = len(counts)
+                counts.append(0)
+                views.append(0)
+                shares.append(0)
+                conversions.append(0)
+            counts[slot] += 1
+            views[slot] += item.get("views", 0)
+            shares[slot] += item.get("shares", 0)
+            conversions[slot] += item.get("conversions", 0)
+
+        performance = {}
+        for content_type, i in slots.items():
+            avg_views = views[i] / counts[i]
+            avg_shares = shares[i] / counts[i]
+            performance[content_type] = {
+                "count": counts[i],
+                "total_views": views[i],
+                "total_shares": shares[i],
+                "total_conversions": conversions[i],
+                "avg_views": avg_views,
+                "avg_shares": avg_shares,
+                "score": avg_views + avg_shares * 5,
+            }
+        return performance
 
     def _get_format_suggestions(self, content_format: ContentFormat) -> List[str]:
         """Get suggestions for a content format."""
@@ -678,6 +755,9 @@ class RecommendationEngine:
     # Keyword Recommendations
     # =========================================================================
 
+    @read_through(
+        "recommendations:keyword_opportunities", tags=seo_tags, enabled=uses_shared_store
+    )
     async def get_keyword_opportunities(
         self,
         organization_id: Optional[str] = None,
@@ -770,6 +850,7 @@ class RecommendationEngine:
         organization_id: Optional[str] = None,
         user_id: Optional[str] = None,
         limit_per_type: int = 3,
+        incremental: bool = False,
     ) -> List[ContentRecommendation]:
         """
         Get all types of recommendations.
@@ -778,39 +859,54 @@ class RecommendationEngine:
             organization_id: Optional organization filter.
             user_id: Optional user filter.
             limit_per_type: Maximum recommendations per type.
+            incremental: Score topic/timing/format from a cached snapshot of
+                the organization's content, re-reading only rows updated
+                since the previous run.
 
         Returns:
             List of all ContentRecommendation objects.
         """
-        all_recommendations = []
-
-        # Get topic recommendations
-        topic_recs = await self.get_topic_recommendations(
-            organization_id=organization_id,
-            user_id=user_id,
-            limit=limit_per_type,
-        )
-        all_recommendations.extend(topic_recs)
-
-        # Get timing recommendations
-        timing_recs = await self.get_timing_recommendations(
-            organization_id=organization_id,
-            user_id=user_id,
-        )
-        all_recommendations.extend(timing_recs[:limit_per_type])
+        if incremental:
+            snapshot, keyword_recs = await asyncio.gather(
+                self._refresh_snapshot(organization_id),
+                self.get_keyword_opportunities(
+                    organization_id=organization_id,
+                    limit=limit_per_type,
+                ),
+            )
+        else:
+            snapshot = None
 
-        # Get format recommendations
-        format_recs = await self.get_format_recommendations(
-            organization_id=organization_id,
-        )
-        all_recommendations.extend(format_recs[:limit_per_type])
+        if snapshot is not None:
+            topic_recs, timing_recs, format_recs = self._score_snapshot(
+                snapshot, user_id, limit_per_type
+            )
+        else:
+            topic_recs, timing_recs, format_recs, keyword_recs = await asyncio.gather(
+                self.get_topic_recommendations(
+                    organization_id=organization_id,
+                    user_id=user_id,
+                    limit=limit_per_type,
+                ),
+                self.get_timing_recommendations(
+                    organization_id=organization_id,
+                    user_id=user_id,
+                ),
+                self.get_format_recommendations(
+                    organization_id=organization_id,
+                ),
+                self.get_keyword_opportunities(
+                    organization_id=organization_id,
+                    limit=limit_per_type,
+                ),
+            )
 
-        # Get keyword opportunities
-        keyword_recs = await self.get_keyword_opportunities(
-            organization_id=organization_id,
-            limit=limit_per_type,
-        )
-        all_recommendations.extend(keyword_recs)
+        all_recommendations: List[ContentRecommendation] = [
+            *topic_recs,
+            *timing_recs[:limit_per_type],
+            *format_recs[:limit_per_type],
+            *keyword_recs,
+        ]
 
         # Sort by priority and confidence
         all_recommendations.sort(key=lambda r: (r.priority, -r.confidence))
@@ -818,8 +914,88 @@ class RecommendationEngine:
         # Store recommendations
         await self._store_recommendations(all_recommendations, organization_id, user_id)
 
+        if snapshot is not None:
+            snapshots = self._snapshot_store()
+            snapshots[organization_id] = snapshot
+            snapshots.move_to_end(organization_id)
+            while len(snapshots) > _MAX_SNAPSHOTS:
+                snapshots.popitem(last=False)
+
         return all_recommendations
 
+    # =========================================================================
+    # Incremental Snapshots
+    # =========================================================================
+
+    def _snapshot_store(self) -> "OrderedDict[Optional[str], _ContentSnapshot]":
+        """Shared snapshots for the Neon store; per-instance for injected clients."""
+        if uses_shared_store(self):
+            return _shared_snapshots
+        return self._local_snapshots
+
+    async def _refresh_snapshot(
+        self, organization_id: Optional[str]
+    ) -> Optional[_ContentSnapshot]:
+        """Load the organization's content, reusing the previous snapshot.
+
+        Returns None when no database is configured or the read fails, in
+        which case callers fall back to the per-family queries.
+        """
+        supabase = self._get_supabase()
+        if not supabase:
+            return None
+
+        now = datetime.now(timezone.utc)
+        previous = self._snapshot_store().get(organization_id)
+        if previous is not None and now - previous.created_at > SNAPSHOT_MAX_AGE:
+            previous = None
+
+        try:
+            query = supabase.table("content_performance").select(_SNAPSHOT_COLUMNS)
+            if organization_id:
+                query = query.eq("organization_id", organization_id)
+            if previous is not None:
+                since = previous.loaded_at - _SNAPSHOT_OVERLAP
+                query = query.gte("updated_at", since.isoformat())
+            result = await query.execute()
+        except Exception as e:
+            logger.error(f"Failed to refresh recommendation snapshot: {e}")
+            return None
+
+        rows = dict(previous.rows) if previous is not None else {}
+        for row in result.data or []:
+            rows[row.get("content_id")] = row
+
+        return _ContentSnapshot(
+            rows=rows,
+            loaded_at=now,
+            created_at=previous.created_at if previous is not None else now,
+        )
+
+    def _score_snapshot(
+        self,
+        snapshot: _ContentSnapshot,
+        user_id: Optional[str],
+        limit_per_type: int,
+    ) -> Tuple[
+        List[TopicRecommendation], List[TimingRecommendation], List[FormatRecommendation]
+    ]:
+        """Apply each family's filters in memory and score the snapshot rows."""
+        rows = list(snapshot.rows.values())
+        user_rows = [r for r in rows if r.get("user_id") == user_id] if user_id else rows
+
+        top_rows = heapq.nlargest(
+            TOPIC_SAMPLE_SIZE, user_rows, key=lambda r: r.get("views") or 0
+        )
+        published_rows = [r for r in user_rows if r.get("published_at") is not None]
+
+        return (
+            self._build_topic_recommendations(top_rows, limit_per_type),
+            self._build_timing_recommendations(published_rows),
+            # The format family is organization-wide, like its query.
+            self._build_format_recommendations(rows),
+        )
+
     async def _store_recommendations(
         self,
         recommendations: List[ContentRecommendation],
@@ -840,9 +1016,9 @@ class RecommendationEngine:
                 delete_query = delete_query.eq("user_id", user_id)
             await delete_query.execute()
 
-            # Insert new recommendations
-            for rec in recommendations:
-                data = {
+            # Insert new recommendations in one statement
+            rows = [
+                {
                     "recommendation_type": rec.recommendation_type.value,
                     "title": rec.title,
                     "description": rec.description,
@@ -857,7 +1033,10 @@ class RecommendationEngine:
                         rec.expires_at.isoformat() if rec.expires_at else None
                     ),
                 }
-                await supabase.table("content_recommendations").insert(data).execute()
+                for rec in recommendations
+            ]
+            if rows:
+                await supabase.table("content_recommendations").insert(rows).execute()
 
         except Exception as e:
             logger.error(f"Failed to store recommendations: {e}")
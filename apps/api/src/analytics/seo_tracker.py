@@ -8,17 +8,28 @@ This service handles:
 - Keyword opportunity detection
 """
 
+import asyncio
+import json
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
-import requests
+import httpx
 
 from ..types.performance import (
     SEOAnalysis,
     SEORanking,
 )
+from ..db import execute, fetch
+from ..storage.query_cache import read_through
+from ..utils import http_client
+from .cache import (
+    invalidate_seo_keyword,
+    invalidate_seo_keywords,
+    seo_keyword_tags,
+    uses_shared_store,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -115,65 +126,18 @@ class SEOTracker:
             raise SEOTrackerError("SERP API key not configured")
 
         try:
-            params = {
-                "api_key": self._api_key,
-                "q": keyword,
-                "location": location or self._default_location,
-                "hl": language or self._default_language,
-                "num": 100,  # Check top 100 results
-                "engine": search_engine,
-            }
-
-            response = requests.get(self.SERP_API_BASE_URL, params=params, timeout=30)
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Find the target URL in organic results
-            organic_results = data.get("organic_results", [])
-            position = None
-            found_url = None
-
-            # Normalize target URL for comparison
-            target_domain = self._extract_domain(target_url)
-
-            for i, result in enumerate(organic_results, start=1):
-                result_url = result.get("link", "")
-                result_domain = self._extract_domain(result_url)
-
-                # Check for exact URL match or domain match
-                if target_url in result_url or target_domain == result_domain:
-                    position = i
-                    found_url = result_url
-                    break
+            position, found_url = await self._lookup_position(
+                keyword, target_url, location, language, search_engine
+            )
 
             if position is None:
                 # Not found in top 100
-                return SEORanking(
-                    keyword=keyword,
-                    position=0,  # 0 indicates not found
-                    url=None,
-                    search_engine=search_engine,
-                    location=location or self._default_location,
-                )
+                return self._build_ranking(keyword, None, None, None, location, search_engine)
 
             # Get previous ranking for comparison
             previous_ranking = await self._get_previous_ranking(keyword, target_url)
-            previous_position = previous_ranking.position if previous_ranking else None
-            change = (previous_position - position) if previous_position else 0
-
-            # Get search volume if available
-            search_volume = self._get_search_volume(keyword)
-
-            ranking = SEORanking(
-                keyword=keyword,
-                position=position,
-                previous_position=previous_position,
-                change=change,
-                search_volume=search_volume,
-                url=found_url,
-                search_engine=search_engine,
-                location=location or self._default_location,
+            ranking = self._build_ranking(
+                keyword, position, found_url, previous_ranking, location, search_engine
             )
 
             # Store the ranking
@@ -181,46 +145,112 @@ class SEOTracker:
 
             return ranking
 
-        except requests.Timeout:
+        except httpx.TimeoutException:
             raise SEOTrackerError(f"SERP API request timed out for keyword: {keyword}")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             raise SEOTrackerError(f"SERP API request failed: {str(e)}")
         except Exception as e:
             raise SEOTrackerError(f"Error checking keyword ranking: {str(e)}")
 
+    async def _lookup_position(
+        self,
+        keyword: str,
+        target_url: str,
+        location: Optional[str],
+        language: Optional[str],
+        search_engine: str,
+    ) -> Tuple[Optional[int], Optional[str]]:
+        """Query the SERP API; return (position, matching URL) or (None, None)."""
+        params = {
+            "api_key": self._api_key,
+            "q": keyword,
+            "location": location or self._default_location,
+            "hl": language or self._default_language,
+            "num": 100,  # Check top 100 results
+            "engine": search_engine,
+        }
+
+        response = await http_client.get(self.SERP_API_BASE_URL, params=params, timeout=30)
+        response.raise_for_status()
+
+        data = response.json()
+
+        # Normalize target URL for comparison
+        target_domain = self._extract_domain(target_url)
+
+        # Find the target URL in organic results
+        for i, result in enumerate(data.get("organic_results", []), start=1):
+            result_url = result.get("link", "")
+            result_domain = self._extract_domain(result_url)
+
+            # Check for exact URL match or domain match
+            if target_url in result_url or target_domain == result_domain:
+                return i, result_url
+
+        return None, None
+
+    def _build_ranking(
+        self,
+        keyword: str,
+        position: Optional[int],
+        found_url: Optional[str],
+        previous_ranking: Optional[SEORanking],
+        location: Optional[str],
+        search_engine: str,
+    ) -> SEORanking:
+        """Ranking for a lookup result, with change against the previous one."""
+        if position is None:
+            return SEORanking(
+                keyword=keyword,
+                position=0,  # 0 indicates not found
+                url=None,
+                search_engine=search_engine,
+                location=location or self._default_location,
+            )
+
+        previous_position = previous_ranking.position if previous_ranking else None
+        change = (previous_position - position) if previous_position else 0
+
+        return SEORanking(
+            keyword=keyword,
+            position=position,
+            previous_position=previous_position,
+            change=change,
+            # Get search volume if available
+            search_volume=self._get_search_volume(keyword),
+            url=found_url,
+            search_engine=search_engine,
+            location=location or self._default_location,
+        )
+
     async def track_multiple_keywords(
         self,
         keywords: List[str],
         target_url: str,
         location: Optional[str] = None,
+        sweep_id: Optional[str] = None,
     ) -> List[SEORanking]:
         """
         Track rankings for multiple keywords.
 
+        Lookups run concurrently under the SERP rate limit, previous rankings
+        are loaded in one query and changed rankings written in one insert
+        (see ``RankSweep``).
+
         Args:
             keywords: List of keywords to track.
             target_url: The URL to find in search results.
             location: Search location.
+            sweep_id: Checkpoint name; a sweep interrupted with the same id
+                resumes without repeating finished lookups.
 
         Returns:
             List of SEORanking objects.
         """
-        rankings = []
-
-        for keyword in keywords:
-            try:
-                ranking = await self.check_keyword_ranking(
-                    keyword=keyword,
-                    target_url=target_url,
-                    location=location,
-                )
-                if ranking:
-                    rankings.append(ranking)
-            except SEOTrackerError as e:
-                logger.warning(f"Failed to track keyword '{keyword}': {e}")
-                continue
+        from .rank_sweep import RankSweep
 
-        return rankings
+        sweep = RankSweep(self, sweep_id=sweep_id)
+        return await sweep.run(keywords, target_url, location=location)
 
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL."""
@@ -258,23 +288,67 @@ class SEOTracker:
             )
 
             if result.data:
-                record = result.data[0]
-                return SEORanking(
-                    keyword=record["keyword"],
-                    position=record["position"],
-                    previous_position=record.get("previous_position"),
-                    change=record.get("change", 0),
-                    search_volume=record.get("search_volume"),
-                    url=record.get("url"),
-                    tracked_at=datetime.fromisoformat(record["tracked_at"]),
-                    search_engine=record.get("search_engine", "google"),
-                    location=record.get("location", "us"),
-                )
+                return self._ranking_from_record(result.data[0])
         except Exception as e:
             logger.error(f"Failed to get previous ranking: {e}")
 
         return None
 
+    async def _get_previous_rankings(
+        self,
+        keywords: List[str],
+        target_url: str,
+    ) -> Dict[str, SEORanking]:
+        """Latest stored ranking per keyword for ``target_url``, in one query."""
+        supabase = self._get_supabase()
+        if not supabase or not keywords:
+            return {}
+
+        from .neon_query import NeonQueryClient
+
+        if not isinstance(supabase, NeonQueryClient):
+            # The builder API has no DISTINCT ON / IN; fall back to one
+            # lookup per keyword, run concurrently.
+            previous = await asyncio.gather(
+                *(self._get_previous_ranking(keyword, target_url) for keyword in keywords)
+            )
+            return {r.keyword: r for r in previous if r is not None}
+
+        try:
+            rows = await fetch(
+                """
+                SELECT DISTINCT ON (keyword) keyword, position, previous_position,
+                       change, search_volume, url, tracked_at, search_engine, location
+                FROM seo_rankings
+                WHERE url = $1 AND keyword = ANY($2::text[])
+                ORDER BY keyword, tracked_at DESC
+                """,
+                target_url,
+                list(keywords),
+            )
+        except Exception as e:
+            logger.error(f"Failed to get previous rankings: {e}")
+            return {}
+
+        return {row["keyword"]: self._ranking_from_record(dict(row)) for row in rows}
+
+    def _ranking_from_record(self, record: Dict[str, Any]) -> SEORanking:
+        """Build an SEORanking from a seo_rankings row."""
+        tracked_at = record["tracked_at"]
+        if isinstance(tracked_at, str):
+            tracked_at = datetime.fromisoformat(tracked_at)
+        return SEORanking(
+            keyword=record["keyword"],
+            position=record["position"],
+            previous_position=record.get("previous_position"),
+            change=record.get("change", 0),
+            search_volume=record.get("search_volume"),
+            url=record.get("url"),
+            tracked_at=tracked_at,
+            search_engine=record.get("search_engine", "google"),
+            location=record.get("location", "us"),
+        )
+
     async def _store_ranking(self, ranking: SEORanking, target_url: str) -> None:
         """Store a ranking in the database."""
         supabase = self._get_supabase()
@@ -282,23 +356,71 @@ class SEOTracker:
             return
 
         try:
-            data = {
-                "keyword": ranking.keyword,
-                "position": ranking.position,
-                "previous_position": ranking.previous_position,
-                "change": ranking.change,
-                "search_volume": ranking.search_volume,
-                "difficulty": ranking.difficulty,
-                "url": target_url,
-                "tracked_at": ranking.tracked_at.isoformat(),
-                "search_engine": ranking.search_engine,
-                "location": ranking.location,
-            }
-
+            data = self._ranking_row(ranking, target_url)
             await supabase.table("seo_rankings").insert(data).execute()
+            await invalidate_seo_keyword(ranking.keyword)
         except Exception as e:
             logger.error(f"Failed to store ranking: {e}")
 
+    async def _store_rankings(
+        self,
+        rankings: List[SEORanking],
+        target_url: str,
+        unchanged: Sequence[str] = (),
+    ) -> bool:
+        """
+        Store a sweep in one call (``record_rank_sweep``): insert the changed
+        rankings and mark the latest row of each ``unchanged`` keyword as
+        checked now. Returns False on failure.
+        """
+        supabase = self._get_supabase()
+        if not supabase or not (rankings or unchanged):
+            return True
+
+        from .neon_query import NeonQueryClient
+
+        rows = [self._ranking_row(ranking, target_url) for ranking in rankings]
+        checked_at = datetime.now(timezone.utc)
+        try:
+            if isinstance(supabase, NeonQueryClient):
+                await execute(
+                    "SELECT record_rank_sweep($1, $2::jsonb, $3::text[], $4)",
+                    target_url,
+                    json.dumps(rows),
+                    list(unchanged),
+                    checked_at,
+                )
+            else:
+                await supabase.rpc(
+                    "record_rank_sweep",
+                    {
+                        "p_url": target_url,
+                        "p_rows": rows,
+                        "p_unchanged": list(unchanged),
+                        "p_checked_at": checked_at.isoformat(),
+                    },
+                ).execute()
+            await invalidate_seo_keywords([*(r.keyword for r in rankings), *unchanged])
+            return True
+        except Exception as e:
+            logger.error(f"Failed to store {len(rankings)} rankings: {e}")
+            return False
+
+    def _ranking_row(self, ranking: SEORanking, target_url: str) -> Dict[str, Any]:
+        return {
+            "keyword": ranking.keyword,
+            "position": ranking.position,
+            "previous_position": ranking.previous_position,
+            "change": ranking.change,
+            "search_volume": ranking.search_volume,
+            "difficulty": ranking.difficulty,
+            "url": target_url,
+            "tracked_at": ranking.tracked_at.isoformat(),
+            "last_checked_at": ranking.tracked_at.isoformat(),
+            "search_engine": ranking.search_engine,
+            "location": ranking.location,
+        }
+
     def _get_search_volume(self, keyword: str) -> Optional[int]:
         """
         Get estimated search volume for a keyword.
@@ -314,6 +436,9 @@ class SEOTracker:
     # Ranking History
     # =========================================================================
 
+    @read_through(
+        "seo_ranking_history", tags=seo_keyword_tags, enabled=uses_shared_store
+    )
     async def get_ranking_history(
         self,
         keyword: str,
@@ -342,7 +467,7 @@ class SEOTracker:
                 supabase.table("seo_rankings")
                 .select("*")
                 .eq("keyword", keyword)
-                .gte("tracked_at", start_date.isoformat())
+                .gte("last_checked_at", start_date.isoformat())
                 .order("tracked_at", desc=True)
             )
 
@@ -399,7 +524,7 @@ class SEOTracker:
                 supabase.table("seo_rankings")
                 .select("*")
                 .eq("content_id", content_id)
-                .gte("tracked_at", start_date.isoformat())
+                .gte("last_checked_at", start_date.isoformat())
                 .order("tracked_at", desc=True)
                 .execute()
             )
@@ -462,7 +587,7 @@ class SEOTracker:
                 "num": 100,
             }
 
-            response = requests.get(self.SERP_API_BASE_URL, params=params, timeout=30)
+            response = http_client.get_sync(self.SERP_API_BASE_URL, params=params, timeout=30)
             response.raise_for_status()
 
             data = response.json()
@@ -524,7 +649,7 @@ class SEOTracker:
                 },
             }
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Competitor comparison failed: {e}")
             return {"error": str(e)}
 
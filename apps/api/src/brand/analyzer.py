@@ -8,9 +8,9 @@ import hashlib
 import json
 import logging
 import re
-from collections import Counter
 from typing import Any, Dict, List, Optional
 
+from src.scoring.text_analysis import analyze_text
 from src.utils.cache import get_voice_analysis_cache
 
 logger = logging.getLogger(__name__)
@@ -68,7 +68,7 @@ class VoiceAnalyzer:
 
     def _get_content_hash(self, content: str, content_type: ContentType) -> str:
         """Generate a hash key for caching based on content."""
-        content_key = f"{content[:500]}:{content_type.value}:{self.provider_type}"
+        content_key = f"{content}:{content_type.value}:{self.provider_type}"
         return hashlib.sha256(content_key.encode()).hexdigest()[:16]
 
     def analyze(
@@ -122,20 +122,21 @@ class VoiceAnalyzer:
     def _analyze_vocabulary(self, content: str) -> VocabularyProfile:
         """Analyze vocabulary patterns."""
         # Tokenize
-        words = re.findall(r'\b[a-zA-Z]+\b', content.lower())
+        analysis = analyze_text(content)
+        words = analysis.words
         if not words:
             return VocabularyProfile()
 
         # Word frequency
-        word_counts = Counter(words)
+        word_counts = analysis.word_counts
         common_words = [word for word, _ in word_counts.most_common(20)]
 
         # Unique phrases (2-3 word combinations)
         phrases = self._extract_phrases(content)
 
         # Calculate metrics
-        avg_word_length = sum(len(w) for w in words) / len(words)
-        unique_words = len(set(words))
+        avg_word_length = analysis.avg_word_length
+        unique_words = len(word_counts)
         vocabulary_richness = unique_words / len(words) if words else 0
 
         # Detect formality indicators
@@ -149,39 +150,33 @@ class VoiceAnalyzer:
             "yeah", "nope", "hey", "stuff", "thing", "guys"
         ]
 
-        formality_found = [w for w in words if w in formal_words]
-        casual_found = [w for w in words if w in casual_words]
+        formality_found = [w for w in formal_words if w in word_counts]
+        casual_found = [w for w in casual_words if w in word_counts]
 
         return VocabularyProfile(
             common_words=common_words,
             unique_phrases=phrases[:10],
             avg_word_length=round(avg_word_length, 2),
             vocabulary_richness=round(vocabulary_richness, 3),
-            formality_indicators=list(set(formality_found)),
-            casual_indicators=list(set(casual_found)),
+            formality_indicators=formality_found,
+            casual_indicators=casual_found,
         )
 
     def _extract_phrases(self, content: str) -> List[str]:
         """Extract meaningful 2-3 word phrases."""
-        # Simple n-gram extraction
-        words = re.findall(r'\b[a-zA-Z]+\b', content.lower())
-        phrases: List[str] = []
-
-        # Bigrams
-        for i in range(len(words) - 1):
-            phrase = f"{words[i]} {words[i+1]}"
-            if len(words[i]) > 3 and len(words[i+1]) > 3:
-                phrases.append(phrase)
-
-        # Count and get most common
-        phrase_counts = Counter(phrases)
-        return [p for p, c in phrase_counts.most_common(15) if c > 1]
+        # Bigrams of content words, most common first
+        phrases = [
+            (f"{first} {second}", count)
+            for (first, second), count in analyze_text(content).bigram_counts.most_common()
+            if len(first) > 3 and len(second) > 3
+        ]
+        return [p for p, c in phrases[:15] if c > 1]
 
     def _analyze_sentences(self, content: str) -> SentencePatterns:
         """Analyze sentence structure patterns."""
         # Split into sentences
-        sentences = re.split(r'[.!?]+', content)
-        sentences = [s.strip() for s in sentences if s.strip()]
+        analysis = analyze_text(content)
+        sentences = analysis.sentences
 
         if not sentences:
             return SentencePatterns()
@@ -221,7 +216,7 @@ class VoiceAnalyzer:
             "in contrast", "on the other hand", "for example",
             "in addition", "as a result", "in conclusion"
         ]
-        content_lower = content.lower()
+        content_lower = analysis.lower
         found_transitions = [t for t in transitions if t in content_lower]
 
         return SentencePatterns(
@@ -331,7 +326,7 @@ Return ONLY the JSON, no other text."""
         score = 0.0
 
         # Word count (50-2000 words is ideal)
-        word_count = len(content.split())
+        word_count = analyze_text(content).token_count
         if 50 <= word_count <= 2000:
             score += 0.3
         elif 30 <= word_count < 50 or 2000 < word_count <= 3000:
@@ -0,0 +1,154 @@
+"""
+Incremental voice fingerprint aggregation.
+
+A fingerprint is derived from VoiceStatistics: per-metric running sums and
+sums of squares plus term counters, summed over the analyses of the samples
+it was trained on. Adding or removing a sample adds or subtracts that one
+sample's analysis, so keeping a fingerprint current costs O(sample) rather
+than a pass over every sample in the profile.
+"""
+
+from typing import Dict, List
+
+from src.types.brand import (
+    MetricMoments,
+    SampleAnalysis,
+    SentencePatterns,
+    StyleMetrics,
+    ToneDistribution,
+    VocabularyProfile,
+    VoiceStatistics,
+)
+
+_VOCABULARY_METRICS = ("avg_word_length", "vocabulary_richness")
+_SENTENCE_METRICS = (
+    "avg_sentence_length",
+    "sentence_length_variance",
+    "question_frequency",
+    "exclamation_frequency",
+    "complex_sentence_ratio",
+)
+_TONE_METRICS = tuple(ToneDistribution.model_fields)
+_STYLE_METRICS = tuple(StyleMetrics.model_fields)
+
+
+def _metric_values(analysis: SampleAnalysis) -> Dict[str, float]:
+    values: Dict[str, float] = {}
+    for name in _VOCABULARY_METRICS:
+        values[f"vocabulary.{name}"] = getattr(analysis.vocabulary, name)
+    for name in _SENTENCE_METRICS:
+        values[f"sentences.{name}"] = getattr(analysis.sentences, name)
+    for name in _TONE_METRICS:
+        values[f"tone.{name}"] = getattr(analysis.tone, name)
+    for name in _STYLE_METRICS:
+        values[f"style.{name}"] = getattr(analysis.style, name)
+    values["quality_score"] = analysis.quality_score
+    return values
+
+
+def _counter_values(analysis: SampleAnalysis) -> Dict[str, List[str]]:
+    return {
+        "common_words": analysis.vocabulary.common_words,
+        "unique_phrases": analysis.vocabulary.unique_phrases,
+        "formality_indicators": analysis.vocabulary.formality_indicators,
+        "casual_indicators": analysis.vocabulary.casual_indicators,
+        "opening_patterns": analysis.sentences.opening_patterns,
+        "transition_words": analysis.sentences.transition_words,
+    }
+
+
+def _apply(stats: VoiceStatistics, analysis: SampleAnalysis, sign: int) -> None:
+    stats.sample_count += sign
+    for name, value in _metric_values(analysis).items():
+        moments = stats.metrics.setdefault(name, MetricMoments())
+        moments.total += sign * value
+        moments.total_sq += sign * value * value
+    for name, terms in _counter_values(analysis).items():
+        counts = stats.counters.setdefault(name, {})
+        for term in terms:
+            count = counts.get(term, 0) + sign
+            if count > 0:
+                counts[term] = count
+            else:
+                counts.pop(term, None)
+
+
+def add_sample(stats: VoiceStatistics, sample_id: str, analysis: SampleAnalysis) -> None:
+    """Fold one sample's analysis into the statistics (in place)."""
+    _apply(stats, analysis, 1)
+    stats.sample_ids.append(sample_id)
+
+
+def remove_sample(stats: VoiceStatistics, sample_id: str, analysis: SampleAnalysis) -> bool:
+    """
+    Take one sample's analysis back out of the statistics (in place).
+
+    ``analysis`` must be the analysis the sample was added with. Returns
+    False if the sample was not part of the statistics.
+    """
+    if sample_id not in stats.sample_ids:
+        return False
+    stats.sample_ids.remove(sample_id)
+    if not stats.sample_ids:
+        # Start clean rather than carry floating-point residue.
+        stats.sample_count = 0
+        stats.metrics.clear()
+        stats.counters.clear()
+        return True
+    _apply(stats, analysis, -1)
+    return True
+
+
+def _top(stats: VoiceStatistics, counter: str, limit: int) -> List[str]:
+    counts = stats.counters.get(counter, {})
+    # Ties broken alphabetically so the result does not depend on sample order.
+    ranked = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+    return [term for term, _ in ranked[:limit]]
+
+
+def _present(stats: VoiceStatistics, counter: str) -> List[str]:
+    return sorted(stats.counters.get(counter, {}))
+
+
+def aggregate_vocabulary(stats: VoiceStatistics) -> VocabularyProfile:
+    """Vocabulary profile across the included samples."""
+    return VocabularyProfile(
+        common_words=_top(stats, "common_words", 30),
+        unique_phrases=_top(stats, "unique_phrases", 15),
+        avg_word_length=round(stats.mean("vocabulary.avg_word_length"), 2),
+        vocabulary_richness=round(stats.mean("vocabulary.vocabulary_richness"), 3),
+        formality_indicators=_present(stats, "formality_indicators"),
+        casual_indicators=_present(stats, "casual_indicators"),
+    )
+
+
+def aggregate_sentences(stats: VoiceStatistics) -> SentencePatterns:
+    """Sentence patterns across the included samples."""
+    return SentencePatterns(
+        avg_sentence_length=round(stats.mean("sentences.avg_sentence_length"), 1),
+        sentence_length_variance=round(stats.mean("sentences.sentence_length_variance"), 2),
+        question_frequency=round(stats.mean("sentences.question_frequency"), 3),
+        exclamation_frequency=round(stats.mean("sentences.exclamation_frequency"), 3),
+        complex_sentence_ratio=round(stats.mean("sentences.complex_sentence_ratio"), 3),
+        opening_patterns=_top(stats, "opening_patterns", 10),
+        transition_words=_present(stats, "transition_words"),
+    )
+
+
+def aggregate_tone(stats: VoiceStatistics) -> ToneDistribution:
+    """Mean tone distribution across the included samples."""
+    return ToneDistribution(**{
+        name: round(stats.mean(f"tone.{name}"), 3) for name in _TONE_METRICS
+    })
+
+
+def aggregate_style(stats: VoiceStatistics) -> StyleMetrics:
+    """Mean style metrics across the included samples."""
+    return StyleMetrics(**{
+        name: round(stats.mean(f"style.{name}"), 3) for name in _STYLE_METRICS
+    })
+
+
+def training_quality(stats: VoiceStatistics) -> float:
+    """Mean sample quality score."""
+    return round(stats.mean("quality_score"), 3)
@@ -4,6 +4,7 @@ Voice Consistency Scorer.
 Scores generated content against a trained brand voice fingerprint.
 """
 
+import hashlib
 import logging
 import re
 import json
@@ -17,6 +18,7 @@ from src.types.brand import (
     SampleAnalysis,
     ContentType,
 )
+from src.utils.cache import get_voice_feedback_cache
 
 logger = logging.getLogger(__name__)
 
@@ -39,8 +41,16 @@ class VoiceScorer:
         content: str,
         fingerprint: VoiceFingerprint,
         content_type: ContentType = ContentType.TEXT,
+        include_feedback: bool = True,
     ) -> VoiceScore:
-        """Score content against the voice fingerprint."""
+        """
+        Score content against the voice fingerprint.
+
+        The numeric scores, deviations and suggestions are computed locally
+        from the (cached) sample analysis. LLM feedback is served from the
+        feedback cache when available; otherwise it is only generated when
+        ``include_feedback`` is set, and left empty when it is not.
+        """
         # Analyze the content
         analysis = self.analyzer.analyze(content, content_type)
 
@@ -61,9 +71,8 @@ class VoiceScorer:
             analysis, fingerprint, content
         )
 
-        # Get detailed feedback from LLM
-        feedback = self._get_llm_feedback(
-            content, fingerprint, analysis, overall_score
+        feedback = self._get_feedback(
+            content, fingerprint, analysis, overall_score, include_feedback
         )
 
         return VoiceScore(
@@ -251,6 +260,39 @@ class VoiceScorer:
 
         return deviations, suggestions
 
+    def _feedback_cache_key(
+        self,
+        content: str,
+        fingerprint: VoiceFingerprint,
+        overall_score: float,
+    ) -> str:
+        """Key feedback by everything its prompt depends on."""
+        key = f"{self.provider_type}:{overall_score:.3f}:{fingerprint.voice_summary}:{content}"
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def _get_feedback(
+        self,
+        content: str,
+        fingerprint: VoiceFingerprint,
+        analysis: SampleAnalysis,
+        overall_score: float,
+        include_feedback: bool,
+    ) -> Dict[str, Any]:
+        """Cached LLM feedback, generated only when requested."""
+        cache = get_voice_feedback_cache()
+        cache_key = self._feedback_cache_key(content, fingerprint, overall_score)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached
+        if not include_feedback:
+            return {}
+
+        feedback = self._request_llm_feedback(content, fingerprint, analysis, overall_score)
+        if feedback is None:
+            return self._fallback_feedback(overall_score)
+        cache.set(cache_key, feedback)
+        return feedback
+
     def _get_llm_feedback(
         self,
         content: str,
@@ -259,6 +301,19 @@ class VoiceScorer:
         overall_score: float,
     ) -> Dict[str, Any]:
         """Get detailed feedback from LLM."""
+        feedback = self._request_llm_feedback(content, fingerprint, analysis, overall_score)
+        if feedback is None:
+            return self._fallback_feedback(overall_score)
+        return feedback
+
+    def _request_llm_feedback(
+        self,
+        content: str,
+        fingerprint: VoiceFingerprint,
+        analysis: SampleAnalysis,
+        overall_score: float,
+    ) -> Optional[Dict[str, Any]]:
+        """Ask the LLM for feedback; None if the response is unusable."""
         # Truncate content if needed
         content_excerpt = content[:1500] if len(content) > 1500 else content
 
@@ -294,7 +349,11 @@ Return ONLY the JSON."""
                 return json.loads(json_match.group())
         except (json.JSONDecodeError, ValueError) as e:
             logger.warning("Feedback generation error: %s", e)
+        return None
+
 
+    def _fallback_feedback(self, overall_score: float) -> Dict[str, Any]:
+        """Grade-only feedback used when the LLM response is unusable."""
         # Fallback feedback
         grade = (
             "A" if overall_score >= 0.85
@@ -315,7 +374,8 @@ def score_content(
     fingerprint: VoiceFingerprint,
     content_type: ContentType = ContentType.TEXT,
     provider_type: str = "openai",
+    include_feedback: bool = True,
 ) -> VoiceScore:
     """Convenience function to score content."""
     scorer = VoiceScorer(provider_type)
-    return scorer.score(content, fingerprint, content_type)
+    return scorer.score(content, fingerprint, content_type, include_feedback)
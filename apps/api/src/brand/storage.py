@@ -25,6 +25,7 @@ from src.types.brand import (
     VocabularyProfile,
     VoiceFingerprint,
     VoiceSample,
+    VoiceStatistics,
 )
 
 logger = logging.getLogger(__name__)
@@ -132,6 +133,7 @@ class InMemoryBrandVoiceStorage(BaseBrandVoiceStorage):
             sample_count=fingerprint.sample_count,
             training_quality=fingerprint.training_quality,
             last_trained_at=datetime.now(timezone.utc).isoformat(),
+            statistics=fingerprint.statistics,
         )
         self._fingerprints[(user_id, fingerprint.profile_id)] = updated
         return fingerprint_id
@@ -207,6 +209,7 @@ class PostgresBrandVoiceStorage(BaseBrandVoiceStorage):
             sample_count=row.get("sample_count", 0),
             training_quality=row.get("training_quality", 0.0),
             last_trained_at=last_trained_at,
+            statistics=VoiceStatistics(**row["statistics"]) if row.get("statistics") else None,
         )
 
     async def get_samples(self, user_id: str, profile_id: str) -> List[VoiceSample]:
@@ -310,9 +313,10 @@ class PostgresBrandVoiceStorage(BaseBrandVoiceStorage):
               voice_summary,
               sample_count,
               training_quality,
+              statistics,
               last_trained_at
             )
-            VALUES ($1, $2::uuid, $3, $4, $5, $6, $7, $8, $9, NOW())
+            VALUES ($1, $2::uuid, $3, $4, $5, $6, $7, $8, $9, $10, NOW())
             ON CONFLICT (user_id, profile_id)
             DO UPDATE SET
               vocabulary_profile = EXCLUDED.vocabulary_profile,
@@ -322,6 +326,7 @@ class PostgresBrandVoiceStorage(BaseBrandVoiceStorage):
               voice_summary = EXCLUDED.voice_summary,
               sample_count = EXCLUDED.sample_count,
               training_quality = EXCLUDED.training_quality,
+              statistics = EXCLUDED.statistics,
               last_trained_at = NOW(),
               updated_at = NOW()
             RETURNING id
@@ -335,6 +340,7 @@ class PostgresBrandVoiceStorage(BaseBrandVoiceStorage):
             fingerprint.voice_summary,
             fingerprint.sample_count,
             fingerprint.training_quality,
+            fingerprint.statistics.model_dump() if fingerprint.statistics else None,
         )
         if not row:
             raise RuntimeError("Failed to save fingerprint")
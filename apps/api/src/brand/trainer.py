@@ -5,22 +5,21 @@ Aggregates sample analyses into a unified voice fingerprint for content generati
 """
 
 import logging
-from collections import Counter
-from typing import Any, Dict, List, Optional
+from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
 from src.text_generation.core import GenerationOptions, generate_text, create_provider_from_env
+from src.brand import fingerprint_stats
 from src.brand.analyzer import VoiceAnalyzer
 from src.types.brand import (
-    SampleAnalysis,
     VoiceFingerprint,
     VocabularyProfile,
     SentencePatterns,
     ToneDistribution,
     StyleMetrics,
     VoiceSample,
-    ContentType,
+    VoiceStatistics,
 )
 
 
@@ -41,8 +40,17 @@ class VoiceTrainer:
         self,
         profile_id: str,
         samples: List[VoiceSample],
+        previous: Optional[VoiceFingerprint] = None,
     ) -> VoiceFingerprint:
-        """Train a voice fingerprint from samples."""
+        """
+        Train a voice fingerprint from samples.
+
+        When ``previous`` carries statistics for a subset of ``samples``, only
+        the samples it has not seen are analyzed and folded in; otherwise the
+        fingerprint is rebuilt from all of ``samples``. Analyses computed here
+        are recorded on the samples (``analysis_result``) so callers can
+        persist them.
+        """
         if not samples:
             return VoiceFingerprint(
                 id="",
@@ -50,178 +58,45 @@ class VoiceTrainer:
                 sample_count=0,
             )
 
-        # Analyze samples that haven't been analyzed
-        analyses: List[SampleAnalysis] = []
-        for sample in samples:
-            if sample.analysis_result:
-                analyses.append(sample.analysis_result)
-            else:
-                analysis = self.analyzer.analyze(
+        sample_ids = {sample.id for sample in samples}
+        incremental = (
+            previous is not None
+            and previous.statistics is not None
+            and "" not in sample_ids
+            and set(previous.statistics.sample_ids) <= sample_ids
+        )
+        if incremental:
+            stats = previous.statistics.model_copy(deep=True)
+        else:
+            stats = VoiceStatistics()
+
+        included = set(stats.sample_ids)
+        new_samples = [s for s in samples if not s.id or s.id not in included]
+        for sample in new_samples:
+            if sample.analysis_result is None:
+                sample.analysis_result = self.analyzer.analyze(
                     sample.content,
                     sample.content_type,
                 )
-                analyses.append(analysis)
-
-        # Aggregate analyses
-        vocabulary = self._aggregate_vocabulary(analyses)
-        sentences = self._aggregate_sentences(analyses)
-        tone = self._aggregate_tone(analyses)
-        style = self._aggregate_style(analyses)
-
-        # Calculate training quality
-        quality_scores = [a.quality_score for a in analyses]
-        training_quality = sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
-
-        # Generate voice summary using LLM
-        voice_summary = self._generate_voice_summary(
-            vocabulary, sentences, tone, style, samples
-        )
-
-        return VoiceFingerprint(
-            id="",  # Will be set by database
-            profile_id=profile_id,
-            vocabulary_profile=vocabulary,
-            sentence_patterns=sentences,
-            tone_distribution=tone,
-            style_metrics=style,
-            voice_summary=voice_summary,
-            sample_count=len(samples),
-            training_quality=round(training_quality, 3),
-        )
-
-    def _aggregate_vocabulary(
-        self,
-        analyses: List[SampleAnalysis],
-    ) -> VocabularyProfile:
-        """Aggregate vocabulary profiles from multiple samples."""
-        all_common_words: List[str] = []
-        all_phrases: List[str] = []
-        word_lengths: List[float] = []
-        richness_scores: List[float] = []
-        all_formal: List[str] = []
-        all_casual: List[str] = []
-
-        for analysis in analyses:
-            v = analysis.vocabulary
-            all_common_words.extend(v.common_words)
-            all_phrases.extend(v.unique_phrases)
-            word_lengths.append(v.avg_word_length)
-            richness_scores.append(v.vocabulary_richness)
-            all_formal.extend(v.formality_indicators)
-            all_casual.extend(v.casual_indicators)
-
-        # Get most common across all samples
-        word_counts = Counter(all_common_words)
-        phrase_counts = Counter(all_phrases)
-
-        return VocabularyProfile(
-            common_words=[w for w, _ in word_counts.most_common(30)],
-            unique_phrases=[p for p, _ in phrase_counts.most_common(15)],
-            avg_word_length=round(
-                sum(word_lengths) / len(word_lengths), 2
-            ) if word_lengths else 0.0,
-            vocabulary_richness=round(
-                sum(richness_scores) / len(richness_scores), 3
-            ) if richness_scores else 0.0,
-            formality_indicators=list(set(all_formal)),
-            casual_indicators=list(set(all_casual)),
-        )
-
-    def _aggregate_sentences(
-        self,
-        analyses: List[SampleAnalysis],
-    ) -> SentencePatterns:
-        """Aggregate sentence patterns from multiple samples."""
-        avg_lengths: List[float] = []
-        variances: List[float] = []
-        question_freqs: List[float] = []
-        exclamation_freqs: List[float] = []
-        complex_ratios: List[float] = []
-        all_openings: List[str] = []
-        all_transitions: List[str] = []
-
-        for analysis in analyses:
-            s = analysis.sentences
-            avg_lengths.append(s.avg_sentence_length)
-            variances.append(s.sentence_length_variance)
-            question_freqs.append(s.question_frequency)
-            exclamation_freqs.append(s.exclamation_frequency)
-            complex_ratios.append(s.complex_sentence_ratio)
-            all_openings.extend(s.opening_patterns)
-            all_transitions.extend(s.transition_words)
+            fingerprint_stats.add_sample(stats, sample.id, sample.analysis_result)
 
-        opening_counts = Counter(all_openings)
-        transition_counts = Counter(all_transitions)
-
-        n = len(analyses)
-        return SentencePatterns(
-            avg_sentence_length=round(sum(avg_lengths) / n, 1) if n else 0.0,
-            sentence_length_variance=round(sum(variances) / n, 2) if n else 0.0,
-            question_frequency=round(sum(question_freqs) / n, 3) if n else 0.0,
-            exclamation_frequency=round(sum(exclamation_freqs) / n, 3) if n else 0.0,
-            complex_sentence_ratio=round(sum(complex_ratios) / n, 3) if n else 0.0,
-            opening_patterns=[o for o, _ in opening_counts.most_common(10)],
-            transition_words=list(set(all_transitions)),
+        fingerprint = fingerprint_from_statistics(
+            profile_id,
+            stats,
+            voice_summary="",
+            fingerprint_id=previous.id if previous else "",
         )
-
-    def _aggregate_tone(
-        self,
-        analyses: List[SampleAnalysis],
-    ) -> ToneDistribution:
-        """Aggregate tone distributions from multiple samples."""
-        tone_sums: Dict[str, float] = {
-            "professional": 0.0,
-            "friendly": 0.0,
-            "casual": 0.0,
-            "authoritative": 0.0,
-            "empathetic": 0.0,
-            "enthusiastic": 0.0,
-            "confident": 0.0,
-            "approachable": 0.0,
-            "innovative": 0.0,
-            "trustworthy": 0.0,
-            "playful": 0.0,
-            "serious": 0.0,
-        }
-
-        for analysis in analyses:
-            tone = analysis.tone
-            for key in tone_sums:
-                tone_sums[key] += getattr(tone, key, 0.0)
-
-        n = len(analyses)
-        if n == 0:
-            return ToneDistribution()
-
-        return ToneDistribution(**{
-            k: round(v / n, 3) for k, v in tone_sums.items()
-        })
-
-    def _aggregate_style(
-        self,
-        analyses: List[SampleAnalysis],
-    ) -> StyleMetrics:
-        """Aggregate style metrics from multiple samples."""
-        style_sums: Dict[str, float] = {
-            "formality_score": 0.0,
-            "complexity_score": 0.0,
-            "engagement_score": 0.0,
-            "personality_score": 0.0,
-            "consistency_score": 0.0,
-        }
-
-        for analysis in analyses:
-            style = analysis.style
-            for key in style_sums:
-                style_sums[key] += getattr(style, key, 0.0)
-
-        n = len(analyses)
-        if n == 0:
-            return StyleMetrics()
-
-        return StyleMetrics(**{
-            k: round(v / n, 3) for k, v in style_sums.items()
-        })
+        if incremental and not new_samples and previous.voice_summary:
+            fingerprint.voice_summary = previous.voice_summary
+        else:
+            fingerprint.voice_summary = self._generate_voice_summary(
+                fingerprint.vocabulary_profile,
+                fingerprint.sentence_patterns,
+                fingerprint.tone_distribution,
+                fingerprint.style_metrics,
+                samples,
+            )
+        return fingerprint
 
     def _generate_voice_summary(
         self,
@@ -290,6 +165,53 @@ Start with "This brand voice..." or "The writing style..."
         )
 
 
+def fingerprint_from_statistics(
+    profile_id: str,
+    stats: VoiceStatistics,
+    voice_summary: str,
+    fingerprint_id: str = "",
+) -> VoiceFingerprint:
+    """Build a fingerprint from its sufficient statistics."""
+    return VoiceFingerprint(
+        id=fingerprint_id,  # Set by the database for new fingerprints
+        profile_id=profile_id,
+        vocabulary_profile=fingerprint_stats.aggregate_vocabulary(stats),
+        sentence_patterns=fingerprint_stats.aggregate_sentences(stats),
+        tone_distribution=fingerprint_stats.aggregate_tone(stats),
+        style_metrics=fingerprint_stats.aggregate_style(stats),
+        voice_summary=voice_summary,
+        sample_count=stats.sample_count,
+        training_quality=fingerprint_stats.training_quality(stats),
+        statistics=stats,
+    )
+
+
+def remove_sample_from_fingerprint(
+    fingerprint: VoiceFingerprint,
+    sample: VoiceSample,
+) -> Optional[VoiceFingerprint]:
+    """
+    Take a deleted sample back out of a fingerprint without retraining.
+
+    Returns the updated fingerprint (voice summary kept as is), or None when
+    the fingerprint has no statistics, was not trained on the sample, or was
+    trained on that sample alone (it is left for the next training run).
+    """
+    if fingerprint.statistics is None or sample.analysis_result is None:
+        return None
+    stats = fingerprint.statistics.model_copy(deep=True)
+    if not fingerprint_stats.remove_sample(stats, sample.id, sample.analysis_result):
+        return None
+    if not stats.sample_count:
+        return None
+    return fingerprint_from_statistics(
+        fingerprint.profile_id,
+        stats,
+        fingerprint.voice_summary,
+        fingerprint_id=fingerprint.id,
+    )
+
+
 def train_voice_profile(
     profile_id: str,
     samples: List[VoiceSample],
@@ -561,8 +561,8 @@ class StorageSettings(BaseSettings):
         description="Directory for conversation persistence",
     )
     api_key_storage_path: str = Field(
-        default="./data/api_keys.json",
-        description="Path for API key storage",
+        default="./data/api_keys.db",
+        description="Path for the API key SQLite database",
     )
     usage_storage_dir: str = Field(
         default="./data/usage",
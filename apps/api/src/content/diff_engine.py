@@ -0,0 +1,503 @@
+"""
+Histogram diff engine for content version comparison.
+
+``difflib.SequenceMatcher`` degrades badly on long documents with many
+small edits.  This module implements the histogram diff strategy used by
+git (anchor on the rarest common token, extend, recurse on both sides),
+preceded by a patience pass over tokens unique to both sides and with a
+bounded Myers O(ND) fallback for regions that have no low-occurrence
+anchor.  Tokens are compared through a precomputed hash index so the inner
+loops work on integers instead of strings.
+
+Three granularities are supported:
+
+- ``line``: one token per line (line endings preserved)
+- ``word``: words, whitespace runs and punctuation as separate tokens
+- ``paragraph``: blocks separated by blank lines
+
+Results are returned as structured hunks that the UI can render directly,
+and can also be formatted as a classic unified diff.
+"""
+
+import bisect
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+from ..types.version import DiffGranularity, DiffHunk, DiffLine
+from ..utils.cache import LRUCache
+
+# Tokens occurring more often than this in a region are not used as anchors
+# (same limit as git's histogram diff).
+MAX_CHAIN_LENGTH = 64
+
+# Upper bound on edit distance explored by the Myers fallback before a
+# region is reported as a plain replacement.
+MAX_MYERS_COST = 2000
+
+_WORD_RE = re.compile(r"\w+|\s+|[^\w\s]", re.UNICODE)
+_PARAGRAPH_SPLIT_RE = re.compile(r"(\n[ \t]*\n\s*)")
+
+_index_cache: Optional[LRUCache] = None
+
+# A matching block: (start in a, start in b, length)
+Block = Tuple[int, int, int]
+# An opcode in difflib form: (tag, i1, i2, j1, j2)
+Opcode = Tuple[str, int, int, int, int]
+
+
+@dataclass(frozen=True)
+class TokenIndex:
+    """Tokens of one version plus their precomputed hashes."""
+
+    tokens: Tuple[str, ...]
+    hashes: Tuple[int, ...]
+
+
+def tokenize(text: str, granularity: DiffGranularity) -> List[str]:
+    """Split *text* into diff tokens; ``"".join(tokens) == text``."""
+    if not text:
+        return []
+    if granularity == DiffGranularity.WORD:
+        return _WORD_RE.findall(text)
+    if granularity == DiffGranularity.PARAGRAPH:
+        parts = _PARAGRAPH_SPLIT_RE.split(text)
+        # Attach each blank-line separator to the paragraph before it.
+        tokens = [
+            parts[i] + (parts[i + 1] if i + 1 < len(parts) else "")
+            for i in range(0, len(parts), 2)
+        ]
+        return [t for t in tokens if t]
+    return text.splitlines(keepends=True)
+
+
+def build_token_index(text: str, granularity: DiffGranularity) -> TokenIndex:
+    """Tokenize *text* and hash every token."""
+    tokens = tuple(tokenize(text, granularity))
+    return TokenIndex(tokens=tokens, hashes=tuple(hash(t) for t in tokens))
+
+
+def get_token_index(
+    text: str,
+    granularity: DiffGranularity,
+    content_hash: Optional[str] = None,
+) -> TokenIndex:
+    """Return the token index for a version, cached by its content hash."""
+    if content_hash is None:
+        return build_token_index(text, granularity)
+
+    global _index_cache
+    if _index_cache is None:
+        _index_cache = LRUCache(
+            max_size=128,
+            default_ttl_seconds=3600,
+            name="diff_token_index",
+        )
+    key = f"{content_hash}:{granularity.value}"
+    index = _index_cache.get(key)
+    if index is None:
+        index = build_token_index(text, granularity)
+        _index_cache.set(key, index)
+    return index
+
+
+# ---------------------------------------------------------------------------
+# Core algorithm
+# ---------------------------------------------------------------------------
+
+
+def _myers_blocks(
+    a: Sequence[int], b: Sequence[int], a0: int, a1: int, b0: int, b1: int
+) -> Optional[List[Block]]:
+    """Minimal matching blocks of a region via Myers' O(ND) algorithm.
+
+    Returns None if the edit distance exceeds ``MAX_MYERS_COST``.
+    """
+    n, m = a1 - a0, b1 - b0
+    max_d = min(n + m, MAX_MYERS_COST)
+    offset = max_d + 1
+    v = [0] * (2 * max_d + 3)
+    trace: List[List[int]] = []
+
+    for d in range(max_d + 1):
+        trace.append(v[:])
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[a0 + x] == b[b0 + y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return _myers_backtrack(trace, v, d, k, offset, a0, b0)
+    return None
+
+
+def _myers_backtrack(
+    trace: List[List[int]], v: List[int], d: int, k: int, offset: int, a0: int, b0: int
+) -> List[Block]:
+    """Recover the diagonal runs of the Myers path ending at (d, k)."""
+    blocks: List[Block] = []
+    x = v[offset + k]
+    for depth in range(d, 0, -1):
+        prev_v = trace[depth]
+        if k == -depth or (k != depth and prev_v[offset + k - 1] < prev_v[offset + k + 1]):
+            prev_k = k + 1
+            prev_x = prev_v[offset + prev_k]
+            start_x = prev_x
+        else:
+            prev_k = k - 1
+            prev_x = prev_v[offset + prev_k]
+            start_x = prev_x + 1
+        start_y = start_x - k
+        if x > start_x:
+            blocks.append((a0 + start_x, b0 + start_y, x - start_x))
+        x, k = prev_x, prev_k
+    if x > 0:
+        blocks.append((a0, b0, x))
+    blocks.reverse()
+    return blocks
+
+
+def _unique_anchors(
+    a: Sequence[int], b: Sequence[int], a0: int, a1: int, b0: int, b1: int
+) -> List[Tuple[int, int]]:
+    """Tokens unique on both sides of a region, in increasing order on both.
+
+    This is the patience-diff step: the longest increasing subsequence of
+    unique common tokens splits the region into many small gaps in a
+    single O(n log n) pass.
+    """
+    counts_a: dict = {}
+    for i in range(a0, a1):
+        entry = counts_a.get(a[i])
+        counts_a[a[i]] = (1, i) if entry is None else (entry[0] + 1, entry[1])
+    counts_b: dict = {}
+    for j in range(b0, b1):
+        entry = counts_b.get(b[j])
+        counts_b[b[j]] = (1, j) if entry is None else (entry[0] + 1, entry[1])
+
+    # Dicts preserve insertion order, so unique tokens come out sorted by j.
+    pairs = []
+    for token, (count, j) in counts_b.items():
+        if count == 1:
+            entry = counts_a.get(token)
+            if entry is not None and entry[0] == 1:
+                pairs.append((entry[1], j))
+    if not pairs:
+        return []
+
+    # Longest increasing subsequence on the a-positions.
+    tails: List[int] = []
+    tail_idx: List[int] = []
+    prev: List[int] = [-1] * len(pairs)
+    for idx, (i, _j) in enumerate(pairs):
+        pos = bisect.bisect_left(tails, i)
+        if pos == len(tails):
+            tails.append(i)
+            tail_idx.append(idx)
+        else:
+            tails[pos] = i
+            tail_idx[pos] = idx
+        prev[idx] = tail_idx[pos - 1] if pos else -1
+
+    result: List[Tuple[int, int]] = []
+    idx = tail_idx[-1]
+    while idx != -1:
+        result.append(pairs[idx])
+        idx = prev[idx]
+    result.reverse()
+    return result
+
+
+def _histogram_anchor(
+    a: Sequence[int], b: Sequence[int], a0: int, a1: int, b0: int, b1: int
+) -> Optional[Block]:
+    """Find the longest match around the rarest shared token (histogram diff)."""
+    occurrences: dict = {}
+    for i in range(a0, a1):
+        positions = occurrences.get(a[i])
+        if positions is None:
+            occurrences[a[i]] = [i]
+        elif len(positions) <= MAX_CHAIN_LENGTH:
+            positions.append(i)
+
+    best: Optional[Block] = None
+    best_count = MAX_CHAIN_LENGTH
+    j = b0
+    while j < b1:
+        positions = occurrences.get(b[j])
+        next_j = j + 1
+        if positions is not None and len(positions) <= best_count:
+            for i in positions:
+                si, sj = i, j
+                while si > a0 and sj > b0 and a[si - 1] == b[sj - 1]:
+                    si -= 1
+                    sj -= 1
+                ei, ej = i + 1, j + 1
+                while ei < a1 and ej < b1 and a[ei] == b[ej]:
+                    ei += 1
+                    ej += 1
+                length = ei - si
+                count = len(positions)
+                if best is None or count < best_count or length > best[2]:
+                    best = (si, sj, length)
+                    best_count = count
+                next_j = max(next_j, ej)
+        j = next_j
+    return best
+
+
+def matching_blocks(a: Sequence[int], b: Sequence[int]) -> List[Block]:
+    """Return ordered, merged matching blocks between hash sequences."""
+    blocks: List[Block] = []
+    stack = [(0, len(a), 0, len(b))]
+    while stack:
+        a0, a1, b0, b1 = stack.pop()
+
+        # Common prefix / suffix are matched directly.
+        start = 0
+        while a0 + start < a1 and b0 + start < b1 and a[a0 + start] == b[b0 + start]:
+            start += 1
+        if start:
+            blocks.append((a0, b0, start))
+            a0 += start
+            b0 += start
+        end = 0
+        while a1 - end > a0 and b1 - end > b0 and a[a1 - end - 1] == b[b1 - end - 1]:
+            end += 1
+        if end:
+            blocks.append((a1 - end, b1 - end, end))
+            a1 -= end
+            b1 -= end
+
+        if a0 == a1 or b0 == b1:
+            continue
+
+        anchors = _unique_anchors(a, b, a0, a1, b0, b1)
+        if anchors:
+            # Consecutive anchors form a single run; only gaps with tokens
+            # on both sides need further diffing.
+            prev_a, prev_b = a0, b0
+            run_a, run_b, run_len = anchors[0][0], anchors[0][1], 0
+            for ai, bj in anchors:
+                if ai == run_a + run_len and bj == run_b + run_len:
+                    run_len += 1
+                    continue
+                blocks.append((run_a, run_b, run_len))
+                if prev_a < run_a and prev_b < run_b:
+                    stack.append((prev_a, run_a, prev_b, run_b))
+                prev_a, prev_b = run_a + run_len, run_b + run_len
+                run_a, run_b, run_len = ai, bj, 1
+            blocks.append((run_a, run_b, run_len))
+            if prev_a < run_a and prev_b < run_b:
+                stack.append((prev_a, run_a, prev_b, run_b))
+            prev_a, prev_b = run_a + run_len, run_b + run_len
+            if prev_a < a1 and prev_b < b1:
+                stack.append((prev_a, a1, prev_b, b1))
+            continue
+
+        anchor = _histogram_anchor(a, b, a0, a1, b0, b1)
+        if anchor is not None:
+            ai, bj, length = anchor
+            blocks.append(anchor)
+            stack.append((ai + length, a1, bj + length, b1))
+            stack.append((a0, ai, b0, bj))
+            continue
+
+        if set(a[a0:a1]).isdisjoint(b[b0:b1]):
+            continue  # Nothing in common: the whole region is a replacement.
+        region = _myers_blocks(a, b, a0, a1, b0, b1)
+        if region:
+            blocks.extend(region)
+
+    blocks.sort()
+    merged: List[Block] = []
+    for i, j, length in blocks:
+        if length <= 0:
+            continue
+        if merged:
+            pi, pj, plen = merged[-1]
+            if pi + plen == i and pj + plen == j:
+                merged[-1] = (pi, pj, plen + length)
+                continue
+        merged.append((i, j, length))
+    return merged
+
+
+def _verified_blocks(
+    old: TokenIndex, new: TokenIndex, blocks: List[Block]
+) -> List[Block]:
+    """Split blocks wherever a hash match is not a real token match."""
+    verified: List[Block] = []
+    for i, j, length in blocks:
+        run_start = None
+        for k in range(length):
+            if old.tokens[i + k] == new.tokens[j + k]:
+                if run_start is None:
+                    run_start = k
+            elif run_start is not None:
+                verified.append((i + run_start, j + run_start, k - run_start))
+                run_start = None
+        if run_start is not None:
+            verified.append((i + run_start, j + run_start, length - run_start))
+    return verified
+
+
+def compute_opcodes(old: TokenIndex, new: TokenIndex) -> List[Opcode]:
+    """Return difflib-style opcodes transforming *old* into *new*."""
+    blocks = _verified_blocks(old, new, matching_blocks(old.hashes, new.hashes))
+    blocks.append((len(old.tokens), len(new.tokens), 0))
+
+    opcodes: List[Opcode] = []
+    i = j = 0
+    for bi, bj, length in blocks:
+        if i < bi and j < bj:
+            opcodes.append(("replace", i, bi, j, bj))
+        elif i < bi:
+            opcodes.append(("delete", i, bi, j, j))
+        elif j < bj:
+            opcodes.append(("insert", i, i, j, bj))
+        if length:
+            opcodes.append(("equal", bi, bi + length, bj, bj + length))
+        i, j = bi + length, bj + length
+    return opcodes
+
+
+def group_opcodes(opcodes: List[Opcode], context: int = 3) -> List[List[Opcode]]:
+    """Group opcodes into hunks with *context* tokens of surrounding context.
+
+    Mirrors ``difflib.SequenceMatcher.get_grouped_opcodes``.
+    """
+    codes = list(opcodes)
+    if not codes:
+        codes = [("equal", 0, 1, 0, 1)]
+    if codes[0][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[0]
+        codes[0] = tag, max(i1, i2 - context), i2, max(j1, j2 - context), j2
+    if codes[-1][0] == "equal":
+        tag, i1, i2, j1, j2 = codes[-1]
+        codes[-1] = tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)
+
+    groups: List[List[Opcode]] = []
+    group: List[Opcode] = []
+    for tag, i1, i2, j1, j2 in codes:
+        if tag == "equal" and i2 - i1 > context * 2:
+            group.append((tag, i1, min(i2, i1 + context), j1, min(j2, j1 + context)))
+            groups.append(group)
+            group = []
+            i1, j1 = max(i1, i2 - context), max(j1, j2 - context)
+        group.append((tag, i1, i2, j1, j2))
+    if group and not (len(group) == 1 and group[0][0] == "equal"):
+        groups.append(group)
+    return groups
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def diff_hunks(
+    old: TokenIndex,
+    new: TokenIndex,
+    context: int = 3,
+    opcodes: Optional[List[Opcode]] = None,
+) -> Tuple[List[DiffHunk], int, int]:
+    """Compute structured hunks between two token indexes.
+
+    Pass precomputed *opcodes* to avoid diffing the same pair twice.
+
+    Returns:
+        Tuple of (hunks, additions, deletions) where additions/deletions
+        count inserted and removed tokens.
+    """
+    if opcodes is None:
+        opcodes = compute_opcodes(old, new)
+    additions = sum(j2 - j1 for tag, _, _, j1, j2 in opcodes if tag in ("replace", "insert"))
+    deletions = sum(i2 - i1 for tag, i1, i2, _, _ in opcodes if tag in ("replace", "delete"))
+
+    hunks: List[DiffHunk] = []
+    for group in group_opcodes(opcodes, context):
+        lines: List[DiffLine] = []
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                lines.extend(
+                    DiffLine(op="equal", text=old.tokens[i], old_index=i, new_index=j1 + (i - i1))
+                    for i in range(i1, i2)
+                )
+                continue
+            if tag in ("replace", "delete"):
+                lines.extend(
+                    DiffLine(op="delete", text=old.tokens[i], old_index=i)
+                    for i in range(i1, i2)
+                )
+            if tag in ("replace", "insert"):
+                lines.extend(
+                    DiffLine(op="insert", text=new.tokens[j], new_index=j)
+                    for j in range(j1, j2)
+                )
+        first, last = group[0], group[-1]
+        hunks.append(
+            DiffHunk(
+                old_start=first[1],
+                old_count=last[2] - first[1],
+                new_start=first[3],
+                new_count=last[4] - first[3],
+                lines=lines,
+            )
+        )
+    return hunks, additions, deletions
+
+
+def _format_range(start: int, stop: int) -> str:
+    """Unified diff range in the same format as difflib."""
+    beginning = start + 1
+    length = stop - start
+    if length == 1:
+        return f"{beginning}"
+    if not length:
+        beginning -= 1
+    return f"{beginning},{length}"
+
+
+def format_unified_diff(
+    old: TokenIndex,
+    new: TokenIndex,
+    fromfile: str,
+    tofile: str,
+    context: int = 3,
+    opcodes: Optional[List[Opcode]] = None,
+) -> Tuple[str, int, int]:
+    """Render a line-level diff in ``difflib.unified_diff(lineterm="")`` form.
+
+    Returns:
+        Tuple of (unified_diff, additions, deletions).
+    """
+    if opcodes is None:
+        opcodes = compute_opcodes(old, new)
+    out: List[str] = []
+    additions = deletions = 0
+    for group in group_opcodes(opcodes, context):
+        if not out:
+            out.append(f"--- {fromfile}")
+            out.append(f"+++ {tofile}")
+        first, last = group[0], group[-1]
+        out.append(
+            f"@@ -{_format_range(first[1], last[2])} "
+            f"+{_format_range(first[3], last[4])} @@"
+        )
+        for tag, i1, i2, j1, j2 in group:
+            if tag == "equal":
+                out.extend(" " + t for t in old.tokens[i1:i2])
+                continue
+            if tag in ("replace", "delete"):
+                out.extend("-" + t for t in old.tokens[i1:i2])
+                deletions += i2 - i1
+            if tag in ("replace", "insert"):
+                out.extend("+" + t for t in new.tokens[j1:j2])
+                additions += j2 - j1
+    return "".join(out), additions, deletions
@@ -0,0 +1,114 @@
+"""
+Compressed forward deltas between content versions.
+
+Versions are stored as a full snapshot every N versions with compact
+line-level deltas in between.  A delta is a list of operations applied
+to the previous version's lines:
+
+- ``["c", start, count]``: copy ``count`` lines from the base starting at
+  ``start``
+- ``["i", [line, ...]]``: insert new lines
+
+The operation list is JSON-encoded and zlib-compressed, so an edit that
+touches a few paragraphs of a long document costs a few hundred bytes
+instead of a full copy of the text.
+"""
+
+import difflib
+import json
+import zlib
+from typing import Iterable, List, Optional
+
+from ..utils.cache import LRUCache
+
+DELTA_FORMAT_VERSION = 1
+
+_diff_cache: Optional[LRUCache] = None
+
+
+def encode_delta(base: str, target: str) -> bytes:
+    """Return a compressed delta that transforms *base* into *target*."""
+    base_lines = base.splitlines(keepends=True)
+    target_lines = target.splitlines(keepends=True)
+
+    ops: List[list] = []
+    matcher = difflib.SequenceMatcher(None, base_lines, target_lines, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            ops.append(["c", i1, i2 - i1])
+        elif tag in ("replace", "insert"):
+            ops.append(["i", target_lines[j1:j2]])
+        # "delete" needs no op: the removed base lines are simply not copied.
+
+    payload = json.dumps(
+        {"v": DELTA_FORMAT_VERSION, "ops": ops},
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return zlib.compress(payload.encode("utf-8"), 6)
+
+
+def apply_delta(base: str, delta: bytes) -> str:
+    """Reconstruct the target text from *base* and a delta from ``encode_delta``."""
+    data = json.loads(zlib.decompress(delta).decode("utf-8"))
+    if data.get("v") != DELTA_FORMAT_VERSION:
+        raise ValueError(f"Unsupported delta format: {data.get('v')!r}")
+
+    base_lines = base.splitlines(keepends=True)
+    out: List[str] = []
+    for op in data["ops"]:
+        if op[0] == "c":
+            start, count = op[1], op[2]
+            out.extend(base_lines[start : start + count])
+        elif op[0] == "i":
+            out.extend(op[1])
+        else:
+            raise ValueError(f"Unknown delta op: {op[0]!r}")
+    return "".join(out)
+
+
+def apply_delta_chain(snapshot: str, deltas: Iterable[bytes]) -> str:
+    """Apply *deltas* in order on top of a full *snapshot*."""
+    content = snapshot
+    for delta in deltas:
+        content = apply_delta(content, delta)
+    return content
+
+
+def is_snapshot_version(version_number: int, snapshot_interval: int) -> bool:
+    """Whether *version_number* should be stored as a full snapshot.
+
+    Version 1 is always a snapshot; after that every ``snapshot_interval``-th
+    version is, which bounds reconstruction to at most ``interval - 1`` deltas.
+    An interval of 1 or less disables delta storage entirely.
+    """
+    if snapshot_interval <= 1:
+        return True
+    return (version_number - 1) % snapshot_interval == 0
+
+
+def get_diff_cache() -> LRUCache:
+    """Shared cache of computed version diffs.
+
+    Entries are keyed by the content hashes of both sides, so they never go
+    stale: versions are immutable once written.
+    """
+    global _diff_cache
+    if _diff_cache is None:
+        _diff_cache = LRUCache(
+            max_size=256,
+            default_ttl_seconds=3600,
+            name="version_diffs",
+        )
+    return _diff_cache
+
+
+def diff_cache_key(
+    hash_1: str,
+    hash_2: str,
+    from_version: int,
+    to_version: int,
+    granularity: str = "line",
+) -> str:
+    """Cache key for a diff between two versions."""
+    return f"{hash_1}:{hash_2}:{from_version}:{to_version}:{granularity}"
@@ -10,7 +10,7 @@ Provides version history management for generated content with support for:
 Supports both Supabase (production) and in-memory (development) storage.
 """
 
-import difflib
+import asyncio
 import hashlib
 import logging
 import os
@@ -24,12 +24,34 @@ from src.types.version import (
     ChangeType,
     ContentVersion,
     ContentVersionSummary,
+    DiffGranularity,
+    DiffHunk,
     VersionComparison,
     VersionStatistics,
 )
 
+from .diff_engine import (
+    build_token_index,
+    compute_opcodes,
+    diff_hunks,
+    format_unified_diff,
+    get_token_index,
+)
+from .version_delta import (
+    apply_delta_chain,
+    diff_cache_key,
+    encode_delta,
+    get_diff_cache,
+    is_snapshot_version,
+)
+
 logger = logging.getLogger(__name__)
 
+CONTENT_PREVIEW_LENGTH = 200
+
+# Combined size of both versions above which diffs run off the event loop.
+DIFF_OFFLOAD_THRESHOLD_CHARS = 200_000
+
 
 class BaseVersionService(ABC):
     """Abstract base class for version service implementations."""
@@ -124,6 +146,7 @@ class BaseVersionService(ABC):
         content_id: str,
         version_1: int,
         version_2: int,
+        granularity: DiffGranularity = DiffGranularity.LINE,
     ) -> Optional[VersionComparison]:
         """
         Compare two versions of content.
@@ -132,6 +155,7 @@ class BaseVersionService(ABC):
             content_id: ID of the content.
             version_1: First version number.
             version_2: Second version number.
+            granularity: Token unit for the structured hunks.
 
         Returns:
             VersionComparison if both versions exist, None otherwise.
@@ -239,26 +263,83 @@ def generate_unified_diff(
     Returns:
         Tuple of (unified_diff, additions, deletions).
     """
-    lines_1 = content_1.splitlines(keepends=True)
-    lines_2 = content_2.splitlines(keepends=True)
-
-    diff = difflib.unified_diff(
-        lines_1,
-        lines_2,
+    return format_unified_diff(
+        build_token_index(content_1, DiffGranularity.LINE),
+        build_token_index(content_2, DiffGranularity.LINE),
         fromfile=f"version_{from_version}",
         tofile=f"version_{to_version}",
-        lineterm="",
     )
 
-    diff_lines = list(diff)
-    additions = sum(
-        1 for line in diff_lines if line.startswith("+") and not line.startswith("+++")
-    )
-    deletions = sum(
-        1 for line in diff_lines if line.startswith("-") and not line.startswith("---")
+
+def _diff_versions(
+    v1: ContentVersion,
+    v2: ContentVersion,
+    granularity: DiffGranularity,
+) -> Tuple[str, int, int, List[DiffHunk]]:
+    """Compute the unified diff and structured hunks for two versions.
+
+    Token indexes are cached per content hash, so a version compared against
+    several others is only tokenized once per granularity.
+    """
+    old_lines = get_token_index(v1.content, DiffGranularity.LINE, v1.content_hash)
+    new_lines = get_token_index(v2.content, DiffGranularity.LINE, v2.content_hash)
+    line_opcodes = compute_opcodes(old_lines, new_lines)
+    unified_diff, additions, deletions = format_unified_diff(
+        old_lines,
+        new_lines,
+        fromfile=f"version_{v1.version_number}",
+        tofile=f"version_{v2.version_number}",
+        opcodes=line_opcodes,
     )
 
-    return "".join(diff_lines), additions, deletions
+    if granularity == DiffGranularity.LINE:
+        hunks, _, _ = diff_hunks(old_lines, new_lines, opcodes=line_opcodes)
+    else:
+        hunks, _, _ = diff_hunks(
+            get_token_index(v1.content, granularity, v1.content_hash),
+            get_token_index(v2.content, granularity, v2.content_hash),
+        )
+    return unified_diff, additions, deletions, hunks
+
+
+async def compare_version_contents(
+    v1: ContentVersion,
+    v2: ContentVersion,
+    granularity: DiffGranularity = DiffGranularity.LINE,
+) -> VersionComparison:
+    """Build a VersionComparison, reusing a cached diff for the same pair.
+
+    Diffs of large documents are computed in a worker thread so they do not
+    block the event loop.
+    """
+    cache = get_diff_cache()
+    key = diff_cache_key(
+        v1.content_hash,
+        v2.content_hash,
+        v1.version_number,
+        v2.version_number,
+        granularity.value,
+    )
+    cached = cache.get(key)
+    if cached is None:
+        if len(v1.content) + len(v2.content) > DIFF_OFFLOAD_THRESHOLD_CHARS:
+            cached = await asyncio.to_thread(_diff_versions, v1, v2, granularity)
+        else:
+            cached = _diff_versions(v1, v2, granularity)
+        cache.set(key, cached)
+    unified_diff, additions, deletions, hunks = cached
+
+    return VersionComparison(
+        version_1=v1,
+        version_2=v2,
+        word_count_diff=v2.word_count - v1.word_count,
+        character_count_diff=v2.character_count - v1.character_count,
+        unified_diff=unified_diff,
+        additions=additions,
+        deletions=deletions,
+        granularity=granularity,
+        hunks=hunks,
+    )
 
 
 class InMemoryVersionService(BaseVersionService):
@@ -364,7 +445,7 @@ class InMemoryVersionService(BaseVersionService):
             ContentVersionSummary(
                 id=v.id or "",
                 version_number=v.version_number,
-                content_preview=v.content[:200],
+                content_preview=v.content[:CONTENT_PREVIEW_LENGTH],
                 content_hash=v.content_hash,
                 change_type=v.change_type,
                 change_summary=v.change_summary,
@@ -433,6 +514,7 @@ class InMemoryVersionService(BaseVersionService):
         content_id: str,
         version_1: int,
         version_2: int,
+        granularity: DiffGranularity = DiffGranularity.LINE,
     ) -> Optional[VersionComparison]:
         """Compare two versions."""
         v1 = await self.get_version(content_id, version_1)
@@ -441,22 +523,7 @@ class InMemoryVersionService(BaseVersionService):
         if not v1 or not v2:
             return None
 
-        unified_diff, additions, deletions = generate_unified_diff(
-            v1.content,
-            v2.content,
-            v1.version_number,
-            v2.version_number,
-        )
-
-        return VersionComparison(
-            version_1=v1,
-            version_2=v2,
-            word_count_diff=v2.word_count - v1.word_count,
-            character_count_diff=v2.character_count - v1.character_count,
-            unified_diff=unified_diff,
-            additions=additions,
-            deletions=deletions,
-        )
+        return await compare_version_contents(v1, v2, granularity)
 
     async def get_statistics(
         self,
@@ -580,18 +647,31 @@ class NeonVersionService(BaseVersionService):
     Persists to the content_versions and content_version_organizations tables
     (db/migrations/007). Mirrors InMemoryVersionService semantics but durably,
     and is the production path for the Neon-only deployment.
+
+    Versions are stored as a full snapshot every ``snapshot_interval``
+    versions and as compressed forward deltas in between (db/migrations/010),
+    so frequent auto-saves of long documents cost roughly the size of the
+    edit rather than the size of the document.
     """
 
-    def __init__(self) -> None:
-        logger.info("Initialized Neon (asyncpg) version service")
+    def __init__(self, snapshot_interval: Optional[int] = None) -> None:
+        if snapshot_interval is None:
+            snapshot_interval = int(
+                os.environ.get("CONTENT_VERSION_SNAPSHOT_INTERVAL", "10")
+            )
+        self.snapshot_interval = snapshot_interval
+        logger.info(
+            "Initialized Neon (asyncpg) version service (snapshot every %d versions)",
+            snapshot_interval,
+        )
 
     @staticmethod
-    def _row_to_version(row) -> ContentVersion:
+    def _row_to_version(row, content: Optional[str] = None) -> ContentVersion:
         return ContentVersion(
             id=str(row["id"]),
             content_id=row["content_id"],
             version_number=row["version_number"],
-            content=row["content"],
+            content=content if content is not None else row["content"],
             content_hash=row["content_hash"],
             diff_from_previous=row["diff_from_previous"],
             change_type=ChangeType(row["change_type"]),
@@ -614,6 +694,40 @@ class NeonVersionService(BaseVersionService):
             )
         return pool
 
+    @staticmethod
+    async def _reconstruct_content(
+        conn,
+        content_id: str,
+        version_number: int,
+    ) -> Optional[str]:
+        """Rebuild a version's text from its nearest snapshot and deltas."""
+        rows = await conn.fetch(
+            """
+            SELECT version_number, storage_kind, content, delta
+            FROM content_versions
+            WHERE content_id = $1
+              AND version_number <= $2
+              AND version_number >= COALESCE(
+                  (SELECT MAX(version_number) FROM content_versions
+                   WHERE content_id = $1 AND version_number <= $2
+                     AND storage_kind = 'full'),
+                  1)
+            ORDER BY version_number ASC
+            """,
+            content_id,
+            version_number,
+        )
+        if not rows or rows[-1]["version_number"] != version_number:
+            return None
+        if rows[0]["storage_kind"] != "full":
+            logger.error(
+                "No snapshot found for content %s version %d", content_id, version_number
+            )
+            return None
+        return apply_delta_chain(
+            rows[0]["content"], (bytes(r["delta"]) for r in rows[1:])
+        )
+
     async def create_version(
         self,
         content_id: str,
@@ -630,7 +744,7 @@ class NeonVersionService(BaseVersionService):
             async with conn.transaction():
                 latest = await conn.fetchrow(
                     """
-                    SELECT id, version_number, content, content_hash
+                    SELECT id, version_number, content, content_hash, storage_kind
                     FROM content_versions
                     WHERE content_id = $1
                     ORDER BY version_number DESC
@@ -651,13 +765,25 @@ class NeonVersionService(BaseVersionService):
                 version_number = (latest["version_number"] + 1) if latest else 1
 
                 diff_from_previous = None
+                previous_content = None
                 if latest is not None:
-                    diff_from_previous, _, _ = generate_unified_diff(
-                        latest["content"],
-                        content,
-                        latest["version_number"],
-                        version_number,
-                    )
+                    previous_content = latest["content"]
+                    if latest["storage_kind"] != "full":
+                        previous_content = await self._reconstruct_content(
+                            conn, content_id, latest["version_number"]
+                        )
+                    if previous_content is not None:
+                        diff_from_previous, _, _ = generate_unified_diff(
+                            previous_content,
+                            content,
+                            latest["version_number"],
+                            version_number,
+                        )
+
+                # Fall back to a snapshot if the chain could not be rebuilt.
+                store_full = previous_content is None or is_snapshot_version(
+                    version_number, self.snapshot_interval
+                )
 
                 await conn.execute(
                     "UPDATE content_versions SET is_current = false WHERE content_id = $1",
@@ -669,13 +795,15 @@ class NeonVersionService(BaseVersionService):
                     INSERT INTO content_versions (
                         content_id, version_number, content, content_hash,
                         diff_from_previous, change_type, change_summary,
-                        word_count, character_count, created_by, is_current
-                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, true)
+                        word_count, character_count, created_by, is_current,
+                        storage_kind, delta, content_preview
+                    ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, true,
+                              $11, $12, $13)
                     RETURNING id
                     """,
                     content_id,
                     version_number,
-                    content,
+                    content if store_full else None,
                     content_hash,
                     diff_from_previous,
                     change_type.value,
@@ -683,6 +811,9 @@ class NeonVersionService(BaseVersionService):
                     calculate_word_count(content),
                     len(content),
                     created_by,
+                    "full" if store_full else "delta",
+                    None if store_full else encode_delta(previous_content, content),
+                    content[:CONTENT_PREVIEW_LENGTH],
                 )
 
         logger.info(
@@ -706,9 +837,10 @@ class NeonVersionService(BaseVersionService):
             )
             rows = await conn.fetch(
                 """
-                SELECT id, version_number, content, content_hash, change_type,
-                       change_summary, word_count, character_count, created_by,
-                       created_at, is_current
+                SELECT id, version_number,
+                       COALESCE(content_preview, LEFT(content, 200)) AS content_preview,
+                       content_hash, change_type, change_summary, word_count,
+                       character_count, created_by, created_at, is_current
                 FROM content_versions
                 WHERE content_id = $1
                 ORDER BY version_number DESC
@@ -723,7 +855,7 @@ class NeonVersionService(BaseVersionService):
             ContentVersionSummary(
                 id=str(row["id"]),
                 version_number=row["version_number"],
-                content_preview=row["content"][:200],
+                content_preview=row["content_preview"] or "",
                 content_hash=row["content_hash"],
                 change_type=ChangeType(row["change_type"]),
                 change_summary=row["change_summary"],
@@ -750,14 +882,23 @@ class NeonVersionService(BaseVersionService):
                 SELECT id, content_id, version_number, content, content_hash,
                        diff_from_previous, change_type, change_summary,
                        word_count, character_count, created_by, created_at,
-                       is_current
+                       is_current, storage_kind
                 FROM content_versions
                 WHERE content_id = $1 AND version_number = $2
                 """,
                 content_id,
                 version_number,
             )
-        return self._row_to_version(row) if row else None
+            if row is None:
+                return None
+            content = None
+            if row["storage_kind"] != "full":
+                content = await self._reconstruct_content(
+                    conn, content_id, version_number
+                )
+                if content is None:
+                    return None
+        return self._row_to_version(row, content)
 
     async def restore_version(
         self,
@@ -790,6 +931,7 @@ class NeonVersionService(BaseVersionService):
         content_id: str,
         version_1: int,
         version_2: int,
+        granularity: DiffGranularity = DiffGranularity.LINE,
     ) -> Optional[VersionComparison]:
         """Compare two versions."""
         v1 = await self.get_version(content_id, version_1)
@@ -797,18 +939,7 @@ class NeonVersionService(BaseVersionService):
         if not v1 or not v2:
             return None
 
-        unified_diff, additions, deletions = generate_unified_diff(
-            v1.content, v2.content, v1.version_number, v2.version_number
-        )
-        return VersionComparison(
-            version_1=v1,
-            version_2=v2,
-            word_count_diff=v2.word_count - v1.word_count,
-            character_count_diff=v2.character_count - v1.character_count,
-            unified_diff=unified_diff,
-            additions=additions,
-            deletions=deletions,
-        )
+        return await compare_version_contents(v1, v2, granularity)
 
     async def get_statistics(
         self,
@@ -961,6 +1092,124 @@ class NeonVersionService(BaseVersionService):
         )
         return False
 
+    async def backfill_storage(
+        self,
+        content_id: Optional[str] = None,
+        batch_size: int = 100,
+    ) -> Dict[str, int]:
+        """Rewrite existing versions to match the current snapshot interval.
+
+        Full rows that fall between snapshots are converted to deltas (and
+        deltas that now land on a snapshot boundary are expanded), one
+        content item per transaction.  Safe to re-run; rows already in the
+        right form are left untouched.
+
+        Args:
+            content_id: Restrict the backfill to one content item.
+            batch_size: Number of content ids fetched per page.
+
+        Returns:
+            Counts of processed content items and converted rows.
+        """
+        pool = await self._pool()
+        stats = {"contents": 0, "to_delta": 0, "to_full": 0}
+
+        last_id = ""
+        while True:
+            async with pool.acquire() as conn:
+                if content_id is not None:
+                    ids = [content_id] if not stats["contents"] else []
+                else:
+                    ids = [
+                        r["content_id"]
+                        for r in await conn.fetch(
+                            """
+                            SELECT DISTINCT content_id FROM content_versions
+                            WHERE content_id > $1
+                            ORDER BY content_id
+                            LIMIT $2
+                            """,
+                            last_id,
+                            batch_size,
+                        )
+                    ]
+            if not ids:
+                break
+
+            for cid in ids:
+                to_delta, to_full = await self._backfill_content(pool, cid)
+                stats["contents"] += 1
+                stats["to_delta"] += to_delta
+                stats["to_full"] += to_full
+                last_id = cid
+
+        logger.info(
+            "Version storage backfill complete: %d contents, %d rows to delta, %d rows to full",
+            stats["contents"],
+            stats["to_delta"],
+            stats["to_full"],
+        )
+        return stats
+
+    async def _backfill_content(self, pool, content_id: str) -> Tuple[int, int]:
+        """Re-encode the version chain of a single content item."""
+        to_delta = to_full = 0
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch(
+                    """
+                    SELECT id, version_number, storage_kind, content, delta
+                    FROM content_versions
+                    WHERE content_id = $1
+                    ORDER BY version_number ASC
+                    FOR UPDATE
+                    """,
+                    content_id,
+                )
+                previous: Optional[str] = None
+                for row in rows:
+                    if row["storage_kind"] == "full":
+                        text = row["content"]
+                    elif previous is not None:
+                        text = apply_delta_chain(previous, [bytes(row["delta"])])
+                    else:
+                        logger.error(
+                            "Cannot backfill %s: version %d has no base snapshot",
+                            content_id,
+                            row["version_number"],
+                        )
+                        return to_delta, to_full
+
+                    want_full = previous is None or is_snapshot_version(
+                        row["version_number"], self.snapshot_interval
+                    )
+                    if want_full and row["storage_kind"] != "full":
+                        await conn.execute(
+                            """
+                            UPDATE content_versions
+                            SET storage_kind = 'full', content = $2, delta = NULL
+                            WHERE id = $1
+                            """,
+                            row["id"],
+                            text,
+                        )
+                        to_full += 1
+                    elif not want_full and row["storage_kind"] == "full":
+                        await conn.execute(
+                            """
+                            UPDATE content_versions
+                            SET storage_kind = 'delta', delta = $2, content = NULL,
+                                content_preview = COALESCE(content_preview, $3)
+                            WHERE id = $1
+                            """,
+                            row["id"],
+                            encode_delta(previous, text),
+                            text[:CONTENT_PREVIEW_LENGTH],
+                        )
+                        to_delta += 1
+                    previous = text
+        return to_delta, to_full
+
 
 class SupabaseVersionService(BaseVersionService):
     """Supabase-backed version service for production."""
@@ -1196,6 +1445,7 @@ class SupabaseVersionService(BaseVersionService):
         content_id: str,
         version_1: int,
         version_2: int,
+        granularity: DiffGranularity = DiffGranularity.LINE,
     ) -> Optional[VersionComparison]:
         """Compare two versions using database function."""
         try:
@@ -1222,23 +1472,10 @@ class SupabaseVersionService(BaseVersionService):
             if not v1 or not v2:
                 return None
 
-            # Generate diff
-            unified_diff, additions, deletions = generate_unified_diff(
-                row["version_1_content"],
-                row["version_2_content"],
-                version_1,
-                version_2,
-            )
-
-            return VersionComparison(
-                version_1=v1,
-                version_2=v2,
-                word_count_diff=row["word_count_diff"],
-                character_count_diff=row["char_count_diff"],
-                unified_diff=unified_diff,
-                additions=additions,
-                deletions=deletions,
-            )
+            comparison = await compare_version_contents(v1, v2, granularity)
+            comparison.word_count_diff = row["word_count_diff"]
+            comparison.character_count_diff = row["char_count_diff"]
+            return comparison
 
         except Exception as e:
             logger.error(f"Error comparing versions: {e}")
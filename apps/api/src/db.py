@@ -9,13 +9,22 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Optional
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
+from urllib.parse import urlparse
 
 import asyncpg
 
 logger = logging.getLogger(__name__)
 
-_pool: Optional[asyncpg.Pool] = None
+DEFAULT_POOL = "default"
+
+# Recent acquire() waits kept per pool for percentiles on /health/db.
+ACQUIRE_WAIT_WINDOW = 512
+
+_pools: Dict[str, "InstrumentedPool"] = {}
 
 
 def get_database_url() -> Optional[str]:
@@ -31,10 +40,146 @@ def is_database_configured() -> bool:
     return bool(get_database_url())
 
 
-async def get_pool() -> Optional[asyncpg.Pool]:
-    global _pool
-    if _pool is not None:
-        return _pool
+def get_statement_cache_size() -> int:
+    """Prepared-statement cache size for new connections (0 = disabled).
+
+    Opt in with DATABASE_STATEMENT_CACHE_SIZE. Only honoured for a direct
+    connection (DATABASE_URL_DIRECT that is not a Neon ``-pooler`` host):
+    PgBouncer in transaction mode cannot keep named prepared statements, so
+    pooled URLs always run with the cache off.
+    """
+    size = int(os.environ.get("DATABASE_STATEMENT_CACHE_SIZE", "0"))
+    if size <= 0:
+        return 0
+
+    direct_url = os.environ.get("DATABASE_URL_DIRECT")
+    if not direct_url or "-pooler" in (urlparse(direct_url).hostname or ""):
+        logger.warning(
+            "DATABASE_STATEMENT_CACHE_SIZE ignored: prepared statements need "
+            "DATABASE_URL_DIRECT pointing at a non-pooler host"
+        )
+        return 0
+    return size
+
+
+@dataclass
+class AcquireStats:
+    """How long callers waited for a pooled connection."""
+
+    acquires: int = 0
+    timeouts: int = 0
+    waiting: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    recent: Deque[float] = field(default_factory=lambda: deque(maxlen=ACQUIRE_WAIT_WINDOW))
+
+    def record(self, seconds: float) -> None:
+        self.acquires += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.recent.append(seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        recent = sorted(self.recent)
+
+        def percentile(p: float) -> float:
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, int(p * len(recent)))] * 1000
+
+        return {
+            "acquires": self.acquires,
+            "timeouts": self.timeouts,
+            "waiting": self.waiting,
+            "avg_wait_ms": (
+                round(self.total_seconds / self.acquires * 1000, 3) if self.acquires else 0.0
+            ),
+            "p95_wait_ms": round(percentile(0.95), 3),
+            "max_wait_ms": round(self.max_seconds * 1000, 3),
+        }
+
+
+class _TimedAcquire:
+    """Wraps ``asyncpg.Pool.acquire()`` and records how long it waited.
+
+    Supports both forms of the public API: ``async with pool.acquire()`` and
+    ``conn = await pool.acquire()``.
+    """
+
+    __slots__ = ("_context", "_stats")
+
+    def __init__(self, context: Any, stats: AcquireStats):
+        self._context = context
+        self._stats = stats
+
+    async def _timed(self, acquiring: Awaitable[asyncpg.Connection]) -> asyncpg.Connection:
+        stats = self._stats
+        stats.waiting += 1
+        start = time.perf_counter()
+        try:
+            conn = await acquiring
+        except TimeoutError:
+            stats.timeouts += 1
+            raise
+        finally:
+            stats.waiting -= 1
+        stats.record(time.perf_counter() - start)
+        return conn
+
+    async def __aenter__(self) -> asyncpg.Connection:
+        return await self._timed(self._context.__aenter__())
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self._context.__aexit__(*exc)
+
+    def __await__(self):
+        return self._timed(self._context).__await__()
+
+
+class InstrumentedPool:
+    """An asyncpg pool that records acquire() wait times.
+
+    Wraps the pool returned by ``asyncpg.create_pool`` and times its public
+    ``acquire()``; every other attribute is delegated to the wrapped pool, so
+    callers need no changes to be measured.
+    """
+
+    def __init__(self, pool: asyncpg.Pool, statement_cache_size: int = 0):
+        self.pool = pool
+        self.acquire_stats = AcquireStats()
+        self.statement_cache_size = statement_cache_size
+
+    def acquire(self, *, timeout: Optional[float] = None) -> _TimedAcquire:
+        return _TimedAcquire(self.pool.acquire(timeout=timeout), self.acquire_stats)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.pool, name)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": self.pool.get_size(),
+            "idle": self.pool.get_idle_size(),
+            "min_size": self.pool.get_min_size(),
+            "max_size": self.pool.get_max_size(),
+            "statement_cache_size": self.statement_cache_size,
+            **self.acquire_stats.to_dict(),
+        }
+
+
+async def get_pool(
+    name: str = DEFAULT_POOL,
+    init: Optional[Callable[[asyncpg.Connection], Awaitable[None]]] = None,
+) -> Optional[InstrumentedPool]:
+    """Return the named pool, creating it on first use.
+
+    ``init`` runs once per new connection (e.g. type codec registration) and
+    only applies when the pool is created. Code that needs per-connection
+    setup that other callers must not see (like a jsonb codec) should use its
+    own named pool rather than the default one.
+    """
+    pool = _pools.get(name)
+    if pool is not None:
+        return pool
 
     dsn = get_database_url()
     if not dsn:
@@ -42,18 +187,35 @@ async def get_pool() -> Optional[asyncpg.Pool]:
 
     min_size = int(os.environ.get("DATABASE_POOL_MIN_SIZE", "1"))
     max_size = int(os.environ.get("DATABASE_POOL_MAX_SIZE", "5"))
+    statement_cache_size = get_statement_cache_size()
 
-    # If you're connecting via a PgBouncer pooler, prepared statements can break.
-    # Disabling the statement cache keeps behavior consistent for both direct and pooled URLs.
-    _pool = await asyncpg.create_pool(
-        dsn=dsn,
-        min_size=min_size,
-        max_size=max_size,
-        statement_cache_size=0,
+    # If you're connecting via a PgBouncer pooler, prepared statements can break,
+    # so the statement cache stays off unless explicitly enabled for a direct URL.
+    pool = InstrumentedPool(
+        await asyncpg.create_pool(
+            dsn=dsn,
+            min_size=min_size,
+            max_size=max_size,
+            init=init,
+            statement_cache_size=statement_cache_size,
+        ),
+        statement_cache_size=statement_cache_size,
     )
+    _pools[name] = pool
 
-    logger.info("Postgres pool initialized (min=%s max=%s)", min_size, max_size)
-    return _pool
+    logger.info(
+        "Postgres pool %r initialized (min=%s max=%s statement_cache=%s)",
+        name,
+        min_size,
+        max_size,
+        statement_cache_size,
+    )
+    return pool
+
+
+def get_pool_stats() -> Dict[str, Dict[str, Any]]:
+    """Sizing and acquire-wait metrics for every open pool."""
+    return {name: pool.stats() for name, pool in _pools.items()}
 
 
 async def fetchrow(query: str, *args):
@@ -80,12 +242,31 @@ async def execute(query: str, *args):
         return await conn.execute(query, *args)
 
 
-async def close_pool() -> None:
-    """Close the global asyncpg pool (used during graceful shutdown)."""
-    global _pool
-    if _pool is None:
+async def fetch_pages(
+    query: str, *args, page_size: int = 1000
+) -> AsyncIterator[List[asyncpg.Record]]:
+    """Yield query results a page at a time from a server-side cursor.
+
+    One pooled connection is held (inside a read-only transaction, which
+    cursors require) until the iterator is exhausted or closed, so only
+    ``page_size`` rows are in memory at once regardless of the result size.
+    """
+    pool = await get_pool()
+    if not pool:
         return
-    try:
-        await _pool.close()
-    finally:
-        _pool = None
+    async with pool.acquire() as conn:
+        async with conn.transaction(readonly=True):
+            cursor = await conn.cursor(query, *args)
+            while True:
+                rows = await cursor.fetch(page_size)
+                if rows:
+                    yield rows
+                if len(rows) < page_size:
+                    break
+
+
+async def close_pool() -> None:
+    """Close every asyncpg pool (used during graceful shutdown)."""
+    while _pools:
+        _, pool = _pools.popitem()
+        await pool.close()
@@ -1,16 +1,39 @@
 """
 Claim extraction — uses LLM to identify factual claims in content.
+
+``extract_claims_batch`` extracts claims from many documents at once:
+identical documents are extracted once, and short documents are packed
+several per LLM call (up to ``FACT_CHECK_EXTRACTION_BATCH_CHARS`` of
+content), with at most ``FACT_CHECK_MAX_CONCURRENCY`` calls in flight.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Optional
+import os
+from typing import Any, Dict, List, Optional
 
-from src.text_generation.core import GenerationOptions, create_provider_from_env, generate_text
+from src.text_generation.core import (
+    GenerationOptions,
+    LLMProvider,
+    create_provider_from_env,
+    generate_text,
+)
 from src.types.fact_check import Claim, ClaimType
+from src.utils.async_bridge import run_sync
+
+from .claim_validator import FACT_CHECK_MAX_CONCURRENCY
 
 logger = logging.getLogger(__name__)
 
+FACT_CHECK_EXTRACTION_BATCH_CHARS = int(
+    os.environ.get("FACT_CHECK_EXTRACTION_BATCH_CHARS", "8000")
+)
+
+# Content beyond this many characters is not sent for extraction.
+MAX_CONTENT_CHARS = 8000
+
 _EXTRACTION_PROMPT = """\
 You are a fact-checker. Extract all factual claims from the following content.
 
@@ -27,6 +50,49 @@ Do NOT include opinions, predictions, or subjective statements.
 
 --- OUTPUT (JSON array only) ---"""
 
+_BATCH_EXTRACTION_PROMPT = """\
+You are a fact-checker. Extract all factual claims from each of the following numbered documents.
+
+For each claim, provide:
+- "text": The exact factual claim (one sentence)
+- "source_section": The section title it appears in (or "" if unknown)
+- "claim_type": One of: statistic, quote, historical, scientific, general
+
+Return a JSON object mapping each document number (as a string) to a JSON
+array of that document's claims; use an empty array for a document without
+claims. Only include verifiable factual statements.
+Do NOT include opinions, predictions, or subjective statements.
+
+{documents}
+
+--- OUTPUT (JSON object only) ---"""
+
+
+def _parse_json(response: str) -> Any:
+    text = response.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1].rsplit("```", 1)[0]
+    return json.loads(text)
+
+
+def _claims_from_data(claims_data: Any) -> list[Claim]:
+    claims = []
+    for item in claims_data:
+        claim_type = item.get("claim_type", "general")
+        try:
+            ct = ClaimType(claim_type)
+        except ValueError:
+            ct = ClaimType.GENERAL
+
+        claims.append(
+            Claim(
+                text=str(item.get("text", "")),
+                source_section=str(item.get("source_section", "")),
+                claim_type=ct,
+            )
+        )
+    return claims
+
 
 def extract_claims(
     content: str,
@@ -44,33 +110,145 @@ def extract_claims(
     Returns:
         List of extracted claims.
     """
-    prompt = _EXTRACTION_PROMPT.format(content=content[:8000])
     provider = create_provider_from_env(provider_type)
+    return _extract_one(content, provider, options)
+
+
+def _extract_one(
+    content: str,
+    provider: LLMProvider,
+    options: Optional[GenerationOptions],
+) -> list[Claim]:
+    """Extract one document's claims in its own LLM call."""
+    prompt = _EXTRACTION_PROMPT.format(content=content[:MAX_CONTENT_CHARS])
     response = generate_text(prompt, provider, options)
 
     try:
-        # Parse JSON from LLM response
-        text = response.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1].rsplit("```", 1)[0]
-        claims_data = json.loads(text)
-
-        claims = []
-        for item in claims_data:
-            claim_type = item.get("claim_type", "general")
-            try:
-                ct = ClaimType(claim_type)
-            except ValueError:
-                ct = ClaimType.GENERAL
-
-            claims.append(
-                Claim(
-                    text=str(item.get("text", "")),
-                    source_section=str(item.get("source_section", "")),
-                    claim_type=ct,
-                )
-            )
-        return claims
-    except (json.JSONDecodeError, KeyError, TypeError) as e:
+        return _claims_from_data(_parse_json(response))
+    except (json.JSONDecodeError, KeyError, TypeError, AttributeError, IndexError) as e:
         logger.warning("Failed to parse claims from LLM response: %s", e)
         return []
+
+
+def _extract_batch(
+    contents: List[str],
+    provider: LLMProvider,
+    options: Optional[GenerationOptions],
+) -> Dict[int, list[Claim]]:
+    """
+    Extract claims from several documents in one LLM call.
+
+    Returns:
+        Claims by position in ``contents``; documents the response did not
+        cover (or covered unparseably) are missing.
+    """
+    documents = "\n\n".join(
+        f"--- DOCUMENT {i+1} ---\n{content}" for i, content in enumerate(contents)
+    )
+    prompt = _BATCH_EXTRACTION_PROMPT.format(documents=documents)
+    response = generate_text(prompt, provider, options)
+
+    extracted: Dict[int, list[Claim]] = {}
+    try:
+        data = _parse_json(response)
+    except (json.JSONDecodeError, IndexError) as e:
+        logger.warning("Failed to parse batch claim extraction: %s", e)
+        return extracted
+    if not isinstance(data, dict):
+        return extracted
+
+    for number, claims_data in data.items():
+        try:
+            index = int(number) - 1
+            if 0 <= index < len(contents) and isinstance(claims_data, list):
+                extracted[index] = _claims_from_data(claims_data)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            continue
+    return extracted
+
+
+async def extract_claims_batch_async(
+    contents: List[str],
+    provider_type: str = "openai",
+    options: Optional[GenerationOptions] = None,
+    max_concurrency: Optional[int] = None,
+    batch_chars: Optional[int] = None,
+) -> List[list[Claim]]:
+    """
+    Extract claims from several documents, batching short ones per LLM call.
+
+    Args:
+        contents: Documents to analyze (identical documents are extracted once).
+        provider_type: LLM provider to use.
+        options: Generation options.
+        max_concurrency: Max LLM calls in flight (FACT_CHECK_MAX_CONCURRENCY).
+        batch_chars: Max content characters per batched call
+            (FACT_CHECK_EXTRACTION_BATCH_CHARS).
+
+    Returns:
+        One list of claims per document, in order. Documents with identical
+        content share the same Claim objects.
+    """
+    if not contents:
+        return []
+
+    max_concurrency = max(1, max_concurrency or FACT_CHECK_MAX_CONCURRENCY)
+    batch_chars = max(1, batch_chars or FACT_CHECK_EXTRACTION_BATCH_CHARS)
+
+    unique: Dict[str, str] = {}
+    doc_keys: List[str] = []
+    for content in contents:
+        truncated = content[:MAX_CONTENT_CHARS]
+        key = hashlib.sha256(truncated.encode("utf-8")).hexdigest()
+        unique.setdefault(key, truncated)
+        doc_keys.append(key)
+
+    # Pack documents into batches of at most batch_chars characters, in order.
+    batches: List[List[str]] = []
+    size = 0
+    for key in unique:
+        length = len(unique[key])
+        if batches and size + length <= batch_chars:
+            batches[-1].append(key)
+            size += length
+        else:
+            batches.append([key])
+            size = length
+
+    provider = create_provider_from_env(provider_type)
+    semaphore = asyncio.Semaphore(max_concurrency)
+    extracted: Dict[str, list[Claim]] = {}
+
+    async def run_one(key: str) -> None:
+        async with semaphore:
+            extracted[key] = await asyncio.to_thread(_extract_one, unique[key], provider, options)
+
+    async def run_batch(keys: List[str]) -> None:
+        async with semaphore:
+            batch = await asyncio.to_thread(
+                _extract_batch, [unique[k] for k in keys], provider, options
+            )
+        for index, key in enumerate(keys):
+            if index in batch:
+                extracted[key] = batch[index]
+        # Documents the batch response dropped are extracted individually.
+        await asyncio.gather(*(run_one(k) for i, k in enumerate(keys) if i not in batch))
+
+    await asyncio.gather(*(
+        run_batch(keys) if len(keys) > 1 else run_one(keys[0]) for keys in batches
+    ))
+
+    logger.info(
+        "Extracted claims from %d documents (%d unique) in %d LLM batches/calls",
+        len(contents), len(unique), len(batches),
+    )
+    return [extracted[key] for key in doc_keys]
+
+
+def extract_claims_batch(
+    contents: List[str],
+    provider_type: str = "openai",
+    options: Optional[GenerationOptions] = None,
+) -> List[list[Claim]]:
+    """Extract claims from several documents (see extract_claims_batch_async)."""
+    return run_sync(extract_claims_batch_async(contents, provider_type, options))
@@ -0,0 +1,179 @@
+"""
+Cross-document claim index for one batch job or workflow run.
+
+Documents in the same run (batch items on one topic, successive drafts of a
+workflow) tend to repeat the same factual claims, often reworded slightly.
+``ClaimIndex`` maps every claim to a canonical claim so each distinct claim
+is validated once per source set, and fans the verdict back out to every
+document that contains it:
+
+- Claims are normalized with ``claim_key`` (case, punctuation and
+  whitespace ignored); equal keys are the same claim.
+- Otherwise a claim matches an earlier one only when they differ in
+  stopwords and inflections alone: the same content words after stemming,
+  in the same order, the same numbers (sign, percent and currency
+  included) and negations, and word sequences at least
+  ``FACT_CHECK_DEDUP_SIMILARITY`` similar.  "Revenue grew 20%" never merges
+  with "grew -20%" or "grew $20", "born in Germany" with "born in Austria",
+  "the largest river" with "the smallest river", or "Microsoft acquired
+  LinkedIn" with "LinkedIn acquired Microsoft".
+
+The index lives in memory for the run only; verdicts across runs are
+shared through the fact-check cache (see claim_validator).
+"""
+
+import hashlib
+import logging
+import os
+import re
+from difflib import SequenceMatcher
+from typing import Dict, List, Optional, Tuple
+
+from src.text_generation.core import GenerationOptions
+from src.types.fact_check import Claim, ClaimVerification
+from src.utils.async_bridge import run_sync
+
+from src.seo.term_matcher import stem
+
+from .claim_validator import _format_sources, claim_key, validate_claims_async
+
+logger = logging.getLogger(__name__)
+
+FACT_CHECK_DEDUP_SIMILARITY = float(os.environ.get("FACT_CHECK_DEDUP_SIMILARITY", "0.9"))
+
+_NUMBER = re.compile(r"\d")
+# "t" is what claim_key leaves of "n't" (doesn't -> doesn t).
+_NEGATIONS = frozenset({"not", "no", "never", "none", "nor", "without", "cannot", "t"})
+# Words whose presence or absence does not change what a claim asserts.
+# Verbs are left out on purpose: "was" and "is" can make different claims.
+_STOPWORDS = frozenset({
+    "a", "an", "the", "of", "in", "on", "at", "to", "for", "by", "with", "as",
+    "it", "its", "this", "that", "these", "those", "which", "who", "also",
+})
+
+_Bucket = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+
+def _bucket(tokens: List[str]) -> _Bucket:
+    """
+    What two claims must share to be considered the same claim: their
+    numbers and negations, and their (stemmed) content words in order, so
+    "Microsoft acquired LinkedIn" and "LinkedIn acquired Microsoft" differ.
+    """
+    guard = tuple(sorted(t for t in tokens if _NUMBER.search(t) or t in _NEGATIONS))
+    content = tuple(stem(t) for t in tokens if t not in _STOPWORDS and t not in _NEGATIONS)
+    return guard, content
+
+
+class ClaimIndex:
+    """
+    Deduplicates claims across the documents of one run and shares verdicts.
+
+    Not thread-safe: use one index per run, from one thread or event loop.
+    """
+
+    def __init__(self, similarity: Optional[float] = None):
+        self.similarity = FACT_CHECK_DEDUP_SIMILARITY if similarity is None else similarity
+        # Normalized key -> canonical key (itself for canonical claims).
+        self._aliases: Dict[str, str] = {}
+        # Canonical claims and their tokens, bucketed by _bucket().
+        self._canonical: Dict[str, Claim] = {}
+        self._buckets: Dict[_Bucket, List[Tuple[str, List[str]]]] = {}
+        # (sources hash, canonical key) -> verdict.
+        self._verdicts: Dict[Tuple[str, str], ClaimVerification] = {}
+        # Claims validated through this index (LLM calls or cache hits).
+        self.validated = 0
+
+    def __len__(self) -> int:
+        return len(self._canonical)
+
+    def canonical_key(self, claim: Claim) -> str:
+        """Return the key of the canonical claim for ``claim``, indexing it if new."""
+        key = claim_key(claim.text)
+        canonical = self._aliases.get(key)
+        if canonical is not None:
+            return canonical
+
+        tokens = key.split()
+        bucket = self._buckets.setdefault(_bucket(tokens), [])
+        canonical = self._fuzzy_match(tokens, bucket)
+        if canonical is None:
+            canonical = key
+            self._canonical[key] = claim
+            bucket.append((key, tokens))
+        self._aliases[key] = canonical
+        return canonical
+
+    def _fuzzy_match(
+        self,
+        tokens: List[str],
+        bucket: List[Tuple[str, List[str]]],
+    ) -> Optional[str]:
+        if self.similarity >= 1.0 or not tokens:
+            return None
+        for candidate, candidate_tokens in bucket:
+            # Upper bound on the ratio from the lengths alone.
+            total = len(tokens) + len(candidate_tokens)
+            if 2 * min(len(tokens), len(candidate_tokens)) < self.similarity * total:
+                continue
+            matcher = SequenceMatcher(None, tokens, candidate_tokens, autojunk=False)
+            if matcher.quick_ratio() >= self.similarity and matcher.ratio() >= self.similarity:
+                return candidate
+        return None
+
+    async def validate_async(
+        self,
+        claims: List[Claim],
+        source_snippets: List[dict],
+        provider_type: str = "openai",
+        options: Optional[GenerationOptions] = None,
+    ) -> List[ClaimVerification]:
+        """
+        Validate claims, each distinct claim at most once per source set.
+
+        Returns:
+            One ClaimVerification per claim, in order, each carrying its own
+            claim (text, section) with the canonical claim's verdict.
+        """
+        sources_hash = hashlib.sha256(
+            _format_sources(source_snippets).encode("utf-8")
+        ).hexdigest()
+
+        keys = [self.canonical_key(claim) for claim in claims]
+        pending = list(dict.fromkeys(
+            key for key in keys if (sources_hash, key) not in self._verdicts
+        ))
+        if pending:
+            verifications = await validate_claims_async(
+                [self._canonical[key] for key in pending],
+                source_snippets,
+                provider_type,
+                options,
+            )
+            for key, verification in zip(pending, verifications):
+                self._verdicts[(sources_hash, key)] = verification
+            self.validated += len(pending)
+
+        logger.info(
+            "Claim index: %d claims, %d validated now, %d distinct in run",
+            len(claims), len(pending), len(self._canonical),
+        )
+
+        results = []
+        for claim, key in zip(claims, keys):
+            verification = self._verdicts[(sources_hash, key)]
+            results.append(
+                verification if verification.claim is claim
+                else verification.model_copy(update={"claim": claim})
+            )
+        return results
+
+    def validate(
+        self,
+        claims: List[Claim],
+        source_snippets: List[dict],
+        provider_type: str = "openai",
+        options: Optional[GenerationOptions] = None,
+    ) -> List[ClaimVerification]:
+        """Synchronous validate_async."""
+        return run_sync(self.validate_async(claims, source_snippets, provider_type, options))
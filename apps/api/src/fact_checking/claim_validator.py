@@ -1,16 +1,49 @@
 """
 Claim validation — checks individual claims against source material using LLM.
+
+``validate_claims`` validates a whole article's claims concurrently:
+
+- Claims that are identical up to case, punctuation and whitespace are
+  validated once and share the verdict.
+- Verdicts are cached per (claim, source-set hash), so re-checking an edited
+  article against the same sources only validates new or changed claims.
+- Short claims are batched, several per LLM call; long claims get a call each.
+- At most ``FACT_CHECK_MAX_CONCURRENCY`` LLM calls are in flight at once.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Optional
+import os
+import re
+from typing import Any, Dict, List, Optional
 
-from src.text_generation.core import GenerationOptions, create_provider_from_env, generate_text
+from src.text_generation.core import (
+    GenerationOptions,
+    LLMProvider,
+    create_provider_from_env,
+    generate_text,
+)
 from src.types.fact_check import Claim, ClaimVerification, VerificationStatus
+from src.utils.async_bridge import run_sync
+from src.utils.cache import get_fact_check_cache
 
 logger = logging.getLogger(__name__)
 
+FACT_CHECK_MAX_CONCURRENCY = int(os.environ.get("FACT_CHECK_MAX_CONCURRENCY", "4"))
+FACT_CHECK_BATCH_SIZE = int(os.environ.get("FACT_CHECK_BATCH_SIZE", "5"))
+
+# Claims up to this many characters are validated in batches.
+SHORT_CLAIM_CHARS = 200
+
+# Numbers keep their sign, decimal point, percent and currency symbol so that
+# "-5%" and "5%" or "$5" and "€5" stay different claims. A sign only counts at
+# the start of a token ("covid-19" and "5-10" are not negative numbers).
+_CLAIM_TOKEN = re.compile(
+    r"(?:(?<![\w.])[-+])?[$€£¥₹]?\d+(?:[.,]\d+)*(?:%|[$€£¥₹])?(?!\w)|\w+"
+)
+
 _VALIDATION_PROMPT = """\
 You are a fact-checker. Determine whether the following claim is supported by the provided sources.
 
@@ -33,6 +66,89 @@ Rules:
 - "unverified": No source confirms or denies the claim.
 - Confidence should reflect how strongly the sources support the verdict."""
 
+_BATCH_VALIDATION_PROMPT = """\
+You are a fact-checker. For each numbered claim, determine whether it is supported by the provided sources.
+
+CLAIMS:
+{claims}
+
+SOURCES:
+{sources}
+
+Respond with ONLY a JSON array, one object per claim:
+[
+  {{
+    "claim": claim number,
+    "status": "verified" | "unverified" | "contradicted",
+    "confidence": 0.0 to 1.0,
+    "supporting_sources": ["source title or URL that supports/contradicts"],
+    "explanation": "Brief explanation (1-2 sentences)"
+  }}
+]
+
+Rules:
+- "verified": The claim is directly supported by at least one source.
+- "contradicted": A source directly contradicts the claim.
+- "unverified": No source confirms or denies the claim.
+- Confidence should reflect how strongly the sources support the verdict.
+- Judge each claim independently."""
+
+
+def _format_sources(source_snippets: list[dict[str, str]]) -> str:
+    return "\n".join(
+        f"[{i+1}] {s.get('title', 'Unknown')}: {s.get('snippet', '')[:300]}"
+        for i, s in enumerate(source_snippets[:10])
+    )
+
+
+def _no_sources(claim: Claim) -> ClaimVerification:
+    return ClaimVerification(
+        claim=claim,
+        confidence=0.0,
+        status=VerificationStatus.UNVERIFIED,
+        explanation="No sources available for verification.",
+    )
+
+
+def _unparsed(claim: Claim) -> ClaimVerification:
+    return ClaimVerification(
+        claim=claim,
+        confidence=0.0,
+        status=VerificationStatus.UNVERIFIED,
+        explanation="Failed to parse verification result.",
+    )
+
+
+def _parse_json(response: str) -> Any:
+    text = response.strip()
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1].rsplit("```", 1)[0]
+    return json.loads(text)
+
+
+def _verification_from_data(claim: Claim, data: dict) -> ClaimVerification:
+    status_str = data.get("status", "unverified")
+    try:
+        ver_status = VerificationStatus(status_str)
+    except ValueError:
+        ver_status = VerificationStatus.UNVERIFIED
+
+    return ClaimVerification(
+        claim=claim,
+        confidence=min(1.0, max(0.0, float(data.get("confidence", 0.5)))),
+        status=ver_status,
+        supporting_sources=data.get("supporting_sources", []),
+        explanation=str(data.get("explanation", "")),
+    )
+
+
+def claim_key(text: str) -> str:
+    """Normalize a claim for deduplication: lowercase words, punctuation ignored.
+
+    Signs, decimal points, percent and currency symbols on numbers are kept.
+    """
+    return " ".join(_CLAIM_TOKEN.findall(text.lower()))
+
 
 def validate_claim(
     claim: Claim,
@@ -52,50 +168,160 @@ def validate_claim(
     Returns:
         ClaimVerification result.
     """
-    sources_text = "\n".join(
-        f"[{i+1}] {s.get('title', 'Unknown')}: {s.get('snippet', '')[:300]}"
-        for i, s in enumerate(source_snippets[:10])
-    )
+    sources_text = _format_sources(source_snippets)
 
     if not sources_text.strip():
-        return ClaimVerification(
-            claim=claim,
-            confidence=0.0,
-            status=VerificationStatus.UNVERIFIED,
-            explanation="No sources available for verification.",
-        )
+        return _no_sources(claim)
 
-    prompt = _VALIDATION_PROMPT.format(claim=claim.text, sources=sources_text)
     provider = create_provider_from_env(provider_type)
+    return _validate_one(claim, sources_text, provider, options) or _unparsed(claim)
+
+
+def _validate_one(
+    claim: Claim,
+    sources_text: str,
+    provider: LLMProvider,
+    options: Optional[GenerationOptions],
+) -> Optional[ClaimVerification]:
+    """Validate one claim in its own LLM call; None if the response is unparseable."""
+    prompt = _VALIDATION_PROMPT.format(claim=claim.text, sources=sources_text)
     response = generate_text(prompt, provider, options)
 
     try:
-        text = response.strip()
-        if text.startswith("```"):
-            text = text.split("\n", 1)[1].rsplit("```", 1)[0]
-        data = json.loads(text)
+        return _verification_from_data(claim, _parse_json(response))
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError, AttributeError, IndexError) as e:
+        logger.warning("Failed to parse validation result: %s", e)
+        return None
+
 
-        status_str = data.get("status", "unverified")
+def _validate_batch(
+    claims: list[Claim],
+    sources_text: str,
+    provider: LLMProvider,
+    options: Optional[GenerationOptions],
+) -> Dict[int, ClaimVerification]:
+    """
+    Validate several claims in one LLM call.
+
+    Returns:
+        Verdicts by position in ``claims``; claims the response did not
+        cover (or covered unparseably) are missing.
+    """
+    claims_text = "\n".join(f"{i+1}. {claim.text}" for i, claim in enumerate(claims))
+    prompt = _BATCH_VALIDATION_PROMPT.format(claims=claims_text, sources=sources_text)
+    response = generate_text(prompt, provider, options)
+
+    verdicts: Dict[int, ClaimVerification] = {}
+    try:
+        items = _parse_json(response)
+    except (json.JSONDecodeError, IndexError) as e:
+        logger.warning("Failed to parse batch validation result: %s", e)
+        return verdicts
+    if not isinstance(items, list):
+        return verdicts
+
+    for item in items:
         try:
-            ver_status = VerificationStatus(status_str)
-        except ValueError:
-            ver_status = VerificationStatus.UNVERIFIED
-
-        return ClaimVerification(
-            claim=claim,
-            confidence=min(1.0, max(0.0, float(data.get("confidence", 0.5)))),
-            status=ver_status,
-            supporting_sources=data.get("supporting_sources", []),
-            explanation=str(data.get("explanation", "")),
+            index = int(item["claim"]) - 1
+            if 0 <= index < len(claims) and index not in verdicts:
+                verdicts[index] = _verification_from_data(claims[index], item)
+        except (KeyError, TypeError, ValueError, AttributeError):
+            continue
+    return verdicts
+
+
+async def validate_claims_async(
+    claims: list[Claim],
+    source_snippets: list[dict[str, str]],
+    provider_type: str = "openai",
+    options: Optional[GenerationOptions] = None,
+    max_concurrency: Optional[int] = None,
+    batch_size: Optional[int] = None,
+) -> list[ClaimVerification]:
+    """
+    Validate a batch of claims concurrently, reusing cached verdicts.
+
+    Args:
+        claims: Claims to validate (duplicates are validated once).
+        source_snippets: List of dicts with 'title', 'url', 'snippet' keys.
+        provider_type: LLM provider.
+        options: Generation options.
+        max_concurrency: Max LLM calls in flight (FACT_CHECK_MAX_CONCURRENCY).
+        batch_size: Max short claims per LLM call (FACT_CHECK_BATCH_SIZE).
+
+    Returns:
+        One ClaimVerification per claim, in order.
+    """
+    sources_text = _format_sources(source_snippets)
+    if not sources_text.strip():
+        return [_no_sources(claim) for claim in claims]
+
+    max_concurrency = max(1, max_concurrency or FACT_CHECK_MAX_CONCURRENCY)
+    batch_size = max(1, batch_size or FACT_CHECK_BATCH_SIZE)
+    cache = get_fact_check_cache()
+    sources_hash = hashlib.sha256(sources_text.encode("utf-8")).hexdigest()
+
+    unique: Dict[str, Claim] = {}
+    for claim in claims:
+        unique.setdefault(claim_key(claim.text), claim)
+
+    verdicts: Dict[str, ClaimVerification] = {}
+    pending: List[str] = []
+    for key in unique:
+        cached = cache.get(f"{sources_hash}:{key}")
+        if cached is not None:
+            verdicts[key] = cached
+        else:
+            pending.append(key)
+
+    if pending:
+        provider = create_provider_from_env(provider_type)
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(key: str) -> None:
+            async with semaphore:
+                verification = await asyncio.to_thread(
+                    _validate_one, unique[key], sources_text, provider, options
+                )
+            if verification is None:
+                verdicts[key] = _unparsed(unique[key])  # not cached: retried next time
+            else:
+                verdicts[key] = verification
+                cache.set(f"{sources_hash}:{key}", verification)
+
+        async def run_batch(keys: List[str]) -> None:
+            async with semaphore:
+                batch = await asyncio.to_thread(
+                    _validate_batch, [unique[k] for k in keys], sources_text, provider, options
+                )
+            for index, key in enumerate(keys):
+                if index in batch:
+                    verdicts[key] = batch[index]
+                    cache.set(f"{sources_hash}:{key}", batch[index])
+            # Claims the batch response dropped are retried individually.
+            await asyncio.gather(*(run_one(k) for i, k in enumerate(keys) if i not in batch))
+
+        short = [k for k in pending if len(unique[k].text) <= SHORT_CLAIM_CHARS]
+        long = [k for k in pending if len(unique[k].text) > SHORT_CLAIM_CHARS]
+        batches = [short[i:i + batch_size] for i in range(0, len(short), batch_size)]
+        jobs = [run_one(k) for k in long]
+        for batch_keys in batches:
+            jobs.append(run_batch(batch_keys) if len(batch_keys) > 1 else run_one(batch_keys[0]))
+        await asyncio.gather(*jobs)
+
+        logger.info(
+            "Validated %d claims (%d unique, %d cached) in %d LLM batches/calls",
+            len(claims), len(unique), len(unique) - len(pending), len(jobs),
         )
-    except (json.JSONDecodeError, KeyError, TypeError) as e:
-        logger.warning("Failed to parse validation result: %s", e)
-        return ClaimVerification(
-            claim=claim,
-            confidence=0.0,
-            status=VerificationStatus.UNVERIFIED,
-            explanation="Failed to parse verification result.",
+
+    results = []
+    for claim in claims:
+        verification = verdicts[claim_key(claim.text)]
+        results.append(
+            verification if verification.claim is claim
+            else verification.model_copy(update={"claim": claim})
         )
+    return results
 
 
 def validate_claims(
@@ -104,8 +330,5 @@ def validate_claims(
     provider_type: str = "openai",
     options: Optional[GenerationOptions] = None,
 ) -> list[ClaimVerification]:
-    """Validate a batch of claims against source material."""
-    return [
-        validate_claim(claim, source_snippets, provider_type, options)
-        for claim in claims
-    ]
+    """Validate a batch of claims against source material (see validate_claims_async)."""
+    return run_sync(validate_claims_async(claims, source_snippets, provider_type, options))
@@ -3,12 +3,14 @@ Fact-checker facade — orchestrates claim extraction, validation, and confidenc
 """
 
 import logging
-from typing import Optional
+from collections import Counter
+from typing import List, Optional
 
 from src.text_generation.core import GenerationOptions
-from src.types.fact_check import FactCheckResult, VerificationStatus
+from src.types.fact_check import Claim, ClaimVerification, FactCheckResult, VerificationStatus
 
-from .claim_extractor import extract_claims
+from .claim_extractor import extract_claims, extract_claims_batch
+from .claim_index import ClaimIndex
 from .claim_validator import validate_claims
 
 logger = logging.getLogger(__name__)
@@ -19,13 +21,15 @@ def check_facts(
     sources: Optional[list[dict[str, str]]] = None,
     provider_type: str = "openai",
     options: Optional[GenerationOptions] = None,
+    claim_index: Optional[ClaimIndex] = None,
 ) -> FactCheckResult:
     """
     Check facts in content against available sources.
 
     Orchestrates:
     1. Extract factual claims from content
-    2. Validate each claim against sources
+    2. Validate claims against sources (concurrently, deduplicated, with
+       verdicts cached per claim and source set)
     3. Compute aggregate confidence
 
     Args:
@@ -34,6 +38,9 @@ def check_facts(
                  If None, falls back to web research.
         provider_type: LLM provider for extraction and validation.
         options: LLM generation options.
+        claim_index: Optional run-wide claim index (see ClaimIndex); claims
+            already validated in the same run against the same sources are
+            not validated again.
 
     Returns:
         FactCheckResult with per-claim verifications and aggregate stats.
@@ -42,35 +49,115 @@ def check_facts(
     claims = extract_claims(content, provider_type, options)
 
     if not claims:
-        logger.info("No factual claims extracted from content")
-        return FactCheckResult(
-            claims=[],
-            overall_confidence=1.0,
-            summary="No verifiable factual claims found in the content.",
-        )
+        return _no_claims_result()
 
     # Step 2: If no sources provided, attempt web research
     if not sources:
-        try:
-            from src.research.web_researcher import conduct_web_research, extract_research_sources
-            from src.types.research import SearchOptions
-
-            # Use claim texts as search queries
-            search_keywords = [c.text[:100] for c in claims[:5]]
-            research = conduct_web_research(search_keywords, SearchOptions(num_results=5))
-            raw_sources = extract_research_sources(research, max_sources=10)
-            sources = [
-                {"title": s.get("title", ""), "url": s.get("url", ""), "snippet": s.get("snippet", "")}
-                for s in raw_sources
-            ]
-        except Exception as e:
-            logger.warning("Web research for fact-checking failed: %s", e)
-            sources = []
+        sources = _research_sources(claims[:5])
 
     # Step 3: Validate claims
-    verifications = validate_claims(claims, sources or [], provider_type, options)
+    if claim_index is not None:
+        verifications = claim_index.validate(claims, sources, provider_type, options)
+    else:
+        verifications = validate_claims(claims, sources, provider_type, options)
 
     # Step 4: Compute aggregate stats
+    return _summarize(verifications)
+
+
+def check_facts_batch(
+    contents: List[str],
+    sources: Optional[list[dict[str, str]]] = None,
+    provider_type: str = "openai",
+    options: Optional[GenerationOptions] = None,
+    claim_index: Optional[ClaimIndex] = None,
+) -> List[FactCheckResult]:
+    """
+    Check facts in several documents, validating each distinct claim once.
+
+    Claims are extracted in batched LLM calls, deduplicated across all
+    documents through a ClaimIndex, validated once each, and each verdict is
+    reported for every document containing the claim.
+
+    Args:
+        contents: The documents to fact-check.
+        sources: Optional sources shared by all documents. If None, web
+            research is run once for the batch, seeded with the claims that
+            appear in the most documents.
+        provider_type: LLM provider for extraction and validation.
+        options: LLM generation options.
+        claim_index: Index to share with other calls in the same run; a new
+            one is used for this batch if omitted.
+
+    Returns:
+        One FactCheckResult per document, in order.
+    """
+    claim_index = claim_index if claim_index is not None else ClaimIndex()
+    claims_by_doc = extract_claims_batch(contents, provider_type, options)
+
+    all_claims = [claim for claims in claims_by_doc for claim in claims]
+    if not all_claims:
+        return [_no_claims_result() for _ in contents]
+
+    if not sources:
+        # Seed research with the claims shared by the most documents.
+        doc_frequency: Counter = Counter()
+        representative = {}
+        for claims in claims_by_doc:
+            keys = {claim_index.canonical_key(claim): claim for claim in claims}
+            doc_frequency.update(keys.keys())
+            for key, claim in keys.items():
+                representative.setdefault(key, claim)
+        sources = _research_sources(
+            [representative[key] for key, _ in doc_frequency.most_common(5)]
+        )
+
+    verifications = claim_index.validate(all_claims, sources, provider_type, options)
+
+    results = []
+    offset = 0
+    for claims in claims_by_doc:
+        doc_verifications = verifications[offset:offset + len(claims)]
+        offset += len(claims)
+        results.append(_summarize(doc_verifications) if claims else _no_claims_result())
+
+    logger.info(
+        "Batch fact-check complete: %d documents, %d claims, %d distinct",
+        len(contents), len(all_claims), len(claim_index),
+    )
+    return results
+
+
+def _no_claims_result() -> FactCheckResult:
+    logger.info("No factual claims extracted from content")
+    return FactCheckResult(
+        claims=[],
+        overall_confidence=1.0,
+        summary="No verifiable factual claims found in the content.",
+    )
+
+
+def _research_sources(claims: List[Claim]) -> list[dict[str, str]]:
+    """Find sources for the given claims via web research ([] on failure)."""
+    try:
+        from src.research.web_researcher import conduct_web_research, extract_research_sources
+        from src.types.research import SearchOptions
+
+        # Use claim texts as search queries
+        search_keywords = [c.text[:100] for c in claims]
+        research = conduct_web_research(search_keywords, SearchOptions(num_results=5))
+        raw_sources = extract_research_sources(research, max_sources=10)
+        return [
+            {"title": s.get("title", ""), "url": s.get("url", ""), "snippet": s.get("snippet", "")}
+            for s in raw_sources
+        ]
+    except Exception as e:
+        logger.warning("Web research for fact-checking failed: %s", e)
+        return []
+
+
+def _summarize(verifications: List[ClaimVerification]) -> FactCheckResult:
+    """Aggregate per-claim verifications into a FactCheckResult."""
     verified = sum(1 for v in verifications if v.status == VerificationStatus.VERIFIED)
     unverified = sum(1 for v in verifications if v.status == VerificationStatus.UNVERIFIED)
     contradicted = sum(1 for v in verifications if v.status == VerificationStatus.CONTRADICTED)
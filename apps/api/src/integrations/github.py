@@ -6,7 +6,7 @@ import base64
 import os
 from typing import Any, Dict, List, Optional
 
-import requests
+import httpx
 
 HTTP_REQUEST_TIMEOUT = 30
 
@@ -16,6 +16,7 @@ from ..types.integrations import (
     GitHubRepository,
     IntegrationResult,
 )
+from ..utils import http_client
 
 
 class GitHubIntegrationError(Exception):
@@ -55,7 +56,7 @@ def upload_file(
         file_sha = None
 
         try:
-            response = requests.get(
+            response = http_client.get_sync(
                 f"https://api.github.com/repos/{repository.owner}/{repository.name}/contents/{options.path}",
                 headers=headers,
                 params={"ref": options.branch},
@@ -65,7 +66,7 @@ def upload_file(
             if response.status_code == 200:
                 file_exists = True
                 file_sha = response.json()["sha"]
-        except requests.RequestException:
+        except httpx.HTTPError:
             # File doesn't exist, which is fine - we'll create it
             pass
         except (KeyError, ValueError):
@@ -83,7 +84,7 @@ def upload_file(
             file_data["sha"] = file_sha
 
         # Upload file
-        response = requests.put(
+        response = http_client.put_sync(
             f"https://api.github.com/repos/{repository.owner}/{repository.name}/contents/{options.path}",
             headers=headers,
             json=file_data,
@@ -104,13 +105,13 @@ def upload_file(
                 message=f"Failed to upload file: {response.text}",
                 data=None,
             )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise GitHubIntegrationError(f"GitHub request timed out while uploading file: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise GitHubIntegrationError(f"Network error connecting to GitHub: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise GitHubIntegrationError(f"GitHub HTTP error while uploading file: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise GitHubIntegrationError(f"GitHub request failed while uploading file: {str(e)}") from e
     except KeyError as e:
         raise GitHubIntegrationError(f"Unexpected GitHub response format, missing key: {str(e)}") from e
@@ -155,7 +156,7 @@ def create_repository(
             repo_data["description"] = description
 
         # Create repository
-        response = requests.post(
+        response = http_client.post_sync(
             "https://api.github.com/user/repos",
             headers=headers,
             json=repo_data,
@@ -172,13 +173,13 @@ def create_repository(
             raise GitHubIntegrationError(
                 f"Failed to create repository: {response.text}"
             )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise GitHubIntegrationError(f"GitHub request timed out while creating repository: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise GitHubIntegrationError(f"Network error connecting to GitHub: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise GitHubIntegrationError(f"GitHub HTTP error while creating repository: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise GitHubIntegrationError(f"GitHub request failed while creating repository: {str(e)}") from e
     except KeyError as e:
         raise GitHubIntegrationError(f"Unexpected GitHub response format, missing key: {str(e)}") from e
@@ -209,7 +210,7 @@ def get_repositories(credentials: GitHubCredentials) -> List[GitHubRepository]:
         }
 
         # Get repositories
-        response = requests.get(
+        response = http_client.get_sync(
             "https://api.github.com/user/repos",
             headers=headers,
             timeout=HTTP_REQUEST_TIMEOUT,
@@ -230,13 +231,13 @@ def get_repositories(credentials: GitHubCredentials) -> List[GitHubRepository]:
             return repos
         else:
             raise GitHubIntegrationError(f"Failed to get repositories: {response.text}")
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise GitHubIntegrationError(f"GitHub request timed out while getting repositories: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise GitHubIntegrationError(f"Network error connecting to GitHub: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise GitHubIntegrationError(f"GitHub HTTP error while getting repositories: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise GitHubIntegrationError(f"GitHub request failed while getting repositories: {str(e)}") from e
     except KeyError as e:
         raise GitHubIntegrationError(f"Unexpected GitHub response format, missing key: {str(e)}") from e
@@ -271,7 +272,7 @@ def get_repository(
         }
 
         # Get repository
-        response = requests.get(
+        response = http_client.get_sync(
             f"https://api.github.com/repos/{owner}/{name}",
             headers=headers,
             timeout=HTTP_REQUEST_TIMEOUT,
@@ -285,13 +286,13 @@ def get_repository(
             )
         else:
             raise GitHubIntegrationError(f"Failed to get repository: {response.text}")
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise GitHubIntegrationError(f"GitHub request timed out while getting repository: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise GitHubIntegrationError(f"Network error connecting to GitHub: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise GitHubIntegrationError(f"GitHub HTTP error while getting repository: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise GitHubIntegrationError(f"GitHub request failed while getting repository: {str(e)}") from e
     except KeyError as e:
         raise GitHubIntegrationError(f"Unexpected GitHub response format, missing key: {str(e)}") from e
@@ -330,7 +331,7 @@ def create_branch(
         }
 
         # Get base branch reference
-        response = requests.get(
+        response = http_client.get_sync(
             f"https://api.github.com/repos/{repository.owner}/{repository.name}/git/refs/heads/{base_branch}",
             headers=headers,
             timeout=HTTP_REQUEST_TIMEOUT,
@@ -349,7 +350,7 @@ def create_branch(
         # Create branch
         branch_data = {"ref": f"refs/heads/{branch_name}", "sha": base_sha}
 
-        response = requests.post(
+        response = http_client.post_sync(
             f"https://api.github.com/repos/{repository.owner}/{repository.name}/git/refs",
             headers=headers,
             json=branch_data,
@@ -369,13 +370,13 @@ def create_branch(
                 message=f"Failed to create branch: {response.text}",
                 data=None,
             )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise GitHubIntegrationError(f"GitHub request timed out while creating branch: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise GitHubIntegrationError(f"Network error connecting to GitHub: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise GitHubIntegrationError(f"GitHub HTTP error while creating branch: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise GitHubIntegrationError(f"GitHub request failed while creating branch: {str(e)}") from e
     except KeyError as e:
         raise GitHubIntegrationError(f"Unexpected GitHub response format, missing key: {str(e)}") from e
@@ -422,7 +423,7 @@ def create_pull_request(
             pr_data["body"] = body
 
         # Create pull request
-        response = requests.post(
+        response = http_client.post_sync(
             f"https://api.github.com/repos/{repository.owner}/{repository.name}/pulls",
             headers=headers,
             json=pr_data,
@@ -443,13 +444,13 @@ def create_pull_request(
                 message=f"Failed to create pull request: {response.text}",
                 data=None,
             )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise GitHubIntegrationError(f"GitHub request timed out while creating pull request: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise GitHubIntegrationError(f"Network error connecting to GitHub: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise GitHubIntegrationError(f"GitHub HTTP error while creating pull request: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise GitHubIntegrationError(f"GitHub request failed while creating pull request: {str(e)}") from e
     except KeyError as e:
         raise GitHubIntegrationError(f"Unexpected GitHub response format, missing key: {str(e)}") from e
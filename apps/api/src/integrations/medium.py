@@ -6,11 +6,12 @@ import json
 import os
 from typing import Any, Dict, List, Optional
 
-import requests
+import httpx
 
 HTTP_REQUEST_TIMEOUT = 30
 
 from ..types.integrations import IntegrationResult, MediumCredentials, MediumPostOptions
+from ..utils import http_client
 
 
 class MediumIntegrationError(Exception):
@@ -44,7 +45,7 @@ def upload_post(
         }
 
         # Get user ID
-        response = requests.get(
+        response = http_client.get_sync(
             "https://api.medium.com/v1/me",
             headers=headers,
             timeout=HTTP_REQUEST_TIMEOUT,
@@ -73,7 +74,7 @@ def upload_post(
             post_data["canonicalUrl"] = options.canonical_url
 
         # Upload post
-        response = requests.post(
+        response = http_client.post_sync(
             f"https://api.medium.com/v1/users/{user_id}/posts",
             headers=headers,
             json=post_data,
@@ -94,13 +95,13 @@ def upload_post(
                 message=f"Failed to upload post: {response.text}",
                 data=None,
             )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise MediumIntegrationError(f"Medium request timed out while uploading post: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise MediumIntegrationError(f"Network error connecting to Medium: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise MediumIntegrationError(f"Medium HTTP error while uploading post: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise MediumIntegrationError(f"Medium request failed while uploading post: {str(e)}") from e
     except KeyError as e:
         raise MediumIntegrationError(f"Unexpected Medium response format, missing key: {str(e)}") from e
@@ -131,7 +132,7 @@ def get_user_publications(credentials: MediumCredentials) -> List[Dict[str, Any]
         }
 
         # Get user ID
-        response = requests.get(
+        response = http_client.get_sync(
             "https://api.medium.com/v1/me",
             headers=headers,
             timeout=HTTP_REQUEST_TIMEOUT,
@@ -144,7 +145,7 @@ def get_user_publications(credentials: MediumCredentials) -> List[Dict[str, Any]
         user_id = response.json()["data"]["id"]
 
         # Get publications
-        response = requests.get(
+        response = http_client.get_sync(
             f"https://api.medium.com/v1/users/{user_id}/publications",
             headers=headers,
             timeout=HTTP_REQUEST_TIMEOUT,
@@ -155,11 +156,11 @@ def get_user_publications(credentials: MediumCredentials) -> List[Dict[str, Any]
             return response.json()["data"]
         else:
             raise MediumIntegrationError(f"Failed to get publications: {response.text}")
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise MediumIntegrationError(f"Medium request timed out while getting publications: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise MediumIntegrationError(f"Network error connecting to Medium: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise MediumIntegrationError(f"Medium request failed while getting publications: {str(e)}") from e
     except KeyError as e:
         raise MediumIntegrationError(f"Unexpected Medium response format, missing key: {str(e)}") from e
@@ -195,7 +196,7 @@ def upload_post_to_publication(
         }
 
         # Get user ID
-        response = requests.get(
+        response = http_client.get_sync(
             "https://api.medium.com/v1/me",
             headers=headers,
             timeout=HTTP_REQUEST_TIMEOUT,
@@ -224,7 +225,7 @@ def upload_post_to_publication(
             post_data["canonicalUrl"] = options.canonical_url
 
         # Upload post
-        response = requests.post(
+        response = http_client.post_sync(
             f"https://api.medium.com/v1/publications/{publication_id}/posts",
             headers=headers,
             json=post_data,
@@ -245,11 +246,11 @@ def upload_post_to_publication(
                 message=f"Failed to upload post to publication: {response.text}",
                 data=None,
             )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise MediumIntegrationError(f"Medium request timed out while uploading post to publication: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise MediumIntegrationError(f"Network error connecting to Medium: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise MediumIntegrationError(f"Medium request failed while uploading post to publication: {str(e)}") from e
     except KeyError as e:
         raise MediumIntegrationError(f"Unexpected Medium response format, missing key: {str(e)}") from e
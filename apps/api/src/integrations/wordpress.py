@@ -7,7 +7,7 @@ import json
 import os
 from typing import Any, Dict, List, Optional
 
-import requests
+import httpx
 
 HTTP_REQUEST_TIMEOUT = 30
 
@@ -19,6 +19,7 @@ from ..types.integrations import (
     WordPressPostOptions,
     WordPressTag,
 )
+from ..utils import http_client
 
 
 class WordPressIntegrationError(Exception):
@@ -74,7 +75,7 @@ def upload_post(
             post_data["featured_media"] = options.featured_media
 
         # Upload post
-        response = requests.post(
+        response = http_client.post_sync(
             f"{credentials.site_url}/wp-json/wp/v2/posts",
             headers=headers,
             json=post_data,
@@ -95,13 +96,13 @@ def upload_post(
                 message=f"Failed to upload post: {response.text}",
                 data=None,
             )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise WordPressIntegrationError(f"WordPress request timed out while uploading post: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise WordPressIntegrationError(f"Network error connecting to WordPress: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise WordPressIntegrationError(f"WordPress HTTP error while uploading post: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise WordPressIntegrationError(f"WordPress request failed while uploading post: {str(e)}") from e
     except KeyError as e:
         raise WordPressIntegrationError(f"Unexpected WordPress response format, missing key: {str(e)}") from e
@@ -132,7 +133,7 @@ def get_categories(credentials: WordPressCredentials) -> List[WordPressCategory]
         headers = {"Authorization": f"Basic {auth}"}
 
         # Get categories
-        response = requests.get(
+        response = http_client.get_sync(
             f"{credentials.site_url}/wp-json/wp/v2/categories",
             headers=headers,
             timeout=HTTP_REQUEST_TIMEOUT,
@@ -157,11 +158,11 @@ def get_categories(credentials: WordPressCredentials) -> List[WordPressCategory]
             raise WordPressIntegrationError(
                 f"Failed to get categories: {response.text}"
             )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise WordPressIntegrationError(f"WordPress request timed out while getting categories: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise WordPressIntegrationError(f"Network error connecting to WordPress: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise WordPressIntegrationError(f"WordPress request failed while getting categories: {str(e)}") from e
     except KeyError as e:
         raise WordPressIntegrationError(f"Unexpected WordPress response format, missing key: {str(e)}") from e
@@ -192,7 +193,7 @@ def get_tags(credentials: WordPressCredentials) -> List[WordPressTag]:
         headers = {"Authorization": f"Basic {auth}"}
 
         # Get tags
-        response = requests.get(
+        response = http_client.get_sync(
             f"{credentials.site_url}/wp-json/wp/v2/tags",
             headers=headers,
             timeout=HTTP_REQUEST_TIMEOUT,
@@ -213,11 +214,11 @@ def get_tags(credentials: WordPressCredentials) -> List[WordPressTag]:
             return tags
         else:
             raise WordPressIntegrationError(f"Failed to get tags: {response.text}")
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise WordPressIntegrationError(f"WordPress request timed out while getting tags: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise WordPressIntegrationError(f"Network error connecting to WordPress: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise WordPressIntegrationError(f"WordPress request failed while getting tags: {str(e)}") from e
     except KeyError as e:
         raise WordPressIntegrationError(f"Unexpected WordPress response format, missing key: {str(e)}") from e
@@ -258,7 +259,7 @@ def create_category(
             category_data["slug"] = slug
 
         # Create category
-        response = requests.post(
+        response = http_client.post_sync(
             f"{credentials.site_url}/wp-json/wp/v2/categories",
             headers=headers,
             json=category_data,
@@ -277,11 +278,11 @@ def create_category(
             raise WordPressIntegrationError(
                 f"Failed to create category: {response.text}"
             )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise WordPressIntegrationError(f"WordPress request timed out while creating category: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise WordPressIntegrationError(f"Network error connecting to WordPress: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise WordPressIntegrationError(f"WordPress request failed while creating category: {str(e)}") from e
     except KeyError as e:
         raise WordPressIntegrationError(f"Unexpected WordPress response format, missing key: {str(e)}") from e
@@ -322,7 +323,7 @@ def create_tag(
             tag_data["slug"] = slug
 
         # Create tag
-        response = requests.post(
+        response = http_client.post_sync(
             f"{credentials.site_url}/wp-json/wp/v2/tags",
             headers=headers,
             json=tag_data,
@@ -337,11 +338,11 @@ def create_tag(
             )
         else:
             raise WordPressIntegrationError(f"Failed to create tag: {response.text}")
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise WordPressIntegrationError(f"WordPress request timed out while creating tag: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise WordPressIntegrationError(f"Network error connecting to WordPress: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise WordPressIntegrationError(f"WordPress request failed while creating tag: {str(e)}") from e
     except KeyError as e:
         raise WordPressIntegrationError(f"Unexpected WordPress response format, missing key: {str(e)}") from e
@@ -385,7 +386,7 @@ def upload_image(
         # Upload image
         files = {"file": (filename, image_data)}
 
-        response = requests.post(
+        response = http_client.post_sync(
             f"{credentials.site_url}/wp-json/wp/v2/media",
             headers=headers,
             files=files,
@@ -409,11 +410,11 @@ def upload_image(
         raise WordPressIntegrationError(f"Image file not found: {str(e)}") from e
     except PermissionError as e:
         raise WordPressIntegrationError(f"Permission denied reading image file: {str(e)}") from e
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise WordPressIntegrationError(f"WordPress request timed out while uploading image: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise WordPressIntegrationError(f"Network error connecting to WordPress: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise WordPressIntegrationError(f"WordPress request failed while uploading image: {str(e)}") from e
     except KeyError as e:
         raise WordPressIntegrationError(f"Unexpected WordPress response format, missing key: {str(e)}") from e
@@ -445,7 +446,7 @@ def update_image_alt_text(
         headers = {"Authorization": f"Basic {auth}", "Content-Type": "application/json"}
 
         # Update alt text
-        response = requests.post(
+        response = http_client.post_sync(
             f"{credentials.site_url}/wp-json/wp/v2/media/{image_id}",
             headers=headers,
             json={"alt_text": alt_text},
@@ -457,11 +458,11 @@ def update_image_alt_text(
             raise WordPressIntegrationError(
                 f"Failed to update image alt text: {response.text}"
             )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise WordPressIntegrationError(f"WordPress request timed out while updating image alt text: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise WordPressIntegrationError(f"Network error connecting to WordPress: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise WordPressIntegrationError(f"WordPress request failed while updating image alt text: {str(e)}") from e
     except WordPressIntegrationError:
         raise
@@ -32,6 +32,7 @@ from src.organizations.audit_service import (
     AuditStatistics,
     get_audit_service,
     init_audit_service,
+    shutdown_audit_service,
 )
 from src.organizations.organization_service import (
     InviteExistsError,
@@ -80,6 +81,7 @@ __all__ = [
     "init_organization_service",
     "get_audit_service",
     "init_audit_service",
+    "shutdown_audit_service",
     # RBAC
     "Permission",
     "PermissionGroup",
@@ -0,0 +1,283 @@
+"""
+Buffered, batched writes for audit log entries.
+
+``AuditService.log`` used to make one RPC round trip per entry on the
+request path.  ``AuditLogBuffer.enqueue()`` instead appends the prepared
+row to a bounded in-memory deque and returns immediately; a background task
+drains it in batches (when ``batch_size`` rows are waiting or every
+``flush_interval`` seconds) through a single ``log_audit_events`` call.
+
+Audit entries must not be lost, so nothing is ever dropped:
+
+- If a batch cannot be written (database unavailable), it and everything
+  still buffered is appended to a local JSONL spill file
+  (``AUDIT_LOG_SPILL_PATH``) instead of being retried in memory.
+- If the buffer is full, the new row goes straight to the spill file.
+- Every flush first replays the spill file.  The file is renamed before
+  replay so new spills never interleave with it, and it is only removed
+  once every row was written.  Rows carry client-generated ids and
+  ``log_audit_events`` skips ids that already exist, so replaying a file
+  that was partially written before is safe.
+
+The file left behind by a crash or an outage is replayed by the first
+flush after the next start.
+
+A batch can also fail because of one row the database rejects (a value
+that violates a column type or CHECK constraint) while the database is
+fine.  Spilling such a batch would make every later replay fail too, so a
+failed write is first followed by an empty probe write: if the probe
+fails, the database is down and the rows are spilled as above; if it
+succeeds, the batch is bisected down to the rejected rows, which are
+moved to a dead-letter file (``AUDIT_LOG_DEAD_LETTER_PATH``) with the
+error instead of being retried.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+AuditRow = Dict[str, Any]
+BatchWriter = Callable[[List[AuditRow]], Awaitable[Any]]
+
+
+@dataclass
+class AuditBufferStats:
+    """Counters for the audit log buffer."""
+
+    enqueued: int = 0
+    written: int = 0
+    spilled: int = 0
+    replayed: int = 0
+    rejected: int = 0
+    batches: int = 0
+    last_batch_ms: float = 0.0
+    started_at: float = field(default_factory=time.monotonic)
+
+    def to_dict(self, buffered: int, spill_pending: bool) -> Dict[str, Any]:
+        return {
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "spilled": self.spilled,
+            "replayed": self.replayed,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "buffered": buffered,
+            "spill_pending": spill_pending,
+            "last_batch_ms": round(self.last_batch_ms, 2),
+        }
+
+
+class AuditLogBuffer:
+    """Bounded queue plus background batch flusher with a local spill file."""
+
+    def __init__(
+        self,
+        writer: BatchWriter,
+        capacity: int = 10_000,
+        batch_size: int = 200,
+        flush_interval: float = 1.0,
+        spill_path: str = "./data/audit_spill.jsonl",
+        dead_letter_path: Optional[str] = None,
+    ):
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.spill_path = spill_path
+        self.replay_path = spill_path + ".replay"
+        self.dead_letter_path = dead_letter_path or (
+            os.path.splitext(spill_path)[0] + ".rejected.jsonl"
+        )
+        self._writer = writer
+        self._buffer: Deque[AuditRow] = deque()
+        self._stats = AuditBufferStats()
+        self._spill_pending = os.path.exists(self.spill_path) or os.path.exists(
+            self.replay_path
+        )
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._stopping = False
+
+    def enqueue(self, row: AuditRow) -> None:
+        """Buffer a row for the next batch. Never blocks or awaits."""
+        self._stats.enqueued += 1
+        if len(self._buffer) >= self.capacity:
+            # Rare: the flusher is far behind. Keep the entry on disk instead.
+            self._append_spill([row])
+        else:
+            self._buffer.append(row)
+        self._ensure_running()
+        if len(self._buffer) >= self.batch_size and self._wake is not None:
+            self._wake.set()
+
+    def _ensure_running(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # Flushed explicitly (or on the next enqueue from a loop).
+        if self._loop is loop and self._task is not None and not self._task.done():
+            return
+        self._loop = loop
+        self._wake = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._task = loop.create_task(self._run())
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            if self._stopping:
+                break
+            try:
+                await self.flush()
+            except Exception as e:  # pragma: no cover - flush already logs
+                logger.error("Audit log flush failed: %s", e)
+
+    async def flush(self) -> int:
+        """Replay spilled rows, then write everything buffered. Returns rows written."""
+        if self._flush_lock is None:
+            self._flush_lock = asyncio.Lock()
+        written = 0
+        async with self._flush_lock:
+            healthy = True
+            if self._spill_pending:
+                try:
+                    written += await self._replay_spill()
+                except Exception as e:
+                    healthy = False
+                    logger.warning("Audit spill replay failed, will retry: %s", e)
+
+            while self._buffer:
+                count = min(self.batch_size, len(self._buffer))
+                batch = [self._buffer.popleft() for _ in range(count)]
+                if healthy:
+                    try:
+                        written += await self._write_isolating(batch)
+                        continue
+                    except Exception as e:
+                        healthy = False
+                        logger.warning(
+                            "Audit batch write failed, spilling to %s: %s", self.spill_path, e
+                        )
+                # Database unavailable: keep the rest on disk until the next flush.
+                await asyncio.to_thread(self._append_spill, batch)
+        return written
+
+    async def _write(self, batch: List[AuditRow]) -> None:
+        start = time.perf_counter()
+        await self._writer(batch)
+        self._stats.last_batch_ms = (time.perf_counter() - start) * 1000
+        self._stats.batches += 1
+        self._stats.written += len(batch)
+
+    async def _write_isolating(self, batch: List[AuditRow]) -> int:
+        """
+        Write a batch, dead-lettering rows the database rejects.
+
+        Raises if the database is unavailable, so the caller spills the
+        batch; rows of it already written are skipped on replay by id.
+        Returns the number of rows written.
+        """
+        try:
+            await self._write(batch)
+            return len(batch)
+        except Exception:
+            await self._writer([])  # Probe: raises if the database is down.
+
+        if len(batch) > 1:
+            mid = len(batch) // 2
+            return await self._write_isolating(batch[:mid]) + await self._write_isolating(
+                batch[mid:]
+            )
+
+        # A single row: retry once in case the failure was transient.
+        try:
+            await self._write(batch)
+            return 1
+        except Exception as e:
+            await self._writer([])
+            logger.error(
+                "Audit log entry %s rejected by the database, moved to %s: %s",
+                batch[0].get("id"), self.dead_letter_path, e,
+            )
+            await asyncio.to_thread(self._append_dead_letter, batch[0], e)
+            return 0
+
+    async def stop(self) -> None:
+        """Stop the background flusher and write (or spill) any remaining rows."""
+        # Not cancelled: a batch popped mid-write would otherwise be lost.
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            self._stopping = True
+            self._wake.set()
+            try:
+                await task
+            finally:
+                self._stopping = False
+        await self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._stats.to_dict(len(self._buffer), self._spill_pending)
+
+    # =========================================================================
+    # Spill file
+    # =========================================================================
+
+    def _append_spill(self, rows: List[AuditRow]) -> None:
+        os.makedirs(os.path.dirname(self.spill_path) or ".", exist_ok=True)
+        with open(self.spill_path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(row, default=str) + "\n" for row in rows))
+            f.flush()
+            os.fsync(f.fileno())
+        self._spill_pending = True
+        self._stats.spilled += len(rows)
+
+    def _append_dead_letter(self, row: AuditRow, error: Exception) -> None:
+        os.makedirs(os.path.dirname(self.dead_letter_path) or ".", exist_ok=True)
+        entry = {"error": str(error), "rejected_at": datetime.now(timezone.utc).isoformat(), "row": row}
+        with open(self.dead_letter_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._stats.rejected += 1
+
+    def _load_replay(self) -> List[AuditRow]:
+        rows: List[AuditRow] = []
+        with open(self.replay_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    rows.append(json.loads(line))
+                except ValueError:
+                    continue  # torn final line from an interrupted write
+        return rows
+
+    async def _replay_spill(self) -> int:
+        # A leftover .replay file (failed earlier replay) goes first; otherwise
+        # claim the current spill file so new spills start a fresh one.
+        if not os.path.exists(self.replay_path):
+            if not os.path.exists(self.spill_path):
+                self._spill_pending = False
+                return 0
+            os.replace(self.spill_path, self.replay_path)
+
+        rows = await asyncio.to_thread(self._load_replay)
+        written = 0
+        for start in range(0, len(rows), self.batch_size):
+            written += await self._write_isolating(rows[start:start + self.batch_size])
+        os.remove(self.replay_path)
+        self._stats.replayed += written
+        self._spill_pending = os.path.exists(self.spill_path)
+        logger.info("Replayed %d spilled audit log entries", written)
+        return written
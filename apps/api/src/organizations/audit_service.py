@@ -11,12 +11,21 @@ Security Notes:
 - Sensitive data is filtered before logging
 - All timestamps are in UTC
 - IP addresses and user agents are captured for security
+
+Entries are written in batches by a background task (see audit_buffer.py);
+set AUDIT_LOG_BUFFERED=false to write each entry synchronously instead.
 """
 
+import ipaddress
 import logging
-from datetime import datetime, timedelta
+import os
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Union
 
+from src.organizations.audit_buffer import AuditLogBuffer
+
 from src.types.organization import (
     AuditAction,
     AuditLogCreate,
@@ -51,9 +60,49 @@ SENSITIVE_FIELDS = frozenset({
 # Maximum size for logged values (truncate if larger)
 MAX_VALUE_SIZE = 10000
 
+# Column limits enforced by CHECK constraints on audit_logs; entries are
+# made to fit before queueing so one bad value cannot fail a whole batch.
+MAX_ACTION_LENGTH = 100
+MAX_RESOURCE_TYPE_LENGTH = 50
+MAX_USER_AGENT_LENGTH = 500
+
 # Maximum age for audit log queries (for performance)
 MAX_QUERY_DAYS = 365
 
+# Actions included in security queries and summaries
+SECURITY_ACTIONS = (
+    "login.success",
+    "login.failure",
+    "api_key.create",
+    "api_key.revoke",
+    "member.remove",
+    "organization.delete",
+)
+
+
+@lru_cache(maxsize=4096)
+def _is_sensitive_key(key: str) -> bool:
+    """Whether a field name contains a sensitive term (cached per key)."""
+    key_lower = key.lower()
+    return any(sensitive in key_lower for sensitive in SENSITIVE_FIELDS)
+
+
+def _valid_ip_address(value: Any) -> Optional[str]:
+    """The address if Postgres INET accepts it, else None (X-Forwarded-For is client-supplied)."""
+    if not value:
+        return None
+    text = str(value).strip()
+    if "%" in text:  # IPv6 zone ids are not valid INET input
+        return None
+    try:
+        return str(ipaddress.ip_address(text))
+    except ValueError:
+        return None
+
+
+def is_buffered_audit_enabled() -> bool:
+    return os.environ.get("AUDIT_LOG_BUFFERED", "true").lower() in ("1", "true", "yes")
+
 
 # =============================================================================
 # Audit Service
@@ -69,14 +118,29 @@ class AuditService:
     should not break the main application flow.
     """
 
-    def __init__(self, db_client: Any):
+    def __init__(self, db_client: Any, buffered: Optional[bool] = None):
         """
         Initialize the audit service.
 
         Args:
             db_client: Database client (Supabase client or similar).
+            buffered: Queue entries and write them in batches (default:
+                AUDIT_LOG_BUFFERED, true).
         """
         self.db = db_client
+        self._partitions_checked_on: Optional[date] = None
+        if buffered is None:
+            buffered = is_buffered_audit_enabled()
+        self.buffer: Optional[AuditLogBuffer] = None
+        if buffered:
+            self.buffer = AuditLogBuffer(
+                writer=self._write_batch,
+                capacity=int(os.environ.get("AUDIT_LOG_BUFFER_SIZE", "10000")),
+                batch_size=int(os.environ.get("AUDIT_LOG_BATCH_SIZE", "200")),
+                flush_interval=int(os.environ.get("AUDIT_LOG_FLUSH_INTERVAL_MS", "1000")) / 1000,
+                spill_path=os.environ.get("AUDIT_LOG_SPILL_PATH", "./data/audit_spill.jsonl"),
+                dead_letter_path=os.environ.get("AUDIT_LOG_DEAD_LETTER_PATH") or None,
+            )
 
     async def log(
         self,
@@ -96,7 +160,9 @@ class AuditService:
         Log an audit event.
 
         This method is designed to be fail-safe - exceptions are caught
-        and logged but not raised to avoid breaking the main flow.
+        and logged but not raised to avoid breaking the main flow. When
+        buffered, the entry is queued and written by the background flusher;
+        the returned ID is assigned here and is the one stored.
 
         Args:
             action: The action performed.
@@ -121,7 +187,10 @@ class AuditService:
                 resource_type.value
                 if isinstance(resource_type, ResourceType)
                 else str(resource_type)
-            )
+            )[:MAX_RESOURCE_TYPE_LENGTH]
+            action_str = action_str[:MAX_ACTION_LENGTH]
+            if not action_str or not resource_type_str:
+                raise ValueError("action and resource_type must not be empty")
 
             # Sanitize data
             sanitized_metadata = self._sanitize_data(metadata) if metadata else {}
@@ -134,12 +203,34 @@ class AuditService:
             request_id = None
 
             if request_context:
-                ip_address = request_context.get("ip_address")
+                ip_address = _valid_ip_address(request_context.get("ip_address"))
                 user_agent = request_context.get("user_agent")
-                if user_agent and len(user_agent) > 500:
-                    user_agent = user_agent[:500]
+                if user_agent and len(user_agent) > MAX_USER_AGENT_LENGTH:
+                    user_agent = user_agent[:MAX_USER_AGENT_LENGTH]
                 request_id = request_context.get("request_id")
 
+            row = {
+                "id": str(uuid.uuid4()),
+                "organization_id": organization_id,
+                "user_id": user_id,
+                "action": action_str,
+                "resource_type": resource_type_str,
+                "resource_id": resource_id,
+                "metadata": sanitized_metadata,
+                "old_values": sanitized_old,
+                "new_values": sanitized_new,
+                "ip_address": ip_address,
+                "user_agent": user_agent,
+                "request_id": request_id,
+                "success": success,
+                "error_message": error_message,
+                "created_at": datetime.now(timezone.utc).isoformat(),
+            }
+
+            if self.buffer is not None:
+                self.buffer.enqueue(row)
+                return row["id"]
+
             # Use database function for insertion
             result = await self.db.rpc(
                 "log_audit_event",
@@ -161,6 +252,7 @@ class AuditService:
             ).execute()
 
             log_id = result.data if result.data else None
+            await self._ensure_stats_partitions()
 
             if log_id:
                 logger.debug(
@@ -187,6 +279,38 @@ class AuditService:
             )
             return None
 
+    async def _write_batch(self, rows: List[Dict[str, Any]]) -> None:
+        """Insert a batch of prepared entries (raises so the buffer can spill)."""
+        await self.db.rpc("log_audit_events", {"p_events": rows}).execute()
+        if rows:
+            await self._ensure_stats_partitions()
+
+    async def _ensure_stats_partitions(self) -> None:
+        """
+        Create the upcoming monthly audit_log_daily_stats partitions, at most
+        once a day. Covers databases where migration 020 could not schedule
+        the pg_cron job; never raises.
+        """
+        today = datetime.now(timezone.utc).date()
+        if self._partitions_checked_on == today:
+            return
+        self._partitions_checked_on = today
+        try:
+            await self.db.rpc("ensure_audit_stats_partitions", {}).execute()
+        except Exception as e:
+            logger.warning(f"Failed to create audit stats partitions: {e}")
+
+    async def flush(self) -> int:
+        """Write buffered entries now. Returns the number written."""
+        if self.buffer is None:
+            return 0
+        return await self.buffer.flush()
+
+    async def close(self) -> None:
+        """Stop the background flusher, writing or spilling pending entries."""
+        if self.buffer is not None:
+            await self.buffer.stop()
+
     async def log_security_event(
         self,
         action: str,
@@ -363,22 +487,12 @@ class AuditService:
         """
         start_date = datetime.utcnow() - timedelta(days=min(days, 90))
 
-        # Query for security-related actions
-        security_actions = [
-            "login.success",
-            "login.failure",
-            "api_key.create",
-            "api_key.revoke",
-            "member.remove",
-            "organization.delete",
-        ]
-
         db_query = self.db.table("audit_logs").select("*")
 
         if organization_id:
             db_query = db_query.eq("organization_id", organization_id)
 
-        db_query = db_query.in_("action", security_actions)
+        db_query = db_query.in_("action", list(SECURITY_ACTIONS))
         db_query = db_query.gte("created_at", start_date.isoformat())
 
         if failures_only:
@@ -447,8 +561,7 @@ class AuditService:
 
         for key, value in data.items():
             # Skip sensitive fields
-            key_lower = key.lower()
-            if any(sensitive in key_lower for sensitive in SENSITIVE_FIELDS):
+            if _is_sensitive_key(key):
                 sanitized[key] = "[REDACTED]"
                 continue
 
@@ -504,7 +617,11 @@ class AuditStatistics:
     """
     Utility class for computing audit statistics.
 
-    Provides aggregated metrics for dashboards and reports.
+    Provides aggregated metrics for dashboards and reports. Counts come from
+    the audit_activity_summary / audit_security_summary database functions
+    (supabase/migrations/020), which aggregate the month-partitioned
+    audit_log_daily_stats counters. Where those are not installed, recent
+    entries are fetched and counted instead.
     """
 
     def __init__(self, audit_service: AuditService):
@@ -531,6 +648,28 @@ class AuditStatistics:
         Returns:
             Activity summary statistics.
         """
+        try:
+            result = await self.audit.db.rpc(
+                "audit_activity_summary",
+                {"p_organization_id": organization_id, "p_days": days},
+            ).execute()
+            if isinstance(result.data, dict):
+                summary = result.data
+                total = int(summary.get("total_events") or 0)
+                success_count = int(summary.get("success_count") or 0)
+                return {
+                    "total_events": total,
+                    "success_count": success_count,
+                    "failure_count": int(summary.get("failure_count") or 0),
+                    "success_rate": success_count / total * 100 if total else 100,
+                    "action_breakdown": summary.get("action_breakdown") or {},
+                    "user_activity": summary.get("user_activity") or {},
+                    "resource_breakdown": summary.get("resource_breakdown") or {},
+                    "period_days": days,
+                }
+        except Exception as e:
+            logger.debug(f"Audit activity aggregation unavailable, counting entries: {e}")
+
         entries = await self.audit.get_organization_activity(
             organization_id=organization_id,
             days=days,
@@ -591,6 +730,27 @@ class AuditStatistics:
         Returns:
             Security summary statistics.
         """
+        try:
+            result = await self.audit.db.rpc(
+                "audit_security_summary",
+                {
+                    "p_organization_id": organization_id,
+                    "p_days": min(days, 90),
+                    "p_actions": list(SECURITY_ACTIONS),
+                },
+            ).execute()
+            if isinstance(result.data, dict):
+                summary = result.data
+                return {
+                    "total_security_events": int(summary.get("total_security_events") or 0),
+                    "login_failures": int(summary.get("login_failures") or 0),
+                    "permission_denials": int(summary.get("permission_denials") or 0),
+                    "suspicious_ips": summary.get("suspicious_ips") or {},
+                    "period_days": days,
+                }
+        except Exception as e:
+            logger.debug(f"Audit security aggregation unavailable, counting entries: {e}")
+
         events = await self.audit.get_security_events(
             organization_id=organization_id,
             days=days,
@@ -663,3 +823,9 @@ def init_audit_service(db_client: Any) -> AuditService:
     _audit_service = AuditService(db_client)
     logger.info("AuditService initialized")
     return _audit_service
+
+
+async def shutdown_audit_service() -> None:
+    """Flush buffered audit entries on shutdown (spilling them if the DB is down)."""
+    if _audit_service is not None:
+        await _audit_service.close()
@@ -0,0 +1,253 @@
+"""
+Caching for organization authorization lookups.
+
+Every org-scoped request resolves the caller's organization (plan tier,
+quota) and membership role before the route runs.  Integrations calling
+with the same API key hundreds of times a minute repeat exactly the same
+two queries, and nested dependencies of a single request can repeat them
+again.  Lookups are therefore layered:
+
+1. Request scope: the resolved principal is memoized on ``request.state``,
+   so every dependency of one request shares a single resolution.
+2. Process scope: ``AuthorizationCache`` (one per OrganizationService)
+   keeps organizations and per-principal ``AuthorizationContext`` objects
+   for a short TTL (``ORG_AUTH_CACHE_TTL_SECONDS``, default 10; 0 disables).
+   OrganizationService invalidates entries when it changes members, roles
+   or the organization, and applies usage increments in place.  Changes made
+   by other workers or outside the service are picked up when the TTL expires.
+
+Resolution latency (and which layer answered) is recorded in
+``get_authorization_timings()``, reported by ``/health/cache``.
+"""
+
+import os
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Hashable, Optional, Tuple
+
+from src.organizations.rbac import AuthorizationContext
+from src.types.organization import Organization
+
+TIMING_WINDOW = 1000
+
+
+@dataclass
+class PrincipalAuthorization:
+    """An organization together with the caller's authorization in it."""
+
+    organization: Organization
+    context: AuthorizationContext
+
+
+@dataclass
+class AuthorizationTimings:
+    """How long resolving a principal's authorization took, per source."""
+
+    lookups: int = 0
+    memo_hits: int = 0
+    cache_hits: int = 0
+    db_lookups: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    recent: Deque[float] = field(default_factory=lambda: deque(maxlen=TIMING_WINDOW))
+
+    def record(self, seconds: float, cached: bool) -> None:
+        self.lookups += 1
+        if cached:
+            self.cache_hits += 1
+        else:
+            self.db_lookups += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.recent.append(seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        recent = sorted(self.recent)
+
+        def percentile(p: float) -> float:
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, int(p * len(recent)))] * 1000
+
+        resolved = self.lookups + self.memo_hits
+        return {
+            "lookups": self.lookups,
+            "memo_hits": self.memo_hits,
+            "cache_hits": self.cache_hits,
+            "db_lookups": self.db_lookups,
+            "hit_rate": (
+                round((self.memo_hits + self.cache_hits) / resolved, 3) if resolved else 0.0
+            ),
+            "avg_ms": (
+                round(self.total_seconds / self.lookups * 1000, 3) if self.lookups else 0.0
+            ),
+            "p95_ms": round(percentile(0.95), 3),
+            "max_ms": round(self.max_seconds * 1000, 3),
+        }
+
+
+_timings = AuthorizationTimings()
+
+
+def get_authorization_timings() -> Dict[str, Any]:
+    """Authorization resolution latency and cache effectiveness."""
+    return _timings.to_dict()
+
+
+class AuthorizationCache:
+    """TTL + LRU cache of organizations and per-principal contexts."""
+
+    def __init__(
+        self,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        if ttl_seconds is None:
+            ttl_seconds = float(os.environ.get("ORG_AUTH_CACHE_TTL_SECONDS", "10"))
+        if max_entries is None:
+            max_entries = int(os.environ.get("ORG_AUTH_CACHE_MAX_ENTRIES", "10000"))
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._organizations: "OrderedDict[str, Tuple[float, Organization]]" = OrderedDict()
+        self._contexts: "OrderedDict[Tuple[str, str], Tuple[float, AuthorizationContext]]" = (
+            OrderedDict()
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def _get(self, entries: OrderedDict, key: Hashable) -> Any:
+        entry = entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del entries[key]
+            return None
+        entries.move_to_end(key)
+        return value
+
+    def _set(self, entries: OrderedDict, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        entries[key] = (time.monotonic() + self.ttl_seconds, value)
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def get_organization(self, organization_id: str) -> Optional[Organization]:
+        return self._get(self._organizations, organization_id)
+
+    def set_organization(self, organization_id: str, organization: Organization) -> None:
+        self._set(self._organizations, organization_id, organization)
+
+    def get_context(self, organization_id: str, user_id: str) -> Optional[AuthorizationContext]:
+        return self._get(self._contexts, (organization_id, user_id))
+
+    def set_context(
+        self, organization_id: str, user_id: str, context: AuthorizationContext
+    ) -> None:
+        self._set(self._contexts, (organization_id, user_id), context)
+
+    def invalidate_member(self, organization_id: str, user_id: str) -> None:
+        """Forget a principal's role (added, removed or role changed)."""
+        self._contexts.pop((organization_id, user_id), None)
+
+    def invalidate_organization(self, organization_id: str) -> None:
+        """Forget an organization and every principal cached for it."""
+        self._organizations.pop(organization_id, None)
+        for key in [k for k in self._contexts if k[0] == organization_id]:
+            del self._contexts[key]
+
+    def update_usage(self, organization_id: str, current_usage: int) -> None:
+        """Apply a known usage total to the cached organization, if any."""
+        entry = self._organizations.get(organization_id)
+        if entry is not None:
+            expires_at, organization = entry
+            self._organizations[organization_id] = (
+                expires_at,
+                organization.model_copy(update={"current_month_usage": current_usage}),
+            )
+
+    def clear(self) -> None:
+        self._organizations.clear()
+        self._contexts.clear()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "organizations": len(self._organizations),
+            "contexts": len(self._contexts),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+async def resolve_principal(
+    org_service: Any,
+    organization_id: str,
+    user_id: str,
+    request: Any = None,
+) -> PrincipalAuthorization:
+    """
+    Resolve the organization and the user's authorization in it.
+
+    Args:
+        org_service: The OrganizationService (its ``authorization_cache`` is
+            used when present).
+        organization_id: The organization ID.
+        user_id: The authenticated user ID.
+        request: The current request, for request-scoped memoization.
+
+    Returns:
+        The principal's organization and context; ``context.role`` is None
+        for non-members.
+
+    Raises:
+        OrganizationNotFoundError: If the organization doesn't exist.
+    """
+    memo: Optional[Dict[Tuple[str, str], PrincipalAuthorization]] = None
+    if request is not None:
+        memo = getattr(request.state, "authorization_memo", None)
+        if memo is None:
+            memo = request.state.authorization_memo = {}
+        principal = memo.get((organization_id, user_id))
+        if principal is not None:
+            _timings.memo_hits += 1
+            return principal
+
+    cache = getattr(org_service, "authorization_cache", None)
+    if not isinstance(cache, AuthorizationCache):
+        cache = None
+
+    start = time.perf_counter()
+    cached = True
+
+    organization = cache.get_organization(organization_id) if cache else None
+    if organization is None:
+        cached = False
+        organization = await org_service.get_organization(organization_id)
+        if cache:
+            cache.set_organization(organization_id, organization)
+
+    context = cache.get_context(organization_id, user_id) if cache else None
+    if context is None:
+        cached = False
+        role = await org_service.get_member_role(organization_id, user_id)
+        context = AuthorizationContext(
+            user_id=user_id,
+            organization_id=organization_id,
+            role=role,
+            is_org_member=role is not None,
+        )
+        if cache:
+            cache.set_context(organization_id, user_id, context)
+
+    _timings.record(time.perf_counter() - start, cached)
+
+    principal = PrincipalAuthorization(organization=organization, context=context)
+    if memo is not None:
+        memo[(organization_id, user_id)] = principal
+    return principal
@@ -37,6 +37,7 @@ from src.types.organization import (
     OrganizationUpdate,
     ResourceType,
 )
+from src.organizations.authz_cache import AuthorizationCache
 from src.organizations.rbac import (
     AuthorizationContext,
     NotOrganizationMemberError,
@@ -153,6 +154,9 @@ class OrganizationService:
         self.db = db_client
         self.audit = audit_service
         self._invite_expiry_days = 7
+        # Short-TTL cache used by the authorization dependencies; the
+        # mutating methods below keep it in sync.
+        self.authorization_cache = AuthorizationCache()
 
     # =========================================================================
     # Organization CRUD Operations
@@ -357,6 +361,7 @@ class OrganizationService:
         await self.db.table("organizations").update(
             update_data
         ).eq("id", organization_id).execute()
+        self.authorization_cache.invalidate_organization(organization_id)
 
         org = await self.get_organization(organization_id)
 
@@ -407,6 +412,7 @@ class OrganizationService:
             "deleted_by": auth_context.user_id,
             "updated_at": datetime.utcnow().isoformat(),
         }).eq("id", organization_id).execute()
+        self.authorization_cache.invalidate_organization(organization_id)
 
         # Log audit event
         if self.audit:
@@ -552,6 +558,7 @@ class OrganizationService:
         }).execute()
 
         member = self._map_member(result.data[0])
+        self.authorization_cache.invalidate_member(organization_id, user_id)
 
         # Log audit event
         if self.audit:
@@ -618,6 +625,7 @@ class OrganizationService:
             "role": new_role.value,
             "updated_at": datetime.utcnow().isoformat(),
         }).eq("id", member.id).execute()
+        self.authorization_cache.invalidate_member(organization_id, target_user_id)
 
         updated_member = await self.get_member(organization_id, target_user_id)
 
@@ -693,6 +701,7 @@ class OrganizationService:
             "deactivation_reason": "self_leave" if is_self_removal else "removed",
             "updated_at": datetime.utcnow().isoformat(),
         }).eq("id", member.id).execute()
+        self.authorization_cache.invalidate_member(organization_id, target_user_id)
 
         # Log audit event
         if self.audit:
@@ -852,6 +861,7 @@ class OrganizationService:
 
         organization_id = row["organization_id"]
         member_id = row["member_id"]
+        self.authorization_cache.invalidate_member(organization_id, user_id)
 
         # Fetch the created member
         member_result = await self.db.table("organization_members").select("*").eq(
@@ -1066,7 +1076,9 @@ class OrganizationService:
             raise OrganizationServiceError("Failed to increment usage")
 
         # Return updated status
-        return await self.check_quota(organization_id)
+        status = await self.check_quota(organization_id)
+        self.authorization_cache.update_usage(organization_id, status.current_usage)
+        return status
 
     # =========================================================================
     # Helper Methods
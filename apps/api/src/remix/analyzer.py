@@ -11,6 +11,8 @@ import re
 import uuid
 from typing import Any, Dict, List, Optional
 
+from src.remix.executor import run_in_remix_executor
+from src.scoring.text_analysis import analyze_text
 from src.text_generation.core import GenerationOptions, generate_text, create_provider_from_env
 from src.types.remix import (
     ContentAnalysis,
@@ -23,17 +25,6 @@ from src.utils.cache import get_content_analysis_cache
 logger = logging.getLogger(__name__)
 
 
-def _parse_markdown_heading(line: str) -> Optional[str]:
-    """Parse a markdown heading without regex backtracking."""
-    level = 0
-    while level < len(line) and level < 3 and line[level] == "#":
-        level += 1
-    if level == 0 or level >= len(line) or not line[level].isspace():
-        return None
-    heading = line[level:].strip()
-    return heading or None
-
-
 class ContentAnalyzer:
     """Analyzes content for remix transformation."""
 
@@ -77,8 +68,8 @@ class ContentAnalyzer:
 
     def _get_content_hash(self, title: str, body: str) -> str:
         """Generate a hash key for caching based on content."""
-        content_key = f"{title}:{body[:1000]}:{self.provider_type}"
-        return hashlib.sha256(content_key.encode()).hexdigest()[:16]
+        content_key = f"{title}:{body}:{self.provider_type}"
+        return hashlib.sha256(content_key.encode()).hexdigest()[:32]
 
     def analyze(self, content: Dict[str, Any], use_cache: bool = True) -> ContentAnalysis:
         """Analyze content and extract structure for transformation."""
@@ -87,10 +78,10 @@ class ContentAnalyzer:
         body = self._extract_body(content)
 
         # Get word count
-        word_count = len(body.split())
+        word_count = analyze_text(body).token_count
 
         # Extract chunks from content structure
-        chunks = self._extract_chunks(content)
+        chunks = self._extract_chunks(content, body)
 
         # Check cache for LLM analysis
         cache = get_content_analysis_cache()
@@ -130,6 +121,12 @@ class ContentAnalyzer:
             suggested_formats=suggested_formats,
         )
 
+    async def analyze_async(
+        self, content: Dict[str, Any], use_cache: bool = True
+    ) -> ContentAnalysis:
+        """Analyze content on the shared remix executor, keeping the LLM call off the event loop."""
+        return await run_in_remix_executor(self.analyze, content, use_cache)
+
     def _extract_body(self, content: Dict[str, Any]) -> str:
         """Extract the main body text from content."""
         # Handle different content structures
@@ -154,7 +151,9 @@ class ContentAnalyzer:
                 texts.append(value)
         return "\n\n".join(texts)
 
-    def _extract_chunks(self, content: Dict[str, Any]) -> List[ContentChunk]:
+    def _extract_chunks(
+        self, content: Dict[str, Any], body: Optional[str] = None
+    ) -> List[ContentChunk]:
         """Extract meaningful chunks from content structure."""
         chunks: List[ContentChunk] = []
 
@@ -173,7 +172,8 @@ class ContentAnalyzer:
                     chunks.append(chunk)
 
         # Extract from body text using structure detection
-        body = self._extract_body(content)
+        if body is None:
+            body = self._extract_body(content)
         if body and not chunks:
             chunks = self._chunk_by_structure(body)
 
@@ -183,12 +183,14 @@ class ContentAnalyzer:
         """Split text into chunks based on structural elements."""
         chunks: List[ContentChunk] = []
 
-        # Split by headers (Markdown style)
+        # Split by headers (Markdown style, H1-H3)
+        analysis = analyze_text(text)
+        headings = {h.line: h.text for h in analysis.headings if h.level <= 3}
         current_section = None
         current_content = []
 
-        for line in text.split('\n'):
-            heading = _parse_markdown_heading(line)
+        for index, line in enumerate(analysis.lines):
+            heading = headings.get(index)
             if heading:
                 # Save previous section
                 if current_content:
@@ -0,0 +1,49 @@
+"""
+Shared, bounded thread pool for the remix engine.
+
+Content analysis, format transforms and quality scoring are blocking LLM
+calls.  They all run here rather than on the event loop (or in one pool per
+RemixService instance), so the number of remix LLM calls in flight on a
+worker is capped by ``REMIX_MAX_WORKERS`` however many requests arrive.
+"""
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+REMIX_MAX_WORKERS = int(os.environ.get("REMIX_MAX_WORKERS", "8"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+
+
+def get_remix_executor() -> ThreadPoolExecutor:
+    """Get the shared remix thread pool, creating it on first use."""
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=REMIX_MAX_WORKERS,
+                thread_name_prefix="remix",
+            )
+        return _executor
+
+
+async def run_in_remix_executor(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking callable on the shared remix pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_remix_executor(), partial(func, *args, **kwargs))
+
+
+def shutdown_remix_executor() -> None:
+    """Shut the shared pool down (application shutdown); it is recreated on next use."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -7,13 +7,14 @@ Main orchestration layer for transforming content across multiple formats.
 import asyncio
 import logging
 import time
-from typing import Any, Dict, List, Optional
-from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
 from src.remix.analyzer import ContentAnalyzer
 from src.remix.adapters import get_adapter, FormatAdapter
+from src.remix.executor import run_in_remix_executor
 from src.brand.storage import get_brand_voice_storage
 from src.types.remix import (
     ContentAnalysis,
@@ -28,44 +29,91 @@ from src.types.remix import (
 )
 
 
+@dataclass
+class RemixEvent:
+    """One step of a streamed remix.
+
+    ``type`` is "analysis" (data: ContentAnalysis), "format" (RemixedContent),
+    "error" (dict with "format" and "error") or "complete" (RemixResponse).
+    """
+
+    type: str
+    data: Any
+
+
 class RemixService:
     """Orchestrates content remixing across multiple formats."""
 
     def __init__(self, provider_type: str = "openai"):
         self.provider_type = provider_type
         self.analyzer = ContentAnalyzer(provider_type)
-        self._executor = ThreadPoolExecutor(max_workers=5)
 
     async def remix(self, request: RemixRequest, user_id: Optional[str] = None) -> RemixResponse:
         """Transform content into multiple formats."""
+        response: Optional[RemixResponse] = None
+        async for event in self.remix_stream(request, user_id):
+            if event.type == "complete":
+                response = event.data
+        return response
+
+    async def remix_stream(
+        self, request: RemixRequest, user_id: Optional[str] = None
+    ) -> AsyncIterator[RemixEvent]:
+        """
+        Transform content into multiple formats, yielding each result as it completes.
+
+        The source analysis is awaited off the event loop (and cached by
+        content hash), then every target format is transformed and scored
+        as one task on the shared remix executor.  Format failures are
+        reported as "error" events; the final "complete" event carries the
+        same RemixResponse that ``remix`` returns.
+        """
         start_time = time.time()
 
-        # Analyze source content
-        analysis = self.analyzer.analyze(request.source_content)
-
-        # Get brand voice if profile specified
+        # Analyze source content and load the brand voice concurrently
+        analysis_task = asyncio.ensure_future(
+            self.analyzer.analyze_async(request.source_content)
+        )
         brand_voice = None
-        if request.brand_profile_id:
-            brand_voice = await self._load_brand_voice(user_id, request.brand_profile_id)
-        elif request.tone_override:
-            brand_voice = request.tone_override
+        try:
+            if request.brand_profile_id:
+                brand_voice = await self._load_brand_voice(user_id, request.brand_profile_id)
+            elif request.tone_override:
+                brand_voice = request.tone_override
+            analysis = await analysis_task
+        finally:
+            if not analysis_task.done():
+                analysis_task.cancel()
+        yield RemixEvent("analysis", analysis)
+
+        # Transform to each target format in parallel, streaming completions
+        async def run_format(fmt: ContentFormat):
+            try:
+                return fmt, await self._transform_format(analysis, fmt, brand_voice)
+            except Exception as e:
+                return fmt, e
 
-        # Transform to each target format
         remixed_content: List[RemixedContent] = []
-
-        # Run transformations in parallel for better performance
-        tasks = [
-            self._transform_format(analysis, fmt, brand_voice)
-            for fmt in request.target_formats
-        ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for result in results:
-            if isinstance(result, RemixedContent):
+        tasks = [asyncio.ensure_future(run_format(fmt)) for fmt in request.target_formats]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                fmt, result = await next_done
+                if isinstance(result, Exception):
+                    # Log error but continue with other formats
+                    logger.warning("Transform error for %s: %s", fmt.value, result)
+                    yield RemixEvent("error", {"format": fmt.value, "error": "Transformation failed"})
+                    continue
                 remixed_content.append(result)
-            elif isinstance(result, Exception):
-                # Log error but continue with other formats
-                logger.warning("Transform error: %s", result)
+                yield RemixEvent("format", result)
+        finally:
+            # The client went away mid-stream: drop formats not started yet
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+        # Keep the requested format order in the final response
+        order = {fmt: i for i, fmt in enumerate(request.target_formats)}
+        remixed_content.sort(key=lambda r: order.get(r.format, len(order)))
 
         # Calculate average quality
         if remixed_content:
@@ -75,7 +123,7 @@ class RemixService:
 
         total_time = int((time.time() - start_time) * 1000)
 
-        return RemixResponse(
+        yield RemixEvent("complete", RemixResponse(
             success=len(remixed_content) > 0,
             source_analysis=analysis,
             remixed_content=remixed_content,
@@ -83,7 +131,7 @@ class RemixService:
             average_quality_score=avg_quality,
             message=f"Generated {len(remixed_content)} format(s) successfully"
             if remixed_content else "Failed to generate any formats",
-        )
+        ))
 
     async def _transform_format(
         self,
@@ -97,18 +145,12 @@ class RemixService:
         # Get adapter for this format
         adapter = get_adapter(format, self.provider_type)
 
-        # Run transformation in thread pool (sync LLM calls)
-        loop = asyncio.get_running_loop()
-        content = await loop.run_in_executor(
-            self._executor,
-            lambda: adapter.transform(analysis, brand_voice)
-        )
+        def transform_and_score():
+            # Sync LLM calls: one executor hop for transform + quality score
+            content = adapter.transform(analysis, brand_voice)
+            return content, adapter.score_quality(content, analysis)
 
-        # Score quality
-        quality_score = await loop.run_in_executor(
-            self._executor,
-            lambda: adapter.score_quality(content, analysis)
-        )
+        content, quality_score = await run_in_remix_executor(transform_and_score)
 
         # Calculate metrics
         word_count = self._count_words(content)
@@ -128,7 +170,7 @@ class RemixService:
     async def preview(self, request: RemixPreviewRequest) -> RemixPreviewResponse:
         """Generate a quick preview without full transformation."""
         # Quick analysis (cached if possible)
-        analysis = self.analyzer.analyze(request.source_content)
+        analysis = await self.analyzer.analyze_async(request.source_content)
 
         format_info = get_format_info(request.target_format)
 
@@ -2,6 +2,9 @@
 Persistent storage for deep research queries and results.
 
 Primary storage is Postgres. In-memory fallback for local dev.
+
+The schema is created by db/migrations/004 and 011 (or ``ensure_research_schema``
+at application startup); request paths never run DDL.
 """
 
 from __future__ import annotations
@@ -13,7 +16,13 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, Optional
 
-from src.db import execute as db_execute, fetch as db_fetch, fetchrow as db_fetchrow, is_database_configured
+from src.db import (
+    execute as db_execute,
+    fetch as db_fetch,
+    fetchrow as db_fetchrow,
+    get_pool,
+    is_database_configured,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +43,10 @@ CREATE TABLE IF NOT EXISTS research_queries (
     total_sources INT DEFAULT 0,
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
+CREATE INDEX IF NOT EXISTS idx_research_queries_lookup
+    ON research_queries(query, depth, created_at DESC);
+CREATE INDEX IF NOT EXISTS idx_research_queries_user_created
+    ON research_queries(user_id, created_at DESC);
 CREATE TABLE IF NOT EXISTS research_sources (
     id TEXT PRIMARY KEY,
     query_id TEXT NOT NULL REFERENCES research_queries(id) ON DELETE CASCADE,
@@ -46,10 +59,22 @@ CREATE TABLE IF NOT EXISTS research_sources (
     quality_json JSONB,
     created_at TIMESTAMPTZ DEFAULT NOW()
 );
+CREATE INDEX IF NOT EXISTS idx_research_sources_query_id ON research_sources(query_id);
+"""
+
+_INSERT_QUERY_SQL = """
+INSERT INTO research_queries (id, user_id, query, keywords, depth, results_json, summary, total_sources)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+"""
+
+_INSERT_SOURCE_SQL = """
+INSERT INTO research_sources (id, query_id, url, title, snippet, provider, quality_score, credibility_tier, quality_json)
+VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)
 """
 
 
-async def _ensure_schema() -> None:
+async def ensure_research_schema() -> None:
+    """Create research tables and indexes if missing. Called once at startup."""
     global _schema_ready
     if _schema_ready or not _db_enabled:
         return
@@ -93,26 +118,28 @@ async def save_research(
     _queries[query_id] = record
 
     if _db_enabled:
-        await _ensure_schema()
+        source_rows = []
+        for src in sources:
+            quality = src.get("quality", {})
+            source_rows.append((
+                str(uuid.uuid4()), query_id,
+                src.get("url", ""), src.get("title", ""),
+                src.get("snippet", ""), src.get("provider", ""),
+                quality.get("overall", 0), quality.get("credibility_tier", "unknown"),
+                json.dumps(quality),
+            ))
         try:
-            await db_execute(
-                """INSERT INTO research_queries (id, user_id, query, keywords, depth, results_json, summary, total_sources)
-                   VALUES ($1, $2, $3, $4, $5, $6, $7, $8)""",
-                query_id, user_id, query, keywords, depth,
-                json.dumps(sources), summary, len(sources),
-            )
-            for src in sources:
-                src_id = str(uuid.uuid4())
-                quality = src.get("quality", {})
-                await db_execute(
-                    """INSERT INTO research_sources (id, query_id, url, title, snippet, provider, quality_score, credibility_tier, quality_json)
-                       VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9)""",
-                    src_id, query_id,
-                    src.get("url", ""), src.get("title", ""),
-                    src.get("snippet", ""), src.get("provider", ""),
-                    quality.get("overall", 0), quality.get("credibility_tier", "unknown"),
-                    json.dumps(quality),
-                )
+            pool = await get_pool()
+            if pool is not None:
+                async with pool.acquire() as conn:
+                    async with conn.transaction():
+                        await conn.execute(
+                            _INSERT_QUERY_SQL,
+                            query_id, user_id, query, keywords, depth,
+                            json.dumps(sources), summary, len(sources),
+                        )
+                        if source_rows:
+                            await conn.executemany(_INSERT_SOURCE_SQL, source_rows)
         except Exception as e:
             logger.warning("Failed to persist research to DB: %s", e)
 
@@ -133,7 +160,6 @@ async def get_cached_research(
     if not _db_enabled:
         return None
 
-    await _ensure_schema()
     try:
         row = await db_fetchrow(
             """SELECT * FROM research_queries
@@ -169,7 +195,6 @@ async def list_research_history(
 ) -> list[dict[str, Any]]:
     """List past research queries for a user."""
     if _db_enabled:
-        await _ensure_schema()
         try:
             rows = await db_fetch(
                 """SELECT id, query, depth, total_sources, summary, created_at
@@ -7,8 +7,12 @@ import os
 import json
 from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
+HTTP_REQUEST_TIMEOUT = 30
+
 from ..types.research import (
     GoogleSerpResult,
     GoogleTrendsResult,
@@ -22,6 +26,7 @@ from ..types.research import (
     TavilySearchResult,
     TrendPoint,
 )
+from ..utils import http_client
 from .cache import get_research_cache
 
 
@@ -229,8 +234,6 @@ def google_serp_search(
         ResearchError: If an error occurs during search.
     """
     try:
-        import requests
-
         api_key = os.environ.get("SERP_API_KEY")
         if not api_key:
             raise ResearchError("SERP_API_KEY environment variable not set")
@@ -249,7 +252,7 @@ def google_serp_search(
             ),
         }
 
-        response = requests.get(url, params=params)
+        response = http_client.get_sync(url, params=params, timeout=HTTP_REQUEST_TIMEOUT)
         response.raise_for_status()
 
         data = response.json()
@@ -284,17 +287,13 @@ def google_serp_search(
             people_also_ask=paa_results,
             related_searches=related_searches,
         )
-    except ImportError:
-        raise ResearchError(
-            "Requests package not installed. Install it with 'pip install requests'."
-        )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise ResearchError(f"Google SERP request timed out: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise ResearchError(f"Network error connecting to Google SERP: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise ResearchError(f"Google SERP HTTP error: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise ResearchError(f"Google SERP request failed: {str(e)}") from e
     except KeyError as e:
         raise ResearchError(f"Unexpected response format from Google SERP, missing key: {str(e)}") from e
@@ -319,8 +318,6 @@ def tavily_ai_search(
         ResearchError: If an error occurs during search.
     """
     try:
-        import requests
-
         api_key = os.environ.get("TAVILY_API_KEY")
         if not api_key:
             raise ResearchError("TAVILY_API_KEY environment variable not set")
@@ -342,7 +339,9 @@ def tavily_ai_search(
             "include_images": False,
         }
 
-        response = requests.post(url, headers=headers, json=data)
+        response = http_client.post_sync(
+            url, headers=headers, json=data, timeout=HTTP_REQUEST_TIMEOUT
+        )
         response.raise_for_status()
 
         result = response.json()
@@ -363,17 +362,13 @@ def tavily_ai_search(
             answer=result.get("answer", ""),
             follow_up_questions=result.get("follow_up_questions", []),
         )
-    except ImportError:
-        raise ResearchError(
-            "Requests package not installed. Install it with 'pip install requests'."
-        )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise ResearchError(f"Tavily AI request timed out: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise ResearchError(f"Network error connecting to Tavily AI: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise ResearchError(f"Tavily AI HTTP error: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise ResearchError(f"Tavily AI request failed: {str(e)}") from e
     except KeyError as e:
         raise ResearchError(f"Unexpected response format from Tavily AI, missing key: {str(e)}") from e
@@ -398,8 +393,6 @@ def metaphor_ai_search(
         ResearchError: If an error occurs during search.
     """
     try:
-        import requests
-
         api_key = os.environ.get("METAPHOR_API_KEY")
         if not api_key:
             raise ResearchError("METAPHOR_API_KEY environment variable not set")
@@ -418,7 +411,9 @@ def metaphor_ai_search(
             data["type"] = "neural"
             data["url"] = options.similar_url
 
-        response = requests.post(url, headers=headers, json=data)
+        response = http_client.post_sync(
+            url, headers=headers, json=data, timeout=HTTP_REQUEST_TIMEOUT
+        )
         response.raise_for_status()
 
         result = response.json()
@@ -430,8 +425,11 @@ def metaphor_ai_search(
             content_url = f"https://api.metaphor.systems/contents"
             content_data = {"ids": [item.get("id")]}
 
-            content_response = requests.post(
-                content_url, headers=headers, json=content_data
+            content_response = http_client.post_sync(
+                content_url,
+                headers=headers,
+                json=content_data,
+                timeout=HTTP_REQUEST_TIMEOUT,
             )
             content_response.raise_for_status()
 
@@ -445,17 +443,13 @@ def metaphor_ai_search(
             )
 
         return metaphor_results
-    except ImportError:
-        raise ResearchError(
-            "Requests package not installed. Install it with 'pip install requests'."
-        )
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise ResearchError(f"Metaphor AI request timed out: {str(e)}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise ResearchError(f"Network error connecting to Metaphor AI: {str(e)}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise ResearchError(f"Metaphor AI HTTP error: {str(e)}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise ResearchError(f"Metaphor AI request failed: {str(e)}") from e
     except KeyError as e:
         raise ResearchError(f"Unexpected response format from Metaphor AI, missing key: {str(e)}") from e
@@ -480,6 +474,10 @@ def google_trends_analysis(
         ResearchError: If an error occurs during analysis.
     """
     try:
+        # pytrends talks to Google over requests, not the shared httpx client,
+        # so its failures surface as requests and pytrends exceptions.
+        import requests
+        from pytrends.exceptions import ResponseError
         from pytrends.request import TrendReq
 
         # Use the first keyword for trends analysis
@@ -535,6 +533,8 @@ def google_trends_analysis(
         raise ResearchError(
             "Pytrends package not installed. Install it with 'pip install pytrends'."
         )
+    except ResponseError as e:
+        raise ResearchError(f"Google Trends returned an error response: {str(e)}") from e
     except requests.Timeout as e:
         raise ResearchError(f"Google Trends request timed out: {str(e)}") from e
     except requests.ConnectionError as e:
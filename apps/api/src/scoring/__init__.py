@@ -13,6 +13,7 @@ from .content_scorer import (
     score_readability,
     score_seo,
 )
+from .text_analysis import TextAnalysis, analyze_text, count_syllables
 
 __all__ = [
     "ContentScorer",
@@ -21,4 +22,7 @@ __all__ = [
     "score_engagement",
     "get_overall_score",
     "score_content",
+    "TextAnalysis",
+    "analyze_text",
+    "count_syllables",
 ]
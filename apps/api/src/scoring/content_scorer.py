@@ -22,6 +22,7 @@ from ..types.scoring import (
     ScoreLevel,
     SEOScore,
 )
+from .text_analysis import TextAnalysis, analyze_text
 
 logger = logging.getLogger(__name__)
 
@@ -91,41 +92,8 @@ STORYTELLING_PATTERNS: List[str] = [
     r"\bturning\s+point\b",
 ]
 
-
-def _count_syllables(word: str) -> int:
-    """
-    Estimate syllable count for a word.
-
-    Uses a simple heuristic based on vowel groups.
-    """
-    word = word.lower().strip()
-    if not word:
-        return 0
-
-    # Special cases
-    if len(word) <= 3:
-        return 1
-
-    # Count vowel groups
-    vowels = "aeiouy"
-    count = 0
-    prev_vowel = False
-
-    for char in word:
-        is_vowel = char in vowels
-        if is_vowel and not prev_vowel:
-            count += 1
-        prev_vowel = is_vowel
-
-    # Handle silent e
-    if word.endswith("e") and count > 1:
-        count -= 1
-
-    # Handle special endings
-    if word.endswith("le") and len(word) > 2 and word[-3] not in vowels:
-        count += 1
-
-    return max(1, count)
+_CTA_RES = [re.compile(pattern) for pattern in CTA_PATTERNS]
+_STORYTELLING_RES = [re.compile(pattern) for pattern in STORYTELLING_PATTERNS]
 
 
 def _get_level(score: float) -> ScoreLevel:
@@ -140,47 +108,32 @@ def _get_level(score: float) -> ScoreLevel:
         return ScoreLevel.POOR
 
 
-def _extract_words(text: str) -> List[str]:
-    """Extract words from text."""
-    # Remove markdown formatting
-    text = re.sub(r'[#*_`\[\]()]', ' ', text)
-    # Extract words
-    words = re.findall(r'\b[a-zA-Z]+\b', text.lower())
-    return words
-
-
-def _extract_sentences(text: str) -> List[str]:
-    """Extract sentences from text."""
-    # Split on sentence-ending punctuation
-    sentences = re.split(r'[.!?]+', text)
-    # Filter out empty sentences
-    return [s.strip() for s in sentences if s.strip()]
-
-
-def score_readability(text: str) -> ReadabilityScore:
+def score_readability(
+    text: str,
+    analysis: Optional[TextAnalysis] = None,
+) -> ReadabilityScore:
     """
     Score content readability using Flesch-Kincaid metrics.
 
     Args:
         text: Content to analyze.
+        analysis: Pre-computed analysis of ``text`` (computed if omitted).
 
     Returns:
         ReadabilityScore with detailed metrics and suggestions.
     """
-    words = _extract_words(text)
-    sentences = _extract_sentences(text)
+    analysis = analysis or analyze_text(text)
 
-    word_count = len(words)
-    sentence_count = max(1, len(sentences))
+    word_count = analysis.word_count
+    sentence_count = max(1, analysis.sentence_count)
 
     # Calculate metrics
-    total_syllables = sum(_count_syllables(word) for word in words)
-    avg_syllables_per_word = total_syllables / max(1, word_count)
+    avg_syllables_per_word = analysis.total_syllables / max(1, word_count)
     avg_words_per_sentence = word_count / sentence_count
-    avg_word_length = sum(len(w) for w in words) / max(1, word_count)
+    avg_word_length = analysis.avg_word_length
 
     # Count complex words (3+ syllables)
-    complex_words = sum(1 for w in words if _count_syllables(w) >= 3)
+    complex_words = analysis.complex_word_count
     complex_percentage = (complex_words / max(1, word_count)) * 100
 
     # Flesch Reading Ease: 206.835 - 1.015(words/sentences) - 84.6(syllables/words)
@@ -232,23 +185,29 @@ def score_readability(text: str) -> ReadabilityScore:
     )
 
 
-def score_seo(text: str, keywords: Optional[List[str]] = None) -> SEOScore:
+def score_seo(
+    text: str,
+    keywords: Optional[List[str]] = None,
+    analysis: Optional[TextAnalysis] = None,
+) -> SEOScore:
     """
     Score content for SEO optimization.
 
     Args:
         text: Content to analyze.
         keywords: Target keywords to check for.
+        analysis: Pre-computed analysis of ``text`` (computed if omitted).
 
     Returns:
         SEOScore with detailed metrics and suggestions.
     """
-    words = _extract_words(text)
-    word_count = len(words)
-    text_lower = text.lower()
+    analysis = analysis or analyze_text(text)
+    words = analysis.words
+    word_count = analysis.word_count
+    text_lower = analysis.lower
 
     # Count headings (markdown style)
-    heading_count = len(re.findall(r'^#{1,6}\s', text, re.MULTILINE))
+    heading_count = analysis.heading_count
 
     # Keyword analysis
     keyword_density = 0.0
@@ -256,11 +215,15 @@ def score_seo(text: str, keywords: Optional[List[str]] = None) -> SEOScore:
 
     if keywords:
         primary_keyword = keywords[0].lower()
-        keyword_occurrences = text_lower.count(primary_keyword)
+        if primary_keyword.isascii() and primary_keyword.isalpha():
+            # Whole-word count, so "ai" is not found inside "said"
+            keyword_occurrences = analysis.word_counts[primary_keyword]
+        else:
+            keyword_occurrences = text_lower.count(primary_keyword)
         keyword_density = (keyword_occurrences / max(1, word_count)) * 100
 
         # Check keyword placement
-        lines = text.split('\n')
+        lines = analysis.lines
         first_100_words = ' '.join(words[:100])
 
         keyword_placement = {
@@ -271,9 +234,8 @@ def score_seo(text: str, keywords: Optional[List[str]] = None) -> SEOScore:
             ),
             "in_first_paragraph": primary_keyword in first_100_words,
             "in_headings": any(
-                primary_keyword in line.lower()
-                for line in lines
-                if re.match(r'^#{1,6}\s', line)
+                primary_keyword in lines[heading.line].lower()
+                for heading in analysis.headings
             ),
         }
 
@@ -447,19 +409,24 @@ async def score_originality(
         return None
 
 
-def score_engagement(text: str) -> EngagementScore:
+def score_engagement(
+    text: str,
+    analysis: Optional[TextAnalysis] = None,
+) -> EngagementScore:
     """
     Score content for engagement potential.
 
     Args:
         text: Content to analyze.
+        analysis: Pre-computed analysis of ``text`` (computed if omitted).
 
     Returns:
         EngagementScore with detailed metrics and suggestions.
     """
-    words = _extract_words(text)
-    text_lower = text.lower()
-    sentences = _extract_sentences(text)
+    analysis = analysis or analyze_text(text)
+    words = analysis.words
+    text_lower = analysis.lower
+    sentences = analysis.sentences
 
     # Count emotional/power words
     emotional_count = sum(1 for word in words if word in EMOTIONAL_WORDS)
@@ -469,8 +436,8 @@ def score_engagement(text: str) -> EngagementScore:
 
     # Count CTAs
     cta_count = sum(
-        1 for pattern in CTA_PATTERNS
-        if re.search(pattern, text_lower)
+        1 for pattern in _CTA_RES
+        if pattern.search(text_lower)
     )
 
     # Count lists (bullet points and numbered lists)
@@ -479,8 +446,8 @@ def score_engagement(text: str) -> EngagementScore:
 
     # Count storytelling elements
     storytelling_count = sum(
-        1 for pattern in STORYTELLING_PATTERNS
-        if re.search(pattern, text_lower)
+        1 for pattern in _STORYTELLING_RES
+        if pattern.search(text_lower)
     )
 
     # Analyze opening hook (first sentence/paragraph)
@@ -633,10 +600,11 @@ def score_content(
     Returns:
         ContentScoreResult with all metrics and suggestions.
     """
-    # Score each dimension
-    readability = score_readability(text)
-    seo = score_seo(text, keywords)
-    engagement = score_engagement(text)
+    # Score each dimension from one shared pass over the text
+    analysis = analyze_text(text)
+    readability = score_readability(text, analysis)
+    seo = score_seo(text, keywords, analysis)
+    engagement = score_engagement(text, analysis)
 
     # Adjust weights based on content type and whether originality is included
     if originality:
@@ -0,0 +1,239 @@
+"""
+Single-pass text analysis shared by the content scorers.
+
+Readability, SEO and engagement scoring, the SERP content optimizer, brand
+voice analysis and the remix analyzer all need the same facts about a piece
+of content: its words, sentences, syllable counts, word frequencies and
+heading structure.  ``analyze_text`` computes them once, in one linear scan,
+and caches the resulting ``TextAnalysis`` by content hash so the scorers
+running on the same request share it.
+
+Tokenization rules (kept identical to the scorers that used to do their own):
+
+- Words are runs of ASCII letters not glued to digits or other letters, with
+  markdown markers (``#*_`[]()``) treated as separators; words are lowercased.
+- Sentences are the non-empty, stripped segments between runs of ``.!?``.
+- Headings are markdown ATX headings (``#`` to ``######`` then whitespace).
+  Headings with no text (``"# "``) are left out of ``headings`` but still
+  counted by ``heading_count``, as the SEO scorer always counted them.
+
+A ``TextAnalysis`` may be shared between callers through the cache and must
+be treated as read-only.
+"""
+
+import hashlib
+import re
+from collections import Counter
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import TYPE_CHECKING, Optional, Tuple
+
+from ..utils.cache import get_text_analysis_cache
+
+if TYPE_CHECKING:
+    from ..seo.term_matcher import TokenIndex
+
+# One alternation, one pass: group 1 is a word, anything else a sentence end.
+# (?<![^\W_]) / (?![^\W_]) mean "not next to a word character other than _",
+# i.e. ``\b[a-zA-Z]+\b`` with underscores treated as separators.
+_TOKEN_PATTERN = re.compile(r"(?<![^\W_])([A-Za-z]+)(?![^\W_])|[.!?]+")
+
+SYLLABLE_CACHE_SIZE = 65536
+
+
+@lru_cache(maxsize=SYLLABLE_CACHE_SIZE)
+def count_syllables(word: str) -> int:
+    """
+    Estimate syllable count for a word.
+
+    Uses a simple heuristic based on vowel groups.  Memoized: natural
+    language reuses a small vocabulary, so most lookups are table hits.
+    """
+    word = word.lower().strip()
+    if not word:
+        return 0
+
+    # Special cases
+    if len(word) <= 3:
+        return 1
+
+    # Count vowel groups
+    vowels = "aeiouy"
+    count = 0
+    prev_vowel = False
+
+    for char in word:
+        is_vowel = char in vowels
+        if is_vowel and not prev_vowel:
+            count += 1
+        prev_vowel = is_vowel
+
+    # Handle silent e
+    if word.endswith("e") and count > 1:
+        count -= 1
+
+    # Handle special endings
+    if word.endswith("le") and len(word) > 2 and word[-3] not in vowels:
+        count += 1
+
+    return max(1, count)
+
+
+def parse_heading(line: str) -> Optional[Tuple[int, str]]:
+    """Parse a markdown heading line into (level, text) without regex backtracking."""
+    candidate = line.strip()
+    level = 0
+    while level < len(candidate) and level < 6 and candidate[level] == "#":
+        level += 1
+    if level == 0 or level >= len(candidate) or not candidate[level].isspace():
+        return None
+    heading = candidate[level:].strip()
+    return (level, heading) if heading else None
+
+
+@dataclass(frozen=True)
+class Heading:
+    """A markdown heading and the index of the line it is on."""
+
+    level: int
+    text: str
+    line: int
+
+
+@dataclass(frozen=True)
+class TextAnalysis:
+    """Tokens, sentences and structure of a text, computed in one pass."""
+
+    text: str
+    lower: str
+    words: Tuple[str, ...]
+    word_spans: Tuple[Tuple[int, int], ...]
+    syllables: Tuple[int, ...]
+    sentences: Tuple[str, ...]
+    sentence_spans: Tuple[Tuple[int, int], ...]
+    lines: Tuple[str, ...]
+    headings: Tuple[Heading, ...]
+    empty_heading_count: int
+    token_count: int
+
+    @property
+    def word_count(self) -> int:
+        return len(self.words)
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentences)
+
+    @property
+    def heading_count(self) -> int:
+        """Headings, including ones with no text."""
+        return len(self.headings) + self.empty_heading_count
+
+    @cached_property
+    def total_syllables(self) -> int:
+        return sum(self.syllables)
+
+    @cached_property
+    def complex_word_count(self) -> int:
+        """Words with three or more syllables."""
+        return sum(1 for s in self.syllables if s >= 3)
+
+    @cached_property
+    def avg_word_length(self) -> float:
+        return sum(map(len, self.words)) / max(1, len(self.words))
+
+    @cached_property
+    def word_counts(self) -> Counter:
+        """Word frequencies, in first-occurrence order for ties."""
+        return Counter(self.words)
+
+    @cached_property
+    def bigram_counts(self) -> Counter:
+        """Adjacent word pair frequencies, in first-occurrence order for ties."""
+        return Counter(zip(self.words, self.words[1:]))
+
+    @cached_property
+    def term_index(self) -> "TokenIndex":
+        """Token positions for SEO term matching (``TermMatcher.scan``)."""
+        from ..seo.term_matcher import TokenIndex
+
+        return TokenIndex(self.lower)
+
+
+def _analyze(text: str) -> TextAnalysis:
+    words = []
+    word_spans = []
+    syllables = []
+    sentences = []
+    sentence_spans = []
+
+    def close_sentence(start: int, end: int) -> None:
+        segment = text[start:end]
+        stripped = segment.strip()
+        if stripped:
+            offset = start + len(segment) - len(segment.lstrip())
+            sentences.append(stripped)
+            sentence_spans.append((offset, offset + len(stripped)))
+
+    sentence_start = 0
+    for match in _TOKEN_PATTERN.finditer(text):
+        word = match.group(1)
+        if word is not None:
+            word = word.lower()
+            words.append(word)
+            word_spans.append(match.span())
+            syllables.append(count_syllables(word))
+        else:
+            close_sentence(sentence_start, match.start())
+            sentence_start = match.end()
+    close_sentence(sentence_start, len(text))
+
+    lines = tuple(text.split("\n"))
+    headings = []
+    empty_headings = 0
+    for index, line in enumerate(lines):
+        if "#" in line:
+            parsed = parse_heading(line)
+            if parsed:
+                headings.append(Heading(level=parsed[0], text=parsed[1], line=index))
+            else:
+                marker = line.strip()
+                if len(marker) <= 6 and marker.strip("#") == "":
+                    empty_headings += 1
+
+    return TextAnalysis(
+        text=text,
+        lower=text.lower(),
+        words=tuple(words),
+        word_spans=tuple(word_spans),
+        syllables=tuple(syllables),
+        sentences=tuple(sentences),
+        sentence_spans=tuple(sentence_spans),
+        lines=lines,
+        headings=tuple(headings),
+        empty_heading_count=empty_headings,
+        token_count=len(text.split()),
+    )
+
+
+def analyze_text(text: str, use_cache: bool = True) -> TextAnalysis:
+    """
+    Analyze text in a single pass, reusing a cached analysis of the same content.
+
+    Args:
+        text: Content to analyze (markdown or plain text).
+        use_cache: Whether to look up / store the result by content hash.
+
+    Returns:
+        The shared, read-only TextAnalysis for this text.
+    """
+    if not use_cache:
+        return _analyze(text)
+
+    cache = get_text_analysis_cache()
+    key = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+    analysis = cache.get(key)
+    if analysis is None:
+        analysis = _analyze(text)
+        cache.set(key, analysis)
+    return analysis
@@ -12,8 +12,16 @@ This module implements a Surfer-SEO-style content scoring system that:
 import json
 import logging
 import re
-from typing import Dict, List, Optional, Set, Tuple
-
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+from ..scoring.text_analysis import TextAnalysis, analyze_text
+from .term_matcher import (
+    TermMatcher,
+    TermScan,
+    get_term_matcher,
+    significant_words,
+)
 from ..text_generation.core import GenerationOptions, LLMProvider, generate_text
 from ..types.seo import (
     ContentBrief,
@@ -27,6 +35,8 @@ from ..types.seo import (
 
 logger = logging.getLogger(__name__)
 
+SECTION_SCAN_CACHE_SIZE = 256
+
 
 class ContentOptimizerError(Exception):
     """Exception raised for errors in the content optimization process."""
@@ -34,42 +44,27 @@ class ContentOptimizerError(Exception):
     pass
 
 
-def _parse_markdown_heading(line: str) -> Optional[str]:
-    """Parse a markdown heading without regex backtracking."""
-    candidate = line.strip()
-    level = 0
-    while level < len(candidate) and level < 6 and candidate[level] == "#":
-        level += 1
-    if level == 0 or level >= len(candidate) or not candidate[level].isspace():
-        return None
-    heading = candidate[level:].strip()
-    return heading or None
-
-
 def _normalize_text(text: str) -> str:
     """Normalize text for comparison: lowercase, strip markdown formatting."""
     normalized = re.sub(r"[#*_`\[\]()]", " ", text)
     return normalized.lower()
 
 
-def _extract_words(text: str) -> List[str]:
-    """Extract individual words from text."""
-    return re.findall(r"\b[a-zA-Z]+\b", text.lower())
+def _scan_for(content_normalized: str, patterns: List[str]) -> TermScan:
+    """Scan content for an ad-hoc pattern list (when no shared scan is given)."""
+    return TermMatcher(patterns).scan(content_normalized)
 
 
-def _extract_headings(text: str) -> List[str]:
-    """Extract markdown headings from content."""
-    headings: List[str] = []
-    for line in text.split("\n"):
-        heading = _parse_markdown_heading(line)
-        if heading:
-            headings.append(heading)
-    return headings
+@lru_cache(maxsize=SECTION_SCAN_CACHE_SIZE)
+def _scan_section(matcher: TermMatcher, section: str) -> TermScan:
+    """Term scan of one section, reused for as long as the section is unchanged."""
+    return matcher.scan(_normalize_text(section), analyze_text(section).term_index)
 
 
 def _calculate_topic_coverage(
     content_normalized: str,
     common_topics: List[str],
+    scan: Optional[TermScan] = None,
 ) -> Tuple[float, List[str], List[str]]:
     """
     Calculate how well the content covers competitor topics.
@@ -77,6 +72,7 @@ def _calculate_topic_coverage(
     Args:
         content_normalized: Lowercase, cleaned content text.
         common_topics: Topics from SERP analysis.
+        scan: Term scan of the content covering every topic and topic word.
 
     Returns:
         Tuple of (score, covered_topics, missing_topics).
@@ -84,6 +80,12 @@ def _calculate_topic_coverage(
     if not common_topics:
         return 100.0, [], []
 
+    if scan is None:
+        scan = _scan_for(
+            content_normalized,
+            [p for t in common_topics for p in [t, *significant_words(t)]],
+        )
+
     covered: List[str] = []
     missing: List[str] = []
 
@@ -91,12 +93,12 @@ def _calculate_topic_coverage(
         topic_lower = topic.lower().strip()
         if not topic_lower:
             continue
-        if topic_lower in content_normalized:
+        if scan.contains(topic_lower):
             covered.append(topic)
         else:
             # Check for partial matches (individual significant words)
-            topic_words = [w for w in topic_lower.split() if len(w) > 3]
-            if topic_words and all(w in content_normalized for w in topic_words):
+            topic_words = significant_words(topic_lower)
+            if topic_words and all(scan.contains(w) for w in topic_words):
                 covered.append(topic)
             else:
                 missing.append(topic)
@@ -112,6 +114,7 @@ def _calculate_topic_coverage(
 def _calculate_term_usage(
     content_normalized: str,
     nlp_terms: List[str],
+    scan: Optional[TermScan] = None,
 ) -> Tuple[float, List[str], List[str]]:
     """
     Calculate how well the content uses recommended NLP terms.
@@ -119,6 +122,7 @@ def _calculate_term_usage(
     Args:
         content_normalized: Lowercase, cleaned content text.
         nlp_terms: Semantically related terms from SERP analysis.
+        scan: Term scan of the content covering every NLP term.
 
     Returns:
         Tuple of (score, covered_terms, missing_terms).
@@ -126,6 +130,9 @@ def _calculate_term_usage(
     if not nlp_terms:
         return 100.0, [], []
 
+    if scan is None:
+        scan = _scan_for(content_normalized, nlp_terms)
+
     covered: List[str] = []
     missing: List[str] = []
 
@@ -133,7 +140,7 @@ def _calculate_term_usage(
         term_lower = term.lower().strip()
         if not term_lower:
             continue
-        if term_lower in content_normalized:
+        if scan.contains(term_lower):
             covered.append(term)
         else:
             missing.append(term)
@@ -230,7 +237,10 @@ def _calculate_word_count_score(
         return 60.0
 
 
-def _calculate_readability_score(content: str) -> float:
+def _calculate_readability_score(
+    content: str,
+    analysis: Optional[TextAnalysis] = None,
+) -> float:
     """
     Calculate a basic readability score for the content.
 
@@ -238,26 +248,21 @@ def _calculate_readability_score(content: str) -> float:
 
     Args:
         content: Raw content text.
+        analysis: Pre-computed analysis of ``content`` (computed if omitted).
 
     Returns:
         Readability score (0-100).
     """
-    words = _extract_words(content)
-    sentences = [s.strip() for s in re.split(r"[.!?]+", content) if s.strip()]
+    analysis = analysis or analyze_text(content)
+    return _flesch_score(analysis.word_count, analysis.sentence_count, analysis.total_syllables)
 
-    word_count = len(words)
-    sentence_count = max(1, len(sentences))
-
-    avg_words_per_sentence = word_count / sentence_count
 
-    # Simplified syllable count
-    total_syllables = 0
-    for word in words:
-        # Simple heuristic: count vowel groups
-        syllables = len(re.findall(r"[aeiouy]+", word.lower()))
-        total_syllables += max(1, syllables)
+def _flesch_score(word_count: int, sentence_count: int, syllable_count: int) -> float:
+    """Flesch Reading Ease from raw counts, clamped to 0-100."""
+    sentence_count = max(1, sentence_count)
 
-    avg_syllables_per_word = total_syllables / max(1, word_count)
+    avg_words_per_sentence = word_count / sentence_count
+    avg_syllables_per_word = syllable_count / max(1, word_count)
 
     # Flesch Reading Ease
     flesch = 206.835 - (1.015 * avg_words_per_sentence) - (84.6 * avg_syllables_per_word)
@@ -274,6 +279,7 @@ def _build_suggestions(
     word_count: int,
     recommended_word_count: int,
     structure_score: float,
+    scan: Optional[TermScan] = None,
 ) -> List[OptimizationSuggestion]:
     """
     Build a prioritized list of optimization suggestions.
@@ -288,11 +294,17 @@ def _build_suggestions(
         word_count: Current word count.
         recommended_word_count: Target word count.
         structure_score: Current structure alignment score.
+        scan: Term scan of the content covering the questions' key words.
 
     Returns:
         Sorted list of OptimizationSuggestion objects.
     """
     suggestions: List[OptimizationSuggestion] = []
+    if scan is None:
+        scan = _scan_for(
+            content_normalized,
+            [w for q in questions[:5] for w in significant_words(q)],
+        )
 
     # Word count suggestions
     if recommended_word_count > 0:
@@ -364,8 +376,8 @@ def _build_suggestions(
     for question in questions[:5]:
         question_lower = question.lower()
         # Check if the question or its key words are addressed in the content
-        question_words = set(w for w in question_lower.split() if len(w) > 3)
-        if question_words and not all(w in content_normalized for w in question_words):
+        question_words = set(significant_words(question_lower))
+        if question_words and not all(scan.contains(w) for w in question_words):
             suggestions.append(
                 OptimizationSuggestion(
                     type=SuggestionType.ANSWER_QUESTION,
@@ -418,6 +430,7 @@ def optimize_content(
     content: str,
     keyword: str,
     serp_analysis: SERPAnalysis,
+    sections: Optional[Sequence[str]] = None,
 ) -> ContentOptimization:
     """
     Score and optimize content against SERP analysis data.
@@ -430,6 +443,10 @@ def optimize_content(
         content: The draft content to optimize.
         keyword: The target keyword.
         serp_analysis: SERP analysis data from analyze_serp().
+        sections: ``content`` split into parts (joined by newlines). Each
+            part's text analysis and term scan is cached by its content, so
+            re-scoring after editing some parts only re-processes those.
+            Word, sentence and syllable counts are summed per part.
 
     Returns:
         ContentOptimization with scores, missing items, and suggestions.
@@ -438,17 +455,33 @@ def optimize_content(
         ContentOptimizerError: If optimization fails.
     """
     try:
-        content_normalized = _normalize_text(content)
-        words = _extract_words(content)
-        word_count = len(words)
-        content_headings = _extract_headings(content)
+        # One pass finds every topic, topic word, term and question word
+        matcher = get_term_matcher(serp_analysis, [keyword])
+        if sections:
+            analyses = [analyze_text(section) for section in sections]
+            scan = TermScan.combine([_scan_section(matcher, section) for section in sections])
+            content_normalized = scan.text
+            word_count = sum(a.word_count for a in analyses)
+            content_headings = [h.text for a in analyses for h in a.headings]
+            readability_score = _flesch_score(
+                word_count,
+                sum(a.sentence_count for a in analyses),
+                sum(a.total_syllables for a in analyses),
+            )
+        else:
+            analysis = analyze_text(content)
+            content_normalized = _normalize_text(content)
+            scan = matcher.scan(content_normalized, analysis.term_index)
+            word_count = analysis.word_count
+            content_headings = [heading.text for heading in analysis.headings]
+            readability_score = _calculate_readability_score(content, analysis)
 
         # Calculate individual scores
         topic_score, covered_topics, missing_topics = _calculate_topic_coverage(
-            content_normalized, serp_analysis.common_topics
+            content_normalized, serp_analysis.common_topics, scan
         )
         term_score, covered_terms, missing_terms = _calculate_term_usage(
-            content_normalized, serp_analysis.nlp_terms
+            content_normalized, serp_analysis.nlp_terms, scan
         )
         structure_score = _calculate_structure_score(
             content_headings, serp_analysis.suggested_headings
@@ -456,7 +489,6 @@ def optimize_content(
         word_count_score = _calculate_word_count_score(
             word_count, serp_analysis.recommended_word_count
         )
-        readability_score = _calculate_readability_score(content)
 
         # Calculate overall score (weighted)
         overall_score = (
@@ -488,6 +520,7 @@ def optimize_content(
             word_count=word_count,
             recommended_word_count=serp_analysis.recommended_word_count,
             structure_score=structure_score,
+            scan=scan,
         )
 
         logger.info(
@@ -1,24 +1,58 @@
 """
 SEO optimization loop -- iteratively improves content until score thresholds are met.
+
+Each pass maps the top suggestions to the sections responsible for them and
+rewrites only those sections, concurrently; the title, description and every
+other section are left untouched.  Scoring is incremental: ``optimize_content``
+is given the post split into sections, and each section's text analysis and
+term scan are cached by content, so re-scoring after a pass only re-processes
+the rewritten sections.  The loop stops as soon as thresholds are met, or
+once a pass improves the overall score by less than
+``SEOThresholds.min_score_gain`` (a pass that lowers the score is undone).
 """
 
 import logging
-from typing import Optional
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
 
+from src.scoring.text_analysis import analyze_text
 from src.seo.content_optimizer import optimize_content
-from src.text_generation.core import GenerationOptions, create_provider_from_env, generate_text
+from src.seo.term_matcher import significant_words, stem
+from src.text_generation.core import (
+    GenerationOptions,
+    LLMProvider,
+    TextGenerationError,
+    create_provider_from_env,
+    generate_text,
+)
 from src.types.content import Section, SubTopic as SubTopicModel
 from src.types.seo import (
+    ContentOptimization,
     ContentScore,
     OptimizationSuggestion,
     SEOOptimizationResult,
     SEOThresholds,
     SERPAnalysis,
     SuggestionPriority,
+    SuggestionType,
 )
 
 logger = logging.getLogger(__name__)
 
+MAX_REWRITE_WORKERS = int(os.environ.get("SEO_REWRITE_WORKERS", "4"))
+
+# Sections touched by a suggestion that is about the post as a whole
+# (length, structure) rather than one topic, term, question or heading.
+SECTIONS_PER_GLOBAL_SUGGESTION = 2
+
+_SUBJECT_SUGGESTIONS = (
+    SuggestionType.COVER_TOPIC,
+    SuggestionType.ADD_TERM,
+    SuggestionType.ANSWER_QUESTION,
+)
+
 
 def _check_thresholds(score: ContentScore, thresholds: SEOThresholds) -> bool:
     """Return True if all dimension scores meet their thresholds."""
@@ -32,12 +66,13 @@ def _check_thresholds(score: ContentScore, thresholds: SEOThresholds) -> bool:
     )
 
 
-def _build_rewrite_prompt(
-    content: str,
+def _build_section_rewrite_prompt(
+    section_text: str,
     suggestions: list[OptimizationSuggestion],
     keyword: str,
+    post_title: str,
 ) -> str:
-    """Build an LLM prompt that asks for content improvements based on SEO suggestions."""
+    """Build an LLM prompt that asks for one section to be improved based on SEO suggestions."""
     suggestion_lines = "\n".join(
         f"- [{s.type.value}] {s.description}"
         + (
@@ -48,35 +83,42 @@ def _build_rewrite_prompt(
         for s in suggestions
     )
     return (
-        f"You are an SEO content editor. Rewrite the following blog post to improve its SEO score "
-        f'for the target keyword "{keyword}".\n\n'
+        f'You are an SEO content editor. Rewrite the following section of the blog post "{post_title}" '
+        f'to improve its SEO score for the target keyword "{keyword}".\n\n'
         f"Apply these specific improvements:\n{suggestion_lines}\n\n"
         f"Rules:\n"
-        f"- Preserve the overall structure (headings marked with ## and ###).\n"
+        f"- Keep the section heading (marked with ##) and its ### subheadings; you may add ### subheadings.\n"
         f"- Keep the same tone and voice.\n"
         f"- Naturally incorporate suggested terms and topics -- do not keyword-stuff.\n"
-        f"- Return ONLY the rewritten blog post content, no commentary.\n\n"
-        f"--- BLOG POST ---\n{content}"
+        f"- Return ONLY the rewritten section, no commentary.\n\n"
+        f"--- SECTION ---\n{section_text}"
     )
 
 
-def _blog_post_to_text(blog_post) -> str:
-    """Convert a BlogPost object to plain text for scoring and rewriting."""
+def _header_to_text(blog_post) -> str:
     parts = [f"# {blog_post.title}\n"]
     if blog_post.description:
         parts.append(f"{blog_post.description}\n")
-    for section in blog_post.sections:
-        parts.append(f"\n## {section.title}\n")
-        for subtopic in section.subtopics:
-            if subtopic.title:
-                parts.append(f"### {subtopic.title}\n")
-            if subtopic.content:
-                parts.append(f"{subtopic.content}\n")
     return "\n".join(parts)
 
 
-def _text_to_sections(text: str, blog_post):
-    """Parse rewritten text back into the blog post's section structure (best-effort)."""
+def _section_to_text(section) -> str:
+    parts = [f"\n## {section.title}\n"]
+    for subtopic in section.subtopics:
+        if subtopic.title:
+            parts.append(f"### {subtopic.title}\n")
+        if subtopic.content:
+            parts.append(f"{subtopic.content}\n")
+    return "\n".join(parts)
+
+
+def _blog_post_parts(blog_post) -> List[str]:
+    """The post as [header, section 1, section 2, ...]; joined by newlines it is the full text."""
+    return [_header_to_text(blog_post)] + [_section_to_text(s) for s in blog_post.sections]
+
+
+def _parse_sections(text: str) -> list[Section]:
+    """Parse markdown text into sections and subtopics (best-effort)."""
     sections: list[Section] = []
     current_section_title = ""
     current_subtopics: list[SubTopicModel] = []
@@ -116,10 +158,138 @@ def _text_to_sections(text: str, blog_post):
             current_content_lines.append(line)
 
     flush_section()
+    return sections
+
+
+def _suggestion_subject(suggestion: OptimizationSuggestion) -> str:
+    """The topic, term, question or heading a suggestion asks for ("" for whole-post ones)."""
+    if suggestion.type == SuggestionType.ADD_HEADING:
+        return suggestion.recommended_value or ""
+    if suggestion.type in _SUBJECT_SUGGESTIONS:
+        return suggestion.description.split(": ", 1)[-1]
+    return ""
+
+
+def _leading_int(value: Optional[str]) -> Optional[int]:
+    match = re.match(r"\s*(\d+)", value or "")
+    return int(match.group(1)) if match else None
 
-    if sections:
-        blog_post.sections = sections
-    return blog_post
+
+def _heading_matches(title: str, suggested_headings: Sequence[str]) -> bool:
+    words = {stem(w) for w in significant_words(title)}
+    return any(words & {stem(w) for w in significant_words(h)} for h in suggested_headings)
+
+
+def _assign_suggestions(
+    suggestions: Sequence[OptimizationSuggestion],
+    section_parts: Sequence[str],
+    section_titles: Sequence[str],
+    suggested_headings: Sequence[str],
+) -> Dict[int, List[OptimizationSuggestion]]:
+    """
+    Map each suggestion to the sections responsible for it.
+
+    Topic, term, question and heading suggestions go to the section whose
+    words overlap the subject most (the shortest section when none do).
+    Length suggestions go to the shortest sections when the post is too
+    short and the longest when too long; structure suggestions go to the
+    sections whose headings match no suggested heading.
+
+    Returns:
+        Section index -> the suggestions its rewrite should apply.
+    """
+    if not section_parts:
+        return {}
+
+    analyses = [analyze_text(part) for part in section_parts]
+    word_counts = [a.word_count for a in analyses]
+    section_stems = [{stem(w) for w in a.word_counts} for a in analyses]
+    by_length = sorted(range(len(section_parts)), key=lambda i: word_counts[i])
+    shortest = by_length[0]
+
+    assignments: Dict[int, List[OptimizationSuggestion]] = {}
+    for suggestion in suggestions:
+        subject = _suggestion_subject(suggestion)
+        if subject:
+            subject_stems = {
+                stem(w) for w in (significant_words(subject) or subject.lower().split())
+            }
+            overlaps = [len(subject_stems & stems) for stems in section_stems]
+            best = max(range(len(overlaps)), key=lambda i: overlaps[i])
+            targets = [best if overlaps[best] else shortest]
+        elif suggestion.type == SuggestionType.ADJUST_LENGTH:
+            current = _leading_int(suggestion.current_value)
+            recommended = _leading_int(suggestion.recommended_value)
+            too_long = current is not None and recommended is not None and current > recommended
+            ordered = by_length[::-1] if too_long else by_length
+            targets = ordered[:SECTIONS_PER_GLOBAL_SUGGESTION]
+        else:
+            unmatched = [
+                i for i, title in enumerate(section_titles)
+                if not _heading_matches(title, suggested_headings)
+            ]
+            targets = (unmatched or [shortest])[:SECTIONS_PER_GLOBAL_SUGGESTION]
+
+        for index in targets:
+            assignments.setdefault(index, []).append(suggestion)
+    return assignments
+
+
+def _rewrite_section(
+    section,
+    suggestions: list[OptimizationSuggestion],
+    keyword: str,
+    post_title: str,
+    provider: LLMProvider,
+    options: Optional[GenerationOptions],
+) -> list:
+    """Rewrite one section; returns its replacement section(s), or the original on failure."""
+    prompt = _build_section_rewrite_prompt(
+        _section_to_text(section), suggestions, keyword, post_title
+    )
+    try:
+        rewritten = generate_text(prompt, provider, options)
+    except TextGenerationError as e:
+        logger.warning("Section rewrite failed for '%s', keeping it: %s", section.title, e)
+        return [section]
+
+    parsed = _parse_sections(rewritten)
+    if not parsed:
+        return [section]
+    if not parsed[0].title:
+        parsed[0].title = section.title
+    return parsed
+
+
+def _rewrite_sections(
+    blog_post,
+    assignments: Dict[int, List[OptimizationSuggestion]],
+    keyword: str,
+    provider: LLMProvider,
+    options: Optional[GenerationOptions],
+) -> None:
+    """Rewrite the assigned sections concurrently and splice the results into the post."""
+    indices = sorted(assignments)
+    sections = list(blog_post.sections)
+
+    def job(index: int) -> list:
+        return _rewrite_section(
+            sections[index], assignments[index], keyword, blog_post.title, provider, options
+        )
+
+    max_workers = max(1, min(MAX_REWRITE_WORKERS, len(indices)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        replacements = dict(zip(indices, executor.map(job, indices)))
+
+    updated = []
+    for index, section in enumerate(sections):
+        updated.extend(replacements.get(index, [section]))
+    blog_post.sections = updated
+
+
+def _score(blog_post, keyword: str, serp_analysis: Optional[SERPAnalysis]) -> ContentOptimization:
+    parts = _blog_post_parts(blog_post)
+    return optimize_content("\n".join(parts), keyword, serp_analysis, sections=parts)
 
 
 def optimize_until_threshold(
@@ -134,7 +304,7 @@ def optimize_until_threshold(
     Score content and iteratively optimize until thresholds are met.
 
     Args:
-        blog_post: The BlogPost object to optimize.
+        blog_post: The BlogPost object to optimize (its sections are updated in place).
         keyword: Target SEO keyword.
         serp_analysis: Optional pre-computed SERP analysis.
         thresholds: Score thresholds (defaults used if None).
@@ -145,11 +315,24 @@ def optimize_until_threshold(
         SEOOptimizationResult with final score, pass/fail, and stats.
     """
     thresholds = thresholds or SEOThresholds()
-    content_text = _blog_post_to_text(blog_post)
+    suggested_headings = serp_analysis.suggested_headings if serp_analysis else []
     suggestions_applied = 0
+    sections_rewritten = 0
+    rewrite_passes = 0
+
+    optimization = _score(blog_post, keyword, serp_analysis)
+
+    def result(passed: bool) -> SEOOptimizationResult:
+        return SEOOptimizationResult(
+            score=optimization.score,
+            passed=passed,
+            suggestions_applied=suggestions_applied,
+            passes_used=min(rewrite_passes + 1, thresholds.max_optimization_passes),
+            sections_rewritten=sections_rewritten,
+            final_suggestions=optimization.suggestions,
+        )
 
     for pass_num in range(thresholds.max_optimization_passes):
-        optimization = optimize_content(content_text, keyword, serp_analysis)
         score = optimization.score
 
         if _check_thresholds(score, thresholds):
@@ -158,55 +341,58 @@ def optimize_until_threshold(
                 pass_num + 1,
                 score.overall_score,
             )
-            return SEOOptimizationResult(
-                score=score,
-                passed=True,
-                suggestions_applied=suggestions_applied,
-                passes_used=pass_num + 1,
-                final_suggestions=optimization.suggestions,
-            )
+            return result(passed=True)
 
-        # Pick top-3 HIGH priority suggestions for the rewrite prompt
+        # Pick top-3 HIGH priority suggestions for the rewrite
         high_suggestions = [
             s for s in optimization.suggestions if s.priority == SuggestionPriority.HIGH
         ][:3]
         if not high_suggestions:
             high_suggestions = optimization.suggestions[:3]
 
-        if not high_suggestions:
+        assignments = _assign_suggestions(
+            high_suggestions,
+            [_section_to_text(s) for s in blog_post.sections],
+            [s.title for s in blog_post.sections],
+            suggested_headings,
+        )
+        if not assignments:
             logger.info("No suggestions to apply, stopping optimization loop")
-            return SEOOptimizationResult(
-                score=score,
-                passed=False,
-                suggestions_applied=suggestions_applied,
-                passes_used=pass_num + 1,
-                final_suggestions=optimization.suggestions,
-            )
+            return result(passed=False)
 
-        prompt = _build_rewrite_prompt(content_text, high_suggestions, keyword)
+        previous_sections = list(blog_post.sections)
         provider = create_provider_from_env(provider_type)
-        rewritten = generate_text(prompt, provider, options)
+        _rewrite_sections(blog_post, assignments, keyword, provider, options)
         suggestions_applied += len(high_suggestions)
+        sections_rewritten += len(assignments)
+        rewrite_passes += 1
+        logger.info(
+            "SEO pass %d rewrote %d of %d sections",
+            pass_num + 1,
+            len(assignments),
+            len(previous_sections),
+        )
 
-        # Update blog_post sections from rewritten text
-        blog_post = _text_to_sections(rewritten, blog_post)
-        content_text = _blog_post_to_text(blog_post)
-
-    # Final scoring after all passes
-    final_optimization = optimize_content(content_text, keyword, serp_analysis)
-    final_score = final_optimization.score
-    passed = _check_thresholds(final_score, thresholds)
+        rescored = _score(blog_post, keyword, serp_analysis)
+        gain = rescored.score.overall_score - score.overall_score
+        if gain < 0:
+            blog_post.sections = previous_sections
+        else:
+            optimization = rescored
+        if gain < thresholds.min_score_gain:
+            logger.info(
+                "SEO optimization stopping after pass %d: score gain %.1f below %.1f",
+                pass_num + 1,
+                gain,
+                thresholds.min_score_gain,
+            )
+            break
 
+    passed = _check_thresholds(optimization.score, thresholds)
     logger.info(
         "SEO optimization %s after %d passes with score %.1f",
         "passed" if passed else "did not pass",
-        thresholds.max_optimization_passes,
-        final_score.overall_score,
-    )
-    return SEOOptimizationResult(
-        score=final_score,
-        passed=passed,
-        suggestions_applied=suggestions_applied,
-        passes_used=thresholds.max_optimization_passes,
-        final_suggestions=final_optimization.suggestions,
+        rewrite_passes,
+        optimization.score.overall_score,
     )
+    return result(passed=passed)
@@ -13,8 +13,11 @@ import os
 import re
 from typing import List, Optional
 
+import httpx
+
 from ..text_generation.core import GenerationOptions, LLMProvider, generate_text
 from ..types.seo import SERPAnalysis, SERPResult
+from ..utils import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -46,13 +49,6 @@ def fetch_serp_results(
     Raises:
         SERPAnalyzerError: If the SERP API request fails.
     """
-    try:
-        import requests
-    except ImportError:
-        raise SERPAnalyzerError(
-            "Requests package not installed. Install it with 'pip install requests'."
-        )
-
     api_key = os.environ.get("SERP_API_KEY")
     if not api_key:
         raise SERPAnalyzerError(
@@ -73,16 +69,16 @@ def fetch_serp_results(
     }
 
     try:
-        response = requests.get(url, params=params, timeout=30)
+        response = http_client.get_sync(url, params=params, timeout=30)
         response.raise_for_status()
         return response.json()
-    except requests.Timeout as e:
+    except httpx.TimeoutException as e:
         raise SERPAnalyzerError(f"SERP API request timed out: {e}") from e
-    except requests.ConnectionError as e:
+    except httpx.NetworkError as e:
         raise SERPAnalyzerError(f"Network error connecting to SERP API: {e}") from e
-    except requests.HTTPError as e:
+    except httpx.HTTPStatusError as e:
         raise SERPAnalyzerError(f"SERP API HTTP error: {e}") from e
-    except requests.RequestException as e:
+    except httpx.HTTPError as e:
         raise SERPAnalyzerError(f"SERP API request failed: {e}") from e
     except (ValueError, KeyError) as e:
         raise SERPAnalyzerError(f"Error parsing SERP API response: {e}") from e
@@ -0,0 +1,296 @@
+"""
+Multi-pattern term matching for SEO scoring.
+
+Topic coverage, NLP term usage, question coverage and keyword density used
+to run one ``term in content`` substring scan per topic, term and topic
+word, and the optimization loop repeated all of them on every pass.
+``TermMatcher`` compiles every pattern into a single Aho-Corasick automaton
+over word stems, so one linear scan of the draft reports every occurrence
+of every pattern with its character span.
+
+Matching is by whole words after light stemming, on both sides:
+
+- "AI" no longer matches inside "said", and "SEO" matches "seo-friendly".
+- "content strategies" matches "content strategy", and "optimized" matches
+  "optimize"/"optimizing".
+- Multi-word patterns do not match across sentence or clause punctuation.
+
+Matchers are built once per pattern set and cached (``get_term_matcher``),
+so repeated scoring against the same ``SERPAnalysis`` and keywords only pays
+for the scan.  The text side is tokenized once too: a ``TokenIndex`` (kept
+on the text's shared ``TextAnalysis`` as ``term_index``) records where each
+distinct token occurs, so a scan only visits the occurrences of tokens some
+pattern uses instead of every word of the draft.
+"""
+
+import re
+from collections import defaultdict, deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ..types.seo import SERPAnalysis
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+# Scanned text is split into words and phrase breaks: punctuation that ends a
+# phrase ("quick. Brown" is not "quick brown"). Breaks never occur in
+# patterns, so the automaton falls back to its root on them.
+_SCAN_PATTERN = re.compile(r"[a-z0-9]+|[.!?;:,|\n]")
+_VOWEL = re.compile(r"[aeiouy]")
+
+MATCHER_CACHE_SIZE = 32
+
+Span = Tuple[int, int]
+
+
+@lru_cache(maxsize=65536)
+def stem(token: str) -> str:
+    """
+    Reduce a lowercase word to a crude stem (plural, -ing, -ed, final -e).
+
+    Deliberately light: it only needs to map inflections of the same word
+    to the same key, and is applied identically to patterns and content.
+    """
+    if len(token) <= 3 or token.isdigit():
+        return token
+
+    base = token
+    if token.endswith("ies") and len(token) > 4:
+        base = token[:-3] + "y"
+    elif token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        base = token[:-1]
+    else:
+        for suffix in ("ing", "ed"):
+            if token.endswith(suffix):
+                candidate = token[:-len(suffix)]
+                if len(candidate) >= 3 and _VOWEL.search(candidate) and not candidate.endswith("e"):
+                    base = candidate
+                    if candidate[-1] == candidate[-2] and candidate[-1] not in "lsz":
+                        base = candidate[:-1]  # running -> run, planned -> plan
+                break
+
+    if len(base) >= 4 and base.endswith("e"):
+        base = base[:-1]  # optimize / optimized / optimizing -> optimiz
+    return base
+
+
+def pattern_key(pattern: str) -> str:
+    """Normalize a pattern the way TermScan lookups expect it."""
+    return " ".join(pattern.lower().split())
+
+
+def _stems(text: str) -> Tuple[str, ...]:
+    return tuple(stem(token) for token in _TOKEN_PATTERN.findall(text.lower()))
+
+
+class TokenIndex:
+    """Scan tokens of a lowercased text and the positions of each distinct token."""
+
+    __slots__ = ("token_count", "positions")
+
+    def __init__(self, text_lower: str):
+        positions: Dict[str, List[int]] = defaultdict(list)
+        index = -1
+        for index, token in enumerate(_SCAN_PATTERN.findall(text_lower)):
+            positions[token].append(index)
+        self.token_count = index + 1
+        self.positions: Dict[str, List[int]] = dict(positions)
+
+
+class TermScan:
+    """Occurrences of every pattern of a TermMatcher in one scanned text."""
+
+    def __init__(
+        self,
+        text: str,
+        hits: Dict[str, List[Tuple[int, int]]],
+        keys: Iterable[str],
+        token_count: int = 0,
+    ):
+        self._text = text
+        self._hits = hits  # key -> [(first token index, last token index)]
+        self._keys = frozenset(keys)
+        self._token_count = token_count
+        self._token_spans: Optional[List[Span]] = None
+
+    @classmethod
+    def combine(cls, scans: Sequence["TermScan"]) -> "TermScan":
+        """
+        Merge scans of consecutive texts into the scan of their newline join.
+
+        The newline is a phrase break, so no pattern can span two parts and
+        the merged hits are exactly those of scanning the joined text.  All
+        scans must come from the same matcher.
+        """
+        hits: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        offset = 0
+        for scan in scans:
+            for key, occurrences in scan._hits.items():
+                hits[key].extend((first + offset, last + offset) for first, last in occurrences)
+            offset += scan._token_count + 1  # the joining newline
+        return cls(
+            "\n".join(scan._text for scan in scans),
+            hits,
+            scans[0]._keys if scans else (),
+            max(0, offset - 1),
+        )
+
+    @property
+    def text(self) -> str:
+        """The scanned (lowercased) text that positions refer to."""
+        return self._text
+
+    @property
+    def found(self) -> frozenset:
+        """Keys of the patterns that occur at least once."""
+        return frozenset(key for key, occurrences in self._hits.items() if occurrences)
+
+    def _hits_for(self, pattern: str) -> List[Tuple[int, int]]:
+        key = pattern_key(pattern)
+        if key not in self._keys:
+            raise KeyError(f"Pattern was not compiled into this matcher: {pattern!r}")
+        return self._hits.get(key, [])
+
+    def positions(self, pattern: str) -> List[Span]:
+        """Character spans (in the scanned text) where the pattern occurs."""
+        hits = self._hits_for(pattern)
+        if hits and self._token_spans is None:
+            # Offsets are only needed by callers that ask for them.
+            self._token_spans = [m.span() for m in _SCAN_PATTERN.finditer(self._text)]
+        spans = self._token_spans
+        return [(spans[first][0], spans[last][1]) for first, last in hits]
+
+    def count(self, pattern: str) -> int:
+        return len(self._hits_for(pattern))
+
+    def contains(self, pattern: str) -> bool:
+        return bool(self._hits_for(pattern))
+
+
+class TermMatcher:
+    """Aho-Corasick automaton over word stems for a fixed set of patterns."""
+
+    def __init__(self, patterns: Iterable[str]):
+        # Node 0 is the root; edges are keyed by stem.
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[Tuple[Tuple[str, int], ...]] = [()]
+        self.keys = set()
+
+        for pattern in patterns:
+            key = pattern_key(pattern)
+            if not key or key in self.keys:
+                continue
+            self.keys.add(key)
+            stems = _stems(key)
+            if not stems:
+                continue  # e.g. punctuation only: can never match
+            node = 0
+            for s in stems:
+                nxt = self._goto[node].get(s)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][s] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append(())
+                node = nxt
+            self._out[node] += ((key, len(stems)),)
+
+        self._build_failure_links()
+        self._alphabet = frozenset(s for edges in self._goto for s in edges)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for s, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and s not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(s, 0)
+                self._out[child] += self._out[self._fail[child]]
+
+    def scan(self, text: str, index: Optional[TokenIndex] = None) -> TermScan:
+        """
+        Find every occurrence of every pattern in text.
+
+        Args:
+            text: The text to scan.
+            index: ``TokenIndex`` of ``text.lower()`` if already built (e.g.
+                ``analyze_text(text).term_index``); built here otherwise.
+        """
+        goto, fail, out = self._goto, self._fail, self._out
+        text = text.lower()
+        if index is None:
+            index = TokenIndex(text)
+
+        # Only occurrences of tokens whose stem some pattern uses can advance
+        # the automaton; any other token (most prose, and every phrase break)
+        # sends it back to the root, which a gap in positions stands for.
+        alphabet = self._alphabet
+        symbols: Dict[int, str] = {}
+        for token, positions in index.positions.items():
+            s = stem(token)
+            if s in alphabet:
+                symbols.update(dict.fromkeys(positions, s))
+
+        hits: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        node = 0
+        previous = -2
+        for position in sorted(symbols):
+            s = symbols[position]
+            if position != previous + 1:
+                node = 0
+            previous = position
+            while node and s not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(s, 0)
+            if out[node]:
+                for key, length in out[node]:
+                    hits[key].append((position - length + 1, position))
+        return TermScan(text, hits, self.keys, index.token_count)
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _cached_matcher(patterns: Tuple[str, ...]) -> TermMatcher:
+    return TermMatcher(patterns)
+
+
+def significant_words(phrase: str) -> List[str]:
+    """Words longer than three characters, used for partial topic/question matches."""
+    return [w for w in phrase.lower().split() if len(w) > 3]
+
+
+def serp_patterns(
+    serp_analysis: Optional[SERPAnalysis] = None,
+    keywords: Sequence[str] = (),
+) -> Tuple[str, ...]:
+    """Every pattern SEO scoring looks up for a SERP analysis and keyword set."""
+    patterns: List[str] = list(keywords)
+    if serp_analysis is not None:
+        for topic in serp_analysis.common_topics:
+            patterns.append(topic)
+            patterns.extend(significant_words(topic))
+        patterns.extend(serp_analysis.nlp_terms)
+        for question in serp_analysis.questions_to_answer[:5]:
+            patterns.extend(significant_words(question))
+    return tuple(dict.fromkeys(pattern_key(p) for p in patterns if p))
+
+
+def get_term_matcher(
+    serp_analysis: Optional[SERPAnalysis] = None,
+    keywords: Sequence[str] = (),
+) -> TermMatcher:
+    """
+    Get the (cached) matcher for a SERP analysis and keyword set.
+
+    Args:
+        serp_analysis: SERP data whose topics, topic words, NLP terms and
+            question words should be matched.
+        keywords: Target keywords to count.
+
+    Returns:
+        A TermMatcher shared by every caller with the same patterns.
+    """
+    return _cached_matcher(serp_patterns(serp_analysis, keywords))
@@ -3,6 +3,8 @@
 from .redis_client import RedisClient, redis_client
 from .job_storage import JobStorage, job_storage
 from .job_store import TypedJobStore, get_bulk_job_store, get_batch_job_store
+from .result_cache import ResultCache, get_result_cache, make_cache_key
+from .query_cache import QueryCache, get_query_cache, invalidate_tags, read_through
 
 __all__ = [
     "RedisClient",
@@ -12,4 +14,11 @@ __all__ = [
     "TypedJobStore",
     "get_bulk_job_store",
     "get_batch_job_store",
+    "ResultCache",
+    "get_result_cache",
+    "make_cache_key",
+    "QueryCache",
+    "get_query_cache",
+    "invalidate_tags",
+    "read_through",
 ]
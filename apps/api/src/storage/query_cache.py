@@ -0,0 +1,259 @@
+"""
+Read-through cache for service query methods.
+
+Analytics, SEO and recommendation reads are aggregate queries over data that
+only changes when new events or rankings are written, yet they were
+re-executed on every page view.  ``read_through`` wraps such an async method:
+
+- Results are kept in a process-local ``LRUCache`` keyed by namespace plus a
+  SHA-256 of the call arguments (``self`` excluded), so org / user / time
+  range each get their own entry.
+- Every entry is tagged.  Tags carry a version number and an entry is only
+  served while all of its tags still have the versions they had when it was
+  computed; ``invalidate_tags`` bumps versions, so invalidation is O(tags)
+  and never scans entries.  With ``REDIS_URL`` set the versions live in a
+  Redis hash, so a write handled by one worker invalidates every worker.
+- Concurrent misses for the same key share one in-flight call (a stampede
+  lock), so a burst of identical dashboard loads runs one query per key per
+  process.
+
+Cached values are returned as-is; callers must treat them as read-only.
+Cache failures never fail the call: Redis errors fall back to local versions.
+"""
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+from ..utils.cache import LRUCache
+from .result_cache import _normalize
+
+logger = logging.getLogger(__name__)
+
+_TAG_HASH_KEY = "qcache:tags"
+
+# After a Redis error, use local tag versions for this long before retrying.
+_REDIS_RETRY_SECONDS = 30.0
+
+TagsFor = Callable[[Dict[str, Any]], Iterable[str]]
+
+
+class QueryCache:
+    """Tagged, versioned result cache with per-key single-flight."""
+
+    def __init__(
+        self,
+        max_entries: int = 2000,
+        ttl_seconds: float = 300,
+        use_redis: bool = False,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.use_redis = use_redis
+        self._entries: LRUCache = LRUCache(
+            max_size=max_entries,
+            default_ttl_seconds=ttl_seconds,
+            name="query_cache",
+        )
+        self._versions: Dict[str, int] = {}
+        self._inflight: Dict[Tuple[str, Tuple[int, ...]], asyncio.Future] = {}
+        self._redis_retry_at = 0.0
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._invalidations = 0
+
+    # -- tag versions ----------------------------------------------------------
+
+    async def _redis(self) -> Any:
+        if not self.use_redis or time.monotonic() < self._redis_retry_at:
+            return None
+        from .redis_client import redis_client
+
+        client = await redis_client.get_client()
+        if client is None:
+            self._redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+        return client
+
+    def _redis_failed(self, error: Exception) -> None:
+        logger.warning("Query cache Redis unavailable, using local tag versions: %s", error)
+        self._redis_retry_at = time.monotonic() + _REDIS_RETRY_SECONDS
+
+    async def tag_versions(self, tags: List[str]) -> Tuple[int, ...]:
+        """Current version of each tag (0 if never invalidated)."""
+        if not tags:
+            return ()
+        client = await self._redis()
+        if client is not None:
+            try:
+                values = await client.hmget(_TAG_HASH_KEY, tags)
+                return tuple(int(v or 0) for v in values)
+            except Exception as e:
+                self._redis_failed(e)
+        return tuple(self._versions.get(tag, 0) for tag in tags)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> None:
+        """Invalidate every entry carrying any of ``tags``."""
+        tags = sorted(set(tags))
+        if not tags:
+            return
+        self._invalidations += 1
+        for tag in tags:
+            self._versions[tag] = self._versions.get(tag, 0) + 1
+
+        client = await self._redis()
+        if client is None:
+            return
+        try:
+            pipe = client.pipeline(transaction=False)
+            for tag in tags:
+                pipe.hincrby(_TAG_HASH_KEY, tag, 1)
+            await pipe.execute()
+        except Exception as e:
+            self._redis_failed(e)
+
+    # -- lookups -----------------------------------------------------------------
+
+    async def get_or_compute(
+        self,
+        key: str,
+        tags: List[str],
+        compute: Callable[[], Awaitable[Any]],
+        ttl_seconds: Optional[float] = None,
+    ) -> Any:
+        """Return the cached value for ``key`` or run ``compute`` once for it."""
+        versions = await self.tag_versions(tags)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == versions:
+            self._hits += 1
+            return entry[1]
+
+        flight_key = (key, versions)
+        inflight = self._inflight.get(flight_key)
+        if inflight is not None:
+            self._coalesced += 1
+            try:
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                if not inflight.cancelled():
+                    raise  # this caller was cancelled
+                # The call we joined was cancelled; run our own.
+                return await compute()
+
+        self._misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[flight_key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters re-raise it; mark retrieved so an unwaited future is quiet.
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            self._entries.set(key, (versions, value), ttl_seconds or self.ttl_seconds)
+            return value
+        finally:
+            self._inflight.pop(flight_key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def cleanup_expired(self) -> int:
+        return self._entries.cleanup_expired()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        total = self._hits + self._misses + self._coalesced
+        return {
+            "backend": "redis" if self.use_redis else "memory",
+            "size": self._entries.stats["size"],
+            "max_entries": self._entries.max_size,
+            "hits": self._hits,
+            "misses": self._misses,
+            "coalesced": self._coalesced,
+            "invalidations": self._invalidations,
+            "hit_rate": round((self._hits + self._coalesced) / total, 3) if total else 0.0,
+        }
+
+
+_query_cache: Optional[QueryCache] = None
+
+
+def is_query_cache_enabled() -> bool:
+    return os.environ.get("QUERY_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+
+
+def get_query_cache() -> QueryCache:
+    """Get the shared query cache configured from the environment."""
+    global _query_cache
+    if _query_cache is None:
+        _query_cache = QueryCache(
+            max_entries=int(os.environ.get("QUERY_CACHE_MAX_ENTRIES", "2000")),
+            ttl_seconds=float(os.environ.get("QUERY_CACHE_TTL_SECONDS", "300")),
+            use_redis=bool(os.environ.get("REDIS_URL")),
+        )
+    return _query_cache
+
+
+async def invalidate_tags(tags: Iterable[str]) -> None:
+    """Invalidate tags on the shared query cache."""
+    await get_query_cache().invalidate_tags(tags)
+
+
+def read_through(
+    namespace: str,
+    tags: TagsFor,
+    ttl_seconds: Optional[float] = None,
+    enabled: Optional[Callable[[Any], bool]] = None,
+) -> Callable:
+    """
+    Decorator caching an async method's result in the shared query cache.
+
+    Args:
+        namespace: Key prefix, unique per decorated method.
+        tags: Called with the bound arguments (name -> value, defaults
+            applied, ``self`` excluded) and returns the entry's tags.
+        ttl_seconds: Entry TTL; defaults to the cache's TTL.
+        enabled: Optional predicate on ``self``; the call bypasses the cache
+            when it returns False (e.g. a service using an injected client).
+
+    Usage:
+        @read_through("dashboard", tags=performance_tags)
+        async def get_dashboard_data(self, time_range, organization_id=None): ...
+    """
+
+    def decorator(func: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if not is_query_cache_enabled() or (enabled is not None and not enabled(self)):
+                return await func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(list(bound.arguments.items())[1:])
+            payload = json.dumps(_normalize(arguments), sort_keys=True, separators=(",", ":"))
+            key = f"{namespace}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+            return await get_query_cache().get_or_compute(
+                key,
+                list(tags(arguments)),
+                lambda: func(self, *args, **kwargs),
+                ttl_seconds,
+            )
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,242 @@
+"""
+Opt-in memoization of deterministic generation results.
+
+Workflow steps, marketing templates and tools frequently re-run with
+inputs identical to a previous run (e.g. a preset workflow where only the
+tone changed, so research and outline are unchanged).  This module lets
+those callers skip the LLM call entirely when the same inputs were seen
+recently.
+
+Entries are keyed by a SHA-256 of a canonical JSON payload built from the
+caller's namespace (step type, template id, tool id), normalized config,
+resolved upstream inputs, provider and generation options.  Values are
+stored in Redis with a TTL; a sorted-set index of insertion times bounds
+the number of entries so the oldest are evicted first.  When Redis is not
+configured an in-process ``LRUCache`` is used instead.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, Optional
+
+from ..utils.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "memo:"
+_INDEX_KEY = "memo:index"
+
+
+def _normalize(value: Any, strip: bool = True) -> Any:
+    """Convert *value* into a JSON-serializable structure with stable ordering.
+
+    Strings are stripped when building keys (``strip=True``) but kept verbatim
+    when serializing values for storage.
+    """
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {
+            str(k): _normalize(v, strip)
+            for k, v in sorted(value.items(), key=lambda i: str(i[0]))
+        }
+    if isinstance(value, (list, tuple)):
+        return [_normalize(v, strip) for v in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_normalize(v, strip) for v in value), key=str)
+    if isinstance(value, str):
+        return value.strip() if strip else value
+    if value is None or isinstance(value, (int, float, bool)):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _normalize(dataclasses.asdict(value), strip)
+    if hasattr(value, "model_dump"):
+        return _normalize(value.model_dump(mode="json"), strip)
+    if hasattr(value, "__dict__"):
+        return _normalize(vars(value), strip)
+    return str(value)
+
+
+def make_cache_key(namespace: str, **parts: Any) -> str:
+    """Build a deterministic cache key for *namespace* and keyword *parts*.
+
+    Dict ordering, surrounding whitespace and enum wrappers do not affect the
+    key, so logically identical inputs always map to the same entry.
+    """
+    payload = json.dumps(_normalize(parts), sort_keys=True, separators=(",", ":"))
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return f"{_KEY_PREFIX}{namespace}:{digest}"
+
+
+class ResultCache:
+    """
+    Redis-backed memoization store with TTL and size-bounded eviction.
+
+    Values must be JSON-serializable.  Oversized values are not cached so a
+    single huge book generation cannot crowd out everything else.  All Redis
+    errors are swallowed and treated as misses: memoization must never make
+    a request fail.
+    """
+
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = 3600,
+        max_entries: int = 1000,
+        max_value_bytes: int = 512 * 1024,
+    ) -> None:
+        self.redis_url = redis_url
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_value_bytes = max_value_bytes
+        self._client: Any = None
+        self._client_failed = False
+        self._lock = threading.Lock()
+        self._local: LRUCache = LRUCache(
+            max_size=max_entries,
+            default_ttl_seconds=ttl_seconds,
+            name="result_memo",
+        )
+        self._hits = 0
+        self._misses = 0
+
+    def _get_client(self) -> Any:
+        """Lazily create a synchronous Redis client, or None when unavailable."""
+        if not self.redis_url or self._client_failed:
+            return None
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    try:
+                        import redis
+
+                        client = redis.Redis.from_url(
+                            self.redis_url,
+                            decode_responses=True,
+                            socket_connect_timeout=2.0,
+                            socket_timeout=2.0,
+                        )
+                        client.ping()
+                        self._client = client
+                    except Exception as e:
+                        logger.warning(
+                            "Result cache Redis unavailable, using in-memory cache: %s", e
+                        )
+                        self._client_failed = True
+                        return None
+        return self._client
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for *key*, or None on a miss."""
+        client = self._get_client()
+        value: Optional[Any] = None
+        try:
+            # Both backends hold the serialized form so callers always get a
+            # fresh copy they are free to mutate.
+            raw = self._local.get(key) if client is None else client.get(key)
+            if raw is not None:
+                value = json.loads(raw)
+        except Exception as e:
+            logger.warning("Result cache read failed for %s: %s", key, e)
+
+        if value is None:
+            self._misses += 1
+        else:
+            self._hits += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> bool:
+        """Store *value* under *key*.  Returns False if the value was not cached.
+
+        Model and dataclass instances are stored as plain dicts, matching how
+        results are persisted elsewhere (e.g. workflow execution JSONB).
+        """
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        try:
+            raw = json.dumps(_normalize(value, strip=False))
+        except (TypeError, ValueError) as e:
+            logger.debug("Result for %s is not JSON-serializable: %s", key, e)
+            return False
+        if len(raw) > self.max_value_bytes:
+            logger.debug("Result for %s exceeds %d bytes, not cached", key, self.max_value_bytes)
+            return False
+
+        client = self._get_client()
+        if client is None:
+            self._local.set(key, raw, ttl)
+            return True
+
+        try:
+            now = time.time()
+            pipe = client.pipeline()
+            pipe.set(key, raw, ex=ttl)
+            pipe.zadd(_INDEX_KEY, {key: now})
+            # Index entries older than the TTL are already gone from Redis.
+            pipe.zremrangebyscore(_INDEX_KEY, "-inf", now - ttl)
+            pipe.zcard(_INDEX_KEY)
+            size = pipe.execute()[-1]
+            if size > self.max_entries:
+                self._evict(client, size - self.max_entries)
+            return True
+        except Exception as e:
+            logger.warning("Result cache write failed for %s: %s", key, e)
+            return False
+
+    def _evict(self, client: Any, count: int) -> None:
+        """Remove the *count* oldest entries from Redis."""
+        oldest = client.zpopmin(_INDEX_KEY, count)
+        keys = [member for member, _score in oldest]
+        if keys:
+            client.delete(*keys)
+            logger.debug("Result cache evicted %d entries", len(keys))
+
+    def clear(self) -> None:
+        """Remove every memoized entry."""
+        self._local.clear()
+        client = self._get_client()
+        if client is None:
+            return
+        try:
+            keys = client.zrange(_INDEX_KEY, 0, -1)
+            if keys:
+                client.delete(*keys)
+            client.delete(_INDEX_KEY)
+        except Exception as e:
+            logger.warning("Result cache clear failed: %s", e)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process."""
+        total = self._hits + self._misses
+        return {
+            "backend": "redis" if self._client is not None else "memory",
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(self._hits / total, 3) if total else 0.0,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+
+_result_cache: Optional[ResultCache] = None
+
+
+def get_result_cache() -> ResultCache:
+    """Get the shared result cache configured from the environment."""
+    global _result_cache
+    if _result_cache is None:
+        _result_cache = ResultCache(
+            redis_url=os.environ.get("REDIS_URL"),
+            ttl_seconds=int(os.environ.get("RESULT_CACHE_TTL_SECONDS", "3600")),
+            max_entries=int(os.environ.get("RESULT_CACHE_MAX_ENTRIES", "1000")),
+        )
+    return _result_cache
@@ -7,6 +7,7 @@ from .template_engine import (
     get_categories,
     get_template,
     get_templates_by_category,
+    search_templates,
 )
 
 __all__ = [
@@ -17,4 +18,5 @@ __all__ = [
     "get_categories",
     "get_template",
     "get_templates_by_category",
+    "search_templates",
 ]
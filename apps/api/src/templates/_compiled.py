@@ -0,0 +1,174 @@
+"""Templates compiled once at load: validators, defaults and render plans.
+
+A ``CompiledTemplate`` turns a template definition into:
+
+- per-field validators (required flag, allowed select options),
+- per-field defaults for missing optional values,
+- a render plan: the prompt split into literal text and field slots, so
+  rendering is a single join over the normalized field values instead of a
+  ``str.format_map`` parse on every call.
+
+Rendering produces exactly what ``template_engine._fill_prompt`` produces.
+Placeholders that do not name a field are resolved to their (constant)
+``_SafeDict`` output at compile time; templates the plan cannot express
+(attribute/index lookups on a field, malformed braces) keep using
+``_fill_prompt``.
+"""
+
+from string import Formatter
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+
+class _SafeDict(dict):
+    """Dict subclass that returns the key wrapped in braces for missing keys."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+class _FieldSpec:
+    """Validation and default handling for one template field."""
+
+    __slots__ = ("name", "required", "allowed", "allowed_message", "default")
+
+    def __init__(self, field_def: Dict[str, Any]):
+        self.name: str = field_def["name"]
+        self.required: bool = field_def.get("required", False)
+
+        options = field_def.get("options", []) if field_def.get("type") == "select" else []
+        self.allowed: Optional[FrozenSet[str]] = frozenset(options) if options else None
+        self.allowed_message = (
+            f"'{self.name}' must be one of: {', '.join(options)}" if options else ""
+        )
+
+        default = field_def.get("default", "")
+        if not default and field_def.get("type") == "select":
+            default = field_def.get("options", [""])[0] if field_def.get("options") else ""
+        self.default = str(default)
+
+
+class CompiledTemplate:
+    """A template definition with precomputed validation and rendering."""
+
+    __slots__ = (
+        "template",
+        "summary",
+        "name_lower",
+        "description_lower",
+        "_fields",
+        "_names",
+        "_plan",
+        "_fallback",
+    )
+
+    def __init__(
+        self,
+        template: Dict[str, Any],
+        fallback_render: Callable[[str, Dict[str, Any], List[Dict[str, Any]]], str],
+    ):
+        self.template = template
+        self.summary: Dict[str, Any] = {
+            "id": template["id"],
+            "name": template["name"],
+            "category": template["category"],
+            "description": template["description"],
+            "fields": template["fields"],
+            "output_format": template.get("output_format", {}),
+            "char_limits": template.get("char_limits", {}),
+        }
+        self.name_lower = template["name"].lower()
+        self.description_lower = template["description"].lower()
+
+        field_defs = template.get("fields", [])
+        self._fields: Tuple[_FieldSpec, ...] = tuple(_FieldSpec(fd) for fd in field_defs)
+        self._names: Tuple[str, ...] = tuple(dict.fromkeys(spec.name for spec in self._fields))
+        self._plan = _compile_plan(template["prompt_template"], self._names)
+        prompt_template = template["prompt_template"]
+        self._fallback = lambda fields: fallback_render(prompt_template, fields, field_defs)
+
+    @property
+    def id(self) -> str:
+        return self.template["id"]
+
+    def validate(self, fields: Dict[str, Any]) -> List[str]:
+        """Return human-readable validation errors (empty if valid)."""
+        errors: List[str] = []
+        for spec in self._fields:
+            value = fields.get(spec.name)
+            blank = value is None or str(value).strip() == ""
+
+            if spec.required and blank:
+                errors.append(f"'{spec.name}' is required")
+                continue
+
+            if spec.allowed is not None and not blank and str(value) not in spec.allowed:
+                errors.append(spec.allowed_message)
+
+        return errors
+
+    def normalize(self, fields: Dict[str, Any]) -> Tuple[str, ...]:
+        """
+        Field values as rendered (stripped, or the field default when blank),
+        one per distinct field name. A repeated field name takes its last
+        definition, as in _fill_prompt.
+        """
+        values: Dict[str, str] = {}
+        for spec in self._fields:
+            raw = fields.get(spec.name)
+            if raw is None or str(raw).strip() == "":
+                values[spec.name] = spec.default
+            else:
+                values[spec.name] = str(raw).strip()
+        return tuple(values.values())
+
+    def render(self, fields: Dict[str, Any]) -> str:
+        """Fill the prompt with user-supplied values."""
+        return self.render_normalized(self.normalize(fields))
+
+    def render_normalized(self, values: Tuple[str, ...]) -> str:
+        """Fill the prompt from ``normalize()`` output."""
+        if self._plan is None:
+            return self._fallback(dict(zip(self._names, values)))
+        literals, slots = self._plan
+        parts = [literals[0]]
+        for slot, literal in zip(slots, literals[1:]):
+            parts.append(values[slot])
+            parts.append(literal)
+        return "".join(parts)
+
+
+# Either (literals, slots), with len(literals) == len(slots) + 1 and each
+# slot an index into the normalized values, or None for the fallback path.
+_Plan = Optional[Tuple[Tuple[str, ...], Tuple[int, ...]]]
+
+
+def _compile_plan(prompt_template: str, field_names: Tuple[str, ...]) -> _Plan:
+    """Split a prompt template into literal text and field slots."""
+    index = {name: i for i, name in enumerate(field_names)}
+    literals: List[str] = []
+    slots: List[int] = []
+    pending = ""
+    try:
+        for literal, field_name, format_spec, conversion in Formatter().parse(prompt_template):
+            pending += literal
+            if field_name is None:
+                continue
+            if field_name in index and not format_spec and not conversion:
+                literals.append(pending)
+                slots.append(index[field_name])
+                pending = ""
+                continue
+            root = field_name.split(".", 1)[0].split("[", 1)[0]
+            if root in index or not field_name or field_name.isdigit() or "{" in format_spec:
+                return None
+            # Not a field: format_map would always substitute "{name}" here.
+            placeholder = "{" + field_name
+            if conversion:
+                placeholder += "!" + conversion
+            if format_spec:
+                placeholder += ":" + format_spec
+            pending += (placeholder + "}").format_map(_SafeDict())
+    except (ValueError, KeyError, IndexError, AttributeError, TypeError):
+        return None
+    literals.append(pending)
+    return tuple(literals), tuple(slots)
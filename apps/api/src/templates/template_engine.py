@@ -4,24 +4,33 @@ Template engine for the marketing copy template library.
 Provides functions to query templates, validate inputs, fill prompt
 templates with user-supplied fields, and generate content through the
 LLM abstraction layer.
+
+Templates are compiled once at import (see ``_compiled.py``) and indexed by
+id and category; listing returns shallow copies of precomputed summaries.
+Rendered prompts are memoized by template id and normalized field values.
 """
 
 import json
 import logging
 import re
 import time
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
+from ..storage.result_cache import get_result_cache, make_cache_key
 from ..text_generation.core import (
     TextGenerationError,
     create_provider_from_env,
     generate_text,
 )
 from ..types.providers import GenerationOptions, ProviderType
+from ._compiled import CompiledTemplate, _SafeDict
 from .marketing_templates import MARKETING_TEMPLATES, TEMPLATE_CATEGORIES
 
 logger = logging.getLogger(__name__)
 
+RENDER_CACHE_SIZE = 1024
+
 
 # ---------------------------------------------------------------------------
 # Public query helpers
@@ -34,10 +43,7 @@ def get_all_templates() -> List[Dict[str, Any]]:
     Each entry includes id, name, category, description, fields, output_format,
     and char_limits.
     """
-    results: List[Dict[str, Any]] = []
-    for template in MARKETING_TEMPLATES.values():
-        results.append(_template_summary(template))
-    return results
+    return [dict(summary) for summary in _ALL_SUMMARIES]
 
 
 def get_templates_by_category(category: str) -> List[Dict[str, Any]]:
@@ -56,10 +62,35 @@ def get_templates_by_category(category: str) -> List[Dict[str, Any]]:
         valid = ", ".join(sorted(TEMPLATE_CATEGORIES.keys()))
         raise ValueError(f"Unknown category '{category}'. Valid categories: {valid}")
 
+    return [dict(compiled.summary) for compiled in _BY_CATEGORY.get(category, ())]
+
+
+def search_templates(
+    search: str,
+    category: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """Return templates whose name or description contains ``search``.
+
+    Args:
+        search: Case-insensitive search term.
+        category: Optional category slug to restrict the search to.
+
+    Returns:
+        A list of matching template summaries.
+
+    Raises:
+        ValueError: If the category does not exist.
+    """
+    if category is not None and category not in TEMPLATE_CATEGORIES:
+        valid = ", ".join(sorted(TEMPLATE_CATEGORIES.keys()))
+        raise ValueError(f"Unknown category '{category}'. Valid categories: {valid}")
+
+    term = search.lower()
+    candidates = _BY_CATEGORY.get(category, ()) if category is not None else _COMPILED.values()
     return [
-        _template_summary(t)
-        for t in MARKETING_TEMPLATES.values()
-        if t["category"] == category
+        dict(compiled.summary)
+        for compiled in candidates
+        if term in compiled.name_lower or term in compiled.description_lower
     ]
 
 
@@ -83,21 +114,7 @@ def get_template(template_id: str) -> Dict[str, Any]:
 
 def get_categories() -> List[Dict[str, Any]]:
     """Return a list of categories with metadata and template counts."""
-    counts: Dict[str, int] = {}
-    for template in MARKETING_TEMPLATES.values():
-        cat = template["category"]
-        counts[cat] = counts.get(cat, 0) + 1
-
-    results: List[Dict[str, Any]] = []
-    for slug, meta in TEMPLATE_CATEGORIES.items():
-        results.append({
-            "id": slug,
-            "name": meta["name"],
-            "description": meta["description"],
-            "icon": meta.get("icon", ""),
-            "template_count": counts.get(slug, 0),
-        })
-    return results
+    return [dict(category) for category in _CATEGORY_LIST]
 
 
 # ---------------------------------------------------------------------------
@@ -110,6 +127,7 @@ def generate_from_template(
     fields: Dict[str, Any],
     provider_type: ProviderType = "openai",
     options: Optional[GenerationOptions] = None,
+    use_cache: bool = False,
 ) -> Dict[str, Any]:
     """Fill a prompt template with user fields, call the LLM, and return output.
 
@@ -118,6 +136,8 @@ def generate_from_template(
         fields: User-supplied field values keyed by field name.
         provider_type: Which LLM provider to use.
         options: Optional generation parameters.
+        use_cache: Reuse a memoized result for an identical filled prompt,
+            provider and options instead of calling the LLM again.
 
     Returns:
         A dict containing:
@@ -128,9 +148,10 @@ def generate_from_template(
             - raw_text (str): The raw LLM response.
             - execution_time_ms (int)
             - error (str | None)
+            - cached (bool): Whether the result was served from the cache.
     """
-    template = MARKETING_TEMPLATES.get(template_id)
-    if template is None:
+    compiled = _COMPILED.get(template_id)
+    if compiled is None:
         return {
             "success": False,
             "template_id": template_id,
@@ -143,7 +164,7 @@ def generate_from_template(
     # ------------------------------------------------------------------
     # Validate required fields
     # ------------------------------------------------------------------
-    validation_errors = _validate_fields(template, fields)
+    validation_errors = compiled.validate(fields)
     if validation_errors:
         return {
             "success": False,
@@ -157,7 +178,19 @@ def generate_from_template(
     # ------------------------------------------------------------------
     # Build prompt from template
     # ------------------------------------------------------------------
-    prompt = _fill_prompt(template["prompt_template"], fields, template["fields"])
+    prompt = _render_prompt(template_id, compiled.normalize(fields))
+
+    cache_key: Optional[str] = None
+    if use_cache:
+        cache_key = make_cache_key(
+            f"template:{template_id}",
+            prompt=prompt,
+            provider_type=provider_type,
+            options=options,
+        )
+        cached = get_result_cache().get(cache_key)
+        if cached is not None:
+            return {**cached, "execution_time_ms": 0, "cached": True}
 
     # ------------------------------------------------------------------
     # Call LLM
@@ -184,14 +217,18 @@ def generate_from_template(
     # ------------------------------------------------------------------
     parsed = _parse_llm_output(raw_text)
 
-    return {
+    result = {
         "success": True,
         "template_id": template_id,
         "output": parsed,
         "raw_text": raw_text,
         "execution_time_ms": elapsed_ms,
         "error": None,
+        "cached": False,
     }
+    if cache_key is not None:
+        get_result_cache().set(cache_key, result)
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -199,50 +236,10 @@ def generate_from_template(
 # ---------------------------------------------------------------------------
 
 
-def _template_summary(template: Dict[str, Any]) -> Dict[str, Any]:
-    """Return a template dict without the raw prompt_template string."""
-    return {
-        "id": template["id"],
-        "name": template["name"],
-        "category": template["category"],
-        "description": template["description"],
-        "fields": template["fields"],
-        "output_format": template.get("output_format", {}),
-        "char_limits": template.get("char_limits", {}),
-    }
-
-
-def _validate_fields(
-    template: Dict[str, Any],
-    fields: Dict[str, Any],
-) -> List[str]:
-    """Validate user fields against the template field definitions.
-
-    Returns a list of human-readable error strings (empty if valid).
-    """
-    errors: List[str] = []
-    for field_def in template.get("fields", []):
-        name = field_def["name"]
-        required = field_def.get("required", False)
-        value = fields.get(name)
-
-        if required and (value is None or str(value).strip() == ""):
-            errors.append(f"'{name}' is required")
-            continue
-
-        # Validate select field values
-        if (
-            field_def.get("type") == "select"
-            and value is not None
-            and str(value).strip() != ""
-        ):
-            allowed = field_def.get("options", [])
-            if allowed and str(value) not in allowed:
-                errors.append(
-                    f"'{name}' must be one of: {', '.join(allowed)}"
-                )
-
-    return errors
+@lru_cache(maxsize=RENDER_CACHE_SIZE)
+def _render_prompt(template_id: str, values: Tuple[str, ...]) -> str:
+    """Render a compiled template from its normalized field values (memoized)."""
+    return _COMPILED[template_id].render_normalized(values)
 
 
 def _fill_prompt(
@@ -284,13 +281,6 @@ def _fill_prompt(
         return result
 
 
-class _SafeDict(dict):
-    """Dict subclass that returns the key wrapped in braces for missing keys."""
-
-    def __missing__(self, key: str) -> str:
-        return "{" + key + "}"
-
-
 def _parse_llm_output(raw_text: str) -> Any:
     """Attempt to parse the LLM output as JSON.
 
@@ -321,3 +311,45 @@ def _parse_llm_output(raw_text: str) -> Any:
 
     # Return raw text as-is.
     return raw_text
+
+
+# ---------------------------------------------------------------------------
+# Compiled catalog
+# ---------------------------------------------------------------------------
+
+
+def _compile_templates() -> Dict[str, CompiledTemplate]:
+    return {
+        template_id: CompiledTemplate(template, _fill_prompt)
+        for template_id, template in MARKETING_TEMPLATES.items()
+    }
+
+
+def _index_by_category(
+    compiled: Dict[str, CompiledTemplate],
+) -> Dict[str, Tuple[CompiledTemplate, ...]]:
+    index: Dict[str, List[CompiledTemplate]] = {}
+    for template in compiled.values():
+        index.setdefault(template.template["category"], []).append(template)
+    return {category: tuple(templates) for category, templates in index.items()}
+
+
+def _category_list(
+    by_category: Dict[str, Tuple[CompiledTemplate, ...]],
+) -> Tuple[Dict[str, Any], ...]:
+    return tuple(
+        {
+            "id": slug,
+            "name": meta["name"],
+            "description": meta["description"],
+            "icon": meta.get("icon", ""),
+            "template_count": len(by_category.get(slug, ())),
+        }
+        for slug, meta in TEMPLATE_CATEGORIES.items()
+    )
+
+
+_COMPILED = _compile_templates()
+_BY_CATEGORY = _index_by_category(_COMPILED)
+_ALL_SUMMARIES = tuple(compiled.summary for compiled in _COMPILED.values())
+_CATEGORY_LIST = _category_list(_BY_CATEGORY)
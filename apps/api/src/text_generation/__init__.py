@@ -8,6 +8,8 @@ from .core import (
     RateLimitError,
     generate_text,
     generate_text_async,
+    generate_text_choices_async,
+    supports_multiple_choices,
     create_provider_from_env,
 )
 from .rate_limiter import (
@@ -35,6 +37,8 @@ __all__ = [
     "RateLimitError",
     "generate_text",
     "generate_text_async",
+    "generate_text_choices_async",
+    "supports_multiple_choices",
     "create_provider_from_env",
     # Types
     "GenerationOptions",
@@ -6,7 +6,7 @@ import asyncio
 import logging
 import os
 import warnings
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from tenacity import (
     retry,
@@ -276,6 +276,66 @@ def _generate_text_internal(
         raise TextGenerationError(f"Unsupported provider: {provider.type}")
 
 
+# Providers whose API can return several completions for one prompt (n > 1).
+MULTI_CHOICE_PROVIDERS = frozenset({"openai"})
+
+
+def supports_multiple_choices(provider: LLMProvider) -> bool:
+    """Whether one call to this provider can return several completions."""
+    return provider.type in MULTI_CHOICE_PROVIDERS
+
+
+async def generate_text_choices_async(
+    prompt: str,
+    provider: LLMProvider,
+    n: int,
+    options: Optional[GenerationOptions] = None,
+    operation_type: Optional[OperationType] = None,
+    check_rate_limit: bool = True,
+    wait_for_rate_limit: bool = True,
+) -> List[str]:
+    """
+    Generate ``n`` completions of one prompt in a single provider call.
+
+    Only providers in MULTI_CHOICE_PROVIDERS support this; the call counts
+    once against the rate limit.
+
+    Returns:
+        The generated texts (empty completions are dropped, so there may be
+        fewer than ``n``).
+
+    Raises:
+        TextGenerationError: If the provider does not support multiple
+            choices or generation fails.
+        RateLimitError: If rate limit is exceeded and wait_for_rate_limit is False.
+    """
+    if not supports_multiple_choices(provider):
+        raise TextGenerationError(
+            f"Provider {provider.type} does not support multiple completions per call"
+        )
+    options = options or GenerationOptions()
+    op_type = operation_type or OperationType.DEFAULT
+
+    if check_rate_limit:
+        try:
+            await get_rate_limiter().acquire(
+                operation_type=op_type,
+                wait=wait_for_rate_limit,
+            )
+        except RateLimitExceededError as e:
+            raise RateLimitError(
+                str(e),
+                operation_type=e.operation_type,
+                wait_time=e.wait_time,
+            ) from e
+
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        None,
+        lambda: generate_choices_with_openai(prompt, provider.config, options, n),
+    )
+
+
 # Default timeout for LLM API calls (in seconds)
 LLM_API_TIMEOUT = int(os.environ.get("LLM_API_TIMEOUT", "60"))
 
@@ -349,6 +409,28 @@ def generate_with_openai(
     Raises:
         TextGenerationError: If an error occurs during text generation.
     """
+    return _openai_completions(prompt, config, options, 1)[0]
+
+
+@LLM_RETRY
+def generate_choices_with_openai(
+    prompt: str, config: OpenAIConfig, options: GenerationOptions, n: int
+) -> List[str]:
+    """
+    Generate ``n`` completions of one prompt in a single OpenAI call.
+
+    Returns:
+        The non-empty completions, in choice order.
+
+    Raises:
+        TextGenerationError: If an error occurs or every completion is empty.
+    """
+    return _openai_completions(prompt, config, options, n)
+
+
+def _openai_completions(
+    prompt: str, config: OpenAIConfig, options: GenerationOptions, n: int
+) -> List[str]:
     if openai is None:
         raise TextGenerationError(
             "OpenAI package not installed. Install it with 'pip install openai'."
@@ -359,6 +441,7 @@ def generate_with_openai(
     try:
         client = _get_openai_client(config.api_key, LLM_API_TIMEOUT)
 
+        extra = {"n": n} if n > 1 else {}
         response = client.chat.completions.create(
             model=config.model,
             messages=[{"role": "user", "content": prompt}],
@@ -367,15 +450,21 @@ def generate_with_openai(
             top_p=options.top_p,
             frequency_penalty=options.frequency_penalty,
             presence_penalty=options.presence_penalty,
+            **extra,
         )
 
         # Validate response structure before accessing
         if not response.choices:
             raise TextGenerationError("OpenAI returned empty response (no choices)")
-        if not response.choices[0].message or not response.choices[0].message.content:
+        texts = [
+            choice.message.content
+            for choice in response.choices
+            if choice.message and choice.message.content
+        ]
+        if not texts:
             raise TextGenerationError("OpenAI returned empty message content")
 
-        return response.choices[0].message.content
+        return texts
     except TimeoutException as e:
         raise TextGenerationError(f"OpenAI request timed out after {LLM_API_TIMEOUT}s: {e}") from e
     except Exception as e:
@@ -10,8 +10,8 @@ Usage:
     # Get the registry
     registry = get_registry()
 
-    # Auto-discover tools from the library
-    registry.auto_discover()
+    # Load tools (from the precomputed catalog when it is current)
+    registry.ensure_loaded()
 
     # List all tools
     tools = registry.list_tools()
@@ -27,6 +27,7 @@ Creating New Tools:
     1. Create a new file in src/tools/library/{category}/
     2. Subclass BaseTool and implement required properties
     3. The tool will be auto-discovered on registry initialization
+    4. Regenerate src/tools/catalog.json: python ../../scripts/build_tool_catalog.py
 
 Example:
     from src.tools import BaseTool, ToolCategory, text_field
@@ -5,17 +5,22 @@ This module provides the abstract base class and common functionality
 for all tools in the registry.
 """
 
+import asyncio
 import logging
 import time
 import uuid
 from abc import ABC, abstractmethod
 from string import Template
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, AsyncIterator, Dict, List, Optional, Type
 
+from ..storage.result_cache import get_result_cache, make_cache_key
 from ..text_generation.core import (
     TextGenerationError,
     create_provider_from_env,
     generate_text,
+    generate_text_async,
+    generate_text_choices_async,
+    supports_multiple_choices,
 )
 from ..types.providers import GenerationOptions, LLMProvider, ProviderType
 from ..types.scoring import (
@@ -35,6 +40,7 @@ from ..types.tools import (
     ToolExecutionResult,
     ToolMetadata,
 )
+from ..utils.async_bridge import run_sync
 
 logger = logging.getLogger(__name__)
 
@@ -292,12 +298,29 @@ class BaseTool(ABC):
         """
         return output.strip()
 
+    def _finalize_prompt(self, prompt: str, processed_inputs: Dict[str, Any]) -> str:
+        """Add the system prompt and any brand voice instruction to a built prompt."""
+        if self.system_prompt:
+            full_prompt = f"{self.system_prompt}\n\n{prompt}"
+        else:
+            full_prompt = prompt
+
+        # Apply brand voice when provided, even if the tool template doesn't
+        # explicitly include a `${brand_voice}` placeholder.
+        brand_voice = str(processed_inputs.get("brand_voice") or "").strip()
+        if brand_voice and "${brand_voice}" not in self.prompt_template:
+            # Keep the injected instruction bounded to avoid runaway prompt size.
+            brand_voice = brand_voice[:2000]
+            full_prompt = f"{full_prompt}\n\nBRAND VOICE SUMMARY (follow strictly):\n{brand_voice}\n"
+        return full_prompt
+
     def execute(
         self,
         inputs: Dict[str, Any],
         provider: Optional[LLMProvider] = None,
         provider_type: ProviderType = "openai",
         options: Optional[GenerationOptions] = None,
+        use_cache: bool = False,
     ) -> ToolExecutionResult:
         """
         Execute the tool with the given inputs.
@@ -307,6 +330,8 @@ class BaseTool(ABC):
             provider: Optional pre-configured LLM provider.
             provider_type: Type of provider to use if not provided.
             options: Optional generation options.
+            use_cache: Reuse a memoized output for an identical prompt,
+                provider and options. Hits set ``metadata["cached"]``.
 
         Returns:
             ToolExecutionResult with the generated content.
@@ -341,19 +366,30 @@ class BaseTool(ABC):
                     max_tokens=self.default_max_tokens,
                 )
 
-            # Add system prompt if defined
-            if self.system_prompt:
-                full_prompt = f"{self.system_prompt}\n\n{prompt}"
-            else:
-                full_prompt = prompt
+            full_prompt = self._finalize_prompt(prompt, processed_inputs)
 
-            # Apply brand voice when provided, even if the tool template doesn't
-            # explicitly include a `${brand_voice}` placeholder.
-            brand_voice = str(processed_inputs.get("brand_voice") or "").strip()
-            if brand_voice and "${brand_voice}" not in self.prompt_template:
-                # Keep the injected instruction bounded to avoid runaway prompt size.
-                brand_voice = brand_voice[:2000]
-                full_prompt = f"{full_prompt}\n\nBRAND VOICE SUMMARY (follow strictly):\n{brand_voice}\n"
+            cache_key = None
+            if use_cache:
+                cache_key = make_cache_key(
+                    f"tool:{self.id}",
+                    prompt=full_prompt,
+                    provider_type=provider_type,
+                    options=options,
+                )
+                cached_output = get_result_cache().get(cache_key)
+                if cached_output is not None:
+                    logger.info(f"Tool '{self.id}' served from cache")
+                    return ToolExecutionResult(
+                        success=True,
+                        tool_id=self.id,
+                        output=cached_output,
+                        execution_time_ms=int((time.time() - start_time) * 1000),
+                        metadata={
+                            "provider": provider_type,
+                            "output_format": self.output_format.value,
+                            "cached": True,
+                        }
+                    )
 
             # Generate text
             logger.info(f"Executing tool '{self.id}' with provider '{provider_type}'")
@@ -362,6 +398,9 @@ class BaseTool(ABC):
             # Post-process output
             processed_output = self.post_process(output, processed_inputs)
 
+            if cache_key is not None:
+                get_result_cache().set(cache_key, processed_output)
+
             execution_time_ms = int((time.time() - start_time) * 1000)
 
             logger.info(f"Tool '{self.id}' completed in {execution_time_ms}ms")
@@ -374,6 +413,7 @@ class BaseTool(ABC):
                 metadata={
                     "provider": provider_type,
                     "output_format": self.output_format.value,
+                    "cached": False,
                 }
             )
 
@@ -394,45 +434,9 @@ class BaseTool(ABC):
                 execution_time_ms=int((time.time() - start_time) * 1000),
             )
 
-    def execute_variations(
-        self,
-        inputs: Dict[str, Any],
-        variation_count: int = 2,
-        provider: Optional[LLMProvider] = None,
-        provider_type: ProviderType = "openai",
-        include_scores: bool = True,
-        keywords: Optional[List[str]] = None,
-    ) -> VariationGenerationResult:
-        """
-        Execute the tool multiple times with different parameters to generate variations.
-
-        Args:
-            inputs: Dictionary of input values.
-            variation_count: Number of variations to generate (2-3).
-            provider: Optional pre-configured LLM provider.
-            provider_type: Type of provider to use if not provided.
-            include_scores: Whether to calculate scores for each variation.
-            keywords: Keywords for SEO scoring.
-
-        Returns:
-            VariationGenerationResult with all generated variations.
-        """
-        start_time = time.time()
-        variation_count = max(2, min(3, variation_count))
-
-        # Validate inputs first
-        errors = self.validate_inputs(inputs)
-        if errors:
-            return VariationGenerationResult(
-                success=False,
-                tool_id=self.id,
-                variations=[],
-                error="; ".join(errors),
-                execution_time_ms=int((time.time() - start_time) * 1000),
-            )
-
-        # Define variation configurations
-        variation_configs = [
+    def _variation_configs(self) -> List[Dict[str, Any]]:
+        """Generation settings for variations A (standard), B (creative) and C (concise)."""
+        return [
             {
                 "label": "A",
                 "temperature": self.default_temperature,
@@ -453,106 +457,243 @@ class BaseTool(ABC):
             },
         ]
 
-        variations: List[ContentVariation] = []
+    def _build_variation(
+        self,
+        config: Dict[str, Any],
+        output: str,
+        processed_inputs: Dict[str, Any],
+        include_scores: bool,
+        keywords: Optional[List[str]],
+    ) -> ContentVariation:
+        """Post-process and (optionally) score one generated variation."""
+        processed_output = self.post_process(output, processed_inputs)
+
+        scores = None
+        if include_scores:
+            try:
+                from ..scoring import score_content
+                scores = score_content(
+                    text=processed_output,
+                    keywords=keywords,
+                    content_type=self.category.value if hasattr(self.category, 'value') else str(self.category),
+                )
+            except Exception as score_error:
+                logger.warning(f"Failed to score variation: {score_error}")
+
+        return ContentVariation(
+            id=str(uuid.uuid4()),
+            content=processed_output,
+            label=config["label"],
+            temperature=config["temperature"],
+            prompt_style=config["prompt_style"],
+            scores=scores,
+        )
 
-        try:
-            # Pre-process inputs once
-            processed_inputs = self.pre_process(inputs)
-            base_prompt = self.build_prompt(processed_inputs)
+    async def stream_variations(
+        self,
+        inputs: Dict[str, Any],
+        variation_count: int = 2,
+        provider: Optional[LLMProvider] = None,
+        provider_type: ProviderType = "openai",
+        include_scores: bool = True,
+        keywords: Optional[List[str]] = None,
+        single_call: bool = False,
+    ) -> AsyncIterator[ContentVariation]:
+        """
+        Generate variations concurrently, yielding each one as soon as it is scored.
 
-            # Add system prompt if defined
-            if self.system_prompt:
-                base_prompt = f"{self.system_prompt}\n\n{base_prompt}"
+        The prompt is built once; every variation is generated and scored in
+        its own task, so total latency is roughly that of the slowest
+        variation. With ``single_call`` and a provider that supports it, all
+        variations come from one call (n > 1) at the standard temperature and
+        prompt, differing by sampling only. Variations that fail to generate
+        are logged and skipped.
 
-            brand_voice = str(processed_inputs.get("brand_voice") or "").strip()
-            if brand_voice and "${brand_voice}" not in self.prompt_template:
-                brand_voice = brand_voice[:2000]
-                base_prompt = f"{base_prompt}\n\nBRAND VOICE SUMMARY (follow strictly):\n{brand_voice}\n"
+        Raises:
+            ToolExecutionError: If the inputs are invalid.
+        """
+        variation_count = max(2, min(3, variation_count))
 
-            # Get or create provider
-            if provider is None:
-                provider = create_provider_from_env(provider_type)
+        errors = self.validate_inputs(inputs)
+        if errors:
+            raise ToolExecutionError("; ".join(errors), self.id)
 
-            # Generate each variation
-            for i in range(variation_count):
-                config = variation_configs[i]
+        processed_inputs = self.pre_process(inputs)
+        base_prompt = self._finalize_prompt(self.build_prompt(processed_inputs), processed_inputs)
 
-                options = GenerationOptions(
-                    temperature=config["temperature"],
-                    max_tokens=self.default_max_tokens,
-                )
+        if provider is None:
+            provider = create_provider_from_env(provider_type)
 
-                # Modify prompt based on style
-                full_prompt = base_prompt + config["prompt_modifier"]
+        configs = self._variation_configs()[:variation_count]
+
+        async def finish(config: Dict[str, Any], output: str) -> ContentVariation:
+            return await asyncio.to_thread(
+                self._build_variation, config, output, processed_inputs, include_scores, keywords
+            )
 
+        if single_call and supports_multiple_choices(provider):
+            standard = configs[0]
+            logger.info(
+                f"Generating {variation_count} variations for tool '{self.id}' in one call "
+                f"(temp={standard['temperature']})"
+            )
+            try:
+                outputs = await generate_text_choices_async(
+                    base_prompt,
+                    provider,
+                    variation_count,
+                    GenerationOptions(
+                        temperature=standard["temperature"],
+                        max_tokens=self.default_max_tokens,
+                    ),
+                )
+            except TextGenerationError as e:
+                logger.error(f"Failed to generate variations for tool '{self.id}': {e}")
+                return
+            tasks = [
+                asyncio.ensure_future(finish({**standard, "label": config["label"]}, output))
+                for config, output in zip(configs, outputs)
+            ]
+        else:
+            async def generate(config: Dict[str, Any]) -> Optional[ContentVariation]:
                 logger.info(
                     f"Generating variation {config['label']} for tool '{self.id}' "
                     f"(temp={config['temperature']})"
                 )
-
                 try:
-                    output = generate_text(full_prompt, provider, options)
-                    processed_output = self.post_process(output, processed_inputs)
-
-                    # Calculate scores if requested
-                    scores = None
-                    if include_scores:
-                        try:
-                            from ..scoring import score_content
-                            scores = score_content(
-                                text=processed_output,
-                                keywords=keywords,
-                                content_type=self.category.value if hasattr(self.category, 'value') else str(self.category),
-                            )
-                        except Exception as score_error:
-                            logger.warning(f"Failed to score variation: {score_error}")
-
-                    variation = ContentVariation(
-                        id=str(uuid.uuid4()),
-                        content=processed_output,
-                        label=config["label"],
-                        temperature=config["temperature"],
-                        prompt_style=config["prompt_style"],
-                        scores=scores,
+                    output = await generate_text_async(
+                        base_prompt + config["prompt_modifier"],
+                        provider,
+                        GenerationOptions(
+                            temperature=config["temperature"],
+                            max_tokens=self.default_max_tokens,
+                        ),
                     )
-                    variations.append(variation)
-
                 except TextGenerationError as e:
                     logger.error(f"Failed to generate variation {config['label']}: {e}")
-                    # Continue with other variations
+                    return None
+                return await finish(config, output)
 
-            if not variations:
-                return VariationGenerationResult(
-                    success=False,
-                    tool_id=self.id,
-                    variations=[],
-                    error="All variation generations failed",
-                    execution_time_ms=int((time.time() - start_time) * 1000),
-                )
+            tasks = [asyncio.ensure_future(generate(config)) for config in configs]
 
-            execution_time_ms = int((time.time() - start_time) * 1000)
-            logger.info(
-                f"Generated {len(variations)} variations for tool '{self.id}' "
-                f"in {execution_time_ms}ms"
-            )
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                variation = await next_done
+                if variation is not None:
+                    yield variation
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def execute_variations_async(
+        self,
+        inputs: Dict[str, Any],
+        variation_count: int = 2,
+        provider: Optional[LLMProvider] = None,
+        provider_type: ProviderType = "openai",
+        include_scores: bool = True,
+        keywords: Optional[List[str]] = None,
+        single_call: bool = False,
+    ) -> VariationGenerationResult:
+        """
+        Generate 2-3 variations concurrently (see stream_variations).
 
+        Returns:
+            VariationGenerationResult with the variations in label order.
+        """
+        start_time = time.time()
+        variations: List[ContentVariation] = []
+
+        try:
+            async for variation in self.stream_variations(
+                inputs,
+                variation_count=variation_count,
+                provider=provider,
+                provider_type=provider_type,
+                include_scores=include_scores,
+                keywords=keywords,
+                single_call=single_call,
+            ):
+                variations.append(variation)
+        except ToolExecutionError as e:
             return VariationGenerationResult(
-                success=True,
+                success=False,
                 tool_id=self.id,
-                variations=variations,
-                execution_time_ms=execution_time_ms,
+                variations=[],
+                error=e.message,
+                execution_time_ms=int((time.time() - start_time) * 1000),
             )
-
         except Exception as e:
             logger.exception(f"Tool '{self.id}' variation generation error: {e}")
             return VariationGenerationResult(
                 success=False,
                 tool_id=self.id,
-                variations=variations,  # Return any successful variations
+                variations=sorted(variations, key=lambda v: v.label),  # Return any successful variations
                 error=f"Unexpected error: {str(e)}",
                 execution_time_ms=int((time.time() - start_time) * 1000),
             )
 
+        if not variations:
+            return VariationGenerationResult(
+                success=False,
+                tool_id=self.id,
+                variations=[],
+                error="All variation generations failed",
+                execution_time_ms=int((time.time() - start_time) * 1000),
+            )
+
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        logger.info(
+            f"Generated {len(variations)} variations for tool '{self.id}' "
+            f"in {execution_time_ms}ms"
+        )
+
+        return VariationGenerationResult(
+            success=True,
+            tool_id=self.id,
+            variations=sorted(variations, key=lambda v: v.label),
+            execution_time_ms=execution_time_ms,
+        )
+
+    def execute_variations(
+        self,
+        inputs: Dict[str, Any],
+        variation_count: int = 2,
+        provider: Optional[LLMProvider] = None,
+        provider_type: ProviderType = "openai",
+        include_scores: bool = True,
+        keywords: Optional[List[str]] = None,
+        single_call: bool = False,
+    ) -> VariationGenerationResult:
+        """
+        Execute the tool multiple times with different parameters to generate variations.
+
+        Synchronous wrapper around execute_variations_async.
+
+        Args:
+            inputs: Dictionary of input values.
+            variation_count: Number of variations to generate (2-3).
+            provider: Optional pre-configured LLM provider.
+            provider_type: Type of provider to use if not provided.
+            include_scores: Whether to calculate scores for each variation.
+            keywords: Keywords for SEO scoring.
+            single_call: Request all variations in one provider call where supported.
+
+        Returns:
+            VariationGenerationResult with all generated variations.
+        """
+        return run_sync(
+            self.execute_variations_async(
+                inputs,
+                variation_count=variation_count,
+                provider=provider,
+                provider_type=provider_type,
+                include_scores=include_scores,
+                keywords=keywords,
+                single_call=single_call,
+            )
+        )
+
 
 # ==========================================================================
 # Helper functions for creating common input fields
@@ -0,0 +1,166 @@
+"""
+Precomputed tool catalog.
+
+The catalog is generated at build time and records, for every tool in
+src/tools/library, its complete ToolDefinition plus the module and class
+that implement it. The registry serves listing, search and definitions from
+it without importing any tool module; a tool's module is imported the first
+time the tool itself is needed (execution, validation, scoring).
+
+The catalog carries a fingerprint of the sources it was built from. A
+catalog whose fingerprint does not match the tree on disk is ignored and
+the registry falls back to importing the library, so a stale file can
+never shadow the real tools.
+
+Regenerate after adding or changing a tool (from apps/api):
+    python ../../scripts/build_tool_catalog.py
+"""
+
+import hashlib
+import importlib
+import json
+import logging
+import os
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Type
+
+from ..types.tools import ToolDefinition
+from .base import BaseTool
+
+logger = logging.getLogger(__name__)
+
+CATALOG_VERSION = 1
+
+_TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+LIBRARY_PATH = os.path.join(_TOOLS_DIR, "library")
+CATALOG_PATH = os.path.join(_TOOLS_DIR, "catalog.json")
+
+# Sources outside the library that shape tool definitions (field helpers,
+# get_definition, the definition models).
+_DEFINITION_SOURCES = (
+    os.path.join(_TOOLS_DIR, "base.py"),
+    os.path.join(os.path.dirname(_TOOLS_DIR), "types", "tools.py"),
+)
+
+
+class CatalogEntry(NamedTuple):
+    """A tool definition and where its implementation lives."""
+
+    definition: ToolDefinition
+    module: str
+    class_name: str
+
+
+def _library_files(package_path: str) -> List[str]:
+    paths = []
+    for root, dirs, files in os.walk(package_path):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        paths.extend(os.path.join(root, f) for f in files if f.endswith(".py"))
+    return sorted(paths)
+
+
+def library_fingerprint(package_path: str = LIBRARY_PATH) -> str:
+    """Hash of the tool library sources (and the definition code they use)."""
+    digest = hashlib.sha256()
+    for path in [*_library_files(package_path), *_DEFINITION_SOURCES]:
+        if not os.path.exists(path):
+            continue
+        digest.update(os.path.relpath(path, os.path.dirname(_TOOLS_DIR)).encode("utf-8"))
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _path_to_module(file_path: str, package_path: str) -> str:
+    """Convert a library file path to a module name."""
+    rel_path = os.path.relpath(file_path, os.path.dirname(package_path))
+    module_path = rel_path.replace(os.sep, ".")[: -len(".py")]
+    return f"src.tools.{module_path}"
+
+
+def discover_tool_classes(package_path: str = LIBRARY_PATH) -> Iterator[Type[BaseTool]]:
+    """
+    Import every module in the library and yield the concrete tools it defines.
+
+    Classes are yielded from the module that defines them, so a tool
+    re-exported elsewhere is only reported once.
+    """
+    for file_path in _library_files(package_path):
+        if os.path.basename(file_path).startswith("_"):
+            continue
+        module_name = _path_to_module(file_path, package_path)
+        try:
+            module = importlib.import_module(module_name)
+        except Exception as e:
+            logger.warning(f"Could not import {module_name}: {e}")
+            continue
+
+        for name in dir(module):
+            obj = getattr(module, name)
+            if (
+                isinstance(obj, type)
+                and issubclass(obj, BaseTool)
+                and obj is not BaseTool
+                and obj.__module__ == module_name
+                and not getattr(obj, "__abstractmethods__", None)
+            ):
+                yield obj
+
+
+def build_catalog(package_path: str = LIBRARY_PATH) -> Dict[str, Any]:
+    """Import the library and build the catalog document."""
+    tools: Dict[str, Dict[str, Any]] = {}
+    for tool_class in discover_tool_classes(package_path):
+        tool = tool_class()
+        tools[tool.id] = {
+            "module": tool_class.__module__,
+            "class": tool_class.__name__,
+            "definition": tool.get_definition().model_dump(mode="json"),
+        }
+    return {
+        "version": CATALOG_VERSION,
+        "fingerprint": library_fingerprint(package_path),
+        "tools": [tools[tool_id] for tool_id in sorted(tools)],
+    }
+
+
+def write_catalog(path: str = CATALOG_PATH, package_path: str = LIBRARY_PATH) -> int:
+    """Build the catalog and write it to ``path``. Returns the tool count."""
+    catalog = build_catalog(package_path)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(catalog, f, indent=2, ensure_ascii=False, sort_keys=True)
+        f.write("\n")
+    return len(catalog["tools"])
+
+
+def read_catalog(
+    path: str = CATALOG_PATH,
+    package_path: str = LIBRARY_PATH,
+) -> Optional[List[CatalogEntry]]:
+    """
+    Read the catalog, or None if it is missing, unreadable or stale.
+    """
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            catalog = json.load(f)
+        if catalog.get("version") != CATALOG_VERSION:
+            logger.warning(f"Ignoring tool catalog {path}: unsupported version")
+            return None
+        if catalog.get("fingerprint") != library_fingerprint(package_path):
+            logger.warning(
+                f"Ignoring stale tool catalog {path}; "
+                "regenerate it with scripts/build_tool_catalog.py"
+            )
+            return None
+        return [
+            CatalogEntry(
+                definition=ToolDefinition.model_validate(entry["definition"]),
+                module=entry["module"],
+                class_name=entry["class"],
+            )
+            for entry in catalog["tools"]
+        ]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Could not read tool catalog {path}: {e}")
+        return None
@@ -8,10 +8,9 @@ supporting tool discovery, filtering, and execution routing.
 import importlib
 import logging
 import os
-import pkgutil
 import threading
 from collections import defaultdict
-from typing import Callable, Dict, List, Optional, Type
+from typing import Dict, List, Optional, Tuple, Type
 
 from ..types.providers import GenerationOptions, LLMProvider, ProviderType
 from ..types.tools import (
@@ -24,6 +23,7 @@ from ..types.tools import (
     ToolMetadata,
 )
 from .base import BaseTool
+from .catalog import CATALOG_PATH, LIBRARY_PATH, discover_tool_classes, read_catalog
 from .categories import get_categories_with_counts, get_category_info
 
 logger = logging.getLogger(__name__)
@@ -42,14 +42,14 @@ class ToolRegistry:
     Central registry for all content generation tools.
 
     The registry supports:
-    - Tool registration (manual or auto-discovery)
+    - Tool registration (manual, auto-discovery, or the precomputed catalog)
     - Tool discovery (list, filter, search)
     - Tool execution routing
     - Category management
 
     Usage:
         registry = ToolRegistry()
-        registry.auto_discover()  # Load all tools from src/tools/library/
+        registry.ensure_loaded()  # Catalog if current, else src/tools/library/
 
         # List all tools
         tools = registry.list_tools()
@@ -67,9 +67,13 @@ class ToolRegistry:
     _instance: Optional["ToolRegistry"] = None
     _lock: threading.Lock = threading.Lock()
     _tools: Dict[str, BaseTool]
+    _tool_sources: Dict[str, Tuple[str, str]]
     _definitions_cache: Dict[str, ToolDefinition]
     _category_index: Dict[ToolCategory, List[str]]
     _tag_index: Dict[str, List[str]]
+    _search_text: Dict[str, str]
+    _listing_order: Optional[List[str]]
+    _load_lock: threading.RLock
 
     def __new__(cls) -> "ToolRegistry":
         """Thread-safe singleton pattern - only one registry instance."""
@@ -79,9 +83,13 @@ class ToolRegistry:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
                     cls._instance._tools = {}
+                    cls._instance._tool_sources = {}
                     cls._instance._definitions_cache = {}
                     cls._instance._category_index = defaultdict(list)
                     cls._instance._tag_index = defaultdict(list)
+                    cls._instance._search_text = {}
+                    cls._instance._listing_order = None
+                    cls._instance._load_lock = threading.RLock()
         return cls._instance
 
     @classmethod
@@ -105,23 +113,67 @@ class ToolRegistry:
             logger.warning(f"Tool '{tool_id}' already registered, overwriting")
 
         self._tools[tool_id] = tool
+        self._tool_sources.pop(tool_id, None)
+        self._index(tool.get_definition())
+
+        logger.info(f"Registered tool: {tool_id} (category: {tool.category.value})")
+
+    def register_definition(
+        self,
+        definition: ToolDefinition,
+        module: str,
+        class_name: str,
+    ) -> None:
+        """
+        Register a tool by definition without importing it.
+
+        The tool class is imported from ``module`` and instantiated the first
+        time the tool is requested through get_tool().
+
+        Args:
+            definition: The tool's definition (as recorded in the catalog).
+            module: Module that defines the tool class.
+            class_name: Name of the tool class in that module.
+        """
+        tool_id = definition.get_id()
+        if tool_id not in self._tools:
+            self._tool_sources[tool_id] = (module, class_name)
+        self._index(definition)
+
+    def _index(self, definition: ToolDefinition) -> None:
+        """Cache a definition and add it to the category, tag and search indexes."""
+        tool_id = definition.get_id()
+        metadata = definition.metadata
 
-        # Cache the definition
-        definition = tool.get_definition()
         self._definitions_cache[tool_id] = definition
 
         # Update category index
-        category = tool.category
+        category = ToolCategory(metadata.category)
         if tool_id not in self._category_index[category]:
             self._category_index[category].append(tool_id)
 
         # Update tag index
-        for tag in tool.tags:
+        for tag in metadata.tags:
             tag_lower = tag.lower()
             if tool_id not in self._tag_index[tag_lower]:
                 self._tag_index[tag_lower].append(tool_id)
 
-        logger.info(f"Registered tool: {tool_id} (category: {category.value})")
+        self._search_text[tool_id] = (
+            f"{metadata.name} {metadata.description} {' '.join(metadata.tags)}".lower()
+        )
+        self._listing_order = None
+
+    def _ordered_ids(self) -> List[str]:
+        """Tool IDs by popularity (descending) then name, computed once per change."""
+        if self._listing_order is None:
+            self._listing_order = sorted(
+                self._definitions_cache,
+                key=lambda tid: (
+                    -self._definitions_cache[tid].metadata.popularity_score,
+                    self._definitions_cache[tid].metadata.name,
+                ),
+            )
+        return self._listing_order
 
     def register_class(self, tool_class: Type[BaseTool]) -> None:
         """
@@ -143,25 +195,28 @@ class ToolRegistry:
         Returns:
             True if the tool was unregistered, False if not found.
         """
-        if tool_id not in self._tools:
+        if tool_id not in self._definitions_cache:
             return False
 
-        tool = self._tools[tool_id]
+        metadata = self._definitions_cache[tool_id].metadata
 
         # Remove from category index
-        category = tool.category
+        category = ToolCategory(metadata.category)
         if tool_id in self._category_index[category]:
             self._category_index[category].remove(tool_id)
 
         # Remove from tag index
-        for tag in tool.tags:
+        for tag in metadata.tags:
             tag_lower = tag.lower()
             if tool_id in self._tag_index[tag_lower]:
                 self._tag_index[tag_lower].remove(tool_id)
 
         # Remove from main storage
-        del self._tools[tool_id]
+        self._tools.pop(tool_id, None)
+        self._tool_sources.pop(tool_id, None)
         del self._definitions_cache[tool_id]
+        del self._search_text[tool_id]
+        self._listing_order = None
 
         logger.info(f"Unregistered tool: {tool_id}")
         return True
@@ -170,6 +225,9 @@ class ToolRegistry:
         """
         Get a tool by ID.
 
+        Tools registered from the catalog are imported and instantiated on
+        first use.
+
         Args:
             tool_id: The tool identifier.
 
@@ -179,9 +237,22 @@ class ToolRegistry:
         Raises:
             ToolNotFoundError: If the tool is not found.
         """
-        if tool_id not in self._tools:
+        tool = self._tools.get(tool_id)
+        if tool is not None:
+            return tool
+        if tool_id not in self._tool_sources:
             raise ToolNotFoundError(tool_id)
-        return self._tools[tool_id]
+
+        with self._load_lock:
+            if tool_id in self._tools:
+                return self._tools[tool_id]
+            module_name, class_name = self._tool_sources[tool_id]
+            tool_class = getattr(importlib.import_module(module_name), class_name)
+            tool = tool_class()
+            self._tools[tool_id] = tool
+            del self._tool_sources[tool_id]
+            logger.info(f"Loaded tool: {tool_id} ({module_name}.{class_name})")
+            return tool
 
     def get_definition(self, tool_id: str) -> ToolDefinition:
         """
@@ -202,7 +273,7 @@ class ToolRegistry:
 
     def has_tool(self, tool_id: str) -> bool:
         """Check if a tool is registered."""
-        return tool_id in self._tools
+        return tool_id in self._definitions_cache
 
     def list_tools(
         self,
@@ -229,12 +300,11 @@ class ToolRegistry:
         Returns:
             ToolListResponse with matching tools.
         """
-        tool_ids = set(self._tools.keys())
+        tool_ids: Optional[set] = None
 
         # Filter by category
         if category is not None:
-            category_tools = set(self._category_index.get(category, []))
-            tool_ids = tool_ids.intersection(category_tools)
+            tool_ids = set(self._category_index.get(category, []))
 
         # Filter by tags
         if tags:
@@ -242,13 +312,18 @@ class ToolRegistry:
             for tag in tags:
                 tag_lower = tag.lower()
                 tag_tools.update(self._tag_index.get(tag_lower, []))
-            tool_ids = tool_ids.intersection(tag_tools)
+            tool_ids = tag_tools if tool_ids is None else tool_ids & tag_tools
+
+        search_lower = search.lower() if search else None
 
-        # Get definitions and apply remaining filters
+        # Walk the precomputed listing order (popularity, then name) and
+        # apply the remaining filters
         results = []
-        for tool_id in tool_ids:
-            definition = self._definitions_cache[tool_id]
-            metadata = definition.metadata
+        for tool_id in self._ordered_ids():
+            if tool_ids is not None and tool_id not in tool_ids:
+                continue
+
+            metadata = self._definitions_cache[tool_id].metadata
 
             # Filter premium/beta
             if not include_premium and metadata.is_premium:
@@ -257,17 +332,11 @@ class ToolRegistry:
                 continue
 
             # Search filter
-            if search:
-                search_lower = search.lower()
-                searchable = f"{metadata.name} {metadata.description} {' '.join(metadata.tags)}".lower()
-                if search_lower not in searchable:
-                    continue
+            if search_lower and search_lower not in self._search_text[tool_id]:
+                continue
 
             results.append(metadata)
 
-        # Sort by popularity (descending) then name
-        results.sort(key=lambda m: (-m.popularity_score, m.name))
-
         total = len(results)
 
         # Apply pagination
@@ -358,12 +427,16 @@ class ToolRegistry:
             provider=provider,
             provider_type=request.provider_type,
             options=options,
+            use_cache=request.use_cache,
         )
 
     def auto_discover(self, package_path: Optional[str] = None) -> int:
         """
         Auto-discover and register tools from the library package.
 
+        Imports every tool module; prefer ensure_loaded(), which serves the
+        precomputed catalog when it is current.
+
         Args:
             package_path: Path to the tools library package.
                          Defaults to src/tools/library.
@@ -372,68 +445,61 @@ class ToolRegistry:
             Number of tools registered.
         """
         if package_path is None:
-            # Default to the library subdirectory
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            package_path = os.path.join(current_dir, "library")
+            package_path = LIBRARY_PATH
 
         if not os.path.exists(package_path):
             logger.warning(f"Tools library path does not exist: {package_path}")
             return 0
 
         registered_count = 0
-
-        # Walk through all Python files in the library
-        for root, dirs, files in os.walk(package_path):
-            # Skip __pycache__ directories
-            dirs[:] = [d for d in dirs if d != "__pycache__"]
-
-            for file in files:
-                if not file.endswith(".py") or file.startswith("_"):
-                    continue
-
-                file_path = os.path.join(root, file)
-                module_name = self._path_to_module(file_path, package_path)
-
-                try:
-                    registered_count += self._load_tools_from_module(module_name)
-                except Exception as e:
-                    logger.error(f"Failed to load tools from {module_name}: {e}")
+        for tool_class in discover_tool_classes(package_path):
+            try:
+                self.register_class(tool_class)
+                registered_count += 1
+            except Exception as e:
+                logger.error(f"Failed to register {tool_class.__name__}: {e}")
 
         logger.info(f"Auto-discovered {registered_count} tools")
         return registered_count
 
-    def _path_to_module(self, file_path: str, base_path: str) -> str:
-        """Convert a file path to a module name."""
-        rel_path = os.path.relpath(file_path, os.path.dirname(base_path))
-        module_path = rel_path.replace(os.sep, ".").replace(".py", "")
-        return f"src.tools.{module_path}"
+    def load_catalog(
+        self,
+        path: Optional[str] = None,
+        package_path: Optional[str] = None,
+    ) -> int:
+        """
+        Register tools from the precomputed catalog without importing them.
 
-    def _load_tools_from_module(self, module_name: str) -> int:
-        """Load all BaseTool subclasses from a module."""
-        try:
-            module = importlib.import_module(module_name)
-        except ImportError as e:
-            logger.warning(f"Could not import {module_name}: {e}")
+        Args:
+            path: Catalog file. Defaults to src/tools/catalog.json.
+            package_path: Library the catalog must match.
+                         Defaults to src/tools/library.
+
+        Returns:
+            Number of tools registered (0 if the catalog is missing or stale).
+        """
+        entries = read_catalog(path or CATALOG_PATH, package_path or LIBRARY_PATH)
+        if not entries:
             return 0
 
-        registered = 0
-        for name in dir(module):
-            obj = getattr(module, name)
-
-            # Check if it's a BaseTool subclass (but not BaseTool itself)
-            if (
-                isinstance(obj, type)
-                and issubclass(obj, BaseTool)
-                and obj is not BaseTool
-                and not getattr(obj, "__abstractmethods__", None)
-            ):
-                try:
-                    self.register_class(obj)
-                    registered += 1
-                except Exception as e:
-                    logger.error(f"Failed to register {name}: {e}")
-
-        return registered
+        for entry in entries:
+            self.register_definition(entry.definition, entry.module, entry.class_name)
+
+        logger.info(f"Loaded {len(entries)} tools from catalog")
+        return len(entries)
+
+    def ensure_loaded(self) -> None:
+        """
+        Populate an empty registry, from the catalog if it is current and
+        by importing the library otherwise.
+        """
+        if self._definitions_cache:
+            return
+        with self._load_lock:
+            if self._definitions_cache:
+                return
+            if self.load_catalog() == 0:
+                self.auto_discover()
 
     def get_stats(self) -> Dict:
         """
@@ -448,7 +514,8 @@ class ToolRegistry:
         }
 
         return {
-            "total_tools": len(self._tools),
+            "total_tools": len(self._definitions_cache),
+            "loaded_tools": len(self._tools),
             "categories": category_counts,
             "premium_tools": sum(
                 1 for d in self._definitions_cache.values()
@@ -57,6 +57,9 @@ from .version import (
     CreateVersionRequest,
     CreateVersionResponse,
     DEFAULT_AUTO_VERSION_CONFIG,
+    DiffGranularity,
+    DiffHunk,
+    DiffLine,
     RestoreVersionRequest,
     RestoreVersionResponse,
     VersionComparison,
@@ -121,6 +124,9 @@ __all__ = [
     "CreateVersionRequest",
     "CreateVersionResponse",
     "DEFAULT_AUTO_VERSION_CONFIG",
+    "DiffGranularity",
+    "DiffHunk",
+    "DiffLine",
     "RestoreVersionRequest",
     "RestoreVersionResponse",
     "VersionComparison",
@@ -204,6 +204,40 @@ class VoiceSample(BaseModel):
         return v
 
 
+class MetricMoments(BaseModel):
+    """Running sum and sum of squares of one numeric metric across samples."""
+    total: float = 0.0
+    total_sq: float = 0.0
+
+
+class VoiceStatistics(BaseModel):
+    """
+    Mergeable sufficient statistics behind a fingerprint.
+
+    Every aggregate in the fingerprint is a function of these sums and
+    counters, so samples can be added or removed without revisiting the rest.
+    """
+    sample_ids: List[str] = Field(default_factory=list)
+    sample_count: int = 0
+    metrics: Dict[str, MetricMoments] = Field(default_factory=dict)
+    counters: Dict[str, Dict[str, int]] = Field(default_factory=dict)
+
+    def mean(self, metric: str) -> float:
+        """Mean of a metric over the included samples."""
+        moments = self.metrics.get(metric)
+        if not moments or not self.sample_count:
+            return 0.0
+        return moments.total / self.sample_count
+
+    def variance(self, metric: str) -> float:
+        """Population variance of a metric over the included samples."""
+        moments = self.metrics.get(metric)
+        if not moments or not self.sample_count:
+            return 0.0
+        mean = moments.total / self.sample_count
+        return max(0.0, moments.total_sq / self.sample_count - mean * mean)
+
+
 class VoiceFingerprint(BaseModel):
     """Aggregated voice characteristics from all samples."""
     id: str
@@ -216,6 +250,8 @@ class VoiceFingerprint(BaseModel):
     sample_count: int = 0
     training_quality: float = 0.0
     last_trained_at: Optional[str] = None
+    # Persisted with the fingerprint but kept out of API responses.
+    statistics: Optional[VoiceStatistics] = Field(default=None, exclude=True)
 
 
 class VoiceScore(BaseModel):
@@ -346,6 +346,12 @@ class SEOThresholds(BaseModel):
     readability_minimum: float = Field(default=50.0, ge=0, le=100)
     word_count_minimum: float = Field(default=50.0, ge=0, le=100)
     max_optimization_passes: int = Field(default=3, ge=1, le=10)
+    min_score_gain: float = Field(
+        default=1.0,
+        ge=0,
+        le=100,
+        description="Stop once a rewrite pass improves the overall score by less than this",
+    )
 
 
 class SEOOptimizationResult(BaseModel):
@@ -355,6 +361,7 @@ class SEOOptimizationResult(BaseModel):
     passed: bool = Field(description="Whether all thresholds were met")
     suggestions_applied: int = Field(default=0, description="Number of suggestions fed to LLM")
     passes_used: int = Field(default=0, description="Optimization passes executed")
+    sections_rewritten: int = Field(default=0, description="Section rewrites sent to the LLM")
     final_suggestions: List[OptimizationSuggestion] = Field(
         default_factory=list,
         description="Remaining suggestions after optimization",
@@ -218,6 +218,10 @@ class ToolExecutionRequest(BaseModel):
         default=None,
         description="Conversation ID for tracking"
     )
+    use_cache: bool = Field(
+        default=False,
+        description="Reuse a memoized output for identical inputs"
+    )
 
 
 class ToolExecutionResult(BaseModel):
@@ -10,7 +10,7 @@ This module defines the data models for:
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -184,6 +184,47 @@ class VersionDetailResponse(BaseModel):
     )
 
 
+class DiffGranularity(str, Enum):
+    """Unit of comparison for version diffs."""
+    LINE = "line"
+    WORD = "word"
+    PARAGRAPH = "paragraph"
+
+
+class DiffLine(BaseModel):
+    """A single token (line, word or paragraph) inside a diff hunk."""
+
+    op: Literal["equal", "insert", "delete"] = Field(
+        ...,
+        description="Whether the token is unchanged, added or removed"
+    )
+    text: str = Field(
+        ...,
+        description="Token text, including trailing whitespace/newline"
+    )
+    old_index: Optional[int] = Field(
+        default=None,
+        description="0-based token index in the first version"
+    )
+    new_index: Optional[int] = Field(
+        default=None,
+        description="0-based token index in the second version"
+    )
+
+
+class DiffHunk(BaseModel):
+    """A contiguous group of changes with surrounding context."""
+
+    old_start: int = Field(..., ge=0, description="0-based start token in the first version")
+    old_count: int = Field(..., ge=0, description="Number of first-version tokens covered")
+    new_start: int = Field(..., ge=0, description="0-based start token in the second version")
+    new_count: int = Field(..., ge=0, description="Number of second-version tokens covered")
+    lines: List[DiffLine] = Field(
+        default_factory=list,
+        description="Tokens in display order"
+    )
+
+
 class VersionComparison(BaseModel):
     """
     Comparison between two versions.
@@ -221,6 +262,14 @@ class VersionComparison(BaseModel):
         ge=0,
         description="Number of lines deleted"
     )
+    granularity: DiffGranularity = Field(
+        default=DiffGranularity.LINE,
+        description="Unit used for hunks (additions/deletions count lines)"
+    )
+    hunks: List[DiffHunk] = Field(
+        default_factory=list,
+        description="Structured diff hunks for rendering"
+    )
 
 
 class VersionCompareResponse(BaseModel):
@@ -1,11 +1,22 @@
 """Utility modules for Blog AI."""
 
+from .async_bridge import run_sync
 from .cache import (
     LRUCache,
     CacheEntry,
     cached,
     get_content_analysis_cache,
+    get_fact_check_cache,
+    get_text_analysis_cache,
     get_voice_analysis_cache,
+    get_voice_feedback_cache,
+)
+from .http_client import (
+    HostPolicy,
+    OutboundHTTPClient,
+    close_http_clients,
+    get_http_client,
+    get_http_stats,
 )
 from .logging import (
     setup_logging,
@@ -25,12 +36,23 @@ from .logging import (
 )
 
 __all__ = [
+    # Sync/async bridging
+    "run_sync",
     # Cache utilities
     "LRUCache",
     "CacheEntry",
     "cached",
     "get_content_analysis_cache",
     "get_voice_analysis_cache",
+    "get_voice_feedback_cache",
+    "get_text_analysis_cache",
+    "get_fact_check_cache",
+    # Outbound HTTP
+    "HostPolicy",
+    "OutboundHTTPClient",
+    "close_http_clients",
+    "get_http_client",
+    "get_http_stats",
     # Logging utilities
     "setup_logging",
     "set_request_context",
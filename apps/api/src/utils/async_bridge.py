@@ -0,0 +1,31 @@
+"""
+Running coroutines from synchronous code.
+
+Several services expose a synchronous wrapper around an async
+implementation (batched fact-checking, tool variations). Those wrappers
+are called both from plain threads and from code already running inside
+an event loop, where ``asyncio.run`` is not allowed.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[object, object, T]) -> T:
+    """
+    Run a coroutine to completion and return its result.
+
+    Without a running event loop the coroutine runs on a new one in this
+    thread. Inside a running loop it runs on a private loop in a worker
+    thread, blocking the caller until it finishes.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
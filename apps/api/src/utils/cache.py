@@ -207,6 +207,9 @@ def cached(
 # Global cache instances for common use cases
 _content_analysis_cache: Optional[LRUCache] = None
 _voice_analysis_cache: Optional[LRUCache] = None
+_voice_feedback_cache: Optional[LRUCache] = None
+_text_analysis_cache: Optional[LRUCache] = None
+_fact_check_cache: Optional[LRUCache] = None
 
 
 def get_content_analysis_cache() -> LRUCache:
@@ -231,3 +234,39 @@ def get_voice_analysis_cache() -> LRUCache:
             name="voice_analysis",
         )
     return _voice_analysis_cache
+
+
+def get_voice_feedback_cache() -> LRUCache:
+    """Get the shared brand voice feedback cache (keyed by content, voice and score)."""
+    global _voice_feedback_cache
+    if _voice_feedback_cache is None:
+        _voice_feedback_cache = LRUCache(
+            max_size=500,
+            default_ttl_seconds=3600,  # 1 hour
+            name="voice_feedback",
+        )
+    return _voice_feedback_cache
+
+
+def get_text_analysis_cache() -> LRUCache:
+    """Get the shared single-pass text analysis cache (keyed by content hash)."""
+    global _text_analysis_cache
+    if _text_analysis_cache is None:
+        _text_analysis_cache = LRUCache(
+            max_size=128,
+            default_ttl_seconds=600,  # 10 minutes
+            name="text_analysis",
+        )
+    return _text_analysis_cache
+
+
+def get_fact_check_cache() -> LRUCache:
+    """Get the shared claim verdict cache (keyed by claim and source-set hash)."""
+    global _fact_check_cache
+    if _fact_check_cache is None:
+        _fact_check_cache = LRUCache(
+            max_size=2000,
+            default_ttl_seconds=21600,  # 6 hours
+            name="fact_check",
+        )
+    return _fact_check_cache
@@ -0,0 +1,394 @@
+"""
+Shared outbound HTTP client layer.
+
+All calls to third-party APIs (search providers, SERP API, publishing
+integrations) go through this module so connections are pooled and reused
+per upstream host instead of paying DNS, TCP and TLS setup on every call.
+
+Every upstream host gets:
+- an ``httpx.AsyncClient`` for async call sites and an ``httpx.Client`` for
+  sync call sites (which run in worker threads), both with keep-alive
+  connection pooling and HTTP/2 when the optional ``h2`` package is installed
+- a concurrency limit shared by all callers of that host
+- retries with exponential backoff on connection errors and 429/5xx
+  responses (non-idempotent requests are only retried when the connection
+  was never established)
+- latency and error counters, exposed via ``get_http_stats()``
+
+Usage:
+    from src.utils import http_client
+
+    response = http_client.get_sync(url, params=params, timeout=30)
+    response = await http_client.get(url, params=params, timeout=30)
+
+Responses are plain ``httpx.Response`` objects and errors are the standard
+``httpx`` exceptions.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, FrozenSet, Optional, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+# Upper bound on how long a Retry-After header may make us wait.
+MAX_RETRY_AFTER_SECONDS = 10.0
+
+# Number of recent latencies kept per host for percentile estimates.
+LATENCY_WINDOW = 256
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """Connection, concurrency and retry settings for one upstream host."""
+
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    max_concurrency: int = 20
+    timeout_seconds: float = 30.0
+    connect_timeout_seconds: float = 10.0
+    max_retries: int = 2
+    backoff_base_seconds: float = 0.25
+    backoff_max_seconds: float = 4.0
+    retry_statuses: FrozenSet[int] = frozenset({429, 502, 503, 504})
+    http2: bool = True
+
+
+def _default_policy() -> HostPolicy:
+    return HostPolicy(
+        max_connections=int(os.environ.get("HTTP_CLIENT_MAX_CONNECTIONS", "20")),
+        max_concurrency=int(os.environ.get("HTTP_CLIENT_MAX_CONCURRENCY", "20")),
+        timeout_seconds=float(os.environ.get("HTTP_CLIENT_TIMEOUT_SECONDS", "30")),
+        max_retries=int(os.environ.get("HTTP_CLIENT_MAX_RETRIES", "2")),
+    )
+
+
+@dataclass
+class HostStats:
+    """Latency and error counters for one upstream host."""
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    recent: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_WINDOW))
+
+    def to_dict(self) -> Dict[str, Any]:
+        recent = sorted(self.recent)
+
+        def percentile(p: float) -> float:
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, int(p * len(recent)))] * 1000
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "avg_ms": round(self.total_seconds / self.requests * 1000, 2) if self.requests else 0.0,
+            "p50_ms": round(percentile(0.50), 2),
+            "p95_ms": round(percentile(0.95), 2),
+            "max_ms": round(self.max_seconds * 1000, 2),
+        }
+
+
+class OutboundHTTPClient:
+    """Registry of pooled per-host HTTP clients."""
+
+    def __init__(self, default_policy: Optional[HostPolicy] = None):
+        self.default_policy = default_policy or _default_policy()
+        self._policies: Dict[str, HostPolicy] = {}
+        self._sync_clients: Dict[str, Tuple[httpx.Client, threading.BoundedSemaphore]] = {}
+        self._async_clients: Dict[
+            Tuple[str, asyncio.AbstractEventLoop], Tuple[httpx.AsyncClient, asyncio.Semaphore]
+        ] = {}
+        self._stats: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+    # -- configuration -----------------------------------------------------
+
+    def set_policy(self, host: str, policy: HostPolicy) -> None:
+        """Override the policy for *host* (``scheme://host[:port]``).
+
+        Takes effect for clients created afterwards.
+        """
+        self._policies[host] = policy
+
+    def policy_for(self, host: str) -> HostPolicy:
+        return self._policies.get(host, self.default_policy)
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        parsed = httpx.URL(url)
+        port = f":{parsed.port}" if parsed.port else ""
+        return f"{parsed.scheme}://{parsed.host}{port}"
+
+    def _client_kwargs(self, policy: HostPolicy) -> Dict[str, Any]:
+        return {
+            "limits": httpx.Limits(
+                max_connections=policy.max_connections,
+                max_keepalive_connections=policy.max_keepalive_connections,
+                keepalive_expiry=policy.keepalive_expiry,
+            ),
+            "timeout": httpx.Timeout(
+                policy.timeout_seconds,
+                connect=min(policy.connect_timeout_seconds, policy.timeout_seconds),
+            ),
+            "http2": policy.http2 and HTTP2_AVAILABLE,
+            "follow_redirects": True,
+        }
+
+    # -- client lookup -----------------------------------------------------
+
+    def _sync_client(self, host: str) -> Tuple[httpx.Client, threading.BoundedSemaphore]:
+        entry = self._sync_clients.get(host)
+        if entry is None:
+            with self._lock:
+                entry = self._sync_clients.get(host)
+                if entry is None:
+                    policy = self.policy_for(host)
+                    entry = (
+                        httpx.Client(**self._client_kwargs(policy)),
+                        threading.BoundedSemaphore(policy.max_concurrency),
+                    )
+                    self._sync_clients[host] = entry
+        return entry
+
+    def _async_client(self, host: str) -> Tuple[httpx.AsyncClient, asyncio.Semaphore]:
+        # Async clients and semaphores are bound to the loop that created them,
+        # so each loop (the server's, and short-lived ones from ``run_sync``)
+        # gets its own and they never evict each other.
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get((host, loop))
+        if entry is None:
+            with self._lock:
+                self._prune_closed_loops()
+                policy = self.policy_for(host)
+                entry = (
+                    httpx.AsyncClient(**self._client_kwargs(policy)),
+                    asyncio.Semaphore(policy.max_concurrency),
+                )
+                self._async_clients[(host, loop)] = entry
+        return entry
+
+    def _prune_closed_loops(self) -> None:
+        """Forget clients whose event loop has finished.
+
+        A closed loop can no longer run ``aclose()``; its transports were torn
+        down with it, so dropping the client releases the remaining sockets.
+        """
+        for key in [k for k in self._async_clients if k[1].is_closed()]:
+            del self._async_clients[key]
+
+    # -- retry policy ------------------------------------------------------
+
+    def _should_retry(
+        self,
+        policy: HostPolicy,
+        method: str,
+        attempt: int,
+        response: Optional[httpx.Response],
+        error: Optional[Exception],
+    ) -> bool:
+        if attempt >= policy.max_retries:
+            return False
+        if error is not None:
+            # A failed connect means the request was never sent, so even
+            # non-idempotent requests are safe to retry.
+            if isinstance(error, (httpx.ConnectError, httpx.ConnectTimeout)):
+                return True
+            return method in IDEMPOTENT_METHODS and isinstance(error, httpx.TransportError)
+        return (
+            response is not None
+            and response.status_code in policy.retry_statuses
+            and (method in IDEMPOTENT_METHODS or response.status_code == 429)
+        )
+
+    @staticmethod
+    def _backoff(policy: HostPolicy, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(float(retry_after), MAX_RETRY_AFTER_SECONDS)
+                except ValueError:
+                    pass
+        delay = min(policy.backoff_max_seconds, policy.backoff_base_seconds * (2 ** attempt))
+        return delay * (0.5 + random.random() / 2)
+
+    def _record(self, host: str, elapsed: float, failed: bool, retried: bool) -> None:
+        with self._lock:
+            stats = self._stats.get(host)
+            if stats is None:
+                stats = self._stats[host] = HostStats()
+            if retried:
+                stats.retries += 1
+                return
+            stats.requests += 1
+            stats.total_seconds += elapsed
+            stats.max_seconds = max(stats.max_seconds, elapsed)
+            stats.recent.append(elapsed)
+            if failed:
+                stats.errors += 1
+
+    # -- requests ----------------------------------------------------------
+
+    def request_sync(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request from sync code using the pooled client for the host."""
+        method = method.upper()
+        host = self.host_key(url)
+        policy = self.policy_for(host)
+        client, semaphore = self._sync_client(host)
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            response: Optional[httpx.Response] = None
+            error: Optional[Exception] = None
+            with semaphore:
+                try:
+                    response = client.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    error = e
+            elapsed = time.perf_counter() - start
+            if self._should_retry(policy, method, attempt, response, error):
+                self._record(host, elapsed, failed=True, retried=True)
+                time.sleep(self._backoff(policy, attempt, response))
+                attempt += 1
+                continue
+            self._record(host, elapsed, failed=error is not None or response.status_code >= 500, retried=False)
+            if error is not None:
+                raise error
+            return response
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request from async code using the pooled client for the host."""
+        method = method.upper()
+        host = self.host_key(url)
+        policy = self.policy_for(host)
+        client, semaphore = self._async_client(host)
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            response: Optional[httpx.Response] = None
+            error: Optional[Exception] = None
+            async with semaphore:
+                try:
+                    response = await client.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    error = e
+            elapsed = time.perf_counter() - start
+            if self._should_retry(policy, method, attempt, response, error):
+                self._record(host, elapsed, failed=True, retried=True)
+                await asyncio.sleep(self._backoff(policy, attempt, response))
+                attempt += 1
+                continue
+            self._record(host, elapsed, failed=error is not None or response.status_code >= 500, retried=False)
+            if error is not None:
+                raise error
+            return response
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host latency and error counters."""
+        with self._lock:
+            return {host: s.to_dict() for host, s in self._stats.items()}
+
+    async def aclose(self) -> None:
+        """Close all pooled connections."""
+        with self._lock:
+            sync_clients = list(self._sync_clients.values())
+            self._sync_clients.clear()
+        for client, _ in sync_clients:
+            client.close()
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        with self._lock:
+            async_clients = list(self._async_clients.items())
+            self._async_clients.clear()
+        for (_, client_loop), (client, _) in async_clients:
+            if client_loop is loop:
+                await client.aclose()
+            elif client_loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), client_loop)
+
+
+_client: Optional[OutboundHTTPClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> OutboundHTTPClient:
+    """Return the process-wide outbound HTTP client registry."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = OutboundHTTPClient()
+    return _client
+
+
+def get_http_stats() -> Dict[str, Dict[str, Any]]:
+    """Per-host latency and error counters for outbound calls."""
+    return get_http_client().stats()
+
+
+async def close_http_clients() -> None:
+    """Close pooled outbound connections (called on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def request_sync(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    return get_http_client().request_sync(method, url, **kwargs)
+
+
+def get_sync(url: str, **kwargs: Any) -> httpx.Response:
+    return get_http_client().request_sync("GET", url, **kwargs)
+
+
+def post_sync(url: str, **kwargs: Any) -> httpx.Response:
+    return get_http_client().request_sync("POST", url, **kwargs)
+
+
+def put_sync(url: str, **kwargs: Any) -> httpx.Response:
+    return get_http_client().request_sync("PUT", url, **kwargs)
+
+
+async def request(method: str, url: str, **kwargs: Any) -> httpx.Response:
+    return await get_http_client().request(method, url, **kwargs)
+
+
+async def get(url: str, **kwargs: Any) -> httpx.Response:
+    return await get_http_client().request("GET", url, **kwargs)
+
+
+async def post(url: str, **kwargs: Any) -> httpx.Response:
+    return await get_http_client().request("POST", url, **kwargs)
+
+
+async def put(url: str, **kwargs: Any) -> httpx.Response:
+    return await get_http_client().request("PUT", url, **kwargs)
@@ -15,12 +15,14 @@ Design goals:
 
 import asyncio
 import copy
+import functools
 import logging
 import uuid
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Callable, Coroutine, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Dict, List, Optional
 
 from ..text_generation.core import (
     GenerationOptions,
@@ -30,6 +32,9 @@ from ..text_generation.core import (
 )
 from ..types.providers import ProviderType
 
+if TYPE_CHECKING:
+    from ..storage.result_cache import ResultCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -114,6 +119,7 @@ class WorkflowExecution:
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     error: Optional[str] = None
+    cached_steps: List[str] = field(default_factory=list)
 
 
 class WorkflowExecutionError(Exception):
@@ -134,15 +140,37 @@ ProgressCallback = Callable[
 ]
 
 
+def _with_run_state(func: Callable[..., Coroutine[Any, Any, Any]]):
+    """Give each call of ``func`` a fresh ``_run_state`` (see step handlers)."""
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _run_state.set({})
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _run_state.reset(token)
+
+    return wrapper
+
+
 # ---------------------------------------------------------------------------
 # Engine
 # ---------------------------------------------------------------------------
 
 class WorkflowEngine:
-    """Executes workflow DAGs by dispatching each step to the correct handler."""
+    """Executes workflow DAGs by dispatching each step to the correct handler.
 
-    def __init__(self) -> None:
+    Pass a ``ResultCache`` to opt in to step memoization: deterministic
+    steps (see ``CACHEABLE_STEP_TYPES``) whose type, config, upstream
+    outputs and generation options match a previous run are served from
+    the cache instead of being re-executed.  Individual steps can opt out
+    with ``config["cache"] = False``.
+    """
+
+    def __init__(self, result_cache: Optional["ResultCache"] = None) -> None:
         self._cancelled: bool = False
+        self._result_cache = result_cache
 
     # ------------------------------------------------------------------
     # Public API
@@ -152,6 +180,7 @@ class WorkflowEngine:
         """Request cancellation.  Takes effect before the next step starts."""
         self._cancelled = True
 
+    @_with_run_state
     async def execute_workflow(
         self,
         workflow: Workflow,
@@ -216,7 +245,17 @@ class WorkflowEngine:
                 await progress_callback(step.id, WorkflowStatus.RUNNING, f"Starting: {step.name}")
 
             try:
-                output = await self.execute_step(step, context, provider, options)
+                cache_key = self._step_cache_key(step, context, options)
+                output = None
+                if cache_key is not None:
+                    output = await asyncio.to_thread(self._result_cache.get, cache_key)
+                if output is not None:
+                    execution.cached_steps.append(step.id)
+                    logger.info("Step %s (%s) served from cache", step.id, step.name)
+                else:
+                    output = await self.execute_step(step, context, provider, options)
+                    if cache_key is not None:
+                        await asyncio.to_thread(self._result_cache.set, cache_key, output)
                 step.output = output
                 step.status = WorkflowStatus.COMPLETED
                 step.completed_at = datetime.now(timezone.utc)
@@ -287,6 +326,43 @@ class WorkflowEngine:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _step_cache_key(
+        self,
+        step: WorkflowStep,
+        context: Dict[str, Any],
+        options: GenerationOptions,
+    ) -> Optional[str]:
+        """Return the memoization key for *step*, or None if it must run.
+
+        The key covers the step type, its config, the variables the handler
+        reads, every upstream output in *context* (handlers such as
+        ``_resolve_content`` may look at any of them), the provider and the
+        generation options.
+        """
+        if self._result_cache is None or step.type not in CACHEABLE_STEP_TYPES:
+            return None
+        if step.config.get("cache") is False:
+            return None
+
+        from ..storage.result_cache import make_cache_key
+
+        variables = context.get("variables", {})
+        relevant_vars = {
+            name: variables.get(name)
+            for name in CACHEABLE_STEP_TYPES[step.type]
+            if name in variables
+        }
+        upstream = {k: v for k, v in context.items() if k not in ("variables", "provider_type")}
+        config = {k: v for k, v in step.config.items() if k != "cache"}
+        return make_cache_key(
+            f"workflow:{step.type.value}",
+            config=config,
+            variables=relevant_vars,
+            upstream=upstream,
+            provider_type=context.get("provider_type"),
+            options=options,
+        )
+
     @staticmethod
     def _topological_sort(steps: List[WorkflowStep]) -> List[WorkflowStep]:
         """
@@ -324,8 +400,15 @@ class WorkflowEngine:
 # ``config`` is the per-step configuration dict.
 # ``context`` accumulates outputs from prior steps keyed by step id,
 # plus ``context["variables"]`` which holds user-supplied input.
+#
+# State that must outlive a step but is not a step output (and so must stay
+# out of ``context``, step cache keys and content resolution) lives in
+# ``_run_state``, a dict scoped to one ``execute_workflow`` call.
 # ---------------------------------------------------------------------------
 
+_run_state: ContextVar[Optional[Dict[str, Any]]] = ContextVar("workflow_run_state", default=None)
+
+
 def _resolve_content(context: Dict[str, Any]) -> str:
     """Extract the best available content string from context.
 
@@ -994,9 +1077,22 @@ async def _execute_fact_check(
     provider: LLMProvider,
     options: Optional[GenerationOptions],
 ) -> Any:
-    """Run fact-checking on the accumulated content."""
+    """Run fact-checking on the accumulated content.
+
+    Fact-check steps in the same run share a claim index, so claims that an
+    earlier step already validated against the same sources are not
+    validated again.
+    """
+    from ..fact_checking.claim_index import ClaimIndex
     from ..fact_checking.fact_checker import check_facts
 
+    claim_index = None
+    run_state = _run_state.get()
+    if run_state is not None:
+        claim_index = run_state.get("claim_index")
+        if claim_index is None:
+            claim_index = run_state["claim_index"] = ClaimIndex()
+
     content = _resolve_content(context)
     sources = config.get("sources")
     result = await asyncio.to_thread(
@@ -1005,6 +1101,7 @@ async def _execute_fact_check(
         sources=sources,
         provider_type=provider.config.provider_type if hasattr(provider, "config") else "openai",
         options=options,
+        claim_index=claim_index,
     )
     return {
         "overall_confidence": result.overall_confidence,
@@ -1019,6 +1116,22 @@ async def _execute_fact_check(
 # Handler registry
 # ---------------------------------------------------------------------------
 
+# Step types safe to memoize, mapped to the variables their handlers read.
+# Publishing and social steps have side effects and are never cached.
+CACHEABLE_STEP_TYPES: Dict[StepType, tuple] = {
+    StepType.RESEARCH: ("topic", "keywords"),
+    StepType.OUTLINE: ("topic", "keywords"),
+    StepType.GENERATE_BLOG: ("topic", "keywords", "tone", "brand_voice"),
+    StepType.GENERATE_BOOK: ("topic", "keywords", "tone", "brand_voice"),
+    StepType.PROOFREAD: ("topic",),
+    StepType.HUMANIZE: ("topic",),
+    StepType.SEO_OPTIMIZE: ("topic", "keywords"),
+    StepType.META_DESCRIPTION: ("topic", "keywords"),
+    StepType.STRUCTURED_DATA: ("topic",),
+    StepType.IMAGE_GENERATE: ("topic", "keywords"),
+    StepType.FACT_CHECK: ("topic",),
+}
+
 _STEP_HANDLERS: Dict[StepType, Callable] = {
     StepType.RESEARCH: _execute_research,
     StepType.OUTLINE: _execute_outline,
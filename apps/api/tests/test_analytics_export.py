@@ -0,0 +1,189 @@
+"""Tests for streaming performance / SEO exports."""
+
+import io
+import json
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.analytics import dashboard_service  # noqa: E402
+from src.analytics.dashboard_service import DashboardService  # noqa: E402
+from src.analytics.export import (  # noqa: E402
+    SEO_EXPORT_COLUMNS,
+    encode_export,
+)
+from src.analytics.neon_query import NeonQueryClient  # noqa: E402
+
+try:
+    import pyarrow  # noqa: F401
+
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+_TRACKED = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def _ranking(i):
+    return {
+        "keyword": f"kw{i}",
+        "position": i,
+        "previous_position": None,
+        "change": 0,
+        "search_volume": 100,
+        "url": "https://example.com",
+        "tracked_at": _TRACKED,
+        "last_checked_at": _TRACKED,
+    }
+
+
+async def _pages(*pages):
+    for page in pages:
+        yield page
+
+
+async def _collect(chunks):
+    return b"".join([chunk async for chunk in chunks])
+
+
+class _RangeQuery:
+    """Minimal query builder serving ``rows`` through .range() pages."""
+
+    def __init__(self, rows, calls):
+        self.rows = rows
+        self.calls = calls
+        self.bounds = (0, len(rows) - 1)
+
+    def select(self, columns):
+        return self
+
+    def gte(self, column, value):
+        return self
+
+    def order(self, column, desc=False):
+        return self
+
+    def eq(self, column, value):
+        return self
+
+    def range(self, start, end):
+        self.bounds = (start, end)
+        return self
+
+    async def execute(self):
+        self.calls.append(self.bounds)
+        start, end = self.bounds
+        return SimpleNamespace(data=self.rows[start:end + 1])
+
+
+class _RangeClient:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = []
+
+    def table(self, name):
+        return _RangeQuery(self.rows, self.calls)
+
+
+class TestEncodeExport(unittest.IsolatedAsyncioTestCase):
+    async def test_csv_header_arrives_before_first_page(self):
+        async def never():
+            raise AssertionError("page fetched before header was sent")
+            yield  # pragma: no cover
+
+        chunks = encode_export("csv", never(), SEO_EXPORT_COLUMNS)
+        header = await chunks.__anext__()
+        self.assertEqual(header.decode().strip(), ",".join(n for n, _ in SEO_EXPORT_COLUMNS))
+        await chunks.aclose()
+
+    async def test_csv_one_chunk_per_page(self):
+        chunks = [
+            c async for c in encode_export(
+                "csv", _pages([_ranking(1), _ranking(2)], [_ranking(3)]), SEO_EXPORT_COLUMNS
+            )
+        ]
+        self.assertEqual(len(chunks), 3)
+        lines = b"".join(chunks).decode().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertIn("2026-03-01T12:00:00+00:00", lines[1])
+
+    async def test_ndjson_serializes_decimals_and_datetimes(self):
+        row = dict(_ranking(1), position=Decimal("3"))
+        data = await _collect(encode_export("ndjson", _pages([row]), SEO_EXPORT_COLUMNS))
+        parsed = json.loads(data.decode())
+        self.assertEqual(parsed["position"], 3.0)
+        self.assertEqual(parsed["tracked_at"], "2026-03-01T12:00:00+00:00")
+
+    def test_unknown_format_rejected_eagerly(self):
+        with self.assertRaises(ValueError):
+            encode_export("xlsx", _pages(), SEO_EXPORT_COLUMNS)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    async def test_parquet_row_group_per_page(self):
+        import pyarrow.parquet as pq
+
+        data = await _collect(
+            encode_export(
+                "parquet",
+                _pages(
+                    [_ranking(1), _ranking(2)],
+                    [dict(_ranking(3), tracked_at="2026-03-01T12:00:00Z")],
+                ),
+                SEO_EXPORT_COLUMNS,
+            )
+        )
+        parquet = pq.ParquetFile(io.BytesIO(data))
+        self.assertEqual(parquet.metadata.num_row_groups, 2)
+        table = parquet.read()
+        self.assertEqual(table.column("keyword").to_pylist(), ["kw1", "kw2", "kw3"])
+        self.assertEqual(table.column("tracked_at").to_pylist()[2], _TRACKED)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    async def test_arrow_stream_round_trip(self):
+        import pyarrow as pa
+
+        data = await _collect(encode_export("arrow", _pages([_ranking(1)]), SEO_EXPORT_COLUMNS))
+        table = pa.ipc.open_stream(data).read_all()
+        self.assertEqual(table.num_rows, 1)
+
+
+class TestDashboardStreamingExport(unittest.IsolatedAsyncioTestCase):
+    async def test_neon_reads_through_server_side_cursor(self):
+        calls = []
+
+        async def fake_fetch_pages(query, *args, page_size):
+            calls.append((query, args, page_size))
+            yield [_ranking(1)]
+
+        service = DashboardService(supabase_client=NeonQueryClient())
+        with patch.object(dashboard_service, "fetch_pages", fake_fetch_pages):
+            data = await _collect(
+                service.stream_seo_export("csv", organization_id="org-1", page_size=250)
+            )
+
+        query, args, page_size = calls[0]
+        self.assertIn("FROM seo_rankings", query)
+        self.assertIn("WHERE last_checked_at >= $1", query)
+        self.assertIn("ORDER BY last_checked_at DESC", query)
+        self.assertEqual(args[1], "org-1")
+        self.assertEqual(page_size, 250)
+        self.assertEqual(len(data.decode().splitlines()), 2)
+
+    async def test_injected_client_pages_with_ranges(self):
+        client = _RangeClient([_ranking(i) for i in range(5)])
+        service = DashboardService(supabase_client=client)
+
+        data = await _collect(service.stream_seo_export("ndjson", page_size=2))
+
+        self.assertEqual(client.calls, [(0, 1), (2, 3), (4, 5)])
+        self.assertEqual(len(data.decode().splitlines()), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,187 @@
+"""Tests for the buffered analytics event ingestion pipeline."""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.analytics.ingestion import (  # noqa: E402
+    EventIngestionPipeline,
+    aggregate_events,
+    clean_event,
+)
+from src.types.performance import MetricType, PerformanceEvent  # noqa: E402
+
+
+def _event(content_id="c1", kind=MetricType.VIEW, **kwargs):
+    return PerformanceEvent(event_type=kind, content_id=content_id, **kwargs)
+
+
+class _RecordingWriter:
+    def __init__(self, fail_times=0):
+        self.batches = []
+        self.fail_times = fail_times
+
+    async def __call__(self, batch):
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("db down")
+        self.batches.append(list(batch))
+
+
+class TestAggregateEvents(unittest.TestCase):
+    def test_counts_grouped_per_content(self):
+        totals = aggregate_events([
+            _event("a"),
+            _event("a"),
+            _event("a", MetricType.UNIQUE_VIEW),
+            _event("a", MetricType.SHARE, platform="twitter"),
+            _event("a", MetricType.SHARE, platform="twitter"),
+            _event("a", MetricType.SHARE),
+            _event("b", MetricType.CONVERSION, metadata={"revenue": 9.5}),
+            _event("b", MetricType.TIME_ON_PAGE, value=30),
+        ])
+        self.assertEqual(set(totals), {"a", "b"})
+        self.assertEqual(totals["a"]["views"], 2)
+        self.assertEqual(totals["a"]["unique_views"], 1)
+        self.assertEqual(totals["a"]["shares"], 3)
+        self.assertEqual(totals["a"]["shares_by_platform"], {"twitter": 2, "unknown": 1})
+        self.assertEqual(totals["b"]["conversions"], 1)
+        self.assertEqual(totals["b"]["revenue"], 9.5)
+        self.assertEqual(totals["b"]["views"], 0)
+
+
+class TestCleanEvent(unittest.TestCase):
+    def test_invalid_fields_coerced(self):
+        event = clean_event(_event(
+            kind=MetricType.CONVERSION,
+            ip_address="not-an-ip",
+            metadata={"revenue": "12.5", "content_type": "podcast", "title": 42},
+        ))
+        self.assertIsNone(event.ip_address)
+        self.assertEqual(
+            event.metadata, {"revenue": 12.5, "content_type": "blog", "title": "42"}
+        )
+        self.assertEqual(aggregate_events([event])["c1"]["revenue"], 12.5)
+
+    def test_unusable_revenue_removed(self):
+        for revenue in ("free", "-3", "nan", None):
+            event = clean_event(_event(kind=MetricType.CONVERSION, metadata={"revenue": revenue}))
+            self.assertNotIn("revenue", event.metadata)
+
+    def test_valid_fields_kept(self):
+        event = clean_event(_event(
+            ip_address=" 203.0.113.7 ", metadata={"content_type": "video", "revenue": 3}
+        ))
+        self.assertEqual(event.ip_address, "203.0.113.7")
+        self.assertEqual(event.metadata, {"content_type": "video", "revenue": 3.0})
+
+    def test_unstorable_value_rejected(self):
+        self.assertIsNone(clean_event(_event(value=float("inf"))))
+        self.assertIsNone(clean_event(_event(value="abc")))
+
+
+class _RejectingWriter(_RecordingWriter):
+    """Rejects any batch containing an event for content "bad"."""
+
+    async def __call__(self, batch):
+        if any(e.content_id == "bad" for e in batch):
+            raise RuntimeError("check constraint violated")
+        self.batches.append(list(batch))
+
+
+class TestEventIngestionPipeline(unittest.IsolatedAsyncioTestCase):
+    async def test_flush_writes_in_batches(self):
+        writer = _RecordingWriter()
+        pipeline = EventIngestionPipeline(batch_size=4, flush_interval=60, writer=writer)
+        for _ in range(10):
+            pipeline.enqueue(_event())
+        await pipeline.stop()
+        self.assertEqual([len(b) for b in writer.batches], [4, 4, 2])
+        stats = pipeline.stats()
+        self.assertEqual((stats["enqueued"], stats["written"], stats["buffered"]), (10, 10, 0))
+
+    async def test_background_flush_on_interval(self):
+        writer = _RecordingWriter()
+        pipeline = EventIngestionPipeline(batch_size=100, flush_interval=0.01, writer=writer)
+        pipeline.enqueue(_event())
+        for _ in range(100):
+            if writer.batches:
+                break
+            await asyncio.sleep(0.01)
+        await pipeline.stop()
+        self.assertEqual(sum(len(b) for b in writer.batches), 1)
+
+    async def test_full_buffer_drops_oldest(self):
+        writer = _RecordingWriter()
+        pipeline = EventIngestionPipeline(capacity=3, batch_size=100, flush_interval=60, writer=writer)
+        for i in range(5):
+            pipeline.enqueue(_event(f"c{i}"))
+        await pipeline.stop()
+        self.assertEqual([e.content_id for e in writer.batches[0]], ["c2", "c3", "c4"])
+        self.assertEqual(pipeline.stats()["dropped"], 2)
+
+    async def test_failed_batch_retried_once(self):
+        writer = _RecordingWriter(fail_times=1)
+        pipeline = EventIngestionPipeline(batch_size=10, flush_interval=60, writer=writer)
+        pipeline.enqueue(_event())
+        self.assertEqual(await pipeline.flush(), 0)
+        self.assertEqual(await pipeline.flush(), 1)
+        await pipeline.stop()
+        self.assertEqual(pipeline.stats()["failed"], 0)
+
+    async def test_batch_dropped_after_second_failure(self):
+        writer = _RecordingWriter(fail_times=2)
+        pipeline = EventIngestionPipeline(batch_size=10, flush_interval=60, writer=writer)
+        pipeline.enqueue(_event())
+        await pipeline.flush()
+        await pipeline.flush()
+        await pipeline.stop()
+        self.assertEqual(pipeline.stats()["failed"], 1)
+        self.assertEqual(writer.batches, [])
+
+
+    async def test_rejected_event_isolated_after_retry(self):
+        writer = _RejectingWriter()
+        pipeline = EventIngestionPipeline(batch_size=10, flush_interval=60, writer=writer)
+        for content_id in ("c1", "c2", "bad", "c3", "c4"):
+            pipeline.enqueue(_event(content_id))
+        self.assertEqual(await pipeline.flush(), 0)
+        self.assertEqual(await pipeline.flush(), 4)
+        await pipeline.stop()
+
+        written = sorted(e.content_id for batch in writer.batches for e in batch)
+        self.assertEqual(written, ["c1", "c2", "c3", "c4"])
+        self.assertEqual(pipeline.stats()["failed"], 1)
+
+    async def test_invalid_event_not_buffered(self):
+        writer = _RecordingWriter()
+        pipeline = EventIngestionPipeline(batch_size=10, flush_interval=60, writer=writer)
+        pipeline.enqueue(_event(value=float("nan")))
+        pipeline.enqueue(_event())
+        self.assertEqual(await pipeline.flush(), 1)
+        await pipeline.stop()
+        self.assertEqual(pipeline.stats()["failed"], 1)
+
+
+class TestPerformanceServiceBuffering(unittest.IsolatedAsyncioTestCase):
+    async def test_track_event_enqueues_on_neon(self):
+        from src.analytics import ingestion
+        from src.analytics.neon_query import NeonQueryClient
+        from src.analytics.performance_service import PerformanceService
+
+        writer = _RecordingWriter()
+        pipeline = EventIngestionPipeline(batch_size=100, flush_interval=60, writer=writer)
+        service = PerformanceService(supabase_client=NeonQueryClient())
+        with patch.object(ingestion, "_pipeline", pipeline):
+            self.assertTrue(await service.track_view("c1"))
+            self.assertEqual(writer.batches, [])  # acknowledged before any write
+            await pipeline.stop()
+        self.assertEqual(len(writer.batches[0]), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -49,6 +49,7 @@ class AnalyticsNeonBase(unittest.IsolatedAsyncioTestCase):
         await self._cleanup()
 
     async def asyncTearDown(self):
+        await self._flush()
         await self._cleanup()
         from src.db import close_pool
 
@@ -58,6 +59,12 @@ class AnalyticsNeonBase(unittest.IsolatedAsyncioTestCase):
         else:
             os.environ["DATABASE_URL"] = self._saved
 
+    async def _flush(self):
+        # Events are written by the buffered ingestion pipeline in batches.
+        from src.analytics.ingestion import get_ingestion_pipeline
+
+        await get_ingestion_pipeline().flush()
+
     async def _cleanup(self):
         # Only these tables key off content_id; content_recommendations uses a
         # based_on text[] instead, and the tests don't write it.
@@ -84,12 +91,14 @@ class TestPerformanceServiceNeon(AnalyticsNeonBase):
                 )
             )
         )
+        await self._flush()
         perf1 = await svc.get_content_performance(self.cid)
         self.assertIsNotNone(perf1)
         self.assertGreater(perf1.views, 0)
         await svc.track_event(
             PerformanceEvent(content_id=self.cid, event_type=MetricType.VIEW, value=1)
         )
+        await self._flush()
         perf2 = await svc.get_content_performance(self.cid)
         self.assertGreater(perf2.views, perf1.views)  # accumulates
 
@@ -105,6 +114,7 @@ class TestPerformanceServiceNeon(AnalyticsNeonBase):
         await svc.track_event(
             PerformanceEvent(content_id=self.cid, event_type=MetricType.VIEW, value=1)
         )
+        await self._flush()
         snap = await svc.create_daily_snapshot(self.cid)
         self.assertIsNotNone(snap)
         summary = await svc.get_performance_summary(
@@ -153,6 +163,7 @@ class TestDashboardAndRecommendationsNeon(AnalyticsNeonBase):
         await ps.track_event(
             PerformanceEvent(content_id=self.cid, event_type=MetricType.VIEW, value=1)
         )
+        await self._flush()
 
         dashboard = await DashboardService().get_dashboard_data(
             time_range=PerformanceTimeRange.WEEK
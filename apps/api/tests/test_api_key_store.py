@@ -0,0 +1,165 @@
+"""Tests for indexed API key lookup, legacy import and the verified-key cache."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import bcrypt  # noqa: E402
+
+from app.auth import api_key as auth_module  # noqa: E402
+from app.auth.api_key import APIKeyStore, parse_key_id  # noqa: E402
+
+
+class TestKeyFormat(unittest.TestCase):
+    def test_parse_key_id(self):
+        self.assertEqual(parse_key_id("bai_0123456789ab_secret"), "0123456789ab")
+        self.assertIsNone(parse_key_id("bai_0123456789ab_"))
+        self.assertIsNone(parse_key_id("bai_not-hex-id!!_secret"))
+        self.assertIsNone(parse_key_id("some-legacy-key"))
+
+
+class TestIndexedVerification(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "api_keys.db")
+        # Cheap hashes keep the test fast; cost factor is irrelevant here.
+        rounds = patch.object(APIKeyStore, "BCRYPT_ROUNDS", 4)
+        rounds.start()
+        self.addCleanup(rounds.stop)
+        self.store = APIKeyStore(storage_path=self.path)
+
+    def tearDown(self):
+        self.store._conn.close()
+        self.tmp.cleanup()
+
+    def test_valid_key_costs_one_bcrypt_check(self):
+        keys = {f"user-{i}": self.store.create_key(f"user-{i}") for i in range(5)}
+        self.assertEqual(parse_key_id(keys["user-3"]), keys["user-3"][4:16])
+
+        with patch.object(auth_module.bcrypt, "checkpw", wraps=bcrypt.checkpw) as checkpw:
+            self.assertEqual(self.store.verify_key(keys["user-3"]), "user-3")
+        self.assertEqual(checkpw.call_count, 1)
+
+    def test_unknown_key_id_skips_bcrypt(self):
+        for i in range(5):
+            self.store.create_key(f"user-{i}")
+
+        with patch.object(auth_module.bcrypt, "checkpw") as checkpw:
+            self.assertIsNone(self.store.verify_key("bai_ffffffffffff_guess"))
+            self.assertIsNone(self.store.verify_key("no-prefix-guess"))
+        checkpw.assert_not_called()
+
+    def test_repeat_verification_served_from_cache(self):
+        key = self.store.create_key("user-1")
+        self.store.verify_key(key)
+
+        with patch.object(auth_module.bcrypt, "checkpw") as checkpw:
+            self.assertEqual(self.store.verify_key(key), "user-1")
+        checkpw.assert_not_called()
+        self.assertEqual(self.store.cache_stats()["verified_keys"], 1)
+
+    def test_cache_does_not_outlive_revocation_or_rotation(self):
+        key = self.store.create_key("user-1")
+        self.store.verify_key(key)
+        self.store.create_key("user-1")
+        self.assertIsNone(self.store.verify_key(key))
+
+        key = self.store.create_key("user-2")
+        self.store.verify_key(key)
+        self.store.revoke_key("user-2")
+        self.assertIsNone(self.store.verify_key(key))
+
+    def test_cache_is_bounded(self):
+        self.store.verify_cache_size = 2
+        keys = [self.store.create_key(f"user-{i}") for i in range(3)]
+        for key in keys:
+            self.store.verify_key(key)
+        self.assertEqual(self.store.cache_stats()["verified_keys"], 2)
+
+    def test_cache_entries_expire(self):
+        self.store.verify_cache_ttl = 0
+        key = self.store.create_key("user-1")
+        self.store.verify_key(key)
+
+        with patch.object(auth_module.bcrypt, "checkpw", wraps=bcrypt.checkpw) as checkpw:
+            self.assertEqual(self.store.verify_key(key), "user-1")
+        self.assertEqual(checkpw.call_count, 1)
+
+
+class TestLegacyJsonImport(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.json_path = os.path.join(self.tmp.name, "api_keys.json")
+        self.legacy_key = "legacy-plain-key"
+        with open(self.json_path, "w") as f:
+            json.dump({
+                "old-user": bcrypt.hashpw(
+                    self.legacy_key.encode(), bcrypt.gensalt(rounds=4)
+                ).decode(),
+                "sha-user": "a" * 64,
+            }, f)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_json_next_to_database_is_imported_once(self):
+        store = APIKeyStore(storage_path=os.path.join(self.tmp.name, "api_keys.db"))
+
+        self.assertEqual(store.verify_key(self.legacy_key), "old-user")
+        self.assertTrue(store.has_legacy_hash("sha-user"))
+        self.assertEqual(store.cache_stats()["unindexed_keys"], 1)
+        self.assertFalse(os.path.exists(self.json_path))
+        self.assertTrue(os.path.exists(self.json_path + ".bak"))
+        store._conn.close()
+
+    def test_json_at_storage_path_is_converted_in_place(self):
+        store = APIKeyStore(storage_path=self.json_path)
+        self.assertEqual(store.verify_key(self.legacy_key), "old-user")
+        store._conn.close()
+
+        reopened = APIKeyStore(storage_path=self.json_path)
+        self.assertTrue(reopened.user_has_key("old-user"))
+        reopened._conn.close()
+
+    def test_failed_unindexed_lookup_is_remembered(self):
+        store = APIKeyStore(storage_path=os.path.join(self.tmp.name, "api_keys.db"))
+
+        with patch.object(auth_module.bcrypt, "checkpw", wraps=bcrypt.checkpw) as checkpw:
+            self.assertIsNone(store.verify_key("made-up-key"))
+            self.assertIsNone(store.verify_key("made-up-key"))
+        self.assertEqual(checkpw.call_count, 1)
+        self.assertEqual(store.cache_stats()["rejected_keys"], 1)
+
+        store.rejected_cache_size = 1
+        store.verify_key("another-made-up-key")
+        self.assertEqual(store.cache_stats()["rejected_keys"], 1)
+        self.assertEqual(store.verify_key(self.legacy_key), "old-user")
+        store._conn.close()
+
+    def test_legacy_scan_can_be_switched_off(self):
+        from datetime import datetime, timedelta, timezone
+
+        db_path = os.path.join(self.tmp.name, "api_keys.db")
+        APIKeyStore(storage_path=db_path)._conn.close()
+        past = datetime.now(timezone.utc) - timedelta(days=1)
+        for kwargs in ({"legacy_scan": False}, {"legacy_scan_until": past}):
+            store = APIKeyStore(storage_path=db_path, **kwargs)
+            with patch.object(auth_module.bcrypt, "checkpw") as checkpw:
+                self.assertIsNone(store.verify_key(self.legacy_key))
+            checkpw.assert_not_called()
+            self.assertFalse(store.cache_stats()["legacy_scan"])
+            store._conn.close()
+
+        with patch.dict(os.environ, {"API_KEY_LEGACY_SCAN_UNTIL": "2999-01-01"}):
+            store = APIKeyStore(storage_path=db_path)
+        self.assertEqual(store.verify_key(self.legacy_key), "old-user")
+        store._conn.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,237 @@
+"""Tests for batched audit logging, spill/replay and SQL-backed statistics."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.organizations.audit_buffer import AuditLogBuffer  # noqa: E402
+from src.organizations.audit_service import AuditService, AuditStatistics  # noqa: E402
+
+
+class _RPC:
+    def __init__(self, client, name, params):
+        self.client = client
+        self.name = name
+        self.params = params
+
+    async def execute(self):
+        self.client.calls.append((self.name, self.params))
+        if self.client.down:
+            raise ConnectionError("database unavailable")
+        if self.name == "log_audit_events":
+            if any(row.get("action") == "bad" for row in self.params["p_events"]):
+                raise ValueError("new row violates check constraint")
+            for row in self.params["p_events"]:
+                self.client.rows.setdefault(row["id"], row)
+            return SimpleNamespace(data=len(self.params["p_events"]))
+        return SimpleNamespace(data=self.client.responses.get(self.name))
+
+
+class _Client:
+    def __init__(self, responses=None):
+        self.rows = {}
+        self.calls = []
+        self.down = False
+        self.responses = responses or {}
+
+    def rpc(self, name, params):
+        return _RPC(self, name, params)
+
+
+class TestAuditBuffer(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.spill_path = os.path.join(self.tmp.name, "audit_spill.jsonl")
+        self.client = _Client()
+        self.service = AuditService(self.client, buffered=True)
+        self.service.buffer = AuditLogBuffer(
+            writer=self.service._write_batch,
+            batch_size=2,
+            flush_interval=60,
+            spill_path=self.spill_path,
+        )
+
+    async def asyncTearDown(self):
+        await self.service.close()
+        self.tmp.cleanup()
+
+    async def test_log_queues_and_flushes_in_batches(self):
+        ids = [
+            await self.service.log("content.create", "content", user_id=f"u{i}")
+            for i in range(5)
+        ]
+        self.assertEqual(self.client.calls, [])
+
+        await self.service.flush()
+
+        batches = [
+            params["p_events"] for name, params in self.client.calls
+            if name == "log_audit_events"
+        ]
+        self.assertEqual([len(b) for b in batches], [2, 2, 1])
+        self.assertEqual(list(self.client.rows), ids)
+
+    async def test_stats_partitions_ensured_once_a_day(self):
+        for i in range(5):
+            await self.service.log("content.create", "content", user_id=f"u{i}")
+        await self.service.flush()
+        await self.service.log("content.update", "content", user_id="u1")
+        await self.service.flush()
+
+        names = [name for name, _ in self.client.calls]
+        self.assertEqual(names.count("ensure_audit_stats_partitions"), 1)
+        self.assertEqual(names.index("ensure_audit_stats_partitions"), 1)
+
+    async def test_sensitive_fields_redacted_before_queueing(self):
+        await self.service.log(
+            "member.update", "member",
+            metadata={"stripe_api_key": "k", "nested": {"password": "p", "ok": 1}},
+        )
+        await self.service.flush()
+        row = next(iter(self.client.rows.values()))
+        self.assertEqual(row["metadata"], {"stripe_api_key": "[REDACTED]", "nested": {
+            "password": "[REDACTED]", "ok": 1,
+        }})
+
+    async def test_outage_spills_then_replays_without_loss(self):
+        self.client.down = True
+        ids = [await self.service.log("content.delete", "content") for _ in range(3)]
+        await self.service.flush()
+
+        self.assertTrue(os.path.exists(self.spill_path))
+        self.assertEqual(self.service.buffer.stats()["spilled"], 3)
+        self.assertEqual(self.client.rows, {})
+
+        self.client.down = False
+        later = await self.service.log("content.create", "content")
+        await self.service.flush()
+
+        self.assertEqual(list(self.client.rows), ids + [later])
+        self.assertFalse(os.path.exists(self.spill_path))
+        self.assertFalse(self.service.buffer.stats()["spill_pending"])
+
+    async def test_failed_replay_is_retried_idempotently(self):
+        buffer = self.service.buffer
+        buffer._append_spill([{"id": "a"}, {"id": "b"}, {"id": "c"}])
+
+        # First batch lands, then the database goes away mid-replay.
+        writes = []
+
+        async def flaky(batch):
+            writes.append(batch)
+            if len(writes) >= 2:
+                raise ConnectionError("database unavailable")
+            await self.service._write_batch(batch)
+
+        buffer._writer = flaky
+        await buffer.flush()
+        self.assertTrue(os.path.exists(buffer.replay_path))
+
+        buffer._writer = self.service._write_batch
+        await buffer.flush()
+        self.assertEqual(sorted(self.client.rows), ["a", "b", "c"])
+        self.assertFalse(os.path.exists(buffer.replay_path))
+
+    async def test_full_buffer_spills_instead_of_dropping(self):
+        self.service.buffer.capacity = 1
+        await self.service.log("a", "content")
+        await self.service.log("b", "content")
+        self.assertEqual(self.service.buffer.stats()["spilled"], 1)
+
+        await self.service.flush()
+        self.assertEqual(
+            sorted(r["action"] for r in self.client.rows.values()), ["a", "b"]
+        )
+
+    async def test_rejected_row_dead_lettered_without_blocking(self):
+        buffer = self.service.buffer
+        buffer.batch_size = 4
+        # A spill file from before the fix, holding a row the database rejects.
+        buffer._append_spill([{"id": "a", "action": "bad"}, {"id": "b", "action": "ok"}])
+        ids = [await self.service.log("content.create", "content") for _ in range(3)]
+        buffer._buffer.append({"id": "c", "action": "bad"})
+
+        await self.service.flush()
+
+        self.assertEqual(sorted(self.client.rows), sorted(ids + ["b"]))
+        stats = buffer.stats()
+        self.assertEqual(stats["rejected"], 2)
+        self.assertFalse(stats["spill_pending"])
+        self.assertFalse(os.path.exists(buffer.replay_path))
+        with open(buffer.dead_letter_path) as f:
+            rejected = [json.loads(line) for line in f]
+        self.assertEqual([r["row"]["id"] for r in rejected], ["a", "c"])
+        self.assertIn("check constraint", rejected[0]["error"])
+
+        later = await self.service.log("content.update", "content")
+        await self.service.flush()
+        self.assertIn(later, self.client.rows)
+
+    async def test_untrusted_values_fit_columns_before_queueing(self):
+        for ip in ("not-an-ip", "fe80::1%eth0", "203.0.113.7"):
+            await self.service.log(
+                "x" * 150, "content", request_context={"ip_address": ip},
+            )
+        self.assertIsNone(await self.service.log("", "content"))
+        await self.service.flush()
+
+        rows = list(self.client.rows.values())
+        self.assertEqual([r["ip_address"] for r in rows], [None, None, "203.0.113.7"])
+        self.assertTrue(all(len(r["action"]) == 100 for r in rows))
+
+
+class TestUnbufferedLog(unittest.IsolatedAsyncioTestCase):
+    async def test_writes_single_entry_synchronously(self):
+        client = _Client({"log_audit_event": "log-1"})
+        service = AuditService(client, buffered=False)
+
+        log_id = await service.log("content.create", "content", user_id="u1")
+
+        self.assertEqual(log_id, "log-1")
+        self.assertEqual(client.calls[0][0], "log_audit_event")
+
+
+class TestAuditStatistics(unittest.IsolatedAsyncioTestCase):
+    async def test_activity_summary_uses_sql_aggregation(self):
+        client = _Client({"audit_activity_summary": {
+            "total_events": 4,
+            "success_count": 3,
+            "failure_count": 1,
+            "action_breakdown": {"content.create": 4},
+            "user_activity": {"u1": 4},
+            "resource_breakdown": {"content": 4},
+        }})
+        stats = AuditStatistics(AuditService(client, buffered=False))
+
+        summary = await stats.get_activity_summary("org-1", days=7)
+
+        self.assertEqual(client.calls, [
+            ("audit_activity_summary", {"p_organization_id": "org-1", "p_days": 7}),
+        ])
+        self.assertEqual(summary["success_rate"], 75)
+        self.assertEqual(summary["action_breakdown"], {"content.create": 4})
+        self.assertEqual(summary["period_days"], 7)
+
+    async def test_security_summary_uses_sql_aggregation(self):
+        client = _Client({"audit_security_summary": {
+            "total_security_events": 5,
+            "login_failures": 3,
+            "permission_denials": 1,
+            "suspicious_ips": {"10.0.0.1": 3},
+        }})
+        stats = AuditStatistics(AuditService(client, buffered=False))
+
+        summary = await stats.get_security_summary("org-1")
+
+        self.assertEqual(summary["login_failures"], 3)
+        self.assertEqual(summary["suspicious_ips"], {"10.0.0.1": 3})
+        self.assertIn("login.failure", client.calls[0][1]["p_actions"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,142 @@
+"""Tests for request-scoped and short-TTL authorization caching."""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from starlette.datastructures import State  # noqa: E402
+
+from src.organizations import AuthorizationContext, OrganizationService  # noqa: E402
+from src.organizations.authz_cache import (  # noqa: E402
+    AuthorizationCache,
+    get_authorization_timings,
+    resolve_principal,
+)
+from src.types.organization import (  # noqa: E402
+    Organization,
+    OrganizationMember,
+    OrganizationRole,
+)
+
+NOW = datetime.now(timezone.utc)
+
+
+def _org(usage=0):
+    return Organization(
+        id="org-1",
+        name="Cache Org",
+        slug="cache-org",
+        monthly_generation_limit=100,
+        current_month_usage=usage,
+        quota_reset_date=NOW,
+        created_at=NOW,
+        updated_at=NOW,
+        created_by="owner",
+    )
+
+
+def _service(role=OrganizationRole.EDITOR, ttl=60):
+    db = MagicMock()
+    db.table.return_value.update.return_value.eq.return_value.execute = AsyncMock()
+    service = OrganizationService(db)
+    service.authorization_cache = AuthorizationCache(ttl_seconds=ttl)
+    service.get_organization = AsyncMock(return_value=_org())
+    service.get_member_role = AsyncMock(return_value=role)
+    return service
+
+
+def _request():
+    return SimpleNamespace(state=State())
+
+
+class TestResolvePrincipal(unittest.IsolatedAsyncioTestCase):
+    async def test_repeated_principal_served_from_cache(self):
+        service = _service()
+        before = get_authorization_timings()["cache_hits"]
+
+        first = await resolve_principal(service, "org-1", "u1")
+        second = await resolve_principal(service, "org-1", "u1")
+
+        self.assertEqual(service.get_organization.await_count, 1)
+        self.assertEqual(service.get_member_role.await_count, 1)
+        self.assertIs(second.context, first.context)
+        self.assertEqual(second.context.role, OrganizationRole.EDITOR)
+        self.assertEqual(get_authorization_timings()["cache_hits"], before + 1)
+
+    async def test_request_memo_shared_by_nested_dependencies(self):
+        service = _service(ttl=0)  # process cache disabled
+        request = _request()
+
+        await resolve_principal(service, "org-1", "u1", request)
+        await resolve_principal(service, "org-1", "u1", request)
+        await resolve_principal(service, "org-1", "u1", _request())
+
+        self.assertEqual(service.get_member_role.await_count, 2)
+
+    async def test_non_members_resolve_without_role(self):
+        service = _service(role=None)
+        principal = await resolve_principal(service, "org-1", "stranger")
+        self.assertFalse(principal.context.is_org_member)
+
+    async def test_mocked_service_without_cache_is_not_cached(self):
+        service = AsyncMock()
+        service.get_organization.return_value = _org()
+        service.get_member_role.return_value = OrganizationRole.VIEWER
+
+        await resolve_principal(service, "org-1", "u1")
+        await resolve_principal(service, "org-1", "u1")
+
+        self.assertEqual(service.get_member_role.await_count, 2)
+
+
+class TestInvalidation(unittest.IsolatedAsyncioTestCase):
+    async def test_role_change_invalidates_principal(self):
+        service = _service()
+        await resolve_principal(service, "org-1", "u1")
+
+        service.get_member = AsyncMock(return_value=OrganizationMember(
+            id="m1", user_id="u1", organization_id="org-1",
+            role=OrganizationRole.EDITOR, created_at=NOW, updated_at=NOW,
+        ))
+        owner = AuthorizationContext("owner", "org-1", OrganizationRole.OWNER, True)
+        await service.update_member_role("org-1", "u1", OrganizationRole.VIEWER, owner)
+
+        service.get_member_role.return_value = OrganizationRole.VIEWER
+        principal = await resolve_principal(service, "org-1", "u1")
+
+        self.assertEqual(principal.context.role, OrganizationRole.VIEWER)
+        self.assertEqual(service.get_organization.await_count, 1)
+
+    def test_invalidate_organization_drops_its_principals(self):
+        cache = AuthorizationCache(ttl_seconds=60)
+        cache.set_organization("org-1", _org())
+        cache.set_context("org-1", "u1", AuthorizationContext("u1", "org-1"))
+        cache.set_context("org-2", "u1", AuthorizationContext("u1", "org-2"))
+
+        cache.invalidate_organization("org-1")
+
+        self.assertIsNone(cache.get_organization("org-1"))
+        self.assertIsNone(cache.get_context("org-1", "u1"))
+        self.assertIsNotNone(cache.get_context("org-2", "u1"))
+
+    def test_usage_updated_in_place(self):
+        cache = AuthorizationCache(ttl_seconds=60)
+        cache.set_organization("org-1", _org(usage=5))
+        cache.update_usage("org-1", 6)
+        self.assertEqual(cache.get_organization("org-1").current_month_usage, 6)
+
+    def test_lru_bound(self):
+        cache = AuthorizationCache(ttl_seconds=60, max_entries=2)
+        for user in ("a", "b", "c"):
+            cache.set_context("org-1", user, AuthorizationContext(user, "org-1"))
+        self.assertIsNone(cache.get_context("org-1", "a"))
+        self.assertEqual(cache.stats["contexts"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
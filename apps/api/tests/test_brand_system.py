@@ -545,3 +545,190 @@ class TestEdgeCases:
             assert "strengths" in feedback
             assert "improvements" in feedback
             assert "grade" in feedback
+
+
+# =============================================================================
+# Tests for incremental training
+# =============================================================================
+
+
+def _analysis(seed: int) -> SampleAnalysis:
+    return SampleAnalysis(
+        vocabulary=VocabularyProfile(
+            common_words=["data", "cloud", f"term{seed}"],
+            unique_phrases=["data pipeline"] if seed % 2 else ["cloud native"],
+            avg_word_length=4.0 + seed * 0.3,
+            vocabulary_richness=0.4 + seed * 0.05,
+            formality_indicators=["therefore"] if seed % 2 else [],
+            casual_indicators=[] if seed % 2 else ["stuff"],
+        ),
+        sentences=SentencePatterns(
+            avg_sentence_length=12.0 + seed,
+            sentence_length_variance=4.0 + seed,
+            question_frequency=0.1 * (seed % 3),
+            opening_patterns=["We built a", f"Opening {seed}"],
+            transition_words=["however"] if seed % 2 else ["for example"],
+        ),
+        tone=ToneDistribution(professional=0.5 + seed * 0.1, friendly=0.3),
+        style=StyleMetrics(formality_score=0.2 * seed, engagement_score=0.5),
+        quality_score=0.5 + seed * 0.1,
+    )
+
+
+def _sample(seed: int):
+    from src.types.brand import VoiceSample
+
+    return VoiceSample(
+        id=f"sample-{seed}",
+        profile_id="profile-test-1",
+        content=f"Sample number {seed} about data and the cloud.",
+        is_analyzed=True,
+        analysis_result=_analysis(seed),
+    )
+
+
+def _aggregates(fingerprint: VoiceFingerprint) -> dict:
+    return fingerprint.model_dump(exclude={"id", "voice_summary", "last_trained_at"})
+
+
+@pytest.fixture
+def trainer(mock_provider):
+    from src.brand.trainer import VoiceTrainer
+
+    with patch("src.brand.trainer.create_provider_from_env", return_value=MagicMock()), \
+         patch("src.brand.trainer.generate_text", return_value="This brand voice is clear."):
+        yield VoiceTrainer()
+
+
+class TestIncrementalTraining:
+    """Tests for fingerprints maintained as sufficient statistics."""
+
+    def test_statistics_mean_and_variance(self):
+        from src.brand import fingerprint_stats
+        from src.types.brand import VoiceStatistics
+
+        stats = VoiceStatistics()
+        for seed in (1, 2, 3):
+            fingerprint_stats.add_sample(stats, f"s{seed}", _analysis(seed))
+
+        assert stats.mean("quality_score") == pytest.approx(0.7)
+        assert stats.variance("quality_score") == pytest.approx(0.02 / 3)
+        assert stats.counters["common_words"]["data"] == 3
+
+    def test_adding_sample_matches_full_rebuild(self, trainer):
+        samples = [_sample(seed) for seed in range(4)]
+        full = trainer.train("profile-test-1", samples)
+        previous = trainer.train("profile-test-1", samples[:3])
+
+        with patch.object(trainer.analyzer, "analyze") as analyze:
+            new_sample = _sample(3)
+            new_sample.analysis_result = None
+            analyze.return_value = _analysis(3)
+            incremental = trainer.train("profile-test-1", samples[:3] + [new_sample], previous)
+
+        analyze.assert_called_once()
+        assert _aggregates(incremental) == _aggregates(full)
+        assert new_sample.analysis_result == _analysis(3)
+
+    def test_removing_sample_matches_full_rebuild(self, trainer):
+        from src.brand.trainer import remove_sample_from_fingerprint
+
+        samples = [_sample(seed) for seed in range(4)]
+        trained = trainer.train("profile-test-1", samples)
+        without = trainer.train("profile-test-1", [samples[0], samples[2], samples[3]])
+
+        updated = remove_sample_from_fingerprint(trained, samples[1])
+
+        assert updated.sample_count == 3
+        assert updated.voice_summary == trained.voice_summary
+        assert _aggregates(updated) == _aggregates(without)
+        # The original fingerprint is left untouched
+        assert trained.sample_count == 4
+
+    def test_remove_untrained_or_last_sample_is_noop(self, trainer):
+        from src.brand.trainer import remove_sample_from_fingerprint
+
+        trained = trainer.train("profile-test-1", [_sample(1)])
+
+        assert remove_sample_from_fingerprint(trained, _sample(2)) is None
+        assert remove_sample_from_fingerprint(trained, _sample(1)) is None
+
+    def test_retrain_without_new_samples_skips_llm(self, trainer):
+        samples = [_sample(seed) for seed in range(3)]
+        previous = trainer.train("profile-test-1", samples)
+
+        with patch("src.brand.trainer.generate_text") as mock_gen:
+            retrained = trainer.train("profile-test-1", samples, previous)
+
+        mock_gen.assert_not_called()
+        assert retrained.voice_summary == previous.voice_summary
+        assert _aggregates(retrained) == _aggregates(previous)
+
+    def test_previous_with_missing_samples_is_rebuilt(self, trainer):
+        samples = [_sample(seed) for seed in range(3)]
+        previous = trainer.train("profile-test-1", samples)
+
+        rebuilt = trainer.train("profile-test-1", samples[1:], previous)
+
+        assert rebuilt.statistics.sample_ids == ["sample-1", "sample-2"]
+        assert _aggregates(rebuilt) == _aggregates(trainer.train("profile-test-1", samples[1:]))
+
+    def test_statistics_excluded_from_api_dump(self, trainer):
+        fingerprint = trainer.train("profile-test-1", [_sample(1)])
+
+        assert "statistics" not in fingerprint.model_dump()
+        assert fingerprint.statistics.sample_ids == ["sample-1"]
+
+
+# =============================================================================
+# Tests for the scoring fast path
+# =============================================================================
+
+
+class TestScoringFeedback:
+    """Tests for on-demand, cached LLM feedback."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        from src.utils.cache import get_voice_analysis_cache, get_voice_feedback_cache
+
+        get_voice_analysis_cache().clear()
+        get_voice_feedback_cache().clear()
+        yield
+        get_voice_analysis_cache().clear()
+        get_voice_feedback_cache().clear()
+
+    def test_fast_path_skips_feedback_llm(self, sample_content, sample_fingerprint, mock_provider):
+        with patch("src.brand.analyzer.generate_text", return_value="{}"), \
+             patch("src.brand.scorer.generate_text", return_value='{"grade": "B"}') as mock_gen:
+            scorer = VoiceScorer()
+            fast = scorer.score(sample_content, sample_fingerprint, include_feedback=False)
+            full = scorer.score(sample_content, sample_fingerprint)
+
+        assert fast.feedback == {}
+        assert fast.overall_score == full.overall_score
+        assert mock_gen.call_count == 1
+
+    def test_feedback_served_from_cache(self, sample_content, sample_fingerprint, mock_provider):
+        feedback = '{"strengths": ["Clear"], "improvements": [], "example_rewrites": [], "grade": "B"}'
+        with patch("src.brand.analyzer.generate_text", return_value="{}"), \
+             patch("src.brand.scorer.generate_text", return_value=feedback) as mock_gen:
+            scorer = VoiceScorer()
+            first = scorer.score(sample_content, sample_fingerprint, include_feedback=True)
+            again = scorer.score(sample_content, sample_fingerprint, include_feedback=True)
+            fast = scorer.score(sample_content, sample_fingerprint, include_feedback=False)
+
+        assert mock_gen.call_count == 1
+        assert first.feedback["strengths"] == ["Clear"]
+        assert again.feedback == first.feedback
+        assert fast.feedback == first.feedback
+
+    def test_fallback_feedback_not_cached(self, sample_content, sample_fingerprint, mock_provider):
+        with patch("src.brand.analyzer.generate_text", return_value="{}"), \
+             patch("src.brand.scorer.generate_text", return_value="not json") as mock_gen:
+            scorer = VoiceScorer()
+            first = scorer.score(sample_content, sample_fingerprint, include_feedback=True)
+            scorer.score(sample_content, sample_fingerprint, include_feedback=True)
+
+        assert "grade" in first.feedback
+        assert mock_gen.call_count == 2
@@ -0,0 +1,169 @@
+"""Tests for dashboard aggregation over the performance rollup tables."""
+
+import asyncio
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.analytics import dashboard_service  # noqa: E402
+from src.analytics.dashboard_service import DashboardService  # noqa: E402
+from src.analytics.ingestion import aggregate_rollups  # noqa: E402
+from src.analytics.neon_query import NeonQueryClient  # noqa: E402
+from src.types.performance import (  # noqa: E402
+    MetricType,
+    PerformanceEvent,
+    PerformanceTimeRange,
+)
+
+
+class _FakeDB:
+    """Records SQL sent through src.db.fetch/fetchrow and returns canned rows."""
+
+    def __init__(self, totals=None, content_count=0, rows=None):
+        self.queries = []
+        self.totals = totals or {}
+        self.content_count = content_count
+        self.rows = rows or []
+
+    async def fetchrow(self, query, *args):
+        self.queries.append((query, args))
+        if "content_performance" in query:
+            return {"n": self.content_count}
+        row = dict.fromkeys(
+            ("views", "unique_views", "shares", "conversions", "time_on_page_seconds",
+             "time_on_page_samples", "bounces"),
+            0,
+        )
+        row.update(self.totals)
+        return row
+
+    async def fetch(self, query, *args):
+        self.queries.append((query, args))
+        return self.rows
+
+
+class TestRollupPeriodData(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.service = DashboardService(supabase_client=NeonQueryClient())
+
+    def _patch(self, db):
+        return patch.multiple(dashboard_service, fetch=db.fetch, fetchrow=db.fetchrow)
+
+    async def test_period_totals_come_from_sql_aggregate(self):
+        db = _FakeDB(
+            totals={"views": 200, "unique_views": 50, "shares": 7, "conversions": 3,
+                    "time_on_page_seconds": 900, "time_on_page_samples": 10, "bounces": 40},
+            content_count=12,
+        )
+        with self._patch(db):
+            data = await self.service._get_period_data(PerformanceTimeRange.MONTH, "org-1", None)
+
+        self.assertEqual(data["views"], 200)
+        self.assertEqual(data["avg_time_on_page"], 90.0)
+        self.assertEqual(data["avg_bounce_rate"], 0.2)
+        self.assertEqual(data["content_count"], 12)
+
+        rollup_sql, args = next(q for q in db.queries if "performance_rollups" in q[0])
+        self.assertIn("performance_rollups_daily", rollup_sql)
+        self.assertIn("SUM(views)", rollup_sql)
+        self.assertNotIn("bucket_start <", rollup_sql)  # current period is open-ended
+        self.assertEqual(args[1], "org-1")
+        self.assertEqual((args[0].hour, args[0].minute, args[0].tzinfo), (0, 0, timezone.utc))
+
+    async def test_short_range_uses_hourly_buckets(self):
+        db = _FakeDB()
+        with self._patch(db):
+            await self.service._get_period_data(PerformanceTimeRange.DAY, None, "u1")
+        rollup_sql, args = next(q for q in db.queries if "performance_rollups" in q[0])
+        self.assertIn("performance_rollups_hourly", rollup_sql)
+        self.assertIn("user_id = $2", rollup_sql)
+
+    async def test_previous_period_ends_where_current_starts(self):
+        db = _FakeDB()
+        with self._patch(db):
+            await self.service._get_period_data(PerformanceTimeRange.WEEK, None, None)
+            await self.service._get_previous_period_data(PerformanceTimeRange.WEEK, None, None)
+        current, previous = [q for q in db.queries if "performance_rollups" in q[0]]
+        self.assertIn("bucket_start < $2", previous[0])
+        self.assertEqual(previous[1][1], current[1][0])
+
+    async def test_views_chart_grouped_by_bucket(self):
+        db = _FakeDB(rows=[
+            {"bucket_start": datetime(2026, 1, 2, tzinfo=timezone.utc), "views": 5, "unique_views": 2},
+            {"bucket_start": datetime(2026, 1, 1, tzinfo=timezone.utc), "views": 3, "unique_views": 1},
+        ])
+        with self._patch(db):
+            chart = await self.service._build_views_chart(PerformanceTimeRange.MONTH, None, None)
+        self.assertEqual(chart.labels, ["2026-01-01", "2026-01-02"])
+        self.assertEqual(chart.datasets[0]["data"], [3, 5])
+        self.assertIn("GROUP BY bucket_start", db.queries[0][0])
+
+    async def test_shares_chart_labels_blank_platform_unknown(self):
+        db = _FakeDB(rows=[{"label": "twitter", "total": 4}, {"label": "", "total": 1}])
+        with self._patch(db):
+            chart = await self.service._build_shares_chart(None, None)
+        self.assertEqual(dict(zip(chart.labels, chart.datasets[0]["data"])),
+                         {"twitter": 4, "unknown": 1})
+
+
+class TestDashboardConcurrency(unittest.IsolatedAsyncioTestCase):
+    async def test_sections_fetched_concurrently(self):
+        service = DashboardService(supabase_client=NeonQueryClient())
+        in_flight = 0
+        peak = 0
+
+        def section(result):
+            async def run(*args, **kwargs):
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return result
+            return run
+
+        empty = service._get_empty_period_data()
+        with patch.multiple(
+            service,
+            _get_period_data=section(empty),
+            _get_previous_period_data=section(empty),
+            _build_charts=section([]),
+            _get_top_content_list=section([]),
+            _get_recent_activity=section([]),
+        ):
+            data = await service.get_dashboard_data(PerformanceTimeRange.WEEK)
+
+        self.assertEqual(peak, 5)
+        self.assertEqual(len(data.metrics), 6)
+
+
+class TestAggregateRollups(unittest.TestCase):
+    def test_events_bucketed_by_hour_and_platform(self):
+        ts = datetime(2026, 3, 1, 10, 15)
+        totals = aggregate_rollups([
+            PerformanceEvent(content_id="a", event_type=MetricType.VIEW, timestamp=ts),
+            PerformanceEvent(content_id="a", event_type=MetricType.VIEW,
+                             timestamp=ts.replace(minute=59)),
+            PerformanceEvent(content_id="a", event_type=MetricType.VIEW,
+                             timestamp=ts.replace(hour=11)),
+            PerformanceEvent(content_id="a", event_type=MetricType.SHARE, timestamp=ts,
+                             platform="twitter"),
+            PerformanceEvent(content_id="a", event_type=MetricType.TIME_ON_PAGE, timestamp=ts,
+                             value=30),
+            PerformanceEvent(content_id="a", event_type=MetricType.BOUNCE, timestamp=ts),
+        ])
+        hour = datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+        self.assertEqual(totals[("a", hour, "")]["views"], 2)
+        self.assertEqual(totals[("a", hour, "")]["time_on_page"], 30.0)
+        self.assertEqual(totals[("a", hour, "")]["time_on_page_samples"], 1)
+        self.assertEqual(totals[("a", hour, "")]["bounces"], 1)
+        self.assertEqual(totals[("a", hour, "twitter")]["shares"], 1)
+        self.assertEqual(totals[("a", hour.replace(hour=11), "")]["views"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
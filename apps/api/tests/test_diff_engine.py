@@ -0,0 +1,159 @@
+"""Tests for the histogram diff engine used by version comparison."""
+
+import asyncio
+import difflib
+import os
+import random
+import sys
+import unittest
+import unittest.mock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.content import version_service  # noqa: E402
+from src.content.diff_engine import (  # noqa: E402
+    build_token_index,
+    compute_opcodes,
+    diff_hunks,
+    format_unified_diff,
+    tokenize,
+)
+from src.content.version_service import InMemoryVersionService  # noqa: E402
+from src.types.version import ChangeType, DiffGranularity  # noqa: E402
+
+
+def _apply(old, new, opcodes):
+    out = []
+    for tag, i1, i2, j1, j2 in opcodes:
+        if tag == "equal":
+            out.extend(old.tokens[i1:i2])
+        elif tag in ("replace", "insert"):
+            out.extend(new.tokens[j1:j2])
+    return "".join(out)
+
+
+def _random_pair(rng):
+    base = [rng.choice("abcdefg") + "\n" for _ in range(rng.randint(0, 80))]
+    edited = list(base)
+    for _ in range(rng.randint(0, 12)):
+        roll = rng.random()
+        if roll < 0.3 and edited:
+            edited.pop(rng.randrange(len(edited)))
+        elif roll < 0.6:
+            edited.insert(rng.randint(0, len(edited)), rng.choice("abxyz") + "\n")
+        elif edited:
+            edited[rng.randrange(len(edited))] = "changed\n"
+    return "".join(base), "".join(edited)
+
+
+class TestTokenize(unittest.TestCase):
+    def test_round_trip(self):
+        text = "Hello, world!\n\nSecond  paragraph.\nLast line"
+        for granularity in DiffGranularity:
+            self.assertEqual("".join(tokenize(text, granularity)), text)
+
+    def test_granularities(self):
+        text = "one two\n\nthree\n"
+        self.assertEqual(tokenize(text, DiffGranularity.LINE), ["one two\n", "\n", "three\n"])
+        self.assertEqual(
+            tokenize(text, DiffGranularity.WORD), ["one", " ", "two", "\n\n", "three", "\n"]
+        )
+        self.assertEqual(len(tokenize(text, DiffGranularity.PARAGRAPH)), 2)
+
+
+class TestOpcodes(unittest.TestCase):
+    def test_opcodes_reconstruct_target(self):
+        rng = random.Random(7)
+        for _ in range(200):
+            old_text, new_text = _random_pair(rng)
+            for granularity in DiffGranularity:
+                old = build_token_index(old_text, granularity)
+                new = build_token_index(new_text, granularity)
+                self.assertEqual(_apply(old, new, compute_opcodes(old, new)), new_text)
+
+    def test_unified_diff_matches_difflib_shape(self):
+        rng = random.Random(11)
+        for _ in range(100):
+            old_text, new_text = _random_pair(rng)
+            old = build_token_index(old_text, DiffGranularity.LINE)
+            new = build_token_index(new_text, DiffGranularity.LINE)
+            diff, additions, deletions = format_unified_diff(old, new, "v1", "v2")
+            reference = list(
+                difflib.unified_diff(
+                    old_text.splitlines(keepends=True),
+                    new_text.splitlines(keepends=True),
+                    "v1",
+                    "v2",
+                    lineterm="",
+                )
+            )
+            self.assertEqual(diff == "", not reference)
+            if diff:
+                self.assertTrue(diff.startswith("--- v1+++ v2@@ -"))
+            # Additions and deletions must account for the net size change.
+            net = len(new.tokens) - len(old.tokens)
+            self.assertEqual(additions - deletions, net)
+
+    def test_hunks(self):
+        old = build_token_index("a\nb\nc\n", DiffGranularity.LINE)
+        new = build_token_index("a\nB\nc\n", DiffGranularity.LINE)
+        hunks, additions, deletions = diff_hunks(old, new, context=1)
+        self.assertEqual((additions, deletions), (1, 1))
+        self.assertEqual(len(hunks), 1)
+        self.assertEqual(
+            [(line.op, line.text) for line in hunks[0].lines],
+            [("equal", "a\n"), ("delete", "b\n"), ("insert", "B\n"), ("equal", "c\n")],
+        )
+
+    def test_repetitive_document(self):
+        lines = ["\n" if i % 2 else f"line {i % 5}\n" for i in range(4000)]
+        edited = lines[:1000] + ["new\n"] + lines[1000:3000] + lines[3001:]
+        old = build_token_index("".join(lines), DiffGranularity.LINE)
+        new = build_token_index("".join(edited), DiffGranularity.LINE)
+        opcodes = compute_opcodes(old, new)
+        self.assertEqual(_apply(old, new, opcodes), "".join(edited))
+        changed = [op for op in opcodes if op[0] != "equal"]
+        self.assertLessEqual(len(changed), 2)
+
+
+class TestCompareGranularity(unittest.IsolatedAsyncioTestCase):
+    async def test_word_hunks(self):
+        svc = InMemoryVersionService()
+        await svc.create_version("c1", "The quick brown fox.\n", ChangeType.INITIAL)
+        await svc.create_version("c1", "The quick red fox.\n")
+        comparison = await svc.compare_versions(
+            "c1", 1, 2, granularity=DiffGranularity.WORD
+        )
+        self.assertEqual(comparison.granularity, DiffGranularity.WORD)
+        changed = [
+            (line.op, line.text)
+            for hunk in comparison.hunks
+            for line in hunk.lines
+            if line.op != "equal"
+        ]
+        self.assertEqual(changed, [("delete", "brown"), ("insert", "red")])
+        # Line-level counters are unaffected by the hunk granularity.
+        self.assertEqual((comparison.additions, comparison.deletions), (1, 1))
+
+    async def test_large_diff_runs_in_thread(self):
+        svc = InMemoryVersionService()
+        body = "".join(f"paragraph {i}\n" for i in range(30000))
+        await svc.create_version("big", body, ChangeType.INITIAL)
+        await svc.create_version("big", body + "tail\n")
+        calls = []
+        original = asyncio.to_thread
+
+        async def tracking_to_thread(func, *args, **kwargs):
+            calls.append(func)
+            return await original(func, *args, **kwargs)
+
+        with unittest.mock.patch.object(
+            version_service.asyncio, "to_thread", tracking_to_thread
+        ):
+            comparison = await svc.compare_versions("big", 1, 2)
+        self.assertEqual(calls, [version_service._diff_versions])
+        self.assertEqual((comparison.additions, comparison.deletions), (1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -121,3 +121,331 @@ class TestFactChecker:
 
         assert result.overall_confidence == 1.0
         assert len(result.claims) == 0
+
+
+def _verdict_json(claim_numbers, status="verified"):
+    return json.dumps([
+        {"claim": n, "status": status, "confidence": 0.8, "explanation": f"Claim {n}"}
+        for n in claim_numbers
+    ])
+
+
+def _sources(snippet="Earth facts"):
+    return [{"title": "Src", "url": "http://example.com", "snippet": snippet}]
+
+
+class TestClaimKey:
+    def test_punctuation_and_case_ignored(self):
+        from src.fact_checking.claim_validator import claim_key
+
+        assert claim_key("The Company, founded in 1998!") == "the company founded in 1998"
+        assert claim_key("COVID-19 cases rose 5-10 times") == "covid 19 cases rose 5 10 times"
+
+    def test_number_signs_and_units_kept(self):
+        from src.fact_checking.claim_validator import claim_key
+
+        assert claim_key("Profit fell -5% in 2023") == "profit fell -5% in 2023"
+        assert claim_key("Shares cost $5.50.") == "shares cost $5.50"
+        keys = {
+            claim_key(text)
+            for text in ("Margins moved 5%", "Margins moved -5%", "Margins moved 5",
+                         "Margins moved 5.5", "Margins moved $5", "Margins moved €5")
+        }
+        assert len(keys) == 6
+
+
+class TestParallelValidation:
+    def setup_method(self):
+        from src.utils.cache import get_fact_check_cache
+
+        get_fact_check_cache().clear()
+
+    @patch("src.fact_checking.claim_validator.generate_text")
+    @patch("src.fact_checking.claim_validator.create_provider_from_env")
+    def test_short_claims_batched_and_duplicates_shared(self, mock_provider, mock_generate):
+        from src.fact_checking.claim_validator import validate_claims
+
+        mock_generate.side_effect = lambda prompt, *a: _verdict_json(
+            [n for n in range(1, 4) if f"\n{n}. " in prompt]
+        )
+        claims = [
+            Claim(text="Water covers 71% of Earth."),
+            Claim(text="The Moon orbits Earth"),
+            Claim(text="water covers 71% of earth", source_section="Recap"),
+            Claim(text="Mars has two moons"),
+        ]
+
+        results = validate_claims(claims, _sources())
+
+        assert mock_generate.call_count == 1
+        assert [r.status for r in results] == [VerificationStatus.VERIFIED] * 4
+        assert results[2].claim.source_section == "Recap"
+        assert results[2].explanation == results[0].explanation
+
+    @patch("src.fact_checking.claim_validator.generate_text")
+    @patch("src.fact_checking.claim_validator.create_provider_from_env")
+    def test_recheck_only_validates_new_claims(self, mock_provider, mock_generate):
+        from src.fact_checking.claim_validator import validate_claims
+
+        mock_generate.return_value = json.dumps({"status": "verified", "confidence": 0.9})
+        first = [Claim(text="Claim A")]
+        validate_claims(first, _sources())
+        validate_claims(first + [Claim(text="Claim B")], _sources())
+        validate_claims(first, _sources("Edited sources"))
+
+        prompts = [c.args[0] for c in mock_generate.call_args_list]
+        assert len(prompts) == 3
+        assert "Claim B" in prompts[1] and "Claim A" not in prompts[1]
+        assert "Edited sources" in prompts[2]
+
+    @patch("src.fact_checking.claim_validator.generate_text")
+    @patch("src.fact_checking.claim_validator.create_provider_from_env")
+    def test_claims_missing_from_batch_retried_individually(self, mock_provider, mock_generate):
+        from src.fact_checking.claim_validator import validate_claims
+
+        single = json.dumps({"status": "contradicted", "confidence": 0.7})
+        mock_generate.side_effect = [_verdict_json([1]), single]
+
+        results = validate_claims([Claim(text="One"), Claim(text="Two")], _sources())
+
+        assert mock_generate.call_count == 2
+        assert results[0].status == VerificationStatus.VERIFIED
+        assert results[1].status == VerificationStatus.CONTRADICTED
+
+    @patch("src.fact_checking.claim_validator.generate_text")
+    @patch("src.fact_checking.claim_validator.create_provider_from_env")
+    def test_concurrency_bounded(self, mock_provider, mock_generate):
+        import asyncio
+        import threading
+        import time
+
+        from src.fact_checking.claim_validator import validate_claims_async
+
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow(prompt, *args):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+            return json.dumps({"status": "unverified", "confidence": 0.2})
+
+        mock_generate.side_effect = slow
+        claims = [Claim(text=f"Claim number {i}") for i in range(8)]
+
+        results = asyncio.run(
+            validate_claims_async(claims, _sources(), max_concurrency=3, batch_size=1)
+        )
+
+        assert len(results) == 8
+        assert mock_generate.call_count == 8
+        assert 1 < state["peak"] <= 3
+
+    @patch("src.fact_checking.claim_validator.generate_text")
+    @patch("src.fact_checking.claim_validator.create_provider_from_env")
+    def test_unparseable_verdict_not_cached(self, mock_provider, mock_generate):
+        from src.fact_checking.claim_validator import validate_claims
+
+        mock_generate.return_value = "not json"
+        validate_claims([Claim(text="Claim C")], _sources())
+        results = validate_claims([Claim(text="Claim C")], _sources())
+
+        assert mock_generate.call_count == 2
+        assert results[0].explanation == "Failed to parse verification result."
+
+
+def _batch_claims_json(prompt):
+    """One claim per document in a batch extraction prompt."""
+    numbers = [n for n in range(1, 10) if f"--- DOCUMENT {n} ---" in prompt]
+    return json.dumps({str(n): [{"text": f"Claim from document {n}"}] for n in numbers})
+
+
+class TestBatchExtraction:
+    @patch("src.fact_checking.claim_extractor.generate_text")
+    @patch("src.fact_checking.claim_extractor.create_provider_from_env")
+    def test_short_documents_share_one_call(self, mock_provider, mock_generate):
+        from src.fact_checking.claim_extractor import extract_claims_batch
+
+        mock_generate.side_effect = lambda prompt, *a: _batch_claims_json(prompt)
+
+        results = extract_claims_batch(["Doc one.", "Doc two.", "Doc three."])
+
+        assert mock_generate.call_count == 1
+        assert [[c.text for c in claims] for claims in results] == [
+            ["Claim from document 1"],
+            ["Claim from document 2"],
+            ["Claim from document 3"],
+        ]
+
+    @patch("src.fact_checking.claim_extractor.generate_text")
+    @patch("src.fact_checking.claim_extractor.create_provider_from_env")
+    def test_identical_documents_extracted_once(self, mock_provider, mock_generate):
+        from src.fact_checking.claim_extractor import extract_claims_batch
+
+        mock_generate.return_value = json.dumps([{"text": "Water covers 71% of Earth"}])
+
+        results = extract_claims_batch(["Same doc.", "Same doc."])
+
+        assert mock_generate.call_count == 1
+        assert results[0] is results[1]
+
+    @patch("src.fact_checking.claim_extractor.generate_text")
+    @patch("src.fact_checking.claim_extractor.create_provider_from_env")
+    def test_dropped_documents_extracted_individually(self, mock_provider, mock_generate):
+        from src.fact_checking.claim_extractor import extract_claims_batch
+
+        single = json.dumps([{"text": "Single claim", "claim_type": "statistic"}])
+        mock_generate.side_effect = [json.dumps({"1": []}), single]
+
+        results = extract_claims_batch(["Doc one.", "Doc two."])
+
+        assert mock_generate.call_count == 2
+        assert results[0] == []
+        assert results[1][0].claim_type == ClaimType.STATISTIC
+
+    @patch("src.fact_checking.claim_extractor.generate_text")
+    @patch("src.fact_checking.claim_extractor.create_provider_from_env")
+    def test_batches_bounded_by_characters(self, mock_provider, mock_generate):
+        import asyncio
+
+        from src.fact_checking.claim_extractor import extract_claims_batch_async
+
+        mock_generate.side_effect = lambda prompt, *a: (
+            _batch_claims_json(prompt) if "DOCUMENT" in prompt else "[]"
+        )
+        contents = [f"Document {i} " + "x" * 40 for i in range(4)]
+
+        results = asyncio.run(extract_claims_batch_async(contents, batch_chars=110))
+
+        assert len(results) == 4
+        assert mock_generate.call_count == 2
+
+
+class TestClaimIndex:
+    def setup_method(self):
+        from src.utils.cache import get_fact_check_cache
+
+        get_fact_check_cache().clear()
+
+    def test_exact_and_near_duplicates_share_a_key(self):
+        from src.fact_checking.claim_index import ClaimIndex
+
+        index = ClaimIndex(similarity=0.8)
+        a = index.canonical_key(Claim(text="The company was founded in 1998 in Seattle."))
+        b = index.canonical_key(Claim(text="the company was founded in 1998 in seattle"))
+        c = index.canonical_key(Claim(text="Company was founded in 1998 in Seattle"))
+        d = index.canonical_key(Claim(text="The companies were founded in 1998 in Seattle"))
+
+        assert a == b == c
+        assert d != a
+        assert len(index) == 2
+
+    def test_entity_and_antonym_swaps_never_merge(self):
+        from src.fact_checking.claim_index import ClaimIndex
+
+        index = ClaimIndex(similarity=0.5)
+        pairs = [
+            ("Einstein was born in Germany in the town of Ulm",
+             "Einstein was born in Austria in the town of Ulm"),
+            ("The Nile is the largest river in Africa",
+             "The Nile is the smallest river in Africa"),
+            ("Paris is the capital of France", "Lyon is the capital of France"),
+            ("The company was founded in Seattle", "The company is founded in Seattle"),
+            ("In 2016 Microsoft acquired LinkedIn for 26 billion dollars in cash",
+             "In 2016 LinkedIn acquired Microsoft for 26 billion dollars in cash"),
+        ]
+        for first, second in pairs:
+            assert index.canonical_key(Claim(text=first)) != index.canonical_key(Claim(text=second))
+
+    def test_numbers_and_negations_never_merge(self):
+        from src.fact_checking.claim_index import ClaimIndex
+
+        index = ClaimIndex(similarity=0.5)
+        keys = {
+            index.canonical_key(Claim(text="Revenue grew 20% in the last fiscal year")),
+            index.canonical_key(Claim(text="Revenue grew 30% in the last fiscal year")),
+            index.canonical_key(Claim(text="Revenue did not grow in the last fiscal year")),
+            index.canonical_key(Claim(text="Revenue grew -20% in the last fiscal year")),
+            index.canonical_key(Claim(text="Revenue grew $20 in the last fiscal year")),
+            index.canonical_key(Claim(text="Revenue grew €20 in the last fiscal year")),
+        }
+
+        assert len(keys) == 6
+
+    @patch("src.fact_checking.claim_validator.generate_text")
+    @patch("src.fact_checking.claim_validator.create_provider_from_env")
+    def test_validates_once_per_source_set(self, mock_provider, mock_generate):
+        from src.fact_checking.claim_index import ClaimIndex
+
+        mock_generate.return_value = json.dumps({"status": "verified", "confidence": 0.9})
+        index = ClaimIndex()
+        first = index.validate([Claim(text="Mars has two moons", source_section="A")], _sources())
+        second = index.validate([Claim(text="Mars has two moons.", source_section="B")], _sources())
+        index.validate([Claim(text="Mars has two moons")], _sources("Other sources"))
+
+        assert mock_generate.call_count == 2
+        assert index.validated == 2
+        assert second[0].status == first[0].status == VerificationStatus.VERIFIED
+        assert second[0].claim.source_section == "B"
+
+
+class TestCheckFactsBatch:
+    def setup_method(self):
+        from src.utils.cache import get_fact_check_cache
+
+        get_fact_check_cache().clear()
+
+    @patch("src.fact_checking.claim_validator.generate_text")
+    @patch("src.fact_checking.claim_validator.create_provider_from_env")
+    @patch("src.fact_checking.fact_checker.extract_claims_batch")
+    def test_shared_claims_validated_once(self, mock_extract, mock_provider, mock_generate):
+        from src.fact_checking.fact_checker import check_facts_batch
+
+        mock_extract.return_value = [
+            [Claim(text="Water covers 71% of Earth"), Claim(text="Mars has two moons")],
+            [Claim(text="water covers 71% of earth.")],
+            [],
+        ]
+        mock_generate.side_effect = lambda prompt, *a: _verdict_json(
+            [n for n in range(1, 4) if f"\n{n}. " in prompt]
+        )
+
+        results = check_facts_batch(["doc 1", "doc 2", "doc 3"], sources=_sources())
+
+        assert mock_generate.call_count == 1
+        assert "Mars has two moons" in mock_generate.call_args.args[0]
+        assert [len(r.claims) for r in results] == [2, 1, 0]
+        assert results[1].claims[0].claim.text == "water covers 71% of earth."
+        assert results[2].overall_confidence == 1.0
+
+
+class TestWorkflowClaimIndex:
+    async def test_fact_check_steps_share_index_within_run(self):
+        from src.workflows.workflow_engine import StepType, Workflow, WorkflowEngine, WorkflowStep
+
+        workflow = Workflow(
+            name="double check",
+            steps=[
+                WorkflowStep(id="check1", type=StepType.FACT_CHECK),
+                WorkflowStep(id="check2", type=StepType.FACT_CHECK, depends_on=["check1"]),
+            ],
+        )
+        indexes = []
+
+        def fake_check_facts(**kwargs):
+            indexes.append(kwargs["claim_index"])
+            return FactCheckResult(claims=[], overall_confidence=1.0, summary="")
+
+        engine = WorkflowEngine()
+        with patch("src.fact_checking.fact_checker.check_facts", side_effect=fake_check_facts), \
+                patch("src.workflows.workflow_engine.create_provider_from_env"):
+            await engine.execute_workflow(workflow, {"topic": "AI"})
+            await engine.execute_workflow(workflow, {"topic": "AI"})
+
+        assert len(indexes) == 4
+        assert indexes[0] is indexes[1]
+        assert indexes[2] is indexes[3]
+        assert indexes[0] is not indexes[2]
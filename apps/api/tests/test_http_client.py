@@ -0,0 +1,134 @@
+"""Tests for the shared outbound HTTP client layer."""
+
+import asyncio
+import os
+import sys
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.utils.http_client import HostPolicy, OutboundHTTPClient  # noqa: E402
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def _reply(self):
+        with self.server.lock:
+            self.server.hits += 1
+            status = self.server.statuses.pop(0) if self.server.statuses else 200
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _reply
+    do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.hits = 0
+        self.statuses = []
+
+
+class TestOutboundHTTPClient(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server = _StubServer()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/search"
+        self.client = OutboundHTTPClient(
+            HostPolicy(max_retries=2, backoff_base_seconds=0.001, backoff_max_seconds=0.01)
+        )
+
+    async def asyncTearDown(self):
+        await self.client.aclose()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_sync_requests_reuse_connection(self):
+        for _ in range(5):
+            self.assertEqual(self.client.request_sync("GET", self.url).json(), {"ok": True})
+        self.assertEqual(self.server.connections, 1)
+
+        host = OutboundHTTPClient.host_key(self.url)
+        stats = self.client.stats()[host]
+        self.assertEqual(stats["requests"], 5)
+        self.assertEqual(stats["errors"], 0)
+
+    async def test_async_requests_reuse_connection(self):
+        for _ in range(5):
+            response = await self.client.request("GET", self.url)
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.connections, 1)
+
+    async def test_clients_from_other_loops_do_not_evict_this_loops(self):
+        await self.client.request("GET", self.url)
+        # A run_sync-style call: a private loop in a worker thread.
+        worker = threading.Thread(
+            target=lambda: asyncio.run(self.client.request("GET", self.url))
+        )
+        worker.start()
+        worker.join()
+        await self.client.request("GET", self.url)
+
+        self.assertEqual(self.server.connections, 2)
+        # The worker's loop is closed, so its client is dropped on the next lookup.
+        self.client._async_client("http://127.0.0.1:1")
+        self.assertTrue(all(not loop.is_closed() for _, loop in self.client._async_clients))
+
+    def test_get_retried_on_503(self):
+        self.server.statuses = [503, 503]
+        response = self.client.request_sync("GET", self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.server.hits, 3)
+        host = OutboundHTTPClient.host_key(self.url)
+        self.assertEqual(self.client.stats()[host]["retries"], 2)
+
+    def test_retries_are_bounded(self):
+        self.server.statuses = [503, 503, 503, 503]
+        response = self.client.request_sync("GET", self.url)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.server.hits, 3)
+
+    async def test_post_not_retried_on_server_error(self):
+        self.server.statuses = [503]
+        response = await self.client.request("POST", self.url, json={"q": "x"})
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.server.hits, 1)
+
+    def test_connect_error_raises_after_retries(self):
+        import httpx
+
+        self.server.shutdown()
+        self.server.server_close()
+        with self.assertRaises(httpx.ConnectError):
+            self.client.request_sync("POST", self.url)
+        host = OutboundHTTPClient.host_key(self.url)
+        stats = self.client.stats()[host]
+        self.assertEqual((stats["requests"], stats["errors"], stats["retries"]), (1, 1, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -53,8 +53,8 @@ class TestGitHubIntegration(unittest.TestCase):
             branch="main",
         )
 
-    @patch("src.integrations.github.requests.get")
-    @patch("src.integrations.github.requests.put")
+    @patch("src.integrations.github.http_client.get_sync")
+    @patch("src.integrations.github.http_client.put_sync")
     def test_upload_file(self, mock_put, mock_get):
         """Test the upload_file function."""
         # Set up mocks
@@ -82,7 +82,7 @@ class TestGitHubIntegration(unittest.TestCase):
         mock_get.assert_called_once()
         mock_put.assert_called_once()
 
-    @patch("src.integrations.github.requests.post")
+    @patch("src.integrations.github.http_client.post_sync")
     def test_create_repository(self, mock_post):
         """Test the create_repository function."""
         # Set up mocks
@@ -103,7 +103,7 @@ class TestGitHubIntegration(unittest.TestCase):
         # Verify mocks were called
         mock_post.assert_called_once()
 
-    @patch("src.integrations.github.requests.get")
+    @patch("src.integrations.github.http_client.get_sync")
     def test_get_repositories(self, mock_get):
         """Test the get_repositories function."""
         # Set up mocks
@@ -178,8 +178,8 @@ class TestMediumIntegration(unittest.TestCase):
             publish_status="draft",
         )
 
-    @patch("src.integrations.medium.requests.get")
-    @patch("src.integrations.medium.requests.post")
+    @patch("src.integrations.medium.http_client.get_sync")
+    @patch("src.integrations.medium.http_client.post_sync")
     def test_upload_post(self, mock_post, mock_get):
         """Test the upload_post function."""
         # Set up mocks
@@ -210,7 +210,7 @@ class TestMediumIntegration(unittest.TestCase):
         mock_get.assert_called_once()
         mock_post.assert_called_once()
 
-    @patch("src.integrations.medium.requests.get")
+    @patch("src.integrations.medium.http_client.get_sync")
     def test_get_user_publications(self, mock_get):
         """Test the get_user_publications function."""
         # Set up mocks
@@ -308,7 +308,7 @@ class TestWordPressIntegration(unittest.TestCase):
             featured_media=0,
         )
 
-    @patch("src.integrations.wordpress.requests.post")
+    @patch("src.integrations.wordpress.http_client.post_sync")
     def test_upload_post(self, mock_post):
         """Test the upload_post function."""
         # Set up mocks
@@ -332,7 +332,7 @@ class TestWordPressIntegration(unittest.TestCase):
         # Verify mocks were called
         mock_post.assert_called_once()
 
-    @patch("src.integrations.wordpress.requests.get")
+    @patch("src.integrations.wordpress.http_client.get_sync")
     def test_get_categories(self, mock_get):
         """Test the get_categories function."""
         # Set up mocks
@@ -357,7 +357,7 @@ class TestWordPressIntegration(unittest.TestCase):
         # Verify mocks were called
         mock_get.assert_called_once()
 
-    @patch("src.integrations.wordpress.requests.post")
+    @patch("src.integrations.wordpress.http_client.post_sync")
     def test_create_category(self, mock_post):
         """Test the create_category function."""
         # Set up mocks
@@ -0,0 +1,147 @@
+"""Tests for the NeonQueryClient builder and the asyncpg pool helpers."""
+
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src import db  # noqa: E402
+from src.analytics import neon_query  # noqa: E402
+from src.analytics.neon_query import NeonQueryClient  # noqa: E402
+
+
+class _RecordingClient(NeonQueryClient):
+    def __init__(self):
+        self.fetched = []
+        self.executed_many = []
+
+    async def _fetch(self, sql, params):
+        self.fetched.append((sql, params))
+        return []
+
+    async def _executemany(self, sql, args):
+        self.executed_many.append((sql, args))
+
+
+class TestBulkWrites(unittest.IsolatedAsyncioTestCase):
+    async def test_small_insert_uses_multi_row_values(self):
+        client = _RecordingClient()
+        rows = [{"content_id": f"c{i}", "views": i} for i in range(3)]
+        await client.table("content_performance").insert(rows).execute()
+        sql, params = client.fetched[0]
+        self.assertIn("($5, $6)", sql)
+        self.assertIn("RETURNING *", sql)
+        self.assertEqual(len(params), 6)
+        self.assertEqual(client.executed_many, [])
+
+    async def test_large_upsert_uses_executemany(self):
+        client = _RecordingClient()
+        rows = [
+            {"content_id": f"c{i}", "snapshot_date": "2026-01-02", "views": i}
+            for i in range(neon_query.BULK_ROWS_THRESHOLD + 1)
+        ]
+        result = await (
+            client.table("performance_snapshots")
+            .upsert(rows, on_conflict="content_id")
+            .execute()
+        )
+        sql, args = client.executed_many[0]
+        self.assertIn("VALUES ($1, $2, $3)", sql)
+        self.assertIn('ON CONFLICT ("content_id") DO UPDATE', sql)
+        self.assertNotIn("RETURNING", sql)
+        self.assertEqual(len(args), len(rows))
+        self.assertEqual(args[0][1].isoformat(), "2026-01-02")  # ISO strings coerced
+        self.assertEqual(len(result.data), len(rows))
+        self.assertEqual(client.fetched, [])
+
+
+class TestAnalyticsPool(unittest.IsolatedAsyncioTestCase):
+    async def test_codec_registered_by_pool_init_hook(self):
+        get_pool = AsyncMock(return_value=None)
+        with patch.object(db, "get_pool", get_pool):
+            with self.assertRaises(RuntimeError):
+                await NeonQueryClient()._fetch("SELECT 1", [])
+        get_pool.assert_awaited_once_with(
+            neon_query.ANALYTICS_POOL, init=neon_query._init_connection
+        )
+
+        conn = AsyncMock()
+        await neon_query._init_connection(conn)
+        conn.set_type_codec.assert_awaited_once()
+        self.assertEqual(conn.set_type_codec.await_args.args, ("jsonb",))
+
+
+class TestStatementCacheSize(unittest.TestCase):
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {"DATABASE_URL_DIRECT": "postgres://db.example/x"}):
+            os.environ.pop("DATABASE_STATEMENT_CACHE_SIZE", None)
+            self.assertEqual(db.get_statement_cache_size(), 0)
+
+    def test_enabled_for_direct_url(self):
+        env = {
+            "DATABASE_STATEMENT_CACHE_SIZE": "128",
+            "DATABASE_URL_DIRECT": "postgres://u@ep-cool-1.us-east-2.aws.neon.tech/x",
+        }
+        with patch.dict(os.environ, env):
+            self.assertEqual(db.get_statement_cache_size(), 128)
+
+    def test_ignored_for_pooler_or_missing_direct_url(self):
+        pooler = "postgres://u@ep-cool-1-pooler.us-east-2.aws.neon.tech/x"
+        with patch.dict(os.environ, {"DATABASE_STATEMENT_CACHE_SIZE": "128",
+                                     "DATABASE_URL_DIRECT": pooler}):
+            self.assertEqual(db.get_statement_cache_size(), 0)
+        with patch.dict(os.environ, {"DATABASE_STATEMENT_CACHE_SIZE": "128",
+                                     "DATABASE_URL_DIRECT": ""}):
+            self.assertEqual(db.get_statement_cache_size(), 0)
+
+
+class TestAcquireStats(unittest.TestCase):
+    def test_wait_percentiles(self):
+        stats = db.AcquireStats()
+        for ms in range(1, 101):
+            stats.record(ms / 1000)
+        out = stats.to_dict()
+        self.assertEqual(out["acquires"], 100)
+        self.assertEqual(out["max_wait_ms"], 100.0)
+        self.assertEqual(out["p95_wait_ms"], 96.0)
+        self.assertAlmostEqual(out["avg_wait_ms"], 50.5)
+
+
+class _FakeAcquireContext:
+    def __init__(self, timeout):
+        self.timeout = timeout
+
+    async def __aenter__(self):
+        if self.timeout == 0:
+            raise TimeoutError
+        return "conn"
+
+    async def __aexit__(self, *exc):
+        return None
+
+    def __await__(self):
+        return self.__aenter__().__await__()
+
+
+class TestInstrumentedPool(unittest.IsolatedAsyncioTestCase):
+    async def test_times_public_acquire(self):
+        inner = AsyncMock()
+        inner.acquire = lambda timeout=None: _FakeAcquireContext(timeout)
+        pool = db.InstrumentedPool(inner)
+
+        async with pool.acquire() as conn:
+            self.assertEqual(conn, "conn")
+        conn = await pool.acquire()
+        await pool.release(conn)
+        with self.assertRaises(TimeoutError):
+            await pool.acquire(timeout=0)
+
+        inner.release.assert_awaited_once_with("conn")
+        stats = pool.acquire_stats.to_dict()
+        self.assertEqual((stats["acquires"], stats["timeouts"], stats["waiting"]), (2, 1, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
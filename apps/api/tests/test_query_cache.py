@@ -0,0 +1,132 @@
+"""Tests for the read-through query cache and analytics cache invalidation."""
+
+import asyncio
+import os
+import sys
+import unittest
+from unittest.mock import AsyncMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.analytics import ingestion  # noqa: E402
+from src.analytics.cache import invalidate_performance, performance_tags  # noqa: E402
+from src.analytics.ingestion import EventIngestionPipeline  # noqa: E402
+from src.storage import query_cache  # noqa: E402
+from src.storage.query_cache import QueryCache, read_through  # noqa: E402
+from src.types.performance import MetricType, PerformanceEvent  # noqa: E402
+
+
+class _Service:
+    def __init__(self, cacheable=True, delay=0.0):
+        self.cacheable = cacheable
+        self.delay = delay
+        self.calls = []
+
+    @read_through("test:summary", tags=performance_tags, enabled=lambda s: s.cacheable)
+    async def summary(self, time_range="week", organization_id=None, user_id=None):
+        self.calls.append((time_range, organization_id, user_id))
+        await asyncio.sleep(self.delay)
+        if time_range == "boom":
+            raise ValueError("query failed")
+        return {"range": time_range, "org": organization_id, "n": len(self.calls)}
+
+
+class QueryCacheTestBase(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.cache = QueryCache(max_entries=100, ttl_seconds=60)
+        patcher = patch.object(query_cache, "_query_cache", self.cache)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class TestReadThrough(QueryCacheTestBase):
+    async def test_repeat_calls_hit_cache_per_argument_set(self):
+        service = _Service()
+        first = await service.summary("week", organization_id="org-a")
+        again = await service.summary(organization_id="org-a")  # defaults applied
+        await service.summary("month", organization_id="org-a")
+        await service.summary("week", organization_id="org-b")
+
+        self.assertIs(first, again)
+        self.assertEqual(len(service.calls), 3)
+        self.assertEqual(self.cache.stats["hits"], 1)
+
+    async def test_cache_shared_across_service_instances(self):
+        await _Service().summary(organization_id="org-a")
+        other = _Service()
+        await other.summary(organization_id="org-a")
+        self.assertEqual(other.calls, [])
+
+    async def test_disabled_for_instance_bypasses_cache(self):
+        service = _Service(cacheable=False)
+        await service.summary()
+        await service.summary()
+        self.assertEqual(len(service.calls), 2)
+        self.assertEqual(self.cache.stats["size"], 0)
+
+    async def test_org_invalidation_keeps_other_orgs(self):
+        service = _Service()
+        await service.summary(organization_id="org-a")
+        await service.summary(organization_id="org-b")
+        await service.summary()
+
+        await invalidate_performance({"org-a"})
+        await service.summary(organization_id="org-a")
+        await service.summary(organization_id="org-b")
+        await service.summary()
+
+        self.assertEqual(
+            [c[1] for c in service.calls], ["org-a", "org-b", None, "org-a", None]
+        )
+
+    async def test_reset_tag_drops_everything(self):
+        service = _Service()
+        await service.summary(organization_id="org-a")
+        await self.cache.invalidate_tags(["performance"])
+        await service.summary(organization_id="org-a")
+        self.assertEqual(len(service.calls), 2)
+
+    async def test_concurrent_misses_run_one_query(self):
+        service = _Service(delay=0.02)
+        results = await asyncio.gather(
+            *(service.summary(organization_id="org-a") for _ in range(20))
+        )
+        self.assertEqual(len(service.calls), 1)
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(self.cache.stats["coalesced"], 19)
+
+    async def test_failures_are_shared_but_not_cached(self):
+        service = _Service(delay=0.01)
+        outcomes = await asyncio.gather(
+            service.summary("boom"), service.summary("boom"), return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(o, ValueError) for o in outcomes))
+        self.assertEqual(len(service.calls), 1)
+        with self.assertRaises(ValueError):
+            await service.summary("boom")
+        self.assertEqual(len(service.calls), 2)
+
+
+class TestIngestionInvalidation(QueryCacheTestBase):
+    async def test_invalidation_coalesced_per_interval(self):
+        async def writer(batch):
+            return {"org-a"}
+
+        invalidate = AsyncMock()
+        pipeline = EventIngestionPipeline(
+            batch_size=10, flush_interval=60, writer=writer, invalidate_interval=60
+        )
+        with patch.object(ingestion, "invalidate_performance", invalidate):
+            for _ in range(3):
+                pipeline.enqueue(PerformanceEvent(content_id="c1", event_type=MetricType.VIEW))
+                await pipeline.flush()
+            self.assertEqual(invalidate.await_count, 1)
+
+            # Events written inside the interval are invalidated on stop.
+            await pipeline.stop()
+        self.assertEqual(invalidate.await_count, 2)
+        self.assertEqual(invalidate.await_args.args[0], {"org-a"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""Tests for concurrent keyword rank sweeps."""
+
+import asyncio
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.analytics.rank_sweep import RankSweep  # noqa: E402
+from src.analytics.seo_tracker import SEOTracker  # noqa: E402
+from src.types.performance import SEORanking  # noqa: E402
+
+
+class _StubTracker(SEOTracker):
+    """SEOTracker with canned SERP positions and in-memory storage."""
+
+    def __init__(self, positions, previous=None, fail=()):
+        super().__init__(api_key="test")
+        self.positions = positions
+        self.previous = previous or {}
+        self.fail = set(fail)
+        self.lookups = []
+        self.stored = []
+        self.confirmed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _lookup_position(self, keyword, target_url, location, language, search_engine):
+        self.lookups.append(keyword)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        if keyword in self.fail:
+            raise RuntimeError("serp down")
+        position = self.positions.get(keyword)
+        return (position, "https://example.com/post") if position else (None, None)
+
+    async def _get_previous_rankings(self, keywords, target_url):
+        return {
+            k: SEORanking(keyword=k, position=p) for k, p in self.previous.items() if k in keywords
+        }
+
+    async def _store_rankings(self, rankings, target_url, unchanged=()):
+        self.stored.append(list(rankings))
+        self.confirmed.append(list(unchanged))
+        return True
+
+
+class TestRankSweep(unittest.IsolatedAsyncioTestCase):
+    async def test_only_changed_rankings_are_stored(self):
+        tracker = _StubTracker(
+            positions={"same": 4, "moved": 2, "new": 9, "missing": None},
+            previous={"same": 4, "moved": 5},
+        )
+        sweep = RankSweep(tracker, concurrency=4, requests_per_second=1000)
+
+        rankings = await sweep.run(["same", "moved", "new", "missing"], "https://example.com")
+
+        self.assertEqual([r.keyword for r in rankings], ["same", "moved", "new", "missing"])
+        self.assertEqual([r.keyword for r in tracker.stored[0]], ["moved", "new"])
+        self.assertEqual(tracker.confirmed[0], ["same"])
+        self.assertEqual(rankings[1].change, 3)
+        self.assertEqual(sweep.stats["unchanged"], 1)
+
+    async def test_lookups_bounded_by_concurrency(self):
+        keywords = [f"kw{i}" for i in range(20)]
+        tracker = _StubTracker(positions={k: 1 for k in keywords})
+
+        await RankSweep(tracker, concurrency=3, requests_per_second=1000).run(
+            keywords, "https://example.com"
+        )
+
+        self.assertEqual(sorted(tracker.lookups), sorted(keywords))
+        self.assertLessEqual(tracker.max_in_flight, 3)
+
+    async def test_resume_skips_checkpointed_keywords(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tracker = _StubTracker(positions={"a": 1, "b": 2}, fail={"b"})
+
+            async def store_fails(rankings, target_url, unchanged=()):
+                return False
+
+            tracker._store_rankings = store_fails
+            first = RankSweep(tracker, requests_per_second=1000, sweep_id="s1", checkpoint_dir=tmp)
+            await first.run(["a", "b"], "https://example.com")
+            self.assertTrue(os.path.exists(first.checkpoint_path))
+
+            retry = _StubTracker(positions={"a": 1, "b": 2})
+            second = RankSweep(retry, requests_per_second=1000, sweep_id="s1", checkpoint_dir=tmp)
+            rankings = await second.run(["a", "b"], "https://example.com")
+
+            self.assertEqual(retry.lookups, ["b"])
+            self.assertEqual(second.stats["resumed"], 1)
+            self.assertEqual([r.keyword for r in retry.stored[0]], ["a", "b"])
+            self.assertEqual(len(rankings), 2)
+            self.assertFalse(os.path.exists(second.checkpoint_path))
+
+
+
+class _RecordingRPC:
+    def __init__(self):
+        self.calls = []
+
+    def rpc(self, name, params):
+        self.calls.append((name, params))
+        return self
+
+    async def execute(self):
+        return None
+
+
+class TestStoreRankings(unittest.IsolatedAsyncioTestCase):
+    async def test_changed_and_unchanged_stored_in_one_call(self):
+        tracker = SEOTracker(api_key="test")
+        client = _RecordingRPC()
+        tracker._get_supabase = lambda: client
+
+        stored = await tracker._store_rankings(
+            [SEORanking(keyword="moved", position=2, previous_position=5, change=3)],
+            "https://example.com",
+            ["same"],
+        )
+
+        self.assertTrue(stored)
+        self.assertEqual(len(client.calls), 1)
+        name, params = client.calls[0]
+        self.assertEqual(name, "record_rank_sweep")
+        self.assertEqual([row["keyword"] for row in params["p_rows"]], ["moved"])
+        self.assertEqual(params["p_rows"][0]["last_checked_at"], params["p_rows"][0]["tracked_at"])
+        self.assertEqual(params["p_unchanged"], ["same"])
+
+    async def test_nothing_to_store_skips_the_call(self):
+        tracker = SEOTracker(api_key="test")
+        client = _RecordingRPC()
+        tracker._get_supabase = lambda: client
+
+        self.assertTrue(await tracker._store_rankings([], "https://example.com"))
+        self.assertEqual(client.calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
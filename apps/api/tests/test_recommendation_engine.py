@@ -0,0 +1,151 @@
+"""Tests for recommendation scoring and incremental snapshots."""
+
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.analytics import recommendation_engine  # noqa: E402
+from src.analytics.recommendation_engine import RecommendationEngine  # noqa: E402
+from src.types.performance import RecommendationType  # noqa: E402
+
+
+def _content(i, **overrides):
+    row = {
+        "content_id": f"c{i}",
+        "title": f"Scaling Postgres ingestion part {i}",
+        "content_type": "blog" if i % 2 else "social",
+        "user_id": "u1",
+        "views": 100 + i,
+        "shares": i % 3,
+        "conversions": 0,
+        "published_at": f"2026-03-0{1 + i % 7}T{9 + i % 4}:00:00+00:00",
+        "metadata": {},
+    }
+    row.update(overrides)
+    return row
+
+
+class _Query:
+    def __init__(self, client, table):
+        self.client = client
+        self.table = table
+        self.filters = []
+
+    def __getattr__(self, name):
+        # select / order / limit / eq / lte / delete / insert / is_
+        def record(*args, **kwargs):
+            self.filters.append((name, args))
+            return self
+
+        return record
+
+    @property
+    def not_(self):
+        return self
+
+    def gte(self, column, value):
+        self.filters.append(("gte", (column, value)))
+        return self
+
+    async def execute(self):
+        self.client.queries.append((self.table, self.filters))
+        if self.table != "content_performance":
+            return SimpleNamespace(data=[])
+        if any(name == "gte" and args[0] == "updated_at" for name, args in self.filters):
+            return SimpleNamespace(data=self.client.updated)
+        return SimpleNamespace(data=self.client.rows)
+
+
+class _Client:
+    def __init__(self, rows):
+        self.rows = rows
+        self.updated = []
+        self.queries = []
+
+    def table(self, name):
+        return _Query(self, name)
+
+    def content_reads(self):
+        return [f for t, f in self.queries if t == "content_performance"]
+
+
+class TestScoring(unittest.TestCase):
+    def setUp(self):
+        self.engine = RecommendationEngine()
+
+    def test_title_topics_words_then_bigrams(self):
+        self.assertEqual(
+            self.engine._extract_topics_from_title("How to Scale Postgres, Fast!"),
+            ["scale", "postgres", "fast", "scale postgres", "postgres fast"],
+        )
+        self.assertEqual(self.engine._extract_topics_from_title(""), [])
+
+    def test_title_topics_cached_per_content_until_renamed(self):
+        first = recommendation_engine._title_topics_for("cid-cache", "Postgres tuning")
+        self.assertIs(recommendation_engine._title_topics_for("cid-cache", "Postgres tuning"), first)
+        renamed = recommendation_engine._title_topics_for("cid-cache", "Redis tuning")
+        self.assertIn("redis", renamed)
+
+    def test_analyze_topics_aggregates_per_topic(self):
+        scores = self.engine._analyze_topics([
+            {"content_id": "a", "title": "Postgres", "views": 10, "shares": 1},
+            {"content_id": "b", "title": "Postgres", "views": 30, "shares": 0,
+             "metadata": {"keywords": ["neon"]}},
+        ])
+        self.assertEqual(scores["postgres"]["count"], 2)
+        self.assertEqual(scores["postgres"]["score"], 50)
+        self.assertEqual(scores["postgres"]["avg_views"], 20)
+        self.assertEqual(scores["postgres"]["content_ids"], ["a", "b"])
+        self.assertEqual(scores["neon"]["total_views"], 30)
+
+    def test_analyze_timing_accepts_strings_and_datetimes(self):
+        timing = self.engine._analyze_timing([
+            {"published_at": "2026-03-03T14:00:00Z", "views": 10, "shares": 0},
+            {"published_at": datetime(2026, 3, 3, 14, tzinfo=timezone.utc), "views": 30, "shares": 1},
+            {"published_at": "not a date", "views": 99, "shares": 0},
+        ])
+        self.assertEqual(list(timing["by_day"]), ["tuesday"])
+        self.assertEqual(timing["by_day"]["tuesday"]["count"], 2)
+        self.assertEqual(timing["by_hour"][14]["avg_views"], 20)
+        self.assertEqual(timing["best_hour"], 14)
+
+    def test_analyze_formats_scores_by_type(self):
+        formats = self.engine._analyze_formats([_content(i) for i in range(4)])
+        self.assertEqual(formats["blog"]["count"], 2)
+        self.assertEqual(formats["social"]["total_views"], 100 + 102)
+
+
+class TestGetAllRecommendations(unittest.IsolatedAsyncioTestCase):
+    async def test_full_mode_runs_every_family(self):
+        client = _Client([_content(i) for i in range(10)])
+        engine = RecommendationEngine(supabase_client=client)
+
+        recs = await engine.get_all_recommendations(organization_id="org-1", user_id="u1")
+
+        types = {r.recommendation_type for r in recs}
+        self.assertTrue({RecommendationType.TIMING, RecommendationType.FORMAT} <= types)
+        self.assertEqual(len(client.content_reads()), 3)
+
+    async def test_incremental_rereads_only_updated_rows(self):
+        client = _Client([_content(i) for i in range(10)])
+        engine = RecommendationEngine(supabase_client=client)
+
+        await engine.get_all_recommendations(organization_id="org-1", incremental=True)
+        self.assertEqual(len(client.content_reads()), 1)
+
+        client.updated = [_content(3, content_type="video", views=10_000)]
+        recs = await engine.get_all_recommendations(organization_id="org-1", incremental=True)
+
+        second_read = client.content_reads()[1]
+        self.assertIn(("gte", "updated_at"), [(n, a[0]) for n, a in second_read if n == "gte"])
+        formats = [r for r in recs if r.recommendation_type == RecommendationType.FORMAT]
+        self.assertEqual(formats[0].recommended_format.value, "video")
+        self.assertEqual(len(engine._local_snapshots["org-1"].rows), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
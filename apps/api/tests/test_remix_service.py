@@ -0,0 +1,131 @@
+"""Tests for the async remix pipeline and its shared executor."""
+
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.remix.executor import get_remix_executor  # noqa: E402
+from src.remix.service import RemixService  # noqa: E402
+from src.types.remix import ContentFormat, QualityScore, RemixRequest  # noqa: E402
+from src.utils.cache import get_content_analysis_cache  # noqa: E402
+
+ANALYSIS_JSON = json.dumps({
+    "summary": "A post about remixing.",
+    "key_points": ["One", "Two"],
+    "main_argument": "Remix everything",
+    "target_audience": "marketers",
+    "tone": "casual",
+    "keywords": ["remix"],
+})
+
+
+def _score():
+    return QualityScore(
+        overall=0.8, format_fit=0.8, voice_match=0.8,
+        completeness=0.8, engagement=0.8, platform_optimization=0.8,
+    )
+
+
+class _Adapter:
+    def __init__(self, delay, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.threads = []
+
+    def transform(self, analysis, brand_voice):
+        self.threads.append(threading.current_thread().name)
+        time.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("boom")
+        return {"text": f"{analysis.title} remixed"}
+
+    def score_quality(self, content, analysis):
+        self.threads.append(threading.current_thread().name)
+        return _score()
+
+
+def _request(*formats):
+    return RemixRequest(
+        source_content={"title": "Remix", "body": "Body text about remixing content."},
+        target_formats=list(formats),
+        conversation_id="conv-1",
+    )
+
+
+class TestRemixPipeline(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        get_content_analysis_cache().clear()
+        patcher = patch("src.remix.analyzer.create_provider_from_env", return_value=MagicMock())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = RemixService("openai")
+
+    async def test_analysis_runs_off_the_event_loop(self):
+        loop_thread = threading.current_thread()
+        calls = []
+
+        def generate(*args, **kwargs):
+            calls.append(threading.current_thread())
+            return ANALYSIS_JSON
+
+        with patch("src.remix.analyzer.generate_text", side_effect=generate):
+            first = await self.service.analyzer.analyze_async({"title": "T", "body": "Same body"})
+            await self.service.analyzer.analyze_async({"title": "T", "body": "Same body"})
+
+        self.assertEqual(len(calls), 1)  # second call served from the content-hash cache
+        self.assertIsNot(calls[0], loop_thread)
+        self.assertEqual(first.main_argument, "Remix everything")
+
+    async def test_formats_streamed_in_completion_order(self):
+        adapters = {
+            ContentFormat.TWITTER_THREAD: _Adapter(0.15),
+            ContentFormat.LINKEDIN_POST: _Adapter(0.01),
+            ContentFormat.EMAIL_NEWSLETTER: _Adapter(0.05, fail=True),
+        }
+        with patch("src.remix.analyzer.generate_text", return_value=ANALYSIS_JSON), \
+                patch("src.remix.service.get_adapter", side_effect=lambda fmt, _: adapters[fmt]):
+            events = [
+                event async for event in self.service.remix_stream(_request(*adapters))
+            ]
+
+        self.assertEqual(
+            [e.type for e in events], ["analysis", "format", "error", "format", "complete"]
+        )
+        self.assertEqual(events[1].data.format, ContentFormat.LINKEDIN_POST)
+        self.assertEqual(events[2].data["format"], ContentFormat.EMAIL_NEWSLETTER.value)
+        response = events[-1].data
+        self.assertTrue(response.success)
+        self.assertEqual(
+            [r.format for r in response.remixed_content],
+            [ContentFormat.TWITTER_THREAD, ContentFormat.LINKEDIN_POST],
+        )
+
+        # Transform and score share one hop on the shared pool
+        for adapter in adapters.values():
+            self.assertTrue(all(name.startswith("remix") for name in adapter.threads))
+
+    async def test_remix_returns_final_response(self):
+        adapter = _Adapter(0)
+        with patch("src.remix.analyzer.generate_text", return_value=ANALYSIS_JSON), \
+                patch("src.remix.service.get_adapter", return_value=adapter):
+            response = await self.service.remix(_request(ContentFormat.LINKEDIN_POST))
+
+        self.assertTrue(response.success)
+        self.assertEqual(response.remixed_content[0].content, {"text": "Remix remixed"})
+        self.assertEqual(response.average_quality_score, 0.8)
+
+    def test_executor_shared_across_services(self):
+        executor = get_remix_executor()
+        RemixService("anthropic")
+        self.assertIs(get_remix_executor(), executor)
+        self.assertFalse(hasattr(self.service, "_executor"))
+
+
+if __name__ == "__main__":
+    unittest.main()
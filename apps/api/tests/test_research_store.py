@@ -0,0 +1,77 @@
+"""
+Tests for research persistence.
+"""
+
+import unittest
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.research import research_store
+
+
+class _FakeConnection:
+    def __init__(self):
+        self.execute = AsyncMock()
+        self.executemany = AsyncMock()
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def _transaction(self):
+        self.transactions += 1
+        yield
+
+    def transaction(self):
+        return self._transaction()
+
+
+def _fake_pool(conn):
+    @asynccontextmanager
+    async def acquire():
+        yield conn
+
+    pool = MagicMock()
+    pool.acquire = acquire
+    return pool
+
+
+class TestSaveResearch(unittest.IsolatedAsyncioTestCase):
+    """save_research writes the query and all sources in one transaction."""
+
+    async def asyncTearDown(self):
+        research_store._queries.clear()
+
+    async def test_sources_written_with_executemany(self):
+        conn = _FakeConnection()
+        sources = [
+            {"url": f"https://example.com/{i}", "title": f"Source {i}",
+             "quality": {"overall": 0.5, "credibility_tier": "medium"}}
+            for i in range(30)
+        ]
+        with patch.object(research_store, "_db_enabled", True), \
+                patch.object(research_store, "get_pool", AsyncMock(return_value=_fake_pool(conn))), \
+                patch.object(research_store, "db_execute", AsyncMock()) as ddl:
+            query_id = await research_store.save_research(
+                "user-1", "ai trends", ["ai"], "deep", sources
+            )
+
+        ddl.assert_not_called()
+        self.assertEqual(conn.transactions, 1)
+        conn.execute.assert_awaited_once()
+        conn.executemany.assert_awaited_once()
+        rows = conn.executemany.await_args.args[1]
+        self.assertEqual(len(rows), 30)
+        self.assertTrue(all(row[1] == query_id for row in rows))
+        self.assertEqual(rows[0][6:8], (0.5, "medium"))
+
+    async def test_no_sources_skips_executemany(self):
+        conn = _FakeConnection()
+        with patch.object(research_store, "_db_enabled", True), \
+                patch.object(research_store, "get_pool", AsyncMock(return_value=_fake_pool(conn))):
+            await research_store.save_research("user-1", "q", [], "basic", [])
+
+        conn.execute.assert_awaited_once()
+        conn.executemany.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
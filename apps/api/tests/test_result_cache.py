@@ -0,0 +1,129 @@
+"""
+Tests for opt-in result memoization (workflow steps, templates, tools).
+"""
+
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.storage.result_cache import ResultCache, make_cache_key
+from src.text_generation.core import GenerationOptions
+from src.workflows.workflow_engine import (
+    StepType,
+    Workflow,
+    WorkflowEngine,
+    WorkflowStep,
+)
+
+
+class TestMakeCacheKey:
+    def test_key_ignores_dict_order_and_whitespace(self):
+        a = make_cache_key("ns", config={"a": 1, "b": " x "}, provider_type="openai")
+        b = make_cache_key("ns", config={"b": "x", "a": 1}, provider_type="openai")
+        assert a == b
+
+    def test_key_depends_on_options(self):
+        a = make_cache_key("ns", options=GenerationOptions(temperature=0.7))
+        b = make_cache_key("ns", options=GenerationOptions(temperature=0.2))
+        assert a != b
+
+    def test_key_includes_namespace(self):
+        assert make_cache_key("one", x=1) != make_cache_key("two", x=1)
+
+
+class TestResultCacheMemoryBackend:
+    def test_roundtrip_returns_copy(self):
+        cache = ResultCache()
+        cache.set("k", {"items": [1, 2]})
+        first = cache.get("k")
+        first["items"].append(3)
+        assert cache.get("k") == {"items": [1, 2]}
+
+    def test_miss_returns_none_and_counts(self):
+        cache = ResultCache()
+        assert cache.get("missing") is None
+        assert cache.stats["misses"] == 1
+        assert cache.stats["backend"] == "memory"
+
+    def test_oversized_values_are_not_cached(self):
+        cache = ResultCache(max_value_bytes=10)
+        assert cache.set("k", "x" * 100) is False
+        assert cache.get("k") is None
+
+    def test_size_bounded(self):
+        cache = ResultCache(max_entries=2)
+        for i in range(3):
+            cache.set(f"k{i}", i)
+        assert cache.get("k0") is None
+        assert cache.get("k2") == 2
+
+
+class TestWorkflowMemoization:
+    @pytest.fixture
+    def workflow(self):
+        return Workflow(
+            name="memo",
+            steps=[
+                WorkflowStep(id="research", type=StepType.RESEARCH),
+                WorkflowStep(
+                    id="social",
+                    type=StepType.SOCIAL_POST,
+                    depends_on=["research"],
+                ),
+            ],
+        )
+
+    async def _run(self, engine, workflow, variables, calls):
+        async def fake_research(config, context, provider, options):
+            calls.append("research")
+            return {"research_context": context["variables"]["topic"]}
+
+        async def fake_social(config, context, provider, options):
+            calls.append("social")
+            return {"social_posts": {}}
+
+        handlers = {
+            StepType.RESEARCH: fake_research,
+            StepType.SOCIAL_POST: fake_social,
+        }
+        with patch("src.workflows.workflow_engine._STEP_HANDLERS", handlers), patch(
+            "src.workflows.workflow_engine.create_provider_from_env"
+        ):
+            return await engine.execute_workflow(workflow, variables)
+
+    async def test_identical_step_inputs_hit_cache(self, workflow):
+        engine = WorkflowEngine(result_cache=ResultCache())
+        calls = []
+
+        first = await self._run(engine, workflow, {"topic": "AI", "tone": "a"}, calls)
+        second = await self._run(engine, workflow, {"topic": "AI", "tone": "b"}, calls)
+
+        assert first.cached_steps == []
+        # Research ignores tone, so it is reused; social posts always re-run.
+        assert second.cached_steps == ["research"]
+        assert calls == ["research", "social", "social"]
+        assert second.results["research"] == {"research_context": "AI"}
+
+    async def test_changed_inputs_miss_cache(self, workflow):
+        engine = WorkflowEngine(result_cache=ResultCache())
+        calls = []
+
+        await self._run(engine, workflow, {"topic": "AI"}, calls)
+        second = await self._run(engine, workflow, {"topic": "ML"}, calls)
+
+        assert second.cached_steps == []
+        assert calls.count("research") == 2
+
+    async def test_cache_disabled_by_default(self, workflow):
+        engine = WorkflowEngine()
+        calls = []
+
+        await self._run(engine, workflow, {"topic": "AI"}, calls)
+        second = await self._run(engine, workflow, {"topic": "AI"}, calls)
+
+        assert second.cached_steps == []
+        assert calls.count("research") == 2
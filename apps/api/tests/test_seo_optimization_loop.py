@@ -4,12 +4,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.types.content import BlogPost, Section, SubTopic
 from src.types.seo import (
     ContentOptimization,
     ContentScore,
     OptimizationSuggestion,
     SEOOptimizationResult,
     SEOThresholds,
+    SERPAnalysis,
     SuggestionPriority,
     SuggestionType,
 )
@@ -165,15 +167,158 @@ class TestOptimizeUntilThreshold:
 
 class TestBlogPostConversion:
     def test_roundtrip(self):
-        from src.seo.optimization_loop import _blog_post_to_text, _text_to_sections
+        from src.seo.optimization_loop import _blog_post_parts, _parse_sections
 
         blog_post = _make_blog_post()
-        text = _blog_post_to_text(blog_post)
+        text = "\n".join(_blog_post_parts(blog_post))
 
         assert "# Test Blog Post" in text
         assert "## Introduction" in text
         assert "### Overview" in text
 
         # Parse back
-        updated = _text_to_sections(text, blog_post)
-        assert len(updated.sections) >= 1
+        sections = _parse_sections(text)
+        assert [s.title for s in sections if s.title] == ["Introduction"]
+
+
+def _make_long_post():
+    return BlogPost(
+        title="Email Marketing Guide",
+        description="Everything about email marketing.",
+        sections=[
+            Section(title="Getting Started", subtopics=[
+                SubTopic(title="Lists", content="Build your email list with signup forms and lead magnets."),
+            ]),
+            Section(title="Deliverability", subtopics=[
+                SubTopic(title="Inbox", content="Warm up your sending domain and authenticate with SPF records."),
+            ]),
+            Section(title="Measuring Results", subtopics=[
+                SubTopic(title="Metrics", content="Track open rates, click rates and conversions every week."),
+            ]),
+        ],
+    )
+
+
+def _topic_suggestion(topic: str) -> OptimizationSuggestion:
+    return OptimizationSuggestion(
+        type=SuggestionType.COVER_TOPIC,
+        priority=SuggestionPriority.HIGH,
+        description=f"Add content covering the topic: {topic}",
+    )
+
+
+class TestSectionRewrites:
+    def test_suggestions_mapped_to_responsible_sections(self):
+        from src.seo.optimization_loop import _assign_suggestions, _section_to_text
+
+        post = _make_long_post()
+        length = OptimizationSuggestion(
+            type=SuggestionType.ADJUST_LENGTH,
+            priority=SuggestionPriority.HIGH,
+            description="Content is significantly shorter than top-ranking competitors.",
+            current_value="40 words",
+            recommended_value="1500 words",
+        )
+        assignments = _assign_suggestions(
+            [_topic_suggestion("domain authentication"), _topic_suggestion("click tracking"), length],
+            [_section_to_text(s) for s in post.sections],
+            [s.title for s in post.sections],
+            [],
+        )
+
+        assert [s.description for s in assignments[1]][0].endswith("domain authentication")
+        assert [s.description for s in assignments[2]][0].endswith("click tracking")
+        assert sum(length in suggestions for suggestions in assignments.values()) == 2
+
+    @patch("src.seo.optimization_loop.generate_text")
+    @patch("src.seo.optimization_loop.create_provider_from_env")
+    @patch("src.seo.optimization_loop.optimize_content")
+    def test_only_assigned_section_is_sent_and_replaced(self, mock_optimize, mock_provider, mock_generate):
+        from src.seo.optimization_loop import optimize_until_threshold
+
+        low_score = _make_score(overall=40)
+        high_score = _make_score(overall=85, topic_coverage=80, term_usage=75, structure_score=70, readability_score=65, word_count_score=80)
+        mock_optimize.side_effect = [
+            _make_optimization(low_score, [_topic_suggestion("SPF and DKIM authentication")]),
+            _make_optimization(high_score),
+        ]
+        mock_generate.return_value = "## Deliverability\n### Inbox\nAuthenticate with SPF and DKIM."
+
+        post = _make_long_post()
+        untouched = [post.sections[0], post.sections[2]]
+        result = optimize_until_threshold(post, "email marketing")
+
+        prompt = mock_generate.call_args[0][0]
+        assert mock_generate.call_count == 1
+        assert "Warm up your sending domain" in prompt
+        assert "signup forms" not in prompt and "open rates" not in prompt
+        assert post.sections[1].subtopics[0].content == "Authenticate with SPF and DKIM."
+        assert [post.sections[0], post.sections[2]] == untouched
+        assert result.passed is True
+        assert result.sections_rewritten == 1
+        _, kwargs = mock_optimize.call_args
+        assert len(kwargs["sections"]) == 4  # header + three sections
+
+    @patch("src.seo.optimization_loop.generate_text")
+    @patch("src.seo.optimization_loop.create_provider_from_env")
+    @patch("src.seo.optimization_loop.optimize_content")
+    def test_stops_when_gain_below_minimum(self, mock_optimize, mock_provider, mock_generate):
+        from src.seo.optimization_loop import optimize_until_threshold
+
+        suggestions = [_topic_suggestion("list building")]
+        mock_optimize.side_effect = [
+            _make_optimization(_make_score(overall=40), suggestions),
+            _make_optimization(_make_score(overall=40.5), suggestions),
+        ]
+        mock_generate.return_value = "## Getting Started\nBuild a list."
+
+        thresholds = SEOThresholds(max_optimization_passes=5, min_score_gain=1.0)
+        result = optimize_until_threshold(_make_long_post(), "email marketing", thresholds=thresholds)
+
+        assert mock_generate.call_count == 1
+        assert result.passed is False
+        assert result.passes_used == 2
+        assert result.score.overall_score == 40.5
+
+    @patch("src.seo.optimization_loop.generate_text")
+    @patch("src.seo.optimization_loop.create_provider_from_env")
+    @patch("src.seo.optimization_loop.optimize_content")
+    def test_regressing_pass_is_undone(self, mock_optimize, mock_provider, mock_generate):
+        from src.seo.optimization_loop import optimize_until_threshold
+
+        suggestions = [_topic_suggestion("list building")]
+        mock_optimize.side_effect = [
+            _make_optimization(_make_score(overall=40), suggestions),
+            _make_optimization(_make_score(overall=30), suggestions),
+        ]
+        mock_generate.return_value = "## Getting Started\nWorse."
+
+        post = _make_long_post()
+        original = list(post.sections)
+        result = optimize_until_threshold(post, "email marketing")
+
+        assert post.sections == original
+        assert result.score.overall_score == 40
+
+
+class TestSectionedScoring:
+    def test_matches_whole_text_coverage(self):
+        from src.seo.content_optimizer import optimize_content
+        from src.seo.optimization_loop import _blog_post_parts
+
+        serp = SERPAnalysis(
+            keyword="email marketing",
+            common_topics=["sending domain", "lead magnets", "segmentation"],
+            nlp_terms=["open rates", "SPF", "A/B testing"],
+            suggested_headings=["Deliverability", "Metrics"],
+            questions_to_answer=["How do you build an email list?"],
+            recommended_word_count=60,
+        )
+        parts = _blog_post_parts(_make_long_post())
+        whole = optimize_content("\n".join(parts), "email marketing", serp)
+        sectioned = optimize_content("\n".join(parts), "email marketing", serp, sections=parts)
+
+        assert sectioned.covered_topics == whole.covered_topics
+        assert sectioned.missing_terms == whole.missing_terms
+        assert sectioned.score.structure_score == whole.score.structure_score
+        assert sectioned.score.word_count_score == whole.score.word_count_score
@@ -0,0 +1,162 @@
+"""Tests for the compiled marketing template engine."""
+
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.templates import template_engine  # noqa: E402
+from src.templates._compiled import CompiledTemplate  # noqa: E402
+from src.templates.marketing_templates import (  # noqa: E402
+    MARKETING_TEMPLATES,
+    TEMPLATE_CATEGORIES,
+)
+from src.templates.template_engine import (  # noqa: E402
+    _fill_prompt,
+    generate_from_template,
+    get_all_templates,
+    get_categories,
+    get_templates_by_category,
+    search_templates,
+)
+
+
+def _sample_fields(template, blank_optional=False):
+    fields = {}
+    for fd in template["fields"]:
+        if fd.get("type") == "select":
+            fields[fd["name"]] = fd["options"][-1]
+        elif fd.get("required") or not blank_optional:
+            fields[fd["name"]] = f"  value for {fd['name']} "
+    return fields
+
+
+class TestCompiledRendering(unittest.TestCase):
+    def test_matches_format_map_rendering_for_every_template(self):
+        for template_id, template in MARKETING_TEMPLATES.items():
+            compiled = CompiledTemplate(template, _fill_prompt)
+            for blank in (False, True):
+                fields = _sample_fields(template, blank_optional=blank)
+                with self.subTest(template=template_id, blank_optional=blank):
+                    self.assertEqual(
+                        compiled.render(fields),
+                        _fill_prompt(template["prompt_template"], fields, template["fields"]),
+                    )
+
+    def test_unknown_placeholders_and_escaped_braces(self):
+        template = {
+            "id": "t",
+            "name": "T",
+            "category": "other",
+            "description": "",
+            "fields": [{"name": "topic", "type": "text", "required": True}],
+            "prompt_template": "About {topic}: {unknown} {{\"key\": \"{topic}\"}} {other:>8}",
+        }
+        compiled = CompiledTemplate(template, _fill_prompt)
+        fields = {"topic": "cats"}
+        self.assertEqual(
+            compiled.render(fields),
+            _fill_prompt(template["prompt_template"], fields, template["fields"]),
+        )
+
+    def test_unsupported_templates_fall_back(self):
+        for prompt in ("Broken {topic", "Indexed {topic[0]}", "Positional {0}"):
+            template = {
+                "id": "t",
+                "name": "T",
+                "category": "other",
+                "description": "",
+                "fields": [{"name": "topic", "type": "text", "required": True}],
+                "prompt_template": prompt,
+            }
+            compiled = CompiledTemplate(template, _fill_prompt)
+            with self.subTest(prompt=prompt):
+                self.assertEqual(
+                    compiled.render({"topic": "cats"}),
+                    _fill_prompt(prompt, {"topic": "cats"}, template["fields"]),
+                )
+
+    def test_validation(self):
+        compiled = CompiledTemplate(MARKETING_TEMPLATES["facebook-ad"], _fill_prompt)
+        errors = compiled.validate({"objective": "fame"})
+        self.assertIn("'product_name' is required", errors)
+        self.assertIn(
+            "'objective' must be one of: awareness, traffic, engagement, leads, sales",
+            errors,
+        )
+        self.assertEqual(compiled.validate(_sample_fields(MARKETING_TEMPLATES["facebook-ad"])), [])
+
+
+class TestCatalogIndexes(unittest.TestCase):
+    def test_listing_matches_template_set(self):
+        self.assertEqual([t["id"] for t in get_all_templates()], list(MARKETING_TEMPLATES))
+        for category in TEMPLATE_CATEGORIES:
+            expected = [t["id"] for t in MARKETING_TEMPLATES.values() if t["category"] == category]
+            self.assertEqual([t["id"] for t in get_templates_by_category(category)], expected)
+
+        counts = {c["id"]: c["template_count"] for c in get_categories()}
+        self.assertEqual(sum(counts.values()), len(MARKETING_TEMPLATES))
+
+        with self.assertRaises(ValueError):
+            get_templates_by_category("nope")
+
+    def test_returned_lists_are_copies(self):
+        get_all_templates().clear()
+        get_categories()[0]["template_count"] = -1
+        self.assertEqual(len(get_all_templates()), len(MARKETING_TEMPLATES))
+        self.assertGreaterEqual(get_categories()[0]["template_count"], 0)
+
+        category = next(iter(TEMPLATE_CATEGORIES))
+        for results in (
+            get_all_templates(),
+            get_templates_by_category(category),
+            search_templates(""),
+        ):
+            results[0]["name"] = "mutated"
+        self.assertNotIn("mutated", [t["name"] for t in get_all_templates()])
+        self.assertNotIn("mutated", [t["name"] for t in get_templates_by_category(category)])
+
+    def test_search(self):
+        results = search_templates("GOOGLE")
+        self.assertIn("google-search-ad", [t["id"] for t in results])
+        self.assertEqual(search_templates("google", "email"), [])
+        with self.assertRaises(ValueError):
+            search_templates("google", "nope")
+
+
+class TestGenerateFromTemplate(unittest.TestCase):
+    def setUp(self):
+        template_engine._render_prompt.cache_clear()
+
+    def test_renders_once_per_normalized_input(self):
+        template = MARKETING_TEMPLATES["google-search-ad"]
+        fields = _sample_fields(template)
+        # Same text values after stripping: served from the render cache.
+        padded = {k: v if k == "tone" else f"  {v}  " for k, v in fields.items()}
+
+        with patch.object(template_engine, "create_provider_from_env", return_value=MagicMock()), \
+                patch.object(template_engine, "generate_text", return_value='{"headlines": []}') as gen:
+            first = generate_from_template("google-search-ad", fields)
+            second = generate_from_template("google-search-ad", padded)
+
+        self.assertTrue(first["success"] and second["success"])
+        self.assertEqual(first["output"], {"headlines": []})
+        self.assertEqual(gen.call_args_list[0].args[0], gen.call_args_list[1].args[0])
+        info = template_engine._render_prompt.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_validation_error(self):
+        result = generate_from_template("google-search-ad", {})
+        self.assertFalse(result["success"])
+        self.assertIn("Validation errors", result["error"])
+
+    def test_unknown_template(self):
+        result = generate_from_template("nope", {"a": "b"})
+        self.assertFalse(result["success"])
+        self.assertIn("Template not found", result["error"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for the Aho-Corasick term matcher used by SEO scoring."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.seo.content_optimizer import optimize_content  # noqa: E402
+from src.seo.term_matcher import (  # noqa: E402
+    TermMatcher,
+    get_term_matcher,
+    serp_patterns,
+    stem,
+)
+from src.types.seo import SERPAnalysis  # noqa: E402
+
+
+def _serp():
+    return SERPAnalysis(
+        keyword="content marketing",
+        common_topics=["content strategy", "buyer personas"],
+        nlp_terms=["AI", "editorial calendar", "SEO"],
+        questions_to_answer=["How do you measure content marketing ROI?"],
+    )
+
+
+class TestTermMatcher(unittest.TestCase):
+    def test_whole_words_only(self):
+        scan = TermMatcher(["ai", "seo"]).scan("She said the SEO-friendly draft was ready.")
+        self.assertFalse(scan.contains("AI"))
+        self.assertEqual(scan.count("seo"), 1)
+
+    def test_stemmed_variants_match(self):
+        self.assertEqual(stem("strategies"), stem("strategy"))
+        self.assertEqual(stem("optimized"), stem("optimize"))
+        self.assertEqual(stem("optimizing"), stem("optimize"))
+        self.assertEqual(stem("planned"), "plan")
+
+        scan = TermMatcher(["content strategy"]).scan("Two content strategies work.")
+        self.assertTrue(scan.contains("Content  Strategy"))
+
+    def test_phrases_do_not_cross_punctuation(self):
+        scan = TermMatcher(["quick brown"]).scan("Be quick. Brown is a colour; quick brown fox.")
+        self.assertEqual(scan.count("quick brown"), 1)
+
+    def test_overlapping_patterns_and_positions(self):
+        text = "Content marketing and marketing automation. Content marketing wins."
+        scan = TermMatcher(["content marketing", "marketing", "marketing automation"]).scan(text)
+
+        self.assertEqual(scan.count("marketing"), 3)
+        self.assertEqual(scan.count("marketing automation"), 1)
+        self.assertEqual(
+            [text[start:end] for start, end in scan.positions("content marketing")],
+            ["Content marketing", "Content marketing"],
+        )
+
+    def test_scan_with_shared_token_index(self):
+        from src.scoring.text_analysis import analyze_text
+
+        text = "Content marketing and marketing automation. Content marketing wins."
+        matcher = TermMatcher(["content marketing", "marketing automation", "wins"])
+        shared = matcher.scan(text, analyze_text(text).term_index)
+        direct = matcher.scan(text)
+
+        for pattern in ("content marketing", "marketing automation", "wins"):
+            self.assertEqual(shared.positions(pattern), direct.positions(pattern))
+
+    def test_unknown_pattern_raises(self):
+        scan = TermMatcher(["seo"]).scan("seo")
+        with self.assertRaises(KeyError):
+            scan.count("ranking")
+
+    def test_matcher_cached_per_pattern_set(self):
+        serp = _serp()
+        matcher = get_term_matcher(serp, ["content marketing"])
+
+        self.assertIs(get_term_matcher(_serp(), ["content marketing"]), matcher)
+        self.assertIsNot(get_term_matcher(serp, ["email"]), matcher)
+        self.assertIn("measure", serp_patterns(serp))
+        self.assertIn("personas", matcher.keys)
+
+
+class TestOptimizeContent(unittest.TestCase):
+    def test_coverage_uses_word_matching(self):
+        content = (
+            "# Content marketing\n\n"
+            "She said our content strategies need an editorial calendar. "
+            "Measure ROI for every content marketing push."
+        )
+        result = optimize_content(content, "content marketing", _serp())
+
+        self.assertIn("content strategy", result.covered_topics)
+        self.assertIn("buyer personas", result.missing_topics)
+        self.assertIn("editorial calendar", result.covered_terms)
+        self.assertIn("AI", result.missing_terms)
+
+
+if __name__ == "__main__":
+    unittest.main()
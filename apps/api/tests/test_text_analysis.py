@@ -0,0 +1,104 @@
+"""Tests for the single-pass TextAnalysis shared by the content scorers."""
+
+import os
+import re
+import sys
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from src.scoring import content_scorer  # noqa: E402
+from src.scoring.text_analysis import (  # noqa: E402
+    _analyze,
+    analyze_text,
+    count_syllables,
+)
+
+SAMPLE = """# Unlock Better Writing
+
+Do you struggle with _readable_ prose? Here's the story: it all started
+with a simple table. Read more below!
+
+## Why it matters
+- Short sentences help.
+- Simple words help... a lot.
+
+####### not a heading
+  ### Indented heading
+Version 2abc and foo_bar count as words? Maybe.
+"""
+
+
+class TestTokenization(unittest.TestCase):
+    def test_words_match_legacy_markdown_stripping_regex(self):
+        stripped = re.sub(r'[#*_`\[\]()]', ' ', SAMPLE)
+        expected = re.findall(r'\b[a-zA-Z]+\b', stripped.lower())
+
+        self.assertEqual(list(analyze_text(SAMPLE).words), expected)
+
+    def test_sentences_match_legacy_split(self):
+        expected = [s.strip() for s in re.split(r'[.!?]+', SAMPLE) if s.strip()]
+        analysis = analyze_text(SAMPLE)
+
+        self.assertEqual(list(analysis.sentences), expected)
+        for sentence, (start, end) in zip(analysis.sentences, analysis.sentence_spans):
+            self.assertEqual(SAMPLE[start:end], sentence)
+
+    def test_word_spans_and_syllables(self):
+        analysis = analyze_text(SAMPLE)
+        for word, (start, end) in zip(analysis.words, analysis.word_spans):
+            self.assertEqual(SAMPLE[start:end].lower(), word)
+        self.assertEqual(
+            list(analysis.syllables), [count_syllables(w) for w in analysis.words]
+        )
+        self.assertEqual(count_syllables("table"), 2)
+        self.assertEqual(count_syllables("readable"), 3)
+
+    def test_headings(self):
+        headings = analyze_text(SAMPLE).headings
+        self.assertEqual(
+            [(h.level, h.text) for h in headings],
+            [(1, "Unlock Better Writing"), (2, "Why it matters"), (3, "Indented heading")],
+        )
+        self.assertEqual(analyze_text(SAMPLE).lines[headings[1].line], "## Why it matters")
+
+    def test_empty_headings_counted_but_not_listed(self):
+        text = "# Title\n# \n## Section\n###\nbody #\n"
+        analysis = analyze_text(text)
+        self.assertEqual([h.text for h in analysis.headings], ["Title", "Section"])
+        self.assertEqual(analysis.heading_count, 4)
+        self.assertEqual(analysis.heading_count, len(re.findall(r"^#{1,6}\s", text, re.MULTILINE)))
+        self.assertEqual(content_scorer.score_seo(text).heading_count, 4)
+
+    def test_ngram_counters(self):
+        analysis = analyze_text("big data big data big ideas")
+        self.assertEqual(analysis.word_counts["big"], 3)
+        self.assertEqual(analysis.bigram_counts[("big", "data")], 2)
+
+    def test_empty_text(self):
+        analysis = analyze_text("")
+        self.assertEqual(analysis.word_count, 0)
+        self.assertEqual(analysis.sentence_count, 0)
+        self.assertEqual(analysis.avg_word_length, 0)
+
+
+class TestSharedAnalysis(unittest.TestCase):
+    def test_cached_by_content(self):
+        self.assertIs(analyze_text(SAMPLE), analyze_text(SAMPLE))
+        self.assertIsNot(analyze_text(SAMPLE, use_cache=False), analyze_text(SAMPLE))
+
+    def test_score_content_tokenizes_once(self):
+        text = SAMPLE + " unique suffix for this test"
+        with patch(
+            "src.scoring.text_analysis._analyze", wraps=_analyze
+        ) as analyze:
+            result = content_scorer.score_content(text, keywords=["writing"])
+            content_scorer.score_readability(text)
+        self.assertEqual(analyze.call_count, 1)
+        self.assertEqual(result.seo.heading_count, 3)
+        self.assertTrue(result.seo.keyword_placement["in_headings"])
+
+
+if __name__ == "__main__":
+    unittest.main()
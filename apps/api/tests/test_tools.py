@@ -4,8 +4,11 @@ Tests for the tools module.
 Tests the BaseTool class, ToolRegistry, and library tools.
 """
 
+import json
 import os
+import shutil
 import sys
+import tempfile
 import unittest
 from datetime import datetime
 from typing import List
@@ -437,6 +440,124 @@ class TestBaseToolExecution(unittest.TestCase):
         self.assertGreaterEqual(result.execution_time_ms, 0)
 
 
+class TestBaseToolVariations(unittest.IsolatedAsyncioTestCase):
+    """Tests for concurrent variation generation."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.tool = MockTool()
+        self.provider = MagicMock(type="openai")
+
+    async def test_variations_generated_concurrently(self):
+        """Variations run in parallel and are returned in label order."""
+        import asyncio
+
+        delays = {0.7: 0.2, 0.9: 0.05}
+        in_flight = []
+        peak = []
+
+        async def generate(prompt, provider, options):
+            in_flight.append(options.temperature)
+            peak.append(len(in_flight))
+            await asyncio.sleep(delays.get(round(options.temperature, 1), 0.1))
+            in_flight.remove(options.temperature)
+            return f"Output at {options.temperature:.1f}"
+
+        with patch("src.tools.base.generate_text_async", side_effect=generate) as mock_generate:
+            result = await self.tool.execute_variations_async(
+                {"title": "Test"}, variation_count=3, provider=self.provider, include_scores=False
+            )
+
+        self.assertTrue(result.success)
+        self.assertEqual(mock_generate.call_count, 3)
+        self.assertEqual(max(peak), 3)
+        self.assertEqual([v.label for v in result.variations], ["A", "B", "C"])
+        self.assertEqual([v.prompt_style for v in result.variations], ["standard", "creative", "concise"])
+        prompts = [call.args[0] for call in mock_generate.call_args_list]
+        self.assertTrue(all(p.startswith(prompts[0]) for p in prompts))
+
+    async def test_stream_yields_in_completion_order(self):
+        """Each variation is yielded as soon as it finishes."""
+        import asyncio
+
+        async def generate(prompt, provider, options):
+            await asyncio.sleep(0.01 if "creative" in prompt else 0.1)
+            return "Output"
+
+        with patch("src.tools.base.generate_text_async", side_effect=generate):
+            labels = [
+                v.label async for v in self.tool.stream_variations(
+                    {"title": "Test"}, provider=self.provider, include_scores=False
+                )
+            ]
+
+        self.assertEqual(labels, ["B", "A"])
+
+    async def test_failed_variation_is_skipped(self):
+        """A failed variation does not fail the others."""
+        from src.text_generation.core import TextGenerationError
+
+        async def generate(prompt, provider, options):
+            if "concise" in prompt:
+                raise TextGenerationError("API Error")
+            return "Output"
+
+        with patch("src.tools.base.generate_text_async", side_effect=generate):
+            result = await self.tool.execute_variations_async(
+                {"title": "Test"}, variation_count=3, provider=self.provider, include_scores=False
+            )
+
+        self.assertTrue(result.success)
+        self.assertEqual([v.label for v in result.variations], ["A", "B"])
+
+    async def test_single_call_requests_n_choices(self):
+        """single_call makes one n>1 request on providers that support it."""
+        with patch(
+            "src.tools.base.generate_text_choices_async",
+            new=AsyncMock(return_value=["First", "Second", "Third"]),
+        ) as mock_choices, patch("src.tools.base.generate_text_async") as mock_generate:
+            result = await self.tool.execute_variations_async(
+                {"title": "Test"}, variation_count=3, provider=self.provider,
+                include_scores=False, single_call=True,
+            )
+
+        mock_choices.assert_awaited_once()
+        self.assertEqual(mock_choices.await_args.args[2], 3)
+        mock_generate.assert_not_called()
+        self.assertEqual([v.content for v in result.variations], ["First", "Second", "Third"])
+        self.assertEqual({v.temperature for v in result.variations}, {self.tool.default_temperature})
+
+    async def test_single_call_falls_back_without_provider_support(self):
+        """Providers without n>1 support get one call per variation."""
+        provider = MagicMock(type="anthropic")
+        with patch("src.tools.base.generate_text_choices_async") as mock_choices, \
+                patch("src.tools.base.generate_text_async", new=AsyncMock(return_value="Output")) as mock_generate:
+            result = await self.tool.execute_variations_async(
+                {"title": "Test"}, provider=provider, include_scores=False, single_call=True,
+            )
+
+        mock_choices.assert_not_called()
+        self.assertEqual(mock_generate.await_count, 2)
+        self.assertEqual(len(result.variations), 2)
+
+    async def test_invalid_inputs_return_failure(self):
+        """Validation errors are reported without generating."""
+        with patch("src.tools.base.generate_text_async") as mock_generate:
+            result = await self.tool.execute_variations_async({}, provider=self.provider)
+
+        mock_generate.assert_not_called()
+        self.assertFalse(result.success)
+        self.assertIsNotNone(result.error)
+
+    def test_sync_wrapper(self):
+        """execute_variations runs the async path from synchronous code."""
+        with patch("src.tools.base.generate_text_async", new=AsyncMock(return_value="Output")):
+            result = self.tool.execute_variations({"title": "Test"}, provider=self.provider, include_scores=False)
+
+        self.assertTrue(result.success)
+        self.assertEqual(len(result.variations), 2)
+
+
 # =============================================================================
 # ToolRegistry Tests
 # =============================================================================
@@ -720,5 +841,101 @@ class TestAutoDiscovery(unittest.TestCase):
         self.assertGreater(stats["total_tools"], 0)
 
 
+class TestToolCatalog(unittest.TestCase):
+    """Tests for the precomputed catalog and lazy tool loading."""
+
+    def setUp(self):
+        """Set up a fresh registry for each test."""
+        ToolRegistry.reset()
+        self.registry = ToolRegistry()
+        self.addCleanup(ToolRegistry.reset)
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.catalog_path = os.path.join(self.tmpdir, "catalog.json")
+
+    def test_catalog_matches_discovered_definitions(self):
+        """The catalog should describe exactly the discovered tools."""
+        from src.tools.catalog import read_catalog, write_catalog
+
+        write_catalog(self.catalog_path)
+        entries = read_catalog(self.catalog_path)
+
+        self.registry.auto_discover()
+        self.assertEqual(len(entries), self.registry.get_stats()["total_tools"])
+        for entry in entries:
+            live = self.registry.get_definition(entry.definition.get_id())
+            self.assertEqual(entry.definition.model_dump(), live.model_dump())
+
+    def test_load_catalog_does_not_import_tools(self):
+        """Catalog tools are listed without being instantiated."""
+        from src.tools.catalog import write_catalog
+
+        write_catalog(self.catalog_path)
+        count = self.registry.load_catalog(self.catalog_path)
+
+        self.assertGreater(count, 0)
+        self.assertEqual(self.registry.get_stats()["loaded_tools"], 0)
+        self.assertTrue(self.registry.has_tool("blog-title-generator"))
+        self.assertEqual(self.registry.list_tools().total, count)
+        self.assertGreater(len(self.registry.get_tools_by_category(ToolCategory.BLOG)), 0)
+        self.assertEqual(self.registry.get_stats()["loaded_tools"], 0)
+
+    def test_get_tool_imports_lazily(self):
+        """get_tool should import and cache a catalog tool on first use."""
+        from src.tools.catalog import write_catalog
+        from src.tools.library.blog.blog_title import BlogTitleGeneratorTool
+
+        write_catalog(self.catalog_path)
+        self.registry.load_catalog(self.catalog_path)
+
+        tool = self.registry.get_tool("blog-title-generator")
+        self.assertIsInstance(tool, BlogTitleGeneratorTool)
+        self.assertIs(self.registry.get_tool("blog-title-generator"), tool)
+        self.assertEqual(self.registry.get_stats()["loaded_tools"], 1)
+
+    def test_stale_catalog_is_ignored(self):
+        """A catalog built from different sources should not be loaded."""
+        from src.tools.catalog import write_catalog
+
+        write_catalog(self.catalog_path)
+        with open(self.catalog_path) as f:
+            catalog = json.load(f)
+        catalog["fingerprint"] = "stale"
+        with open(self.catalog_path, "w") as f:
+            json.dump(catalog, f)
+
+        self.assertEqual(self.registry.load_catalog(self.catalog_path), 0)
+        self.assertFalse(self.registry.has_tool("blog-title-generator"))
+
+    def test_ensure_loaded_falls_back_to_discovery(self):
+        """ensure_loaded should import the library when no catalog is usable."""
+        with patch.object(ToolRegistry, "load_catalog", return_value=0):
+            self.registry.ensure_loaded()
+        self.assertTrue(self.registry.has_tool("blog-title-generator"))
+        self.assertGreater(self.registry.get_stats()["loaded_tools"], 0)
+
+    def test_listing_order_updates_on_register(self):
+        """The precomputed listing order should follow registration changes."""
+        self.registry.register(MockTool())
+        self.registry.register(PremiumMockTool())
+        names = [m.name for m in self.registry.list_tools().tools]
+        self.assertEqual(names, sorted(names))
+
+        self.registry.unregister("mock-tool")
+        ids = [m.id for m in self.registry.list_tools().tools]
+        self.assertNotIn("mock-tool", ids)
+        self.assertEqual(self.registry.list_tools(search="mock").total, 1)
+
+    def test_committed_catalog_is_current(self):
+        """src/tools/catalog.json should be regenerated when tools change."""
+        from src.tools.catalog import read_catalog
+
+        self.assertIsNotNone(
+            read_catalog(),
+            "src/tools/catalog.json is missing or stale; run "
+            "`python ../../scripts/build_tool_catalog.py` from apps/api",
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
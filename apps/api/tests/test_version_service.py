@@ -11,6 +11,7 @@ import asyncio
 import os
 import sys
 import unittest
+import unittest.mock
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -20,6 +21,12 @@ from src.content.version_service import (  # noqa: E402
     NeonVersionService,
     SupabaseVersionService,
 )
+from src.content.version_delta import (  # noqa: E402
+    apply_delta,
+    apply_delta_chain,
+    encode_delta,
+    is_snapshot_version,
+)
 from src.types.version import ChangeType  # noqa: E402
 
 
@@ -75,6 +82,51 @@ class TestFactorySelection(unittest.TestCase):
             )
 
 
+class TestVersionDeltas(unittest.TestCase):
+    BASE = "".join(f"Paragraph {i} of a long document.\n" for i in range(500))
+
+    def test_roundtrip_with_edits(self):
+        target = self.BASE.replace("Paragraph 10 ", "Edited paragraph 10 ")
+        target = target.replace("Paragraph 250 of a long document.\n", "")
+        target += "A new closing line without newline"
+        self.assertEqual(apply_delta(self.BASE, encode_delta(self.BASE, target)), target)
+
+    def test_delta_is_much_smaller_than_content(self):
+        target = self.BASE + "One more line.\n"
+        self.assertLess(len(encode_delta(self.BASE, target)), len(target) // 10)
+
+    def test_chain_reconstruction(self):
+        v2 = self.BASE + "two\n"
+        v3 = "zero\n" + v2
+        chain = [encode_delta(self.BASE, v2), encode_delta(v2, v3)]
+        self.assertEqual(apply_delta_chain(self.BASE, chain), v3)
+
+    def test_empty_and_unicode(self):
+        for base, target in (("", "héllo\n"), ("héllo", ""), ("a\r\nb", "a\r\nc")):
+            self.assertEqual(apply_delta(base, encode_delta(base, target)), target)
+
+    def test_snapshot_schedule(self):
+        self.assertEqual(
+            [n for n in range(1, 12) if is_snapshot_version(n, 5)], [1, 6, 11]
+        )
+        self.assertTrue(all(is_snapshot_version(n, 1) for n in range(1, 5)))
+
+
+class TestInMemoryCompare(unittest.IsolatedAsyncioTestCase):
+    async def test_compare_reuses_cached_diff(self):
+        svc = InMemoryVersionService()
+        await svc.create_version("c1", "alpha\nbeta\n", ChangeType.INITIAL)
+        await svc.create_version("c1", "alpha\ngamma\n")
+        first = await svc.compare_versions("c1", 1, 2)
+        with unittest.mock.patch(
+            "src.content.version_service._diff_versions"
+        ) as gen:
+            second = await svc.compare_versions("c1", 1, 2)
+        gen.assert_not_called()
+        self.assertEqual(first.unified_diff, second.unified_diff)
+        self.assertEqual((second.additions, second.deletions), (1, 1))
+
+
 def _reachable_db_url():
     """Return a DB URL with content_versions present, or None to skip.
 
@@ -175,6 +227,31 @@ class TestNeonVersionServiceIntegration(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(await self.svc.is_content_in_organization(self.cid, "org1"))
         self.assertFalse(await self.svc.register_content_organization(self.cid, "org2"))
 
+    async def test_delta_storage_reconstructs_every_version(self):
+        self.svc.snapshot_interval = 3
+        texts = [f"line {i}\n" * 20 + f"edit {i}\n" for i in range(1, 8)]
+        for text in texts:
+            await self.svc.create_version(self.cid, text)
+        async with self.pool.acquire() as conn:
+            kinds = await conn.fetch(
+                "SELECT storage_kind FROM content_versions WHERE content_id = $1 "
+                "ORDER BY version_number",
+                self.cid,
+            )
+        self.assertEqual(
+            [r["storage_kind"] for r in kinds],
+            ["full", "delta", "delta", "full", "delta", "delta", "full"],
+        )
+        for number, text in enumerate(texts, start=1):
+            version = await self.svc.get_version(self.cid, number)
+            self.assertEqual(version.content, text)
+
+        self.svc.snapshot_interval = 1
+        stats = await self.svc.backfill_storage(content_id=self.cid)
+        self.assertEqual(stats["to_full"], 4)
+        version = await self.svc.get_version(self.cid, 6)
+        self.assertEqual(version.content, texts[5])
+
 
 if __name__ == "__main__":
     unittest.main()
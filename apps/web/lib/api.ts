@@ -68,6 +68,7 @@ export const API_ENDPOINTS = {
     score: (toolId: string) => `${API_V1_BASE_URL}/tools/${toolId}/score`,
     scoreGeneric: `${API_V1_BASE_URL}/tools/score`,
     variations: (toolId: string) => `${API_V1_BASE_URL}/tools/${toolId}/variations`,
+    variationsStream: (toolId: string) => `${API_V1_BASE_URL}/tools/${toolId}/variations/stream`,
     validate: (toolId: string) => `${API_V1_BASE_URL}/tools/${toolId}/validate`,
     byCategory: (category: string) => `${API_V1_BASE_URL}/tools/category/${category}`,
   },
@@ -132,6 +133,7 @@ export const API_ENDPOINTS = {
     analyze: `${API_V1_BASE_URL}/remix/analyze`,
     preview: `${API_V1_BASE_URL}/remix/preview`,
     transform: `${API_V1_BASE_URL}/remix/transform`,
+    transformStream: `${API_V1_BASE_URL}/remix/transform/stream`,
     transformFormat: (formatId: string) => `${API_V1_BASE_URL}/remix/transform/${formatId}`,
     batch: `${API_V1_BASE_URL}/remix/batch`,
   },
@@ -388,6 +388,8 @@ export interface ScoreContentRequest {
   content: string
   content_type: ContentType
   provider?: string
+  /** Generate LLM feedback if none is cached; cached feedback is always returned. */
+  include_feedback?: boolean
 }
 
 export interface TrainingStatusResponse {
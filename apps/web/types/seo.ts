@@ -12,6 +12,7 @@ export interface SEOScore {
   passed: boolean
   passes_used: number
   suggestions_applied: number
+  sections_rewritten?: number
 }
 
 export interface SEOThresholds {
@@ -22,6 +23,7 @@ export interface SEOThresholds {
   readability_minimum?: number
   word_count_minimum?: number
   max_optimization_passes?: number
+  min_score_gain?: number
 }
 
 export interface SEODimension {
@@ -0,0 +1,40 @@
+-- Migration 010: Delta-compressed content version storage
+--
+-- Backs the snapshot + delta storage mode of NeonVersionService
+-- (src/content/version_service.py). Every CONTENT_VERSION_SNAPSHOT_INTERVAL-th
+-- version keeps its full text in `content`; the versions in between store a
+-- zlib-compressed forward delta against the previous version in `delta` and
+-- leave `content` NULL. Reads reconstruct from the nearest snapshot.
+--
+-- `content_preview` holds the first 200 characters so version history lists
+-- never need to ship (or reconstruct) full document text.
+--
+-- Existing rows stay valid as full snapshots (storage_kind defaults to 'full').
+-- Convert them with scripts/backfill_content_version_deltas.py.
+-- Portable/idempotent.
+
+ALTER TABLE content_versions ALTER COLUMN content DROP NOT NULL;
+
+ALTER TABLE content_versions
+  ADD COLUMN IF NOT EXISTS storage_kind text NOT NULL DEFAULT 'full';
+ALTER TABLE content_versions ADD COLUMN IF NOT EXISTS delta bytea;
+ALTER TABLE content_versions ADD COLUMN IF NOT EXISTS content_preview text;
+
+DO $$
+BEGIN
+  ALTER TABLE content_versions
+    ADD CONSTRAINT content_versions_storage_kind_check CHECK (
+      (storage_kind = 'full' AND content IS NOT NULL)
+      OR (storage_kind = 'delta' AND delta IS NOT NULL)
+    );
+EXCEPTION WHEN duplicate_object THEN NULL;
+END $$;
+
+-- Reconstruction looks up the nearest snapshot at or below a version.
+CREATE INDEX IF NOT EXISTS idx_content_versions_snapshots
+  ON content_versions(content_id, version_number DESC)
+  WHERE storage_kind = 'full';
+
+UPDATE content_versions
+SET content_preview = LEFT(content, 200)
+WHERE content_preview IS NULL AND content IS NOT NULL;
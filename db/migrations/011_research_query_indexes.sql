@@ -0,0 +1,18 @@
+-- Migration 011: Research lookup indexes
+--
+-- Backs the two hot reads in src/research/research_store.py:
+--   get_cached_research:   WHERE query = $1 AND depth = $2 AND created_at > ...
+--                          ORDER BY created_at DESC LIMIT 1
+--   list_research_history: WHERE user_id = $1 ORDER BY created_at DESC
+-- The existing GIN full-text index on query cannot serve the exact-match
+-- cache lookup, and the single-column user_id index still needs a sort.
+-- idx_research_queries_user_id is superseded by the composite index.
+-- Portable/idempotent.
+
+CREATE INDEX IF NOT EXISTS idx_research_queries_lookup
+  ON research_queries(query, depth, created_at DESC);
+
+CREATE INDEX IF NOT EXISTS idx_research_queries_user_created
+  ON research_queries(user_id, created_at DESC);
+
+DROP INDEX IF EXISTS idx_research_queries_user_id;
@@ -0,0 +1,97 @@
+-- Migration 012: Hourly/daily performance rollups
+--
+-- Backs the dashboard reads in src/analytics/dashboard_service.py. Both tables
+-- are maintained incrementally by the event ingestion pipeline
+-- (src/analytics/ingestion.py): every micro-batch upserts counter increments
+-- into the hour and day buckets it touched, in the same transaction that
+-- writes performance_events and content_performance.
+--
+-- Rows are keyed by bucket and by the dimensions the dashboard filters and
+-- groups on (organization, user, content type, platform), not by content_id,
+-- so a period summary reads at most buckets x dimensions rows regardless of
+-- how much content an organization has. organization_id / user_id use ''
+-- for "none" so they can take part in the primary key (no FK for that reason).
+--
+-- Daily buckets start at 00:00 UTC. Existing performance_events are backfilled
+-- once below. Portable/idempotent.
+
+CREATE TABLE IF NOT EXISTS performance_rollups_hourly (
+    bucket_start TIMESTAMPTZ NOT NULL,
+    organization_id TEXT NOT NULL DEFAULT '',
+    user_id TEXT NOT NULL DEFAULT '',
+    content_type TEXT NOT NULL DEFAULT 'blog',
+    platform TEXT NOT NULL DEFAULT '',
+
+    views BIGINT NOT NULL DEFAULT 0,
+    unique_views BIGINT NOT NULL DEFAULT 0,
+    shares BIGINT NOT NULL DEFAULT 0,
+    conversions BIGINT NOT NULL DEFAULT 0,
+    revenue NUMERIC(14, 2) NOT NULL DEFAULT 0,
+    backlinks BIGINT NOT NULL DEFAULT 0,
+    time_on_page_seconds NUMERIC(16, 2) NOT NULL DEFAULT 0,
+    time_on_page_samples BIGINT NOT NULL DEFAULT 0,
+    bounces BIGINT NOT NULL DEFAULT 0,
+
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+
+    PRIMARY KEY (bucket_start, organization_id, user_id, content_type, platform)
+);
+
+CREATE TABLE IF NOT EXISTS performance_rollups_daily (
+    LIKE performance_rollups_hourly INCLUDING DEFAULTS INCLUDING CONSTRAINTS,
+    PRIMARY KEY (bucket_start, organization_id, user_id, content_type, platform)
+);
+
+CREATE INDEX IF NOT EXISTS idx_perf_rollups_hourly_org
+  ON performance_rollups_hourly(organization_id, bucket_start);
+CREATE INDEX IF NOT EXISTS idx_perf_rollups_hourly_user
+  ON performance_rollups_hourly(user_id, bucket_start);
+CREATE INDEX IF NOT EXISTS idx_perf_rollups_daily_org
+  ON performance_rollups_daily(organization_id, bucket_start);
+CREATE INDEX IF NOT EXISTS idx_perf_rollups_daily_user
+  ON performance_rollups_daily(user_id, bucket_start);
+
+-- Top content and active-content counts per organization.
+CREATE INDEX IF NOT EXISTS idx_content_perf_org_views
+  ON content_performance(organization_id, views DESC);
+CREATE INDEX IF NOT EXISTS idx_content_perf_org_last_tracked
+  ON content_performance(organization_id, last_tracked_at DESC);
+
+-- One-time backfill from raw events. DO NOTHING keeps re-runs from double
+-- counting; buckets already written by the pipeline are left alone.
+INSERT INTO performance_rollups_hourly (
+    bucket_start, organization_id, user_id, content_type, platform,
+    views, unique_views, shares, conversions, revenue, backlinks,
+    time_on_page_seconds, time_on_page_samples, bounces
+)
+SELECT
+    date_trunc('hour', e.timestamp AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+    COALESCE(cp.organization_id, ''), COALESCE(cp.user_id, ''),
+    cp.content_type, COALESCE(e.platform, ''),
+    COUNT(*) FILTER (WHERE e.event_type = 'view'),
+    COUNT(*) FILTER (WHERE e.event_type = 'unique_view'),
+    COUNT(*) FILTER (WHERE e.event_type = 'share'),
+    COUNT(*) FILTER (WHERE e.event_type = 'conversion'),
+    COALESCE(SUM((e.metadata ->> 'revenue')::numeric) FILTER (WHERE e.event_type = 'conversion'), 0),
+    COUNT(*) FILTER (WHERE e.event_type = 'backlink'),
+    COALESCE(SUM(e.value) FILTER (WHERE e.event_type = 'time_on_page'), 0),
+    COUNT(*) FILTER (WHERE e.event_type = 'time_on_page'),
+    COUNT(*) FILTER (WHERE e.event_type = 'bounce')
+FROM performance_events e
+JOIN content_performance cp ON cp.content_id = e.content_id
+GROUP BY 1, 2, 3, 4, 5
+ON CONFLICT DO NOTHING;
+
+INSERT INTO performance_rollups_daily (
+    bucket_start, organization_id, user_id, content_type, platform,
+    views, unique_views, shares, conversions, revenue, backlinks,
+    time_on_page_seconds, time_on_page_samples, bounces
+)
+SELECT
+    date_trunc('day', bucket_start AT TIME ZONE 'UTC') AT TIME ZONE 'UTC',
+    organization_id, user_id, content_type, platform,
+    SUM(views), SUM(unique_views), SUM(shares), SUM(conversions), SUM(revenue),
+    SUM(backlinks), SUM(time_on_page_seconds), SUM(time_on_page_samples), SUM(bounces)
+FROM performance_rollups_hourly
+GROUP BY 1, 2, 3, 4, 5
+ON CONFLICT DO NOTHING;
@@ -0,0 +1,12 @@
+-- Migration 013: Incremental voice fingerprint statistics
+--
+-- Backs incremental training in src/brand/trainer.py. `statistics` holds the
+-- fingerprint's sufficient statistics (per-metric sums and sums of squares,
+-- term counters and the IDs of the samples folded in; see
+-- src/brand/fingerprint_stats.py). With it, training only analyzes samples
+-- added since the last run and deleting a sample subtracts it in place.
+--
+-- Existing fingerprints keep NULL and are rebuilt from all samples on their
+-- next training run. Portable/idempotent.
+
+ALTER TABLE voice_fingerprints ADD COLUMN IF NOT EXISTS statistics jsonb;
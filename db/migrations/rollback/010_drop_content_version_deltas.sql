@@ -0,0 +1,17 @@
+-- Rollback: 010_content_version_deltas.sql
+-- Description: Removes delta storage columns from content_versions.
+--
+-- Delta-stored versions must be expanded to full snapshots first:
+--   python scripts/backfill_content_version_deltas.py --snapshot-interval 1
+-- Otherwise restoring NOT NULL on `content` fails and the rollback aborts.
+
+BEGIN;
+
+ALTER TABLE content_versions ALTER COLUMN content SET NOT NULL;
+DROP INDEX IF EXISTS idx_content_versions_snapshots;
+ALTER TABLE content_versions DROP CONSTRAINT IF EXISTS content_versions_storage_kind_check;
+ALTER TABLE content_versions DROP COLUMN IF EXISTS content_preview;
+ALTER TABLE content_versions DROP COLUMN IF EXISTS delta;
+ALTER TABLE content_versions DROP COLUMN IF EXISTS storage_kind;
+
+COMMIT;
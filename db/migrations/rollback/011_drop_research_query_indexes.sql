@@ -0,0 +1,12 @@
+-- Rollback: 011_research_query_indexes.sql
+-- Description: Restores the single-column research_queries indexes.
+--
+-- No data is removed.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_research_queries_user_id ON research_queries(user_id);
+DROP INDEX IF EXISTS idx_research_queries_user_created;
+DROP INDEX IF EXISTS idx_research_queries_lookup;
+
+COMMIT;
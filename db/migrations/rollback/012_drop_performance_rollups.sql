@@ -0,0 +1,15 @@
+-- Rollback: 012_performance_rollups.sql
+-- Description: Drops the dashboard rollup tables and the per-organization
+-- content_performance indexes.
+--
+-- Rollup rows are derived data; performance_events and content_performance
+-- are untouched.
+
+BEGIN;
+
+DROP INDEX IF EXISTS idx_content_perf_org_last_tracked;
+DROP INDEX IF EXISTS idx_content_perf_org_views;
+DROP TABLE IF EXISTS performance_rollups_daily CASCADE;
+DROP TABLE IF EXISTS performance_rollups_hourly CASCADE;
+
+COMMIT;
@@ -0,0 +1,11 @@
+-- Rollback: 013_voice_fingerprint_statistics.sql
+-- Description: Removes the incremental training statistics from voice_fingerprints.
+--
+-- The statistics are derived data; fingerprints are rebuilt from samples on
+-- the next training run.
+
+BEGIN;
+
+ALTER TABLE voice_fingerprints DROP COLUMN IF EXISTS statistics;
+
+COMMIT;
@@ -0,0 +1,71 @@
+"""
+Convert stored content versions to snapshot + delta storage.
+
+Rewrites existing content_versions rows (db/migrations/010) so that only every
+N-th version keeps its full text and the rest store compressed deltas. Run with
+--snapshot-interval 1 to expand everything back to full snapshots (required
+before rolling back migration 010).
+
+Usage (from apps/api, with DATABASE_URL set):
+  python ../../scripts/backfill_content_version_deltas.py
+  python ../../scripts/backfill_content_version_deltas.py --content-id abc123
+  python ../../scripts/backfill_content_version_deltas.py --snapshot-interval 1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.getcwd())
+
+from src.content.version_service import NeonVersionService  # noqa: E402
+from src.db import close_pool, is_database_configured  # noqa: E402
+
+
+async def _run(args: argparse.Namespace) -> int:
+    service = NeonVersionService(snapshot_interval=args.snapshot_interval)
+    try:
+        stats = await service.backfill_storage(
+            content_id=args.content_id,
+            batch_size=args.batch_size,
+        )
+    finally:
+        await close_pool()
+
+    print(
+        f"Processed {stats['contents']} content items: "
+        f"{stats['to_delta']} rows converted to deltas, "
+        f"{stats['to_full']} rows expanded to snapshots."
+    )
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Backfill content version deltas")
+    parser.add_argument("--content-id", default=None, help="Only process this content")
+    parser.add_argument(
+        "--snapshot-interval",
+        type=int,
+        default=int(os.environ.get("CONTENT_VERSION_SNAPSHOT_INTERVAL", "10")),
+        help="Keep a full snapshot every N versions (1 disables deltas)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=100,
+        help="Content ids fetched per page",
+    )
+    args = parser.parse_args()
+
+    if not is_database_configured():
+        print("DATABASE_URL (or DATABASE_URL_DIRECT) must be set.")
+        return 1
+
+    return asyncio.run(_run(args))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,133 @@
+"""
+Benchmark the buffered analytics ingestion pipeline.
+
+Measures two numbers:
+
+  ack        how fast PerformanceService-style callers can hand events to the
+             pipeline (what a tracking pixel request waits for)
+  sustained  events/sec actually written while producers run flat out (the
+             pipeline is saturated, so dropped events are expected and show
+             how far the offered load exceeds write capacity)
+
+With DATABASE_URL set (db/migrations applied) the real batch writer is used.
+Otherwise the database is simulated with a fixed round-trip time per
+statement, and the previous per-event path (INSERT event, SELECT aggregate,
+UPDATE aggregate) is measured for comparison.
+
+Usage (from apps/api):
+  python ../../scripts/bench_analytics_ingestion.py
+  python ../../scripts/bench_analytics_ingestion.py --duration 5 --rtt-ms 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.getcwd())
+
+from src.analytics.ingestion import EventIngestionPipeline, write_event_batch  # noqa: E402
+from src.db import close_pool, is_database_configured  # noqa: E402
+from src.types.performance import MetricType, PerformanceEvent  # noqa: E402
+
+_KINDS = [MetricType.VIEW] * 8 + [MetricType.UNIQUE_VIEW, MetricType.SHARE]
+
+
+def _event(rng: random.Random, contents: int) -> PerformanceEvent:
+    return PerformanceEvent(
+        event_type=rng.choice(_KINDS),
+        content_id=f"bench-{rng.randrange(contents)}",
+        platform="twitter",
+        source="tracking_pixel",
+    )
+
+
+def _simulated_writer(rtt: float):
+    async def write(batch):
+        # BEGIN, events INSERT, aggregates upsert, hourly + daily rollups, COMMIT
+        await asyncio.sleep(6 * rtt)
+
+    return write
+
+
+async def _per_event_rate(rtt: float, duration: float) -> float:
+    """Previous behaviour: three sequential statements per event."""
+    written = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        await asyncio.sleep(3 * rtt)
+        written += 1
+    return written / duration
+
+
+async def _sustained(pipeline: EventIngestionPipeline, rng, contents, duration, rate_chunk):
+    deadline = time.perf_counter() + duration
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        for _ in range(rate_chunk):
+            pipeline.enqueue(_event(rng, contents))
+        await asyncio.sleep(0)  # let the flusher run between request bursts
+    await pipeline.stop()
+    elapsed = time.perf_counter() - start
+    return pipeline.stats(), elapsed
+
+
+async def _main(args: argparse.Namespace) -> int:
+    rng = random.Random(7)
+    use_db = is_database_configured() and not args.simulate
+    writer = write_event_batch if use_db else _simulated_writer(args.rtt_ms / 1000)
+
+    # Ack latency: enqueue only, no flusher draining in between.
+    events = [_event(rng, args.contents) for _ in range(args.ack_events)]
+    pipeline = EventIngestionPipeline(
+        capacity=args.ack_events, batch_size=args.ack_events, flush_interval=3600, writer=writer
+    )
+    start = time.perf_counter()
+    for event in events:
+        pipeline.enqueue(event)
+    ack = time.perf_counter() - start
+    await pipeline.stop()
+    print(
+        f"ack: {ack / len(events) * 1e6:.2f} us/event "
+        f"({len(events) / ack:,.0f} events/s accepted)"
+    )
+
+    pipeline = EventIngestionPipeline(
+        batch_size=args.batch_size, flush_interval=args.flush_ms / 1000, writer=writer
+    )
+    stats, elapsed = await _sustained(pipeline, rng, args.contents, args.duration, 200)
+    print(
+        f"sustained ({'postgres' if use_db else f'simulated rtt={args.rtt_ms}ms'}): "
+        f"{stats['written'] / elapsed:,.0f} events/s written "
+        f"in {stats['batches']} batches, {stats['dropped']} dropped"
+    )
+
+    if not use_db:
+        baseline = await _per_event_rate(args.rtt_ms / 1000, min(args.duration, 2.0))
+        print(f"per-event writes (previous path): {baseline:,.0f} events/s")
+
+    if use_db:
+        await close_pool()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark analytics ingestion")
+    parser.add_argument("--duration", type=float, default=3.0, help="Seconds of sustained load")
+    parser.add_argument("--batch-size", type=int, default=500, help="Events per batch")
+    parser.add_argument("--flush-ms", type=int, default=250, help="Flush interval")
+    parser.add_argument("--contents", type=int, default=200, help="Distinct content ids")
+    parser.add_argument("--ack-events", type=int, default=100_000, help="Events for ack timing")
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="Simulated DB round trip")
+    parser.add_argument(
+        "--simulate", action="store_true", help="Simulate the DB even if DATABASE_URL is set"
+    )
+    return asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
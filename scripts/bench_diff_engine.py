@@ -0,0 +1,130 @@
+"""
+Benchmark the version diff engine against difflib.
+
+Generates synthetic documents of increasing size (short paragraphs separated
+by blank lines, like typical generated articles), applies a batch of scattered
+edits (replaced, inserted and deleted lines) and times a line-level unified
+diff with both src.content.diff_engine and difflib.unified_diff.
+
+Usage (from apps/api):
+  python ../../scripts/bench_diff_engine.py
+  python ../../scripts/bench_diff_engine.py --sizes 1000 10000 --edits 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import difflib
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.getcwd())
+
+from src.content.diff_engine import build_token_index, format_unified_diff  # noqa: E402
+from src.types.version import DiffGranularity  # noqa: E402
+
+_WORDS = (
+    "content marketing brand audience campaign social search engine strategy "
+    "conversion funnel email newsletter landing page headline keyword metric"
+).split()
+
+
+def _make_document(lines: int, blank_every: int, rng: random.Random) -> list[str]:
+    return [
+        "\n"
+        if blank_every and i % blank_every == 0
+        else " ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 14))) + "\n"
+        for i in range(lines)
+    ]
+
+
+def _edit(lines: list[str], edits: int, rng: random.Random) -> list[str]:
+    out = list(lines)
+    for _ in range(edits):
+        pos = rng.randrange(len(out))
+        roll = rng.random()
+        if roll < 0.4:
+            out[pos] = "edited " + out[pos]
+        elif roll < 0.7:
+            out.insert(pos, "inserted paragraph text\n")
+        elif len(out) > 1:
+            del out[pos]
+    return out
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark version diffing")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 5000, 10000, 50000],
+        help="Document sizes in lines",
+    )
+    parser.add_argument("--edits", type=int, default=100, help="Edits per document")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement")
+    parser.add_argument(
+        "--blank-every",
+        type=int,
+        default=3,
+        help="Insert a blank line every N lines (0 for none)",
+    )
+    parser.add_argument(
+        "--skip-difflib-above",
+        type=int,
+        default=50000,
+        help="Skip the difflib run for documents larger than this",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    print(f"{'lines':>8} {'engine ms':>10} {'difflib ms':>11} {'speedup':>8}")
+    for size in args.sizes:
+        old_lines = _make_document(size, args.blank_every, rng)
+        new_lines = _edit(old_lines, args.edits, rng)
+        old_text, new_text = "".join(old_lines), "".join(new_lines)
+
+        def run_engine():
+            return format_unified_diff(
+                build_token_index(old_text, DiffGranularity.LINE),
+                build_token_index(new_text, DiffGranularity.LINE),
+                "version_1",
+                "version_2",
+            )
+
+        def run_difflib():
+            return "".join(
+                difflib.unified_diff(
+                    old_text.splitlines(keepends=True),
+                    new_text.splitlines(keepends=True),
+                    "version_1",
+                    "version_2",
+                    lineterm="",
+                )
+            )
+
+        engine = _time(run_engine, args.repeat)
+        if size > args.skip_difflib_above:
+            print(f"{size:>8} {engine * 1000:>10.1f} {'skipped':>11} {'-':>8}")
+            continue
+        reference = _time(run_difflib, args.repeat)
+        print(
+            f"{size:>8} {engine * 1000:>10.1f} {reference * 1000:>11.1f} "
+            f"{reference / engine:>7.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,126 @@
+"""
+Benchmark connection reuse in the shared outbound HTTP client.
+
+Starts a local keep-alive HTTP stub server and sends the same number of
+requests three ways:
+
+  unpooled   bare requests.get, a fresh connection per call (previous behaviour)
+  pooled     src.utils.http_client sync API, one pooled client per host
+  async      src.utils.http_client async API with concurrent requests
+
+The stub adds a fixed per-connection setup delay to stand in for the DNS +
+TCP + TLS handshake cost of a real upstream (plain localhost TCP alone is
+nearly free, which would hide the difference).
+
+Usage (from apps/api):
+  python ../../scripts/bench_http_client.py
+  python ../../scripts/bench_http_client.py --requests 500 --setup-ms 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.getcwd())
+
+import requests  # noqa: E402
+
+from src.utils import http_client  # noqa: E402
+
+
+def _make_handler(setup_delay: float):
+    class StubHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def setup(self):
+            time.sleep(setup_delay)  # simulated handshake, once per connection
+            super().setup()
+
+        def do_GET(self):
+            body = b'{"organic_results": []}'
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return StubHandler
+
+
+class _StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+def _run_unpooled(url: str, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        requests.get(url, timeout=30).raise_for_status()
+    return time.perf_counter() - start
+
+
+def _run_pooled(url: str, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        http_client.get_sync(url).raise_for_status()
+    return time.perf_counter() - start
+
+
+async def _run_async(url: str, count: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            (await http_client.get(url)).raise_for_status()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(count)))
+    return time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark outbound HTTP pooling")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per mode")
+    parser.add_argument(
+        "--setup-ms",
+        type=float,
+        default=10.0,
+        help="Simulated per-connection setup cost in milliseconds",
+    )
+    parser.add_argument("--concurrency", type=int, default=10, help="Async concurrency")
+    args = parser.parse_args()
+
+    server = _StubServer(("127.0.0.1", 0), _make_handler(args.setup_ms / 1000))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/search"
+
+    try:
+        unpooled = _run_unpooled(url, args.requests)
+        pooled = _run_pooled(url, args.requests)
+        concurrent = asyncio.run(_run_async(url, args.requests, args.concurrency))
+    finally:
+        server.shutdown()
+
+    print(f"{'mode':<10} {'total s':>8} {'req/s':>8} {'speedup':>8}")
+    for name, elapsed in (("unpooled", unpooled), ("pooled", pooled), ("async", concurrent)):
+        print(
+            f"{name:<10} {elapsed:>8.2f} {args.requests / elapsed:>8.0f} "
+            f"{unpooled / elapsed:>7.1f}x"
+        )
+    for host, stats in http_client.get_http_stats().items():
+        print(f"{host}: {stats}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
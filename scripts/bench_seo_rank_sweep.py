@@ -0,0 +1,160 @@
+"""
+Benchmark keyword rank sweeps against a stub SERP server.
+
+Starts a local SERP API stand-in that answers every query after a fixed
+delay (the target URL is found at a keyword-dependent position), then
+tracks the same keyword list twice:
+
+  sequential  the previous path: for each keyword a SERP call, a
+              previous-ranking query and an insert, one after another
+  sweep       RankSweep: one bulk previous-ranking query, concurrent rate
+              limited lookups, one bulk insert of changed rankings
+
+Without DATABASE_URL the database is simulated with a fixed round-trip time
+per statement (like bench_analytics_ingestion.py).
+
+Usage (from apps/api):
+  python ../../scripts/bench_seo_rank_sweep.py
+  python ../../scripts/bench_seo_rank_sweep.py --keywords 500 --serp-ms 150 --rps 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import time
+import zlib
+from urllib.parse import parse_qs
+
+sys.path.insert(0, os.getcwd())
+
+import uvicorn  # noqa: E402
+
+from src.analytics.rank_sweep import RankSweep  # noqa: E402
+from src.analytics.seo_tracker import SEOTracker  # noqa: E402
+from src.db import close_pool, is_database_configured  # noqa: E402
+from src.utils.http_client import close_http_clients  # noqa: E402
+
+TARGET_URL = "https://bench.example.com/post"
+
+
+def _stub_serp_app(delay: float):
+    async def app(scope, receive, send):
+        if scope["type"] != "http":
+            return
+        query = parse_qs(scope["query_string"].decode())
+        keyword = query.get("q", [""])[0]
+        position = zlib.crc32(keyword.encode()) % 30 + 1
+        results = [{"link": f"https://other{i}.example.org/"} for i in range(1, position)]
+        results.append({"link": TARGET_URL})
+        body = json.dumps({"organic_results": results}).encode()
+
+        await asyncio.sleep(delay)
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            "headers": [(b"content-type", b"application/json")],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+class _SimulatedDBTracker(SEOTracker):
+    """SEOTracker whose storage calls cost a fixed round trip each."""
+
+    def __init__(self, rtt: float, **kwargs):
+        super().__init__(**kwargs)
+        self._rtt = rtt
+
+    async def _get_previous_ranking(self, keyword, target_url):
+        await asyncio.sleep(self._rtt)
+        return None
+
+    async def _store_ranking(self, ranking, target_url):
+        await asyncio.sleep(self._rtt)
+
+    async def _get_previous_rankings(self, keywords, target_url):
+        await asyncio.sleep(self._rtt)
+        return {}
+
+    async def _store_rankings(self, rankings, target_url):
+        await asyncio.sleep(self._rtt)
+        return True
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def _main(args: argparse.Namespace) -> int:
+    port = _free_port()
+    server = uvicorn.Server(
+        uvicorn.Config(_stub_serp_app(args.serp_ms / 1000), port=port, log_level="warning")
+    )
+    serve = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+
+    use_db = is_database_configured() and not args.simulate
+    if use_db:
+        tracker = SEOTracker(api_key="bench")
+    else:
+        tracker = _SimulatedDBTracker(args.rtt_ms / 1000, api_key="bench")
+    tracker.SERP_API_BASE_URL = f"http://127.0.0.1:{port}/search"
+    keywords = [f"bench keyword {i}" for i in range(args.keywords)]
+
+    sequential_keywords = keywords[: args.sequential]
+    start = time.perf_counter()
+    for keyword in sequential_keywords:
+        await tracker.check_keyword_ranking(keyword, TARGET_URL)
+    per_keyword = (time.perf_counter() - start) / len(sequential_keywords)
+    print(
+        f"sequential: {per_keyword * 1000:.1f} ms/keyword "
+        f"(~{per_keyword * len(keywords):.1f}s for {len(keywords)} keywords, "
+        f"measured on {len(sequential_keywords)})"
+    )
+
+    sweep = RankSweep(tracker, concurrency=args.concurrency, requests_per_second=args.rps)
+    start = time.perf_counter()
+    rankings = await sweep.run(keywords, TARGET_URL)
+    elapsed = time.perf_counter() - start
+    print(
+        f"sweep (concurrency={args.concurrency}, {args.rps:g} req/s): "
+        f"{elapsed:.2f}s for {len(rankings)} keywords "
+        f"({len(rankings) / elapsed:,.0f} keywords/s) stats={sweep.stats}"
+    )
+    print(f"storage: {'postgres' if use_db else f'simulated rtt={args.rtt_ms}ms'}")
+
+    server.should_exit = True
+    await serve
+    await close_http_clients()
+    if use_db:
+        await close_pool()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SEO rank sweeps")
+    parser.add_argument("--keywords", type=int, default=300, help="Keywords per sweep")
+    parser.add_argument(
+        "--sequential", type=int, default=30, help="Keywords timed on the sequential path"
+    )
+    parser.add_argument("--serp-ms", type=float, default=100.0, help="Stub SERP latency")
+    parser.add_argument("--rtt-ms", type=float, default=2.0, help="Simulated DB round trip")
+    parser.add_argument("--concurrency", type=int, default=16, help="Parallel lookups")
+    parser.add_argument("--rps", type=float, default=100.0, help="SERP rate limit")
+    parser.add_argument(
+        "--simulate", action="store_true", help="Simulate the DB even if DATABASE_URL is set"
+    )
+    return asyncio.run(_main(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
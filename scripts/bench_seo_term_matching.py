@@ -0,0 +1,163 @@
+"""
+Benchmark SEO term matching: substring scans vs the Aho-Corasick matcher.
+
+Builds a synthetic SERP analysis (topics, NLP terms and questions; 200
+patterns in total by default) and a draft of N words that mentions about
+half of them, then times:
+
+  substring   the previous approach: one ``pattern in content`` scan per
+              topic, topic word, term and question word
+  cold        compiling a TermMatcher for the pattern set, then one scan
+              (tokenizing the draft)
+  cached      get_term_matcher() (already built for this SERP analysis)
+              plus one scan that tokenizes the draft
+  shared      get_term_matcher() plus one scan of a draft whose
+              TextAnalysis token index already exists, as in
+              optimize_content, which analyzes the draft anyway, and in
+              every later pass over unchanged sections
+
+Usage (from apps/api):
+  python ../../scripts/bench_seo_term_matching.py
+  python ../../scripts/bench_seo_term_matching.py --terms 500 --words 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.getcwd())
+
+from src.seo.content_optimizer import _normalize_text  # noqa: E402
+from src.scoring.text_analysis import analyze_text  # noqa: E402
+from src.seo.term_matcher import (  # noqa: E402
+    TermMatcher,
+    get_term_matcher,
+    serp_patterns,
+    significant_words,
+)
+from src.types.seo import SERPAnalysis  # noqa: E402
+
+_WORDS = (
+    "content marketing brand audience campaign social search engine strategy "
+    "conversion funnel email newsletter landing page headline keyword metric "
+    "analytics traffic ranking backlink authority schema snippet intent persona"
+).split()
+
+# Ordinary prose vocabulary the pattern words are mixed into.
+_FILLER = (
+    "the a of to and in is that for it with as was on be at by this have from "
+    "or one had not but what all were when we there can an your which their "
+    "said if do will each about how up out them then she many some so these "
+    "would other into has more her two like him see time could no make than "
+    "first been its who now people my made over did down only way find use may "
+    "water long little very after words called just where most know get through "
+    "back much before go good new write our used me man too any day same right "
+    "look think also around another came come work three word must because does "
+    "part even place well such here take why things help put years different"
+).split()
+
+
+def _phrase(rng: random.Random, index: int) -> str:
+    words = rng.sample(_WORDS, rng.randint(1, 3))
+    return " ".join(words + [f"topic{index}"])
+
+
+def _make_serp(patterns: int, rng: random.Random) -> SERPAnalysis:
+    topics = [_phrase(rng, i) for i in range(patterns // 4)]
+    terms = [_phrase(rng, i + len(topics)) for i in range(patterns // 2)]
+    questions = [f"how does {_phrase(rng, i + 10_000)} work?" for i in range(5)]
+    serp = SERPAnalysis(
+        keyword="content marketing",
+        common_topics=topics,
+        nlp_terms=terms,
+        questions_to_answer=questions,
+    )
+    # Top up with terms so the compiled pattern count matches --terms.
+    while len(serp_patterns(serp, ["content marketing"])) < patterns:
+        serp.nlp_terms.append(_phrase(rng, len(serp.nlp_terms) + 20_000))
+    return serp
+
+
+def _make_draft(words: int, serp: SERPAnalysis, rng: random.Random) -> str:
+    mentions = rng.sample(
+        serp.common_topics + serp.nlp_terms,
+        (len(serp.common_topics) + len(serp.nlp_terms)) // 2,
+    )
+    out = []
+    while len(out) < words:
+        roll = rng.random()
+        if mentions and roll < 0.02:
+            out.extend(mentions.pop().split())
+        elif roll < 0.1:
+            out.append(rng.choice(_WORDS))
+        else:
+            out.append(rng.choice(_FILLER))
+        if rng.random() < 0.07:
+            out[-1] += "."
+    return " ".join(out)
+
+
+def _substring_scan(content: str, serp: SERPAnalysis) -> int:
+    found = 0
+    for topic in serp.common_topics:
+        topic_lower = topic.lower().strip()
+        if topic_lower in content or all(
+            w in content for w in significant_words(topic_lower)
+        ):
+            found += 1
+    for term in serp.nlp_terms:
+        found += term.lower().strip() in content
+    for question in serp.questions_to_answer[:5]:
+        found += all(w in content for w in significant_words(question))
+    return found
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark SEO term matching")
+    parser.add_argument("--terms", type=int, default=200, help="Patterns to match")
+    parser.add_argument("--words", type=int, default=10_000, help="Draft length in words")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    serp = _make_serp(args.terms, rng)
+    content = _normalize_text(_make_draft(args.words, serp, rng))
+    patterns = serp_patterns(serp, ["content marketing"])
+
+    substring = _time(lambda: _substring_scan(content, serp), args.repeat)
+    cold = _time(lambda: TermMatcher(patterns).scan(content), args.repeat)
+    get_term_matcher(serp, ["content marketing"])
+    cached = _time(
+        lambda: get_term_matcher(serp, ["content marketing"]).scan(content), args.repeat
+    )
+    index = analyze_text(content).term_index
+    shared = _time(
+        lambda: get_term_matcher(serp, ["content marketing"]).scan(content, index), args.repeat
+    )
+
+    scan = get_term_matcher(serp, ["content marketing"]).scan(content)
+    matched = sum(1 for p in patterns if scan.contains(p))
+    print(f"{len(patterns)} patterns, {args.words} words, {matched} patterns found")
+    print(f"{'method':>10} {'ms':>8}")
+    print(f"{'substring':>10} {substring * 1000:>8.2f}")
+    print(f"{'cold':>10} {cold * 1000:>8.2f}")
+    print(f"{'cached':>10} {cached * 1000:>8.2f}")
+    print(f"{'shared':>10} {shared * 1000:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
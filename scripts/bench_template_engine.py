@@ -0,0 +1,169 @@
+"""
+Benchmark the marketing template engine: catalog listing and prompt rendering.
+
+Times, per operation, the previous approach against the compiled engine:
+
+  listing    summarizing every template on each call (get_all_templates),
+             scanning the set for one category, and counting templates per
+             category, vs. the precomputed summaries and category index
+  rendering  validating fields and filling the prompt with format_map on
+             each call, vs. the compiled validators and render plan
+             ("compiled"), vs. the same with the rendered-prompt LRU warm
+             ("cached", as when the same inputs are submitted again)
+
+Usage (from apps/api):
+  python ../../scripts/bench_template_engine.py
+  python ../../scripts/bench_template_engine.py --iterations 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+sys.path.insert(0, os.getcwd())
+
+from src.templates import template_engine  # noqa: E402
+from src.templates.marketing_templates import (  # noqa: E402
+    MARKETING_TEMPLATES,
+    TEMPLATE_CATEGORIES,
+)
+from src.templates.template_engine import (  # noqa: E402
+    _COMPILED,
+    _fill_prompt,
+    _render_prompt,
+    get_all_templates,
+    get_categories,
+    get_templates_by_category,
+)
+
+
+def _summary(template: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "id": template["id"],
+        "name": template["name"],
+        "category": template["category"],
+        "description": template["description"],
+        "fields": template["fields"],
+        "output_format": template.get("output_format", {}),
+        "char_limits": template.get("char_limits", {}),
+    }
+
+
+def _scan_all() -> List[Dict[str, Any]]:
+    return [_summary(t) for t in MARKETING_TEMPLATES.values()]
+
+
+def _scan_category(category: str) -> List[Dict[str, Any]]:
+    return [_summary(t) for t in MARKETING_TEMPLATES.values() if t["category"] == category]
+
+
+def _scan_categories() -> List[Dict[str, Any]]:
+    counts: Dict[str, int] = {}
+    for template in MARKETING_TEMPLATES.values():
+        counts[template["category"]] = counts.get(template["category"], 0) + 1
+    return [
+        {"id": slug, "name": meta["name"], "template_count": counts.get(slug, 0)}
+        for slug, meta in TEMPLATE_CATEGORIES.items()
+    ]
+
+
+def _validate(template: Dict[str, Any], fields: Dict[str, Any]) -> List[str]:
+    errors = []
+    for fd in template.get("fields", []):
+        value = fields.get(fd["name"])
+        if fd.get("required", False) and (value is None or str(value).strip() == ""):
+            errors.append(f"'{fd['name']}' is required")
+            continue
+        if fd.get("type") == "select" and value is not None and str(value).strip() != "":
+            allowed = fd.get("options", [])
+            if allowed and str(value) not in allowed:
+                errors.append(f"'{fd['name']}' must be one of: {', '.join(allowed)}")
+    return errors
+
+
+def _inputs() -> Dict[str, Dict[str, Any]]:
+    inputs = {}
+    for template_id, template in MARKETING_TEMPLATES.items():
+        fields = {}
+        for fd in template["fields"]:
+            if fd.get("type") == "select":
+                fields[fd["name"]] = fd["options"][0]
+            elif fd.get("required"):
+                fields[fd["name"]] = f"Sample {fd['name'].replace('_', ' ')}"
+        inputs[template_id] = fields
+    return inputs
+
+
+def _per_call_us(fn, calls: int, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best / calls * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the template engine")
+    parser.add_argument("--iterations", type=int, default=2000, help="Calls per measurement")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement")
+    args = parser.parse_args()
+    n, repeat = args.iterations, args.repeat
+
+    categories = list(TEMPLATE_CATEGORIES)
+    listing = [
+        ("list all", lambda: [_scan_all() for _ in range(n)],
+         lambda: [get_all_templates() for _ in range(n)]),
+        ("by category", lambda: [_scan_category(categories[i % len(categories)]) for i in range(n)],
+         lambda: [get_templates_by_category(categories[i % len(categories)]) for i in range(n)]),
+        ("categories", lambda: [_scan_categories() for _ in range(n)],
+         lambda: [get_categories() for _ in range(n)]),
+    ]
+
+    inputs = _inputs()
+    work = [(MARKETING_TEMPLATES[tid], _COMPILED[tid], fields) for tid, fields in inputs.items()]
+    calls = n * len(work)
+
+    def previous():
+        for _ in range(n):
+            for template, _, fields in work:
+                _validate(template, fields)
+                _fill_prompt(template["prompt_template"], fields, template["fields"])
+
+    def compiled():
+        for _ in range(n):
+            for _, ct, fields in work:
+                ct.validate(fields)
+                ct.render(fields)
+
+    def cached():
+        for _ in range(n):
+            for _, ct, fields in work:
+                ct.validate(fields)
+                _render_prompt(ct.id, ct.normalize(fields))
+
+    if template_engine.RENDER_CACHE_SIZE < len(work):
+        print("warning: render cache smaller than the template set; 'cached' will miss")
+    cached()  # warm the LRU
+
+    print(f"{len(MARKETING_TEMPLATES)} templates, {len(categories)} categories")
+    print(f"{'listing':>12} {'previous us':>12} {'indexed us':>12} {'speedup':>8}")
+    for name, old, new in listing:
+        before = _per_call_us(old, n, repeat)
+        after = _per_call_us(new, n, repeat)
+        print(f"{name:>12} {before:>12.2f} {after:>12.2f} {before / after:>7.1f}x")
+
+    before = _per_call_us(previous, calls, repeat)
+    print(f"\n{'rendering':>12} {'us/prompt':>12} {'prompts/s':>12} {'speedup':>8}")
+    for name, fn in (("previous", previous), ("compiled", compiled), ("cached", cached)):
+        per_call = _per_call_us(fn, calls, repeat)
+        print(f"{name:>12} {per_call:>12.2f} {1e6 / per_call:>12,.0f} {before / per_call:>7.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,48 @@
+"""
+Generate the precomputed tool catalog (src/tools/catalog.json).
+
+Imports every tool in src/tools/library and records its definition plus the
+module and class that implement it, so the API can list and describe tools
+without importing them. Run after adding or changing a tool; the Docker
+build runs it as well.
+
+Usage (from apps/api):
+  python ../../scripts/build_tool_catalog.py
+  python ../../scripts/build_tool_catalog.py --check
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.getcwd())
+
+from src.tools.catalog import CATALOG_PATH, read_catalog, write_catalog  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", default=CATALOG_PATH, help="catalog file to write")
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="exit non-zero if the catalog is missing or stale instead of writing it",
+    )
+    args = parser.parse_args()
+
+    if args.check:
+        if read_catalog(args.output) is None:
+            print(f"{args.output} is missing or stale; regenerate it")
+            return 1
+        print(f"{args.output} is current")
+        return 0
+
+    count = write_catalog(args.output)
+    print(f"Wrote {count} tools to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+-- Migration: Batched audit logging and partitioned audit statistics
+-- Description: Lets the API write audit entries in batches and serves the
+--   audit dashboards from pre-aggregated, time-partitioned counters instead
+--   of fetching raw audit_logs rows and counting them in Python.
+--
+-- Tables:
+--   audit_log_daily_stats: Event counts per day / organization / action /
+--     resource type / user / outcome, range-partitioned by month
+--
+-- Functions:
+--   log_audit_events: Inserts a JSON array of audit entries (idempotent on id)
+--   ensure_audit_stats_partitions: Creates monthly partitions ahead of time,
+--     moving rows that fell into the DEFAULT partition into them; scheduled
+--     daily with pg_cron when the extension is available (the API also calls
+--     it once a day after writing audit entries)
+--   audit_activity_summary / audit_security_summary: SQL aggregations used by
+--     AuditStatistics
+--
+-- Every insert into audit_logs (single or batched) updates the daily stats
+-- through a statement-level trigger, so both write paths stay consistent.
+
+-- =============================================================================
+-- Daily Audit Statistics (partitioned by month)
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS audit_log_daily_stats (
+    day DATE NOT NULL,
+    -- Nil UUID for system events without an organization
+    organization_id UUID NOT NULL,
+    action TEXT NOT NULL,
+    resource_type TEXT NOT NULL,
+    -- Empty string for system actions
+    user_id TEXT NOT NULL DEFAULT '',
+    success BOOLEAN NOT NULL,
+    event_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, organization_id, action, resource_type, user_id, success)
+) PARTITION BY RANGE (day);
+
+-- Catches rows outside the pre-created monthly partitions
+CREATE TABLE IF NOT EXISTS audit_log_daily_stats_default
+    PARTITION OF audit_log_daily_stats DEFAULT;
+
+CREATE INDEX IF NOT EXISTS idx_audit_log_daily_stats_org_day
+    ON audit_log_daily_stats(organization_id, day DESC);
+
+COMMENT ON TABLE audit_log_daily_stats IS 'Daily audit event counters, partitioned by month; maintained by trigger on audit_logs';
+
+
+-- Function: Create monthly partitions of audit_log_daily_stats
+-- A month without a partition collects its rows in the DEFAULT partition,
+-- and Postgres refuses to create a partition for a range the DEFAULT
+-- partition already holds rows for. Those rows are moved into a detached
+-- table first, which is then attached as the month's partition.
+CREATE OR REPLACE FUNCTION ensure_audit_stats_partitions(
+    p_from DATE DEFAULT CURRENT_DATE,
+    p_months INTEGER DEFAULT 3
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_start DATE;
+    v_end DATE;
+    v_name TEXT;
+    v_created INTEGER := 0;
+BEGIN
+    FOR i IN 0..GREATEST(p_months, 1) - 1 LOOP
+        v_start := (date_trunc('month', p_from) + make_interval(months => i))::DATE;
+        v_end := (v_start + INTERVAL '1 month')::DATE;
+        v_name := 'audit_log_daily_stats_' || to_char(v_start, 'YYYYMM');
+
+        IF to_regclass(v_name) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I (LIKE audit_log_daily_stats INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+                v_name
+            );
+            EXECUTE format(
+                'WITH moved AS (
+                     DELETE FROM audit_log_daily_stats_default
+                     WHERE day >= %L AND day < %L
+                     RETURNING *
+                 )
+                 INSERT INTO %I SELECT * FROM moved',
+                v_start, v_end, v_name
+            );
+            EXECUTE format(
+                'ALTER TABLE audit_log_daily_stats ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                v_name, v_start, v_end
+            );
+            v_created := v_created + 1;
+        END IF;
+    END LOOP;
+
+    RETURN v_created;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+COMMENT ON FUNCTION ensure_audit_stats_partitions IS 'Creates monthly audit_log_daily_stats partitions starting at p_from, adopting matching rows from the DEFAULT partition (run daily)';
+
+-- Partitions for the backfill window and the next few months
+SELECT ensure_audit_stats_partitions(
+    (CURRENT_DATE - INTERVAL '12 months')::DATE, 16
+);
+
+-- Keep creating them ahead of time. Without pg_cron the API's daily call
+-- (AuditService) is the only scheduler.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule(
+            'ensure-audit-stats-partitions',
+            '15 0 * * *',
+            'SELECT ensure_audit_stats_partitions()'
+        );
+    END IF;
+END;
+$$;
+
+
+-- =============================================================================
+-- Stats Trigger
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION audit_logs_update_daily_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO audit_log_daily_stats (
+        day, organization_id, action, resource_type, user_id, success, event_count
+    )
+    SELECT
+        (n.created_at AT TIME ZONE 'UTC')::DATE,
+        COALESCE(n.organization_id, '00000000-0000-0000-0000-000000000000'::UUID),
+        n.action,
+        n.resource_type,
+        COALESCE(n.user_id, ''),
+        n.success,
+        COUNT(*)
+    FROM inserted_audit_logs n
+    GROUP BY 1, 2, 3, 4, 5, 6
+    -- Sorted so concurrent batches lock counter rows in the same order
+    ORDER BY 1, 2, 3, 4, 5, 6
+    ON CONFLICT (day, organization_id, action, resource_type, user_id, success)
+    DO UPDATE SET event_count = audit_log_daily_stats.event_count + EXCLUDED.event_count;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+DROP TRIGGER IF EXISTS audit_logs_daily_stats ON audit_logs;
+CREATE TRIGGER audit_logs_daily_stats
+    AFTER INSERT ON audit_logs
+    REFERENCING NEW TABLE AS inserted_audit_logs
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION audit_logs_update_daily_stats();
+
+-- Backfill counters from existing entries (trigger only sees new rows)
+INSERT INTO audit_log_daily_stats (
+    day, organization_id, action, resource_type, user_id, success, event_count
+)
+SELECT
+    (created_at AT TIME ZONE 'UTC')::DATE,
+    COALESCE(organization_id, '00000000-0000-0000-0000-000000000000'::UUID),
+    action,
+    resource_type,
+    COALESCE(user_id, ''),
+    success,
+    COUNT(*)
+FROM audit_logs
+GROUP BY 1, 2, 3, 4, 5, 6
+ON CONFLICT (day, organization_id, action, resource_type, user_id, success)
+DO UPDATE SET event_count = EXCLUDED.event_count;
+
+
+-- =============================================================================
+-- Batched Inserts
+-- =============================================================================
+
+-- Function: Log a batch of audit events
+-- Entries carry client-generated ids and timestamps, so a batch replayed after
+-- a partial failure never duplicates rows or shifts them in time.
+CREATE OR REPLACE FUNCTION log_audit_events(p_events JSONB)
+RETURNS INTEGER AS $$
+DECLARE
+    v_inserted INTEGER;
+BEGIN
+    INSERT INTO audit_logs (
+        id, organization_id, user_id, action, resource_type, resource_id,
+        metadata, old_values, new_values,
+        ip_address, user_agent, request_id,
+        success, error_message, created_at
+    )
+    SELECT
+        COALESCE(e.id, gen_random_uuid()), e.organization_id, e.user_id,
+        e.action, e.resource_type, e.resource_id,
+        COALESCE(e.metadata, '{}'::JSONB), e.old_values, e.new_values,
+        e.ip_address, e.user_agent, e.request_id,
+        COALESCE(e.success, TRUE), e.error_message, COALESCE(e.created_at, NOW())
+    FROM jsonb_to_recordset(p_events) AS e(
+        id UUID, organization_id UUID, user_id TEXT,
+        action TEXT, resource_type TEXT, resource_id TEXT,
+        metadata JSONB, old_values JSONB, new_values JSONB,
+        ip_address INET, user_agent TEXT, request_id TEXT,
+        success BOOLEAN, error_message TEXT, created_at TIMESTAMPTZ
+    )
+    ON CONFLICT (id) DO NOTHING;
+
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+    RETURN v_inserted;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+COMMENT ON FUNCTION log_audit_events IS 'Records a batch of audit log entries; rows whose id already exists are skipped';
+
+
+-- =============================================================================
+-- Aggregations
+-- =============================================================================
+
+-- Function: Activity summary for an organization from the daily counters
+CREATE OR REPLACE FUNCTION audit_activity_summary(
+    p_organization_id UUID,
+    p_days INTEGER DEFAULT 30,
+    p_top_users INTEGER DEFAULT 50
+)
+RETURNS JSONB AS $$
+    WITH window_stats AS (
+        SELECT action, resource_type, user_id, success, event_count
+        FROM audit_log_daily_stats
+        WHERE organization_id = p_organization_id
+          AND day >= (NOW() AT TIME ZONE 'UTC')::DATE - p_days
+    ),
+    top_users AS (
+        SELECT user_id, SUM(event_count) AS total
+        FROM window_stats
+        WHERE user_id <> ''
+        GROUP BY user_id
+        ORDER BY total DESC
+        LIMIT p_top_users
+    )
+    SELECT jsonb_build_object(
+        'total_events', COALESCE((SELECT SUM(event_count) FROM window_stats), 0),
+        'success_count', COALESCE((SELECT SUM(event_count) FROM window_stats WHERE success), 0),
+        'failure_count', COALESCE((SELECT SUM(event_count) FROM window_stats WHERE NOT success), 0),
+        'action_breakdown', COALESCE((
+            SELECT jsonb_object_agg(action, total)
+            FROM (SELECT action, SUM(event_count) AS total FROM window_stats GROUP BY action) a
+        ), '{}'::JSONB),
+        'user_activity', COALESCE((SELECT jsonb_object_agg(user_id, total) FROM top_users), '{}'::JSONB),
+        'resource_breakdown', COALESCE((
+            SELECT jsonb_object_agg(resource_type, total)
+            FROM (
+                SELECT resource_type, SUM(event_count) AS total
+                FROM window_stats GROUP BY resource_type
+            ) r
+        ), '{}'::JSONB)
+    );
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+COMMENT ON FUNCTION audit_activity_summary IS 'Aggregated audit activity for an organization over the last p_days days (whole UTC days)';
+
+
+-- Function: Security summary (NULL organization = all organizations)
+CREATE OR REPLACE FUNCTION audit_security_summary(
+    p_organization_id UUID DEFAULT NULL,
+    p_days INTEGER DEFAULT 7,
+    p_actions TEXT[] DEFAULT ARRAY[
+        'login.success', 'login.failure', 'api_key.create',
+        'api_key.revoke', 'member.remove', 'organization.delete'
+    ]
+)
+RETURNS JSONB AS $$
+    WITH window_stats AS (
+        SELECT action, success, event_count
+        FROM audit_log_daily_stats
+        WHERE (p_organization_id IS NULL OR organization_id = p_organization_id)
+          AND action = ANY(p_actions)
+          AND day >= (NOW() AT TIME ZONE 'UTC')::DATE - p_days
+    ),
+    -- IPs are not part of the counters; login failures are few and indexed
+    -- by (action, created_at), so they are grouped from audit_logs directly.
+    failure_ips AS (
+        SELECT host(ip_address) AS ip, COUNT(*) AS total
+        FROM audit_logs
+        WHERE action = 'login.failure'
+          AND created_at >= NOW() - make_interval(days => p_days)
+          AND (p_organization_id IS NULL OR organization_id = p_organization_id)
+          AND ip_address IS NOT NULL
+        GROUP BY 1
+        ORDER BY total DESC
+        LIMIT 10
+    )
+    SELECT jsonb_build_object(
+        'total_security_events', COALESCE((SELECT SUM(event_count) FROM window_stats), 0),
+        'login_failures', COALESCE((
+            SELECT SUM(event_count) FROM window_stats WHERE action = 'login.failure'
+        ), 0),
+        'permission_denials', COALESCE((
+            SELECT SUM(event_count) FROM window_stats
+            WHERE action <> 'login.failure' AND NOT success
+        ), 0),
+        'suspicious_ips', COALESCE((SELECT jsonb_object_agg(ip, total) FROM failure_ips), '{}'::JSONB)
+    );
+$$ LANGUAGE sql STABLE SECURITY DEFINER;
+
+COMMENT ON FUNCTION audit_security_summary IS 'Aggregated security events over the last p_days days';
+
+
+-- =============================================================================
+-- Row Level Security
+-- =============================================================================
+
+ALTER TABLE audit_log_daily_stats ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Service role full access to audit_log_daily_stats"
+    ON audit_log_daily_stats
+    FOR ALL
+    TO service_role
+    USING (true)
+    WITH CHECK (true);
+
+
+-- =============================================================================
+-- Grants
+-- =============================================================================
+
+GRANT EXECUTE ON FUNCTION log_audit_events(JSONB) TO service_role;
+GRANT EXECUTE ON FUNCTION ensure_audit_stats_partitions(DATE, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION audit_activity_summary(UUID, INTEGER, INTEGER) TO service_role;
+GRANT EXECUTE ON FUNCTION audit_security_summary(UUID, INTEGER, TEXT[]) TO service_role;
@@ -0,0 +1,120 @@
+-- Migration: Track when SEO rankings were last confirmed
+-- Description: Rank sweeps only insert a seo_rankings row when a keyword's
+--   position changes. A keyword that holds its position would otherwise
+--   look untracked to every reader that filters on tracked_at, so each row
+--   now also records when its position was last confirmed by a check.
+--
+-- Columns:
+--   seo_rankings.last_checked_at: Latest check that saw this position
+--     (equal to tracked_at when the row is inserted)
+--
+-- Functions:
+--   record_rank_sweep: Inserts a sweep's changed rankings and bumps
+--     last_checked_at on the latest row of every unchanged keyword, in one
+--     call
+--
+-- Readers select time windows on last_checked_at and keep ordering by
+-- tracked_at (when the position was first seen).
+
+-- =============================================================================
+-- last_checked_at
+-- =============================================================================
+
+ALTER TABLE seo_rankings
+    ADD COLUMN IF NOT EXISTS last_checked_at TIMESTAMPTZ;
+
+UPDATE seo_rankings SET last_checked_at = tracked_at WHERE last_checked_at IS NULL;
+
+ALTER TABLE seo_rankings
+    ALTER COLUMN last_checked_at SET DEFAULT NOW(),
+    ALTER COLUMN last_checked_at SET NOT NULL;
+
+COMMENT ON COLUMN seo_rankings.last_checked_at IS 'Latest check that confirmed this position (rows are only inserted when the position changes)';
+
+CREATE INDEX IF NOT EXISTS idx_seo_rankings_keyword_checked
+    ON seo_rankings(keyword, last_checked_at DESC);
+CREATE INDEX IF NOT EXISTS idx_seo_rankings_content_checked
+    ON seo_rankings(content_id, last_checked_at DESC);
+CREATE INDEX IF NOT EXISTS idx_seo_rankings_org_checked
+    ON seo_rankings(organization_id, last_checked_at DESC);
+
+-- =============================================================================
+-- Function: Store a rank sweep
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION record_rank_sweep(
+    p_url TEXT,
+    p_rows JSONB,
+    p_unchanged TEXT[],
+    p_checked_at TIMESTAMPTZ DEFAULT NOW()
+)
+RETURNS INTEGER AS $$
+DECLARE
+    v_inserted INTEGER;
+BEGIN
+    -- Unchanged keywords: the latest row's position was confirmed again.
+    UPDATE seo_rankings sr
+    SET last_checked_at = GREATEST(sr.last_checked_at, p_checked_at)
+    FROM (
+        SELECT DISTINCT ON (keyword) id
+        FROM seo_rankings
+        WHERE url = p_url AND keyword = ANY(p_unchanged)
+        ORDER BY keyword, tracked_at DESC
+    ) latest
+    WHERE sr.id = latest.id;
+
+    INSERT INTO seo_rankings (
+        keyword, position, previous_position, change, search_volume, difficulty,
+        url, tracked_at, last_checked_at, search_engine, location
+    )
+    SELECT
+        r.keyword, r.position, r.previous_position, COALESCE(r.change, 0),
+        r.search_volume, r.difficulty, p_url,
+        COALESCE(r.tracked_at, p_checked_at), COALESCE(r.tracked_at, p_checked_at),
+        COALESCE(r.search_engine, 'google'), COALESCE(r.location, 'us')
+    FROM jsonb_to_recordset(COALESCE(p_rows, '[]'::JSONB)) AS r(
+        keyword TEXT,
+        position INTEGER,
+        previous_position INTEGER,
+        change INTEGER,
+        search_volume INTEGER,
+        difficulty NUMERIC,
+        tracked_at TIMESTAMPTZ,
+        search_engine TEXT,
+        location TEXT
+    );
+
+    GET DIAGNOSTICS v_inserted = ROW_COUNT;
+    RETURN v_inserted;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER;
+
+-- =============================================================================
+-- View: SEO opportunities, windowed on the latest check
+-- =============================================================================
+
+CREATE OR REPLACE VIEW v_seo_opportunities AS
+SELECT DISTINCT ON (sr.keyword)
+    sr.keyword,
+    sr.position as current_position,
+    sr.search_volume,
+    sr.content_id,
+    sr.url,
+    sr.organization_id,
+    CASE
+        WHEN sr.search_volume IS NULL THEN 0
+        ELSE sr.search_volume * (0.30 - 0.01)  -- Potential traffic if moved to #1
+    END as potential_traffic
+FROM seo_rankings sr
+WHERE sr.position >= 11
+    AND sr.position <= 30
+    AND sr.last_checked_at > NOW() - INTERVAL '7 days'
+ORDER BY sr.keyword, sr.tracked_at DESC;
+
+COMMENT ON VIEW v_seo_opportunities IS 'Keywords with improvement potential (positions 11-30)';
+
+-- =============================================================================
+-- Permissions
+-- =============================================================================
+
+GRANT EXECUTE ON FUNCTION record_rank_sweep(TEXT, JSONB, TEXT[], TIMESTAMPTZ) TO service_role;
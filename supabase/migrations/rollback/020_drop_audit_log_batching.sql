@@ -0,0 +1,41 @@
+-- Rollback: 020_audit_log_batching.sql
+-- Description: Drops the partitioned audit statistics table, its trigger on
+--              audit_logs, the batched logging / aggregation functions and
+--              the pg_cron job that creates partitions.
+--              audit_logs itself and its rows are left untouched.
+
+BEGIN;
+
+-- =========================================================================
+-- Unschedule Partition Maintenance (pg_cron)
+-- =========================================================================
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.unschedule(jobid)
+        FROM cron.job
+        WHERE jobname = 'ensure-audit-stats-partitions';
+    END IF;
+END;
+$$;
+
+-- =========================================================================
+-- Drop Trigger
+-- =========================================================================
+DROP TRIGGER IF EXISTS audit_logs_daily_stats ON audit_logs;
+
+-- =========================================================================
+-- Drop Functions
+-- =========================================================================
+DROP FUNCTION IF EXISTS audit_security_summary(UUID, INTEGER, TEXT[]) CASCADE;
+DROP FUNCTION IF EXISTS audit_activity_summary(UUID, INTEGER, INTEGER) CASCADE;
+DROP FUNCTION IF EXISTS log_audit_events(JSONB) CASCADE;
+DROP FUNCTION IF EXISTS audit_logs_update_daily_stats() CASCADE;
+DROP FUNCTION IF EXISTS ensure_audit_stats_partitions(DATE, INTEGER) CASCADE;
+
+-- =========================================================================
+-- Drop Table (partitions are dropped with the parent)
+-- =========================================================================
+DROP TABLE IF EXISTS audit_log_daily_stats CASCADE;
+
+COMMIT;
@@ -0,0 +1,41 @@
+-- Rollback: 021_seo_rankings_last_checked.sql
+-- Description: Drops the record_rank_sweep function and the
+--              seo_rankings.last_checked_at column, and restores the
+--              tracked_at window on v_seo_opportunities. Ranking rows are
+--              kept.
+
+BEGIN;
+
+-- =========================================================================
+-- Restore View
+-- =========================================================================
+CREATE OR REPLACE VIEW v_seo_opportunities AS
+SELECT DISTINCT ON (sr.keyword)
+    sr.keyword,
+    sr.position as current_position,
+    sr.search_volume,
+    sr.content_id,
+    sr.url,
+    sr.organization_id,
+    CASE
+        WHEN sr.search_volume IS NULL THEN 0
+        ELSE sr.search_volume * (0.30 - 0.01)  -- Potential traffic if moved to #1
+    END as potential_traffic
+FROM seo_rankings sr
+WHERE sr.position >= 11
+    AND sr.position <= 30
+    AND sr.tracked_at > NOW() - INTERVAL '7 days'
+ORDER BY sr.keyword, sr.tracked_at DESC;
+
+-- =========================================================================
+-- Drop Functions
+-- =========================================================================
+DROP FUNCTION IF EXISTS record_rank_sweep(TEXT, JSONB, TEXT[], TIMESTAMPTZ) CASCADE;
+
+-- =========================================================================
+-- Drop Column (its indexes are dropped with it)
+-- =========================================================================
+ALTER TABLE seo_rankings
+    DROP COLUMN IF EXISTS last_checked_at;
+
+COMMIT;